@@ -21,10 +21,15 @@ import sys
 import os
 
 try:
+    import time
+    _start = time.perf_counter()
 
     from . import core
     reload(core)  # Must be the first to reload
 
+    core.profiling.startup_times.clear()
+    core.profiling.startup_times['import core'] = time.perf_counter() - _start
+
 except Exception as e:
     print("Could not load core functionality!", type(e).__name__, e)
     raise e
@@ -32,17 +37,25 @@ except Exception as e:
     def unregister(): pass
 
 try:
-    from . import export
-    from . import interface
-    from . import operators
-    from . import properties
+    with core.profiling.timed('import export'):
+        from . import export
+    with core.profiling.timed('import interface'):
+        from . import interface
+    with core.profiling.timed('import operators'):
+        from . import operators
+    with core.profiling.timed('import properties'):
+        from . import properties
 
     core.PluginManager.clear()
 
-    reload(operators)
-    reload(properties)
-    reload(export)
-    reload(interface)
+    with core.profiling.timed('reload operators'):
+        reload(operators)
+    with core.profiling.timed('reload properties'):
+        reload(properties)
+    with core.profiling.timed('reload export'):
+        reload(export)
+    with core.profiling.timed('reload interface'):
+        reload(interface)
 
     core.PluginManager.load_icon('hbp', 'icons/hbp.png')
 
@@ -59,7 +72,10 @@ try:
             print('Adding the following path to sys.path: ' + str(generatedAdditionalModulePath.venvPath))
             sys.path = sys.path + generatedAdditionalModulePath.venvPath
 
-        core.PluginManager.register()
+        with core.profiling.timed('register'):
+            core.PluginManager.register()
+
+        core.logfile.core_logger.info(core.profiling.import_profile_report(export.binding_load_times()))
 
 
     def unregister():
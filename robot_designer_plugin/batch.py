@@ -0,0 +1,348 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Headless batch conversion of robot models between URDF and SDF.
+
+The command line interface runs with any Python 3 interpreter and starts a pool of ``blender --background``
+processes. Each of them registers the plugin, imports its files with the import operators (plain files or zipped
+packages) and writes them with the export operators of the target format:
+
+    python3 robot_designer_plugin/batch.py --to sdf --output converted --jobs 4 'models/**/*.urdf' robot.zip
+
+With ``--direct`` the files are translated by :mod:`robot_designer_plugin.translate` in a pool of Python processes
+instead, which does not require Blender but keeps the mesh files as they are.
+
+A JSON summary with the timings and errors of every file is written to ``--summary`` (or printed). The exit code is
+non-zero if a conversion failed.
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+FORMATS = ('sdf', 'urdf')
+"""
+Supported model formats.
+"""
+
+
+def model_format(file_name):
+    """
+    Determines the format of a model file or zipped package from its (contained) file extension.
+
+    :param file_name: Path of a ``.sdf``, ``.urdf`` or ``.zip`` file
+    :return: Tuple of the format (``'sdf'`` or ``'urdf'``) and whether the file is a zipped package
+    :raises ValueError: if the format is not supported
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == '.zip':
+        with zipfile.ZipFile(file_name) as z:
+            extensions = {os.path.splitext(i)[1].lower() for i in z.namelist()}
+        for format in FORMATS:
+            if '.' + format in extensions:
+                return format, True
+        raise ValueError("No SDF or URDF file in package %s" % file_name)
+    if extension[1:] in FORMATS:
+        return extension[1:], False
+    raise ValueError("Unsupported file type: %s" % file_name)
+
+
+def expand_inputs(patterns):
+    """
+    Expands (recursive) glob patterns. Duplicates are removed while the order is kept.
+
+    :param patterns: File names or glob patterns
+    :return: List of absolute file names
+    """
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        files.extend(os.path.abspath(i) for i in matches)
+    return list(dict.fromkeys(files))
+
+
+def output_names(files, output_dir):
+    """
+    Assigns an output directory to every input file (named after the file, numbered if names clash).
+    """
+    names, used = [], set()
+    for file_name in files:
+        stem = os.path.splitext(os.path.basename(file_name))[0]
+        name, number = stem, 1
+        while name in used:
+            number += 1
+            name = '%s_%d' % (stem, number)
+        used.add(name)
+        names.append(os.path.join(os.path.abspath(output_dir), name))
+    return names
+
+
+def _failure(job, message, seconds=0.0):
+    return {'input': job['input'], 'output': job['output'], 'status': 'failed', 'seconds': seconds,
+            'error': message}
+
+
+def run_batch(jobs, target, blender, timeout):
+    """
+    Converts a list of files in one Blender process.
+
+    :param jobs: List of dictionaries with the keys ``input`` and ``output``
+    :param target: Target format
+    :param blender: The Blender executable
+    :param timeout: Timeout in seconds for the whole batch (or None)
+    :return: List of result dictionaries (one per job)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        job_file = os.path.join(directory, 'jobs.json')
+        result_file = os.path.join(directory, 'results.json')
+        with open(job_file, 'w') as f:
+            json.dump({'target': target, 'jobs': jobs}, f)
+
+        command = [blender, '--background', '--factory-startup', '--python', os.path.abspath(__file__),
+                   '--', '--worker', job_file, result_file]
+        start = time.perf_counter()
+        try:
+            process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                     universal_newlines=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return [_failure(job, "Timeout after %ss" % timeout, time.perf_counter() - start) for job in jobs]
+        except OSError as e:
+            return [_failure(job, "Could not start Blender: %s" % e) for job in jobs]
+
+        try:
+            with open(result_file) as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            tail = '\n'.join(process.stdout.splitlines()[-20:])
+            return [_failure(job, "Blender exited with code %d:\n%s" % (process.returncode, tail),
+                             time.perf_counter() - start) for job in jobs]
+
+    # Files the worker did not get to (e.g., due to a crash) are failures as well
+    done = {i['input'] for i in results}
+    return results + [_failure(job, "Not converted (Blender exited with code %d)" % process.returncode)
+                      for job in jobs if job['input'] not in done]
+
+
+def _translator():
+    # The package itself requires Blender. This file runs as a script, hence the plugin directory is on the path.
+    import loader
+    return loader.load('translate')
+
+
+def translate_batch(jobs, target, link=True):
+    """
+    Converts a list of files with the Blender-free translator (:mod:`robot_designer_plugin.translate`).
+
+    :param jobs: List of dictionaries with the keys ``input`` and ``output``
+    :param target: Target format
+    :param link: Hard-link the mesh files instead of copying them
+    :return: List of result dictionaries (one per job)
+    """
+    translate = _translator()
+    results = []
+    for job in jobs:
+        try:
+            format, zipped = model_format(job['input'])
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            results.append(_failure(job, '%s: %s' % (type(e).__name__, e)))
+            continue
+        if not zipped:
+            results.append(translate.translate_job(job, target, link))
+            continue
+        # The mesh files are copied since the extracted package is removed afterwards
+        with tempfile.TemporaryDirectory() as directory:
+            with zipfile.ZipFile(job['input']) as z:
+                z.extractall(directory)
+            model = sorted(glob.glob(os.path.join(directory, '**', '*.' + format), recursive=True))[0]
+            result = translate.translate_job(dict(job, input=model), target, False)
+            result['input'] = job['input']
+            results.append(result)
+    return results
+
+
+def convert(files, target, output_dir, processes=1, batch_size=1, blender='blender', timeout=None, direct=False):
+    """
+    Converts model files with a pool of Blender processes.
+
+    :param files: Input files (``.sdf``, ``.urdf`` or zipped packages)
+    :param target: Target format (``'sdf'`` or ``'urdf'``)
+    :param output_dir: Directory the converted models are written to (one sub directory per input)
+    :param processes: Number of concurrent Blender processes
+    :param batch_size: Number of files converted by a single Blender process
+    :param blender: The Blender executable
+    :param timeout: Timeout in seconds for a Blender process (or None)
+    :param direct: Translate the files without Blender in a pool of Python processes (see
+        :func:`translate_batch`)
+    :return: The summary as dictionary
+    """
+    start = time.perf_counter()
+    jobs = [{'input': i, 'output': j} for i, j in zip(files, output_names(files, output_dir))]
+    batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+    if direct:
+        with ProcessPoolExecutor(max_workers=max(1, processes)) as pool:
+            futures = [pool.submit(translate_batch, batch, target) for batch in batches]
+            results = [result for future in futures for result in future.result()]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, processes)) as pool:
+            futures = [pool.submit(run_batch, batch, target, blender, timeout) for batch in batches]
+            results = [result for future in futures for result in future.result()]
+
+    return {
+        'target': target,
+        'direct': direct,
+        'processes': processes,
+        'batch_size': batch_size,
+        'seconds': time.perf_counter() - start,
+        'succeeded': sum(1 for i in results if i['status'] == 'ok'),
+        'failed': sum(1 for i in results if i['status'] != 'ok'),
+        'files': results,
+    }
+
+
+def main(argv=None):
+    """
+    Entry point of the command line interface.
+    """
+    parser = argparse.ArgumentParser(description="Converts robot models between URDF and SDF.")
+    parser.add_argument('inputs', nargs='+', help="Model files, zipped packages or glob patterns (quoted)")
+    parser.add_argument('--to', dest='target', choices=FORMATS, required=True, help="Target format")
+    parser.add_argument('--output', required=True, help="Output directory")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="Number of Blender processes")
+    parser.add_argument('--batch-size', type=int, default=1, help="Files converted per Blender process")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'), help="Blender executable")
+    parser.add_argument('--timeout', type=float, default=None, help="Timeout per Blender process in seconds")
+    parser.add_argument('--direct', action='store_true',
+                        help="Translate without Blender (links the mesh files instead of re-exporting them)")
+    parser.add_argument('--summary', help="JSON summary file (default: standard output)")
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        parser.error("No input files")
+
+    summary = convert(files, args.target, args.output, args.jobs, max(1, args.batch_size), args.blender,
+                      args.timeout, args.direct)
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump(summary, f, indent=2)
+    else:
+        json.dump(summary, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 1 if summary['failed'] else 0
+
+
+# ######
+# Code executed in the Blender processes
+
+
+def _operators(format, zipped):
+    from robot_designer_plugin.export import sdf, urdf
+
+    module = sdf if format == 'sdf' else urdf
+    return module.ImportZippedPackage if zipped else module.ImportPlain, module.ExportPlain
+
+
+def convert_file(input_file, output_dir, target):
+    """
+    Converts a single file in the running Blender instance (the plugin has to be registered).
+
+    :return: Result dictionary
+    """
+    import bpy
+    from robot_designer_plugin.core.gui import InfoBox
+
+    result = {'input': input_file, 'output': output_dir, 'status': 'failed'}
+    start = time.perf_counter()
+    try:
+        format, zipped = model_format(input_file)
+        import_operator, _ = _operators(format, zipped)
+        _, export_operator = _operators(target, False)
+
+        bpy.ops.wm.read_homefile(use_empty=True)
+        del InfoBox.global_messages[:]
+
+        # The operators catch their exceptions and report them to the info box
+        import_operator.run(filepath=input_file)
+        result['import_seconds'] = time.perf_counter() - start
+        model = bpy.context.active_object
+        if InfoBox.global_messages or model is None or model.type != 'ARMATURE':
+            raise RuntimeError("Import failed: %s" % ('; '.join(map(str, InfoBox.global_messages)) or
+                                                      "no model created"))
+
+        os.makedirs(output_dir, exist_ok=True)
+        export_start = time.perf_counter()
+        if target == 'sdf':
+            export_operator.run(filepath=output_dir)
+            result['output_file'] = os.path.join(output_dir, 'model.sdf')
+        else:
+            result['output_file'] = os.path.join(output_dir, os.path.basename(output_dir) + '.urdf')
+            export_operator.run(filepath=result['output_file'])
+        result['export_seconds'] = time.perf_counter() - export_start
+        if InfoBox.global_messages or not os.path.isfile(result['output_file']):
+            raise RuntimeError("Export failed: %s" % ('; '.join(map(str, InfoBox.global_messages)) or
+                                                      "no file written"))
+        result['status'] = 'ok'
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def worker(job_file, result_file):
+    """
+    Converts the files of a job file written by :func:`run_batch` and writes the results.
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import robot_designer_plugin
+
+    with open(job_file) as f:
+        batch = json.load(f)
+
+    robot_designer_plugin.register()
+    results = []
+    try:
+        for job in batch['jobs']:
+            results.append(convert_file(job['input'], job['output'], batch['target']))
+            # Written after every file such that the results survive a crash of Blender
+            with open(result_file, 'w') as f:
+                json.dump(results, f)
+    finally:
+        robot_designer_plugin.unregister()
+
+
+if __name__ == '__main__':
+    if '--worker' in sys.argv:
+        worker(*sys.argv[sys.argv.index('--worker') + 1:][:2])
+    else:
+        sys.exit(main())
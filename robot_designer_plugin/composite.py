@@ -0,0 +1,204 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Composite mass properties of the :term:`segments<segment>` of a :term:`robot model` (requires numpy, but not
+Blender).
+
+:class:`CompositeBody` keeps the mass, the center of mass and the inertia tensor of every subtree in the frame of its
+root segment. The composite of a subtree only depends on the bodies of its segments and on the transforms between
+them, hence a changed body (e.g., the mass or the pose of a physics frame) or a changed joint only requires the
+ancestors of the segment to be recomputed. :meth:`CompositeBody.whole_body` computes the whole-body properties for
+many poses at once, e.g., with the frames of :meth:`robot_designer_plugin.kinematics.KinematicTree.forward`::
+
+    tree = KinematicTree.from_armature(armature)
+    mass, centers, inertias = body.whole_body(tree.forward(configurations))
+"""
+
+import numpy
+
+
+def combine(masses, centers, inertias):
+    """
+    Combines rigid bodies given in the same frame.
+
+    :param masses: Array (K,) of the masses
+    :param centers: Array (K, 3) of the centers of mass
+    :param inertias: Array (K, 3, 3) of the inertia tensors about the centers of mass
+    :return: Tuple of the total mass, the center of mass and the inertia tensor about it (the center of bodies without
+        mass is the origin)
+    """
+    masses = numpy.asarray(masses, dtype=numpy.float64)
+    centers = numpy.asarray(centers, dtype=numpy.float64).reshape(-1, 3)
+    mass = masses.sum()
+    if mass <= 0:
+        return 0.0, numpy.zeros(3), numpy.zeros((3, 3))
+    center = masses.dot(centers) / mass
+    # Parallel axis theorem: m * (|d|^2 * E - d * d^T) for the offsets d from the common center
+    offsets = centers - center
+    spread = numpy.einsum('k,ki,kj->ij', masses, offsets, offsets)
+    inertia = numpy.sum(inertias, axis=0) + numpy.trace(spread) * numpy.identity(3) - spread
+    return float(mass), center, inertia
+
+
+def transform(matrix, center, inertia):
+    """
+    :param matrix: 4x4 rigid transform into the target frame
+    :return: The center of mass and the inertia tensor in the target frame
+    """
+    rotation = matrix[:3, :3]
+    return rotation.dot(center) + matrix[:3, 3], rotation.dot(inertia).dot(rotation.T)
+
+
+class CompositeBody(object):
+    """
+    Composite rigid bodies of the subtrees of a segment tree with incremental updates.
+
+    :param names: Names of the segments (parents precede their children)
+    :param parents: Index of the parent of every segment (-1 for roots)
+    """
+
+    def __init__(self, names, parents):
+        self.names = list(names)
+        self.parents = numpy.asarray(parents, dtype=numpy.intp)
+        count = len(self.names)
+        self.children = [[] for _ in range(count)]
+        for index, parent in enumerate(self.parents):
+            if parent >= 0:
+                self.children[parent].append(index)
+
+        # Bodies of the segments in their frames
+        self.masses = numpy.zeros(count)
+        self.centers = numpy.zeros((count, 3))
+        self.inertias = numpy.zeros((count, 3, 3))
+        # Frames of the segments in the frames of their parents (roots: in the model frame)
+        self.relative = numpy.tile(numpy.identity(4), (count, 1, 1))
+
+        # Composites of the subtrees in the frames of their roots
+        self._mass = numpy.zeros(count)
+        self._center = numpy.zeros((count, 3))
+        self._inertia = numpy.zeros((count, 3, 3))
+        self._dirty = numpy.zeros(count, dtype=bool)
+        self.recomputed = 0
+        """
+        Number of subtree composites computed so far.
+        """
+
+    def __len__(self):
+        return len(self.names)
+
+    def _invalidate(self, index):
+        # A dirty segment implies dirty ancestors, hence the walk stops at the first dirty one
+        while index >= 0 and not self._dirty[index]:
+            self._dirty[index] = True
+            index = self.parents[index]
+
+    def set_body(self, index, mass, center=(0, 0, 0), inertia=None):
+        """
+        Sets the body of a segment. The subtrees are only invalidated if the body changed.
+
+        :param index: Index of the segment
+        :param mass: Mass
+        :param center: Center of mass in the segment frame
+        :param inertia: 3x3 inertia tensor about the center of mass in the axes of the segment frame (zero if None)
+        """
+        center = numpy.asarray(center, dtype=numpy.float64)
+        inertia = numpy.zeros((3, 3)) if inertia is None else numpy.asarray(inertia, dtype=numpy.float64)
+        if mass != self.masses[index] or not numpy.array_equal(center, self.centers[index]) or \
+                not numpy.array_equal(inertia, self.inertias[index]):
+            self.masses[index] = mass
+            self.centers[index] = center
+            self.inertias[index] = inertia
+            self._invalidate(index)
+
+    def set_frames(self, frames):
+        """
+        Sets the pose of the model. Only the ancestors of segments whose transform to their parent changed are
+        invalidated.
+
+        :param frames: Array (segments, 4, 4) of the segment frames in the model frame (e.g., a configuration of
+            :meth:`robot_designer_plugin.kinematics.KinematicTree.forward`)
+        """
+        frames = numpy.asarray(frames, dtype=numpy.float64)
+        relative = frames.copy()
+        children = self.parents >= 0
+        relative[children] = numpy.matmul(numpy.linalg.inv(frames[self.parents[children]]), frames[children])
+        for index in numpy.flatnonzero(numpy.any(numpy.abs(relative - self.relative) > 1e-12, axis=(1, 2))):
+            self.relative[index] = relative[index]
+            # The composite of the segment itself is given in its own frame and does not change
+            if self.parents[index] >= 0:
+                self._invalidate(self.parents[index])
+
+    def update(self):
+        """
+        Recomputes the invalidated composites (children before their parents).
+        """
+        for index in numpy.flatnonzero(self._dirty)[::-1]:
+            parts = [(self.masses[index], self.centers[index], self.inertias[index])]
+            for child in self.children[index]:
+                center, inertia = transform(self.relative[child], self._center[child], self._inertia[child])
+                parts.append((self._mass[child], center, inertia))
+            masses, centers, inertias = zip(*parts)
+            self._mass[index], self._center[index], self._inertia[index] = combine(masses, centers, inertias)
+            self._dirty[index] = False
+            self.recomputed += 1
+
+    def subtree(self, segment):
+        """
+        :param segment: Name or index of a segment
+        :return: Tuple of the mass, the center of mass and the inertia tensor of the subtree in the segment frame
+        """
+        index = self.names.index(segment) if isinstance(segment, str) else segment
+        self.update()
+        return float(self._mass[index]), self._center[index].copy(), self._inertia[index].copy()
+
+    def whole(self):
+        """
+        :return: Tuple of the mass, the center of mass and the inertia tensor of the model in the model frame
+        """
+        self.update()
+        roots = numpy.flatnonzero(self.parents < 0)
+        parts = [transform(self.relative[i], self._center[i], self._inertia[i]) for i in roots]
+        return combine(self._mass[roots], [i[0] for i in parts], [i[1] for i in parts])
+
+    def whole_body(self, frames):
+        """
+        Computes the whole-body mass properties for many poses at once (without changing the state).
+
+        :param frames: Array (N, segments, 4, 4) of the segment frames in the model frame
+        :return: Tuple of the total mass, the centers of mass (N, 3) and the inertia tensors (N, 3, 3)
+        """
+        frames = numpy.asarray(frames, dtype=numpy.float64)
+        rotations = frames[..., :3, :3]
+        mass = self.masses.sum()
+        centers = numpy.matmul(rotations, self.centers[..., numpy.newaxis])[..., 0] + frames[..., :3, 3]
+        if mass <= 0:
+            return 0.0, numpy.zeros((len(frames), 3)), numpy.zeros((len(frames), 3, 3))
+        center = numpy.einsum('k,nki->ni', self.masses, centers) / mass
+        offsets = centers - center[:, numpy.newaxis]
+        spread = numpy.einsum('k,nki,nkj->nij', self.masses, offsets, offsets)
+        inertia = numpy.matmul(numpy.matmul(rotations, self.inertias), rotations.swapaxes(-1, -2)).sum(axis=1)
+        inertia += numpy.trace(spread, axis1=1, axis2=2)[:, numpy.newaxis, numpy.newaxis] * numpy.identity(3) - spread
+        return float(mass), center, inertia
@@ -0,0 +1,253 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Convex hulls of point sets with the quickhull algorithm (requires numpy, but not Blender).
+
+:func:`quickhull` starts with a tetrahedron of extreme points and assigns every remaining point to a face it lies
+outside of. The farthest point of such a face is added to the hull: the faces it sees are found by walking the
+neighbors (half-edges) of the face, replaced by a fan of triangles from their horizon to the point, and their outside
+points are reassigned to the new faces at once with numpy. Points closer to a face than the tolerance count as inside,
+which merges (nearly) coplanar points instead of creating slivers.
+
+:func:`convex_hulls` computes the hulls of many meshes in a pool of worker processes.
+"""
+
+import numpy
+
+from .pool import map_jobs
+
+TOLERANCE = 1e-6
+"""
+Default tolerance of :func:`quickhull` relative to the largest absolute coordinates of the points (which bound the
+rounding errors of the coordinates, e.g., of the single precision vertices of Blender).
+"""
+
+_ROUNDING = 1e-12
+"""
+Rounding errors of the planes of the faces relative to the largest absolute coordinates of the points.
+"""
+
+
+def _initial_simplex(points, tolerance):
+    """
+    :return: Indices of four extreme points that span a tetrahedron
+    :raises ValueError: if the points are (nearly) coplanar
+    """
+    extremes = numpy.unique(numpy.concatenate([numpy.argmin(points, axis=0), numpy.argmax(points, axis=0)]))
+    distances = numpy.linalg.norm(points[extremes, numpy.newaxis] - points[extremes], axis=2)
+    i, j = numpy.unravel_index(numpy.argmax(distances), distances.shape)
+    first, second = extremes[i], extremes[j]
+    if distances[i, j] <= tolerance:
+        raise ValueError("The points do not span a volume (all points coincide)")
+
+    direction = (points[second] - points[first]) / distances[i, j]
+    relative = points - points[first]
+    line = numpy.linalg.norm(relative - numpy.outer(relative.dot(direction), direction), axis=1)
+    third = numpy.argmax(line)
+    if line[third] <= tolerance:
+        raise ValueError("The points do not span a volume (the points are collinear)")
+
+    normal = numpy.cross(points[second] - points[first], points[third] - points[first])
+    plane = relative.dot(normal / numpy.linalg.norm(normal))
+    fourth = numpy.argmax(numpy.abs(plane))
+    if abs(plane[fourth]) <= tolerance:
+        raise ValueError("The points do not span a volume (the points are coplanar)")
+    return [int(first), int(second), int(third), int(fourth)]
+
+
+class _QuickHull(object):
+    """
+    State of :func:`quickhull`: the faces (triangles with counter-clockwise vertices) with their planes, the face of
+    every half-edge and the outside points of the faces. The faces are few compared to the points and are handled
+    with plain Python floats, the points with numpy.
+    """
+
+    def __init__(self, points, tolerance, rounding):
+        self.points = points
+        # Coordinates of the hull vertices as floats
+        self.coordinates = {}
+        self.tolerance = tolerance
+        # Faces are visible from an added point unless it is within the rounding errors of their plane. The
+        # tolerance only decides which points are added, hidden faces within the tolerance would fold the hull.
+        self.rounding = rounding
+        self.faces = []
+        self.planes = []
+        self.alive = []
+        self.outside = []
+        self.edges = {}
+
+    def add_vertex(self, index):
+        self.coordinates[index] = self.points[index].tolist()
+        return self.coordinates[index]
+
+    def add_faces(self, triangles):
+        """
+        :param triangles: List of vertex index triples
+        :return: Indices of the new faces
+        """
+        begin = len(self.faces)
+        for index, (a, b, c) in enumerate(triangles, begin):
+            (ax, ay, az), (bx, by, bz), (cx, cy, cz) = \
+                self.coordinates[a], self.coordinates[b], self.coordinates[c]
+            ux, uy, uz, vx, vy, vz = bx - ax, by - ay, bz - az, cx - ax, cy - ay, cz - az
+            x, y, z = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+            length = (x * x + y * y + z * z) ** 0.5
+            if length > 0:
+                self.planes.append((x / length, y / length, z / length, (x * ax + y * ay + z * az) / length))
+            else:
+                # Degenerate faces (their points are assigned to the neighbors) never see a point
+                self.planes.append((0.0, 0.0, 0.0, float('inf')))
+            self.edges[a, b] = self.edges[b, c] = self.edges[c, a] = index
+        self.faces.extend(triangles)
+        self.alive.extend([True] * len(triangles))
+        self.outside.extend([None] * len(triangles))
+        return range(begin, len(self.faces))
+
+    def assign(self, candidates, faces):
+        """
+        Assigns points to the face they are farthest outside of (points inside all faces are dropped).
+
+        :return: Faces that got outside points
+        """
+        if not len(candidates):
+            return []
+        planes = numpy.array([self.planes[i] for i in faces])
+        distances = self.points[candidates].dot(planes[:, :3].T) - planes[:, 3]
+        best = numpy.argmax(distances, axis=1)
+        outside = distances[numpy.arange(len(candidates)), best] > self.tolerance
+        candidates, best = candidates[outside], best[outside]
+        order = numpy.argsort(best, kind='stable')
+        candidates, best = candidates[order], best[order]
+        bounds = [0] + (numpy.flatnonzero(best[1:] != best[:-1]) + 1).tolist() + [len(best)]
+        result = []
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            if end > begin:
+                face = faces[int(best[begin])]
+                self.outside[face] = candidates[begin:end]
+                result.append(face)
+        return result
+
+    def add_point(self, face):
+        """
+        Adds the farthest outside point of a face to the hull.
+
+        :return: The new faces that have outside points
+        """
+        candidates = self.outside[face]
+        eye = int(candidates[numpy.argmax(self.points[candidates].dot(self.planes[face][:3]))])
+        x, y, z = self.add_vertex(eye)
+
+        # Walk the faces seen from the point, the horizon are the half-edges to faces that are not visible
+        visible, horizon, stack = {face}, [], [face]
+        while stack:
+            a, b, c = self.faces[stack.pop()]
+            for edge in ((a, b), (b, c), (c, a)):
+                neighbor = self.edges[edge[1], edge[0]]
+                if neighbor in visible:
+                    continue
+                nx, ny, nz, offset = self.planes[neighbor]
+                if nx * x + ny * y + nz * z - offset > self.rounding:
+                    visible.add(neighbor)
+                    stack.append(neighbor)
+                else:
+                    horizon.append(edge)
+
+        candidates = []
+        for index in visible:
+            a, b, c = self.faces[index]
+            del self.edges[a, b], self.edges[b, c], self.edges[c, a]
+            self.alive[index] = False
+            if self.outside[index] is not None:
+                candidates.append(self.outside[index])
+                self.outside[index] = None
+        candidates = numpy.concatenate(candidates)
+        return self.assign(candidates[candidates != eye], self.add_faces([(a, b, eye) for a, b in horizon]))
+
+    def triangles(self):
+        return numpy.array([f for f, alive in zip(self.faces, self.alive) if alive], dtype=numpy.intp)
+
+
+def quickhull(points, tolerance=None):
+    """
+    Computes the convex hull of a point set.
+
+    :param points: Array (N, 3)
+    :param tolerance: Distance below which points count as inside a face (defaults to :data:`TOLERANCE` times the
+        sum of the largest absolute coordinates)
+    :return: Tuple of the hull vertices (M, 3) and the triangles (T, 3) with outward facing normals
+        (counter-clockwise)
+    :raises ValueError: if the points do not span a volume
+    """
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    if len(points) < 4:
+        raise ValueError("The points do not span a volume (less than four points)")
+    scale = numpy.sum(numpy.abs(points).max(axis=0))
+    if tolerance is None:
+        tolerance = TOLERANCE * scale
+
+    simplex = _initial_simplex(points, tolerance)
+    hull = _QuickHull(points, tolerance, _ROUNDING * scale)
+    for i in simplex:
+        hull.add_vertex(i)
+    triangles = []
+    for i in range(4):
+        a, b, c = [simplex[j] for j in range(4) if j != i]
+        # The fourth point lies behind every face
+        if numpy.cross(points[b] - points[a], points[c] - points[a]).dot(points[simplex[i]] - points[a]) > 0:
+            b, c = c, b
+        triangles.append((a, b, c))
+    hull.add_faces(triangles)
+
+    pending = hull.assign(numpy.setdiff1d(numpy.arange(len(points)), simplex), range(4))
+    while pending:
+        face = pending.pop()
+        if hull.alive[face] and hull.outside[face] is not None:
+            pending.extend(hull.add_point(face))
+
+    triangles = hull.triangles()
+    used, triangles = numpy.unique(triangles, return_inverse=True)
+    return points[used], triangles.reshape(-1, 3)
+
+
+def _hull_job(job):
+    points, tolerance = job
+    try:
+        return quickhull(points, tolerance) + ('',)
+    except ValueError as e:
+        return None, None, str(e)
+
+
+def convex_hulls(point_sets, processes=1, tolerance=None):
+    """
+    Computes the convex hulls of many point sets.
+
+    :param point_sets: Sequence of arrays (N, 3)
+    :param processes: Number of worker processes (see :func:`robot_designer_plugin.pool.map_jobs`)
+    :param tolerance: See :func:`quickhull`
+    :return: List of tuples of the vertices, the triangles and an error message (the arrays are None if the hull
+        could not be computed, the message is empty otherwise)
+    """
+    return map_jobs(_hull_job, [(points, tolerance) for points in point_sets], processes)
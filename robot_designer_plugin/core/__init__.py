@@ -47,10 +47,11 @@ It consists of submodules for:
 2. simplify Gui development (:mod:`robot_designer_plugin.core.gui`),
 3. logging and debugging (:mod:`robot_designer_plugin.core.logfile`),
 4. configuration variables (:mod:`robot_designer_plugin.core.config`),
-5. automated plugin setup (registration to blender) (:mod:`robot_designer_plugin.core.pluginmanager`)
+5. automated plugin setup (registration to blender) (:mod:`robot_designer_plugin.core.pluginmanager`),
+6. profiling the start-up of the plugin (:mod:`robot_designer_plugin.core.profiling`)
 '''
 
-from . import constants, config, operators, conditions, logfile, pluginmanager, resources, gui, property
+from . import constants, config, operators, conditions, logfile, pluginmanager, resources, gui, property, profiling
 from importlib import reload
 
 reload(constants)
@@ -58,6 +59,7 @@ reload(gui)
 reload(config)
 reload(conditions)
 reload(logfile)
+reload(profiling)
 reload(operators)
 reload(pluginmanager)  # Should be last imported .. depends on gui and operators
 reload(property)  # Has to be imported after pluginmanager
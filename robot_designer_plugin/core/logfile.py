@@ -39,7 +39,15 @@ This sub package provides logging mechanism for the plugin development.
 Blender is not easy to debug (adding an external debugger is planned) such that providing informative
 output to a log file is mandatory.
 The log file is stored in the path stored in the plugin directory (:data:`.config.script_path`) in
-``resources/log.txt``.
+``resources/log.txt``. If that directory is not writable, the log file is created in the temporary directory.
+
+The loggers only put the records into a queue. A background thread (:data:`log_listener`) writes them to the log
+file which is rotated when the plugin is loaded (such that every session starts with a fresh log) and when it exceeds
+:data:`LOG_FILE_SIZE`. If the writer cannot keep up, at most
+:data:`LOG_QUEUE_SIZE` records are buffered and further records are dropped. The level of all loggers follows the
+``operator_debug_level`` property of the scene (see :func:`set_level`). Messages should be passed as format string
+and arguments (and expensive arguments wrapped in :class:`LazyFormat`) such that nothing is formatted for disabled
+levels.
 
 An example of a log file:
 
@@ -49,8 +57,12 @@ An example of a log file:
 Logging of operators can be automated with the decorators and base classes in the :mod:`.operators` module.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import tempfile
 import traceback
 import os
 
@@ -59,11 +71,110 @@ from .gui import InfoBox
 from ..core.config import BACKTRACE_MESSAGE_CALLSTACK, BACKTRACE_MESSAGE, BACKTRACE_FILTER_FUNC, \
     BACKTRACE_FILTER_HIDE_CODE, BACKTRACE_MESSAGE_STACK, BACKTRACE_MESSAGE_STACK_CODE, EXCEPTION_MESSAGE, script_path
 
-from importlib import reload
+LOG_FORMAT = '[%(levelname)5s|%(name)10s|%(filename)12s:%(lineno)03d|%(funcName)s()] %(message)s'
+LOG_FILE_SIZE = 5 * 1024 * 1024
+"""
+Size in bytes after which the log file is rotated.
+"""
+LOG_FILE_BACKUPS = 2
+"""
+Number of rotated log files that are kept (``log.txt.1``, ...).
+"""
+LOG_QUEUE_SIZE = 10000
+"""
+Maximum number of records waiting for the writer thread.
+"""
+
+LEVELS = {'debug': logging.DEBUG, 'info': logging.INFO, 'warning': logging.WARNING, 'error': logging.ERROR}
+"""
+Logging levels for the values of the ``operator_debug_level`` property.
+"""
 
-reload(logging)
-logging.basicConfig(format='[%(levelname)5s|%(name)10s|%(filename)12s:%(lineno)03d|%(funcName)s()] %(message)s',
-                    filename=os.path.join(script_path, 'resources/log.txt'), filemode='w')
+LOGGER_NAMES = ('Operators', 'Core', 'GUI', 'Properties', 'SDF', 'URFD', 'COLLADA')
+"""
+Names of the loggers whose level is set by :func:`set_level` (including those of the generic SDF/URDF packages and
+COLLADA).
+"""
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that drops records instead of raising an error if the queue is full.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LazyFormat(object):
+    """
+    Defers the computation of a logged value until the message is actually formatted, e.g.,
+    ``logger.debug("matrix: %s", LazyFormat(homo2origin, pose_bone.matrix))``.
+
+    :param function: Function computing the value
+    :param args: Arguments of the function
+    """
+    __slots__ = ('function', 'args')
+
+    def __init__(self, function, *args):
+        self.function = function
+        self.args = args
+
+    def __str__(self):
+        return str(self.function(*self.args))
+
+
+def _log_file_handler():
+    for directory in (os.path.join(script_path, 'resources'), tempfile.gettempdir()):
+        try:
+            handler = logging.handlers.RotatingFileHandler(os.path.join(directory, 'log.txt'),
+                                                           maxBytes=LOG_FILE_SIZE, backupCount=LOG_FILE_BACKUPS)
+            # The handler always appends (mode 'w' is ignored with maxBytes), the log of the last session is kept
+            # as the first backup
+            if handler.stream.tell():
+                handler.doRollover()
+        except OSError:
+            continue
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        return handler
+    return logging.NullHandler()
+
+
+def shutdown():
+    """
+    Writes the pending records, stops the writer thread and closes the log file.
+    """
+    if log_handler not in logging.getLogger().handlers:
+        return
+    log_listener.stop()
+    for handler in log_listener.handlers:
+        handler.close()
+    logging.getLogger().removeHandler(log_handler)
+
+
+# When the plugin is reloaded, the writer of the previous instance of this module is stopped first
+if 'log_listener' in globals():
+    shutdown()
+else:
+    atexit.register(shutdown)
+
+log_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+"""
+Handler of the root logger that puts the records into the queue of :data:`log_listener`.
+"""
+log_listener = logging.handlers.QueueListener(log_handler.queue, _log_file_handler())
+"""
+Writer thread of the log file.
+"""
+logging.getLogger().addHandler(log_handler)
+log_listener.start()
 
 operator_logger = logging.getLogger('Operators')
 '''
@@ -82,10 +193,18 @@ prop_logger = logging.getLogger('Properties')
 Logging object associated with :term:`properties`. All loggers store to ``resources/log.txt``
 '''
 
-operator_logger.setLevel(logging.DEBUG)
-core_logger.setLevel(logging.DEBUG)
-gui_logger.setLevel(logging.DEBUG)
-prop_logger.setLevel(logging.DEBUG)
+
+def set_level(level):
+    """
+    Sets the level of all loggers of the plugin.
+
+    :param level: One of the keys of :data:`LEVELS` (i.e., a value of the ``operator_debug_level`` property)
+    """
+    for name in LOGGER_NAMES:
+        logging.getLogger(name).setLevel(LEVELS.get(level, logging.INFO))
+
+
+set_level('info')
 
 
 def LogFunction(func):
@@ -152,10 +271,7 @@ def log_callstack_last(back_trace=False):
 
     message = "empty"
 
-    print("Parsing stack")
-
     for path, line, func, code in stack:
-        print(path,func)
         if func not in BACKTRACE_FILTER_FUNC:
             if func not in BACKTRACE_FILTER_HIDE_CODE:
                 file = os.path.split(path)[-1]
@@ -37,13 +37,14 @@
 This submodule provides the base class and decorators, and some functions for defining Blender :term:`operators` that
 register automatically.
 """
-import inspect
+import sys
 
 import bpy
 from .config import PLUGIN_PREFIX, EXCEPTION_MESSAGE
 from .logfile import log_callstack, log_callstack_last, operator_logger as logger
 from .conditions import Condition
 from .gui import InfoBox
+from . import profiling
 
 
 def get_registered_operator(operator):
@@ -59,6 +60,59 @@ def get_registered_operator(operator):
     return getattr(getattr(bpy.ops, PLUGIN_PREFIX), operator.bl_idname.replace(PLUGIN_PREFIX + '.', ''))
 
 
+def bind_run_keywords(cls):
+    """
+    Replaces the overridden ``run()`` method of an :class:`RDOperator` subclass that forwards its arguments with
+    :meth:`RDOperator.pass_keywords` by an equivalent method that does not need to inspect the call stack.
+    The argument names and default values are read once from the signature of the override when the class is
+    registered (see :meth:`.pluginmanager.PluginManager.register_class`).
+
+    Overrides that do not call :meth:`RDOperator.pass_keywords` are left untouched.
+
+    :param cls: A subclass of :class:`RDOperator`.
+    :return: The class.
+    """
+    owner = next(i for i in cls.__mro__ if 'run' in i.__dict__)
+    run = owner.__dict__['run'].__func__
+    if owner is RDOperator or getattr(run, 'keywords', None) is not None \
+            or 'pass_keywords' not in run.__code__.co_names:
+        return cls
+
+    code = run.__code__
+    names = code.co_varnames[1:code.co_argcount]  # Skip cls
+    defaults = dict(zip(names[len(names) - len(run.__defaults__ or ()):], run.__defaults__ or ()))
+    required = frozenset(names) - defaults.keys()
+    allowed = frozenset(names)
+
+    def keyword_run(klass, *args, **kwargs):
+        if args:
+            if len(args) > len(names):
+                raise TypeError("%s.run() takes %d positional arguments but %d were given" %
+                                (klass.__name__, len(names), len(args)))
+            for name, value in zip(names, args):
+                if name in kwargs:
+                    raise TypeError("%s.run() got multiple values for argument '%s'" % (klass.__name__, name))
+                kwargs[name] = value
+        if not allowed.issuperset(kwargs):
+            raise TypeError("%s.run() got unexpected keyword arguments: %s" %
+                            (klass.__name__, ', '.join(sorted(kwargs.keys() - allowed))))
+        if not required.issubset(kwargs):
+            raise TypeError("%s.run() missing required arguments: %s" %
+                            (klass.__name__, ', '.join(sorted(required - kwargs.keys()))))
+        for name, value in defaults.items():
+            kwargs.setdefault(name, value)
+        return super(owner, klass).run(**kwargs)
+
+    keyword_run.__name__ = run.__name__
+    keyword_run.__qualname__ = run.__qualname__
+    keyword_run.__doc__ = run.__doc__
+    keyword_run.__module__ = run.__module__
+    keyword_run.__wrapped__ = run
+    keyword_run.keywords = names
+    setattr(owner, 'run', classmethod(keyword_run))
+    return cls
+
+
 class RDOperator(bpy.types.Operator):
     """
     Base class for the :term:`operators<operator>` in the RobotDesigner.
@@ -147,13 +201,17 @@ class RDOperator(bpy.types.Operator):
         """
         Helper function that extracts the arguments of the callee (must be a (class) method) and returns them.
 
+        For registered operators, this function is not called anymore as the overridden ``run()`` methods are
+        replaced when the class is registered (see :func:`bind_run_keywords`). It remains as a fallback for
+        classes that are not registered with :class:`.pluginmanager.PluginManager`.
+
         Credits to `Kelly Yancey <http://kbyanc.blogspot.de/2007/07/python-aggregating-function-arguments.html>`_
         """
 
-        args, _, _, locals = inspect.getargvalues(inspect.stack()[1][0])
-        args.pop(0)
-        kwargs = {i: j for i, j in locals.items() if i in args}
-        return kwargs
+        frame = sys._getframe(1)
+        code = frame.f_code
+        locals = frame.f_locals
+        return {i: locals[i] for i in code.co_varnames[1:code.co_argcount]}
 
     @classmethod
     def run(cls, **kwargs):
@@ -255,7 +313,8 @@ class RDOperator(bpy.types.Operator):
         """
         Decorator for the `bpy.types.Operator.execute` method (only for sub classes of :class:`RDOperator`).
 
-        Performs logging and exception handling.
+        Performs logging and exception handling. If :data:`.profiling.operator_profiler` is enabled, the call is
+        recorded in its call tree.
         """
 
         def op_logger(self, context):
@@ -269,6 +328,9 @@ class RDOperator(bpy.types.Operator):
             class_name = self.__class__.__name__
             id = self.__class__.bl_idname
 
+            profiler = profiling.operator_profiler
+            token = profiler.begin(id) if profiler.enabled else None
+
             # Execute the Operator
             try:
                 # self.logger.debug("Entering %s() from %s(%s):\n%s",
@@ -292,6 +354,9 @@ class RDOperator(bpy.types.Operator):
                 else:
                     # Menu has no report and must return None
                     return
+            finally:
+                if token is not None:
+                    profiler.end(token)
 
         return op_logger
 
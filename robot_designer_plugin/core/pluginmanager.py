@@ -45,7 +45,7 @@ import bpy.utils
 
 from .config import EXCEPTION_MESSAGE, resource_path
 from .logfile import core_logger, log_callstack
-from .operators import RDOperator
+from .operators import RDOperator, bind_run_keywords
 from .gui import CollapsibleBase
 
 
@@ -67,6 +67,10 @@ class PluginManager(object):
     _icons_to_register = []
     _property_fields = {}
 
+    _handlers_to_register = []
+    _registered_handlers = []
+    _handler_fallbacks = {'depsgraph_update_pre': 'scene_update_pre', 'depsgraph_update_post': 'scene_update_post'}
+
     @staticmethod
     def register_property_group(base=None):
 
@@ -99,6 +103,8 @@ class PluginManager(object):
 
         def decorator(cls):
             if issubclass(cls, (RDOperator, bpy.types.Menu, bpy.types.Panel, bpy.types.Panel)):
+                if issubclass(cls, RDOperator):
+                    bind_run_keywords(cls)
                 PluginManager._classes_to_register.append((cls, dependencies))
             elif issubclass(cls, CollapsibleBase):
                 PluginManager._bools_to_register.append(cls.property_name)
@@ -124,6 +130,22 @@ class PluginManager(object):
             dependencies = args
             return decorator
 
+    @staticmethod
+    def register_handler(event):
+        """
+        Decorator for functions that are appended to the application handler list ``bpy.app.handlers.<event>`` on
+        registration. Handlers of the dependency graph that are not available in the running Blender version are
+        replaced by their scene update counterparts (e.g., ``depsgraph_update_post`` by ``scene_update_post``).
+
+        :param event: Name of the handler list
+        """
+
+        def decorator(function):
+            PluginManager._handlers_to_register.append((event, function))
+            return function
+
+        return decorator
+
     @classmethod
     def register_property_groups(cls, property_group, btype):
         """
@@ -220,6 +242,7 @@ class PluginManager(object):
         cls._property_groups_to_register.clear()
         cls._bools_to_register.clear()
         cls._icons_to_register.clear()
+        cls._handlers_to_register.clear()
 
     @classmethod
     def get_property(cls, obj, prop):
@@ -265,6 +288,14 @@ class PluginManager(object):
                 setattr(bpy.types.Scene, prop, bpy.props.BoolProperty())
                 cls._registered_bools.append(prop)
 
+            for event, function in cls._handlers_to_register:
+                if not hasattr(bpy.app.handlers, event):
+                    event = cls._handler_fallbacks[event]
+                handler = bpy.app.handlers.persistent(function)
+                getattr(bpy.app.handlers, event).append(handler)
+                report.append("\t+ handler {0:33} on {1:40}".format(function.__name__, event))
+                cls._registered_handlers.append((event, handler))
+
             if cls._icons_to_register:
                 cls._bl_icons_dict = bpy.utils.previews.new()
 
@@ -303,6 +334,12 @@ class PluginManager(object):
             for prop in cls._registered_bools:
                 delattr(bpy.types.Scene, prop)
 
+            for event, handler in cls._registered_handlers:
+                handlers = getattr(bpy.app.handlers, event)
+                if handler in handlers:
+                    handlers.remove(handler)
+                report.append("\t- handler {0:33} on {1:40}".format(handler.__name__, event))
+
             core_logger.info("\n".join(report))
 
             if cls._bl_icons_dict:
@@ -317,3 +354,4 @@ class PluginManager(object):
         cls._registered_classes.clear()
         cls._property_groups_to_register.clear()
         cls._registered_bools.clear()
+        cls._registered_handlers.clear()
@@ -0,0 +1,264 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Timing of the add-on start-up (i.e., the import of the sub packages and the registration to Blender) and the opt-in
+:class:`OperatorProfiler` that records the nested calls of the :term:`operators<operator>`.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+startup_times = OrderedDict()
+"""
+Seconds spent in the start-up phases measured with :func:`timed` (in order of their first occurrence).
+"""
+
+
+@contextmanager
+def timed(name):
+    """
+    Context manager that adds the time spent in its body to :data:`startup_times`.
+
+    :param name: Name of the phase
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_times[name] = startup_times.get(name, 0.0) + time.perf_counter() - start
+
+
+def import_profile_report(load_times=None):
+    """
+    Formats :data:`startup_times` and the load times of lazily imported modules.
+
+    :param load_times: Dictionary of module names and the seconds spent loading them
+    :return: The report as string
+    """
+    lines = ["Add-on start-up profile:"]
+    for name, seconds in startup_times.items():
+        lines.append("  %-40s %9.1f ms" % (name, seconds * 1000))
+    lines.append("  %-40s %9.1f ms" % ("total", sum(startup_times.values()) * 1000))
+
+    lines.append("Lazily loaded modules:")
+    for name, seconds in sorted((load_times or {}).items()):
+        lines.append("  %-40s %9.1f ms" % (name, seconds * 1000))
+    if not load_times:
+        lines.append("  (none)")
+    return "\n".join(lines)
+
+
+class CallNode(object):
+    """
+    Node of the call tree of :class:`OperatorProfiler`. Calls of the same operator from the same parent are merged.
+    """
+    __slots__ = ('name', 'calls', 'wall', 'cpu', 'children')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.children = OrderedDict()
+
+    def child(self, name):
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = CallNode(name)
+        return node
+
+    def self_wall(self):
+        """
+        :return: The wall time not spent in nested operators
+        """
+        return self.wall - sum(i.wall for i in self.children.values())
+
+
+class OperatorProfiler(object):
+    """
+    Records the wall and CPU time of nested operator calls. It is switched on by the *Profile operators* option of
+    the tools tab and filled by :meth:`robot_designer_plugin.core.operators.RDOperator.OperatorLogger`.
+
+    Besides the aggregated call tree, every call is recorded as a pair of open/close events in order to export a
+    timeline for the Chrome tracing viewer (``chrome://tracing``) or `speedscope <https://www.speedscope.app>`_.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        """
+        Discards all recorded calls.
+        """
+        self.root = CallNode('root')
+        self._stack = [self.root]
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def begin(self, name):
+        """
+        Enters an operator.
+
+        :param name: The name of the operator (usually its ``bl_idname``)
+        :return: Token to pass to :meth:`end`
+        """
+        node = self._stack[-1].child(name)
+        self._stack.append(node)
+        start = time.perf_counter()
+        self.events.append(('O', name, start - self.origin))
+        return node, start, time.process_time()
+
+    def end(self, token):
+        """
+        Leaves the operator entered by :meth:`begin`.
+        """
+        node, start, cpu_start = token
+        stop = time.perf_counter()
+        node.calls += 1
+        node.wall += stop - start
+        node.cpu += time.process_time() - cpu_start
+        self.events.append(('C', node.name, stop - self.origin))
+        # Operators that are left by an exception of an inner operator still close their own node
+        while len(self._stack) > 1 and self._stack.pop() is not node:
+            pass
+
+    @contextmanager
+    def record(self, name):
+        """
+        Context manager that records its body as a call of ``name``.
+        """
+        token = self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(token)
+
+    def statistics(self):
+        """
+        Accumulates the call tree per operator. The times of recursive calls are only counted once.
+
+        :return: Dictionary of operator names and lists of calls, wall time, CPU time and self time
+        """
+        result = OrderedDict()
+
+        def visit(node, active):
+            entry = result.setdefault(node.name, [0, 0.0, 0.0, 0.0])
+            entry[0] += node.calls
+            entry[3] += node.self_wall()
+            if node.name not in active:
+                entry[1] += node.wall
+                entry[2] += node.cpu
+            for child in node.children.values():
+                visit(child, active | {node.name})
+
+        for node in self.root.children.values():
+            visit(node, frozenset())
+        return result
+
+    def top(self, count=10):
+        """
+        :param count: Maximum number of entries
+        :return: List of tuples of operator name, calls, wall time, CPU time and self time sorted by the wall time
+        """
+        return sorted(((name,) + tuple(entry) for name, entry in self.statistics().items()),
+                      key=lambda entry: entry[2], reverse=True)[:count]
+
+    def chrome_trace(self):
+        """
+        :return: The recorded calls as dictionary in the Chrome trace event format (complete events in microseconds)
+        """
+        trace = []
+        open_events = []
+        for kind, name, at in self.events:
+            if kind == 'O':
+                open_events.append(at)
+            else:
+                start = open_events.pop()
+                trace.append({'name': name, 'cat': 'operator', 'ph': 'X', 'pid': 1, 'tid': 1,
+                              'ts': start * 1e6, 'dur': (at - start) * 1e6})
+        trace.sort(key=lambda event: (event['ts'], -event['dur']))
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def speedscope(self):
+        """
+        :return: The recorded calls as dictionary in the evented speedscope file format (milliseconds)
+        """
+        frames = OrderedDict()
+        events = []
+        for kind, name, at in self.events:
+            events.append({'type': kind, 'frame': frames.setdefault(name, len(frames)), 'at': at * 1000})
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': [{'name': name} for name in frames]},
+            'profiles': [{'type': 'evented', 'name': 'RobotDesigner operators', 'unit': 'milliseconds',
+                          'startValue': events[0]['at'] if events else 0,
+                          'endValue': events[-1]['at'] if events else 0, 'events': events}],
+            'exporter': 'RobotDesigner',
+        }
+
+    def write(self, file_name, format='chrome'):
+        """
+        Writes the recorded calls of completed operators to a JSON file.
+
+        :param file_name: The output file
+        :param format: Either ``'chrome'`` or ``'speedscope'``
+        """
+        # Drop the events of operators that are still running (i.e., the operator writing the file)
+        events, self.events = self.events, self._closed_events()
+        try:
+            data = self.speedscope() if format == 'speedscope' else self.chrome_trace()
+        finally:
+            self.events = events
+        with open(file_name, 'w') as f:
+            json.dump(data, f)
+
+    def _closed_events(self):
+        depth = len(self._stack) - 1
+        if not depth:
+            return list(self.events)
+        # Remove the last ``depth`` unmatched open events
+        unmatched = []
+        balance = 0
+        for index in range(len(self.events) - 1, -1, -1):
+            if self.events[index][0] == 'C':
+                balance += 1
+            elif balance:
+                balance -= 1
+            else:
+                unmatched.append(index)
+                if len(unmatched) == depth:
+                    break
+        unmatched = set(unmatched)
+        return [event for index, event in enumerate(self.events) if index not in unmatched]
+
+
+operator_profiler = OperatorProfiler()
+"""
+The profiler used by :meth:`robot_designer_plugin.core.operators.RDOperator.OperatorLogger`.
+"""
@@ -0,0 +1,96 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Micro-benchmark for the keyword forwarding of :meth:`robot_designer_plugin.core.operators.RDOperator.run` overrides.
+
+Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/core/test_operators.py
+"""
+
+import inspect
+import os
+import sys
+import timeit
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from robot_designer_plugin.core.operators import RDOperator, bind_run_keywords
+
+
+def stack_pass_keywords():
+    """
+    The former implementation of :meth:`RDOperator.pass_keywords` as a reference.
+    """
+    args, _, _, locals = inspect.getargvalues(inspect.stack()[1][0])
+    args.pop(0)
+    return {i: j for i, j in locals.items() if i in args}
+
+
+class Sink(RDOperator):
+    @classmethod
+    def run(cls, **kwargs):
+        return kwargs
+
+
+class StackOperator(Sink):
+    @classmethod
+    def run(cls, segment_name="", recurse=True):
+        return super().run(**stack_pass_keywords())
+
+
+class BoundOperator(Sink):
+    @classmethod
+    def run(cls, segment_name="", recurse=True):
+        return super().run(**cls.pass_keywords())
+
+
+bind_run_keywords(BoundOperator)
+
+
+class KeywordForwarding(unittest.TestCase):
+    def runTest(self):
+        self.assertEqual(BoundOperator.run('a'), {'segment_name': 'a', 'recurse': True})
+        self.assertEqual(BoundOperator.run(recurse=False), {'segment_name': '', 'recurse': False})
+        self.assertEqual(BoundOperator.run('a'), StackOperator.run('a'))
+        self.assertRaises(TypeError, BoundOperator.run, unknown=1)
+        self.assertRaises(TypeError, BoundOperator.run, 'a', segment_name='b')
+
+
+class KeywordForwardingBenchmark(unittest.TestCase):
+    def runTest(self):
+        number = 200
+        stack = min(timeit.repeat(lambda: StackOperator.run(segment_name='a'), number=number, repeat=3)) / number
+        bound = min(timeit.repeat(lambda: BoundOperator.run(segment_name='a'), number=number, repeat=3)) / number
+
+        sys.stderr.write("pass_keywords per call: inspect.stack() %.2fus, bound %.2fus (%.0fx)\n" %
+                         (stack * 1e6, bound * 1e6, stack / bound))
+        self.assertLess(bound * 10, stack)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
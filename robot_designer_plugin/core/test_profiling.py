@@ -0,0 +1,117 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests for :class:`robot_designer_plugin.core.profiling.OperatorProfiler`. Runs without Blender:
+
+    python3 robot_designer_plugin/core/test_profiling.py
+"""
+
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    'profiling', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiling.py'))
+profiling = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(profiling)
+
+
+class OperatorProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.profiler = profiling.OperatorProfiler()
+        # generate_all -> (select, generate -> assign) twice
+        with self.profiler.record('generate_all'):
+            for _ in range(2):
+                with self.profiler.record('select'):
+                    pass
+                with self.profiler.record('generate'):
+                    with self.profiler.record('assign'):
+                        sum(range(10000))
+
+    def test_tree(self):
+        root = self.profiler.root
+        self.assertEqual(list(root.children), ['generate_all'])
+        generate_all = root.children['generate_all']
+        self.assertEqual(generate_all.calls, 1)
+        self.assertEqual(list(generate_all.children), ['select', 'generate'])
+        self.assertEqual(generate_all.children['generate'].calls, 2)
+        self.assertEqual(generate_all.children['generate'].children['assign'].calls, 2)
+        self.assertGreaterEqual(generate_all.wall, generate_all.children['generate'].wall)
+
+    def test_top(self):
+        top = self.profiler.top(2)
+        self.assertEqual([i[0] for i in top], ['generate_all', 'generate'])
+        self.assertEqual(top[1][1], 2)
+
+    def test_recursion(self):
+        profiler = profiling.OperatorProfiler()
+        with profiler.record('update'):
+            with profiler.record('update'):
+                pass
+        calls, wall, cpu, self_wall = profiler.statistics()['update']
+        self.assertEqual(calls, 2)
+        self.assertAlmostEqual(wall, profiler.root.children['update'].wall)
+
+    def test_exception(self):
+        profiler = profiling.OperatorProfiler()
+        with self.assertRaises(RuntimeError):
+            with profiler.record('outer'):
+                profiler.begin('inner')  # never ended
+                raise RuntimeError()
+        with profiler.record('next'):
+            pass
+        self.assertEqual(list(profiler.root.children), ['outer', 'next'])
+
+    def test_chrome_trace(self):
+        trace = self.profiler.chrome_trace()['traceEvents']
+        self.assertEqual(len(trace), 7)
+        self.assertEqual(trace[0]['name'], 'generate_all')
+        self.assertTrue(all(i['ph'] == 'X' and i['dur'] >= 0 for i in trace))
+
+    def test_speedscope(self):
+        profile = self.profiler.speedscope()
+        frames = [i['name'] for i in profile['shared']['frames']]
+        events = profile['profiles'][0]['events']
+        self.assertEqual(frames, ['generate_all', 'select', 'generate', 'assign'])
+        self.assertEqual(len(events), 14)
+        self.assertEqual([i['type'] for i in events[:2]], ['O', 'O'])
+        self.assertEqual(events[0]['frame'], 0)
+
+    def test_write_while_running(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'profile.json')
+            with self.profiler.record('export_operator_profile'):
+                self.profiler.write(file_name, 'speedscope')
+            with open(file_name) as f:
+                events = json.load(f)['profiles'][0]['events']
+            self.assertEqual(len(events), 14)
+            self.assertEqual(len(self.profiler.events), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,405 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Approximate convex decomposition of meshes in the spirit of V-HACD (requires numpy, but not Blender).
+
+The mesh is voxelized (:func:`voxelize`) and its surface is sampled (:func:`surface_samples`). A part of the mesh is
+the intersection of the solid with an axis aligned box of voxels, its hull is the convex hull of the surface samples
+in the box and of the cross sections at the cutting planes. The concavity of a part is the volume of its hull that
+is not filled by the mesh, relative to the volume of the hull of the whole mesh.
+
+Starting with the whole mesh, the part with the largest concavity is cut by the axis aligned plane that minimizes the
+concavities of both halves (with a small penalty for unbalanced cuts) until all parts are below the concavity
+threshold or the maximum number of hulls is reached. Finally, adjacent parts are merged as long as the merged hull
+stays below the threshold.
+
+:func:`convex_decompositions` decomposes many meshes in a pool of worker processes.
+"""
+
+import heapq
+
+import numpy
+
+from .convex_hull import quickhull
+from .pool import map_jobs
+
+CANDIDATES = 6
+"""
+Number of cutting planes per axis that are evaluated when a part is split.
+"""
+
+BALANCE = 0.05
+"""
+Weight of the volume difference of the halves of a cut (relative to the volume of the part).
+"""
+
+_EVALUATION_POINTS = 2000
+_JITTER = (0.0137, 0.0291)
+
+
+def surface_samples(vertices, triangles, spacing):
+    """
+    Samples triangles with a regular barycentric grid.
+
+    :param vertices: Array (N, 3)
+    :param triangles: Integer array (T, 3)
+    :param spacing: Maximal distance of the samples along the edges
+    :return: Tuple of the samples (S, 3) (including the vertices) and directions (S, 3) that point from the samples
+        towards the center of their triangle and against its normal (into the mesh if its normals face outwards)
+    """
+    corners = numpy.asarray(vertices, dtype=numpy.float64)[numpy.asarray(triangles, dtype=numpy.intp)]
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = numpy.linalg.norm(normals, axis=1)
+    normals /= numpy.where(lengths > 0, lengths, 1.0)[:, numpy.newaxis]
+    edges = numpy.linalg.norm(corners - corners[:, [1, 2, 0]], axis=2).max(axis=1)
+    subdivisions = numpy.maximum(numpy.ceil(edges / spacing), 1).astype(numpy.intp)
+    samples, directions = [numpy.zeros((0, 3))], [numpy.zeros((0, 3))]
+    for n in numpy.unique(subdivisions):
+        # Barycentric coordinates (a, b, n - a - b) / n of the grid
+        a, b = numpy.tril_indices(n + 1)
+        weights = numpy.stack([n - a, a - b, b], axis=1) / n
+        selected = subdivisions == n
+        points = numpy.einsum('pk,tkj->tpj', weights, corners[selected])
+        centers = numpy.mean(corners[selected], axis=1)[:, numpy.newaxis]
+        samples.append(points.reshape(-1, 3))
+        directions.append(((centers - points) / spacing - normals[selected, numpy.newaxis]).reshape(-1, 3))
+    return numpy.concatenate(samples), numpy.concatenate(directions)
+
+
+def voxelize(vertices, triangles, origin, voxel_size, shape, rays=4):
+    """
+    Computes the fraction of every voxel that is inside of a closed mesh. Rays along the z axis (``rays`` x ``rays``
+    per column of voxels, slightly displaced to avoid hitting edges) are intersected with the triangles and the
+    lengths of the inside intervals (between the first and second, third and fourth crossing and so on) are summed.
+
+    :param vertices: Array (N, 3)
+    :param triangles: Integer array (T, 3)
+    :param origin: Lower corner of the voxel grid
+    :param voxel_size: Edge length of the voxels
+    :param shape: Number of voxels along the axes
+    :param rays: Number of rays per voxel along the x and y axes
+    :return: Float array of the given shape
+    """
+    # Coordinates in units of the rays along x and y and of the voxels along z
+    scale = numpy.array([rays, rays, 1]) / voxel_size
+    corners = (numpy.asarray(vertices, dtype=numpy.float64)[numpy.asarray(triangles, dtype=numpy.intp)] -
+               origin) * scale
+    columns_shape = numpy.array(shape[:2]) * rays
+    # The ray of column i is at i + 0.5 + jitter
+    offsets = numpy.array(_JITTER) + 0.5
+    low = numpy.maximum(numpy.ceil(corners[:, :, :2].min(axis=1) - offsets).astype(numpy.intp), 0)
+    high = numpy.minimum(numpy.floor(corners[:, :, :2].max(axis=1) - offsets).astype(numpy.intp), columns_shape - 1)
+    sizes = numpy.maximum(high - low + 1, 0)
+    counts = sizes[:, 0] * sizes[:, 1]
+
+    # Pairs of triangles and the rays of their bounding boxes
+    index = numpy.repeat(numpy.arange(len(corners)), counts)
+    local = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    columns = low[index] + numpy.stack([local // sizes[index, 1], local % sizes[index, 1]], axis=1)
+    x, y = (columns + offsets).T
+
+    a, b, c = corners[index, 0], corners[index, 1], corners[index, 2]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    u = (b[:, 0] - x) * (c[:, 1] - y) - (b[:, 1] - y) * (c[:, 0] - x)
+    v = (c[:, 0] - x) * (a[:, 1] - y) - (c[:, 1] - y) * (a[:, 0] - x)
+    w = area - u - v
+    sign = numpy.sign(area)
+    hit = (area != 0) & (numpy.sign(u) == sign) & (numpy.sign(v) == sign) & (numpy.sign(w) == sign)
+    z = (u[hit] * a[hit, 2] + v[hit] * b[hit, 2] + w[hit] * c[hit, 2]) / area[hit]
+    rays_index = columns[hit, 0] * columns_shape[1] + columns[hit, 1]
+
+    # Crossings alternately enter and leave the mesh along a ray
+    order = numpy.lexsort((z, rays_index))
+    z, rays_index = z[order], rays_index[order]
+    starts = numpy.flatnonzero(numpy.r_[True, rays_index[1:] != rays_index[:-1]])
+    rank = numpy.arange(len(z)) - numpy.repeat(starts, numpy.diff(numpy.r_[starts, len(z)]))
+    direction = numpy.where(rank % 2, -1.0, 1.0)
+
+    # A crossing at z adds (or removes) the part of its voxel above z and all voxels above
+    z = numpy.clip(z, 0, shape[2])
+    layer = numpy.minimum(numpy.floor(z).astype(numpy.intp), shape[2] - 1)
+    partial = numpy.zeros((columns_shape[0] * columns_shape[1], shape[2]))
+    above = numpy.zeros((columns_shape[0] * columns_shape[1], shape[2] + 1))
+    numpy.add.at(partial, (rays_index, layer), direction * numpy.clip(layer + 1 - z, 0, 1))
+    numpy.add.at(above, (rays_index, layer + 1), direction)
+    inside = numpy.clip(partial + numpy.cumsum(above, axis=1)[:, :shape[2]], 0, 1)
+    return inside.reshape(shape[0], rays, shape[1], rays, shape[2]).mean(axis=(1, 3))
+
+
+def _volume(vertices, triangles):
+    corners = vertices[triangles]
+    return numpy.sum(corners[:, 0] * numpy.cross(corners[:, 1], corners[:, 2])) / 6
+
+
+class _Decomposition(object):
+    """
+    The voxels and surface samples of a mesh and the hulls of its parts (boxes of voxels).
+    """
+
+    def __init__(self, vertices, triangles, resolution):
+        vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+        if not len(vertices) or not len(triangles):
+            raise ValueError("The mesh does not span a volume")
+        lower, upper = vertices.min(axis=0), vertices.max(axis=0)
+        self.voxel_size = max(upper - lower) / resolution
+        if not self.voxel_size > 0:
+            raise ValueError("The mesh does not span a volume")
+        self.shape = numpy.maximum(numpy.ceil((upper - lower) / self.voxel_size - 1e-9), 1).astype(numpy.intp)
+        # The grid is centered on the mesh
+        self.origin = (lower + upper - self.shape * self.voxel_size) / 2
+        self.tolerance = self.voxel_size / 20
+
+        triangles = numpy.asarray(triangles, dtype=numpy.intp).reshape(-1, 3)
+        if _volume(vertices, triangles) < 0:
+            # Inverted normals
+            triangles = triangles[:, ::-1]
+        self.samples, directions = surface_samples(vertices, triangles, self.voxel_size / 2)
+        # The voxel of a sample is the one slightly inside of its triangle and the mesh (samples on the faces of
+        # voxels belong to the voxel that contains the solid)
+        inside = self.samples + 1e-3 * self.voxel_size * directions
+        self.sample_voxels = numpy.clip(numpy.floor((inside - self.origin) / self.voxel_size),
+                                        0, self.shape - 1).astype(numpy.intp)
+        filled = voxelize(vertices, triangles, self.origin, self.voxel_size, tuple(self.shape))
+        # The completely filled voxels cover the interior of the cross sections
+        self.full = filled > 1 - 1e-9
+        # Summed volume table of the filled fractions of the voxels
+        self.table = numpy.zeros(self.shape + 1)
+        self.table[1:, 1:, 1:] = filled.cumsum(0).cumsum(1).cumsum(2)
+
+        # The hull of the whole mesh
+        self.whole = self.hull(self.samples, evaluation=False)
+        self.hull_volume = max(self.whole[2], 1e-300)
+
+    def volume(self, lower, upper):
+        """
+        :return: Volume of the mesh in the box (in voxels)
+        """
+        t = self.table
+        (a, b, c), (d, e, f) = lower, upper
+        return float(t[d, e, f] - t[a, e, f] - t[d, b, f] - t[d, e, c] + t[a, b, f] + t[a, e, c] + t[d, b, c] -
+                   t[a, b, c])
+
+    def points(self, lower, upper):
+        """
+        :return: Surface samples in the box and the cross sections of the solid at the inner faces of the box (the
+            samples within half a voxel of a face and the voxels that are completely filled, projected onto it)
+        """
+        inside = numpy.all((self.sample_voxels >= lower) & (self.sample_voxels < upper), axis=1)
+        samples = self.samples[inside]
+        points = [samples]
+        for axis in range(3):
+            for layer, face in ((lower[axis], lower[axis]), (upper[axis] - 1, upper[axis])):
+                if face in (0, self.shape[axis]):
+                    continue
+                plane = self.origin[axis] + face * self.voxel_size
+                near = samples[numpy.abs(samples[:, axis] - plane) < self.voxel_size / 2]
+                low, high = numpy.array(lower), numpy.array(upper)
+                low[axis], high[axis] = layer, layer + 1
+                indices = numpy.argwhere(self.full[tuple(slice(i, j) for i, j in zip(low, high))]) + low
+                section = numpy.concatenate([near, self.origin + (indices + 0.5) * self.voxel_size])
+                section[:, axis] = plane
+                points.append(section)
+        return numpy.concatenate(points)
+
+    def hull(self, points, evaluation=True):
+        """
+        :param evaluation: Compute the hull of a subset of the points (for the evaluation of cuts)
+        :return: Tuple of the vertices, the triangles and the volume of the hull (None, None, 0 without volume)
+        """
+        if evaluation and len(points) > _EVALUATION_POINTS:
+            points = points[::int(numpy.ceil(len(points) / _EVALUATION_POINTS))]
+        try:
+            vertices, triangles = quickhull(points, self.tolerance)
+        except ValueError:
+            return None, None, 0.0
+        return vertices, triangles, _volume(vertices, triangles)
+
+    def simplify(self, vertices, triangles, max_vertices):
+        """
+        Reduces the vertices of a hull by computing the hull of its vertices with growing tolerances (the result is
+        inside of the hull).
+
+        :return: Tuple of the vertices and triangles
+        """
+        tolerance = self.tolerance
+        while len(vertices) > max_vertices:
+            tolerance *= 1.25
+            try:
+                vertices, triangles = quickhull(vertices, tolerance)
+            except ValueError:
+                break
+        return vertices, triangles
+
+    def concavity(self, hull_volume, volume):
+        """
+        :param volume: Volume of the mesh in the hull (in voxels)
+        """
+        return max(hull_volume - volume * self.voxel_size ** 3, 0.0) / self.hull_volume
+
+    def evaluate(self, lower, upper):
+        """
+        :return: Tuple of the concavity and the volume (in voxels) of a box
+        """
+        volume = self.volume(lower, upper)
+        return self.concavity(self.hull(self.points(lower, upper))[2], volume), volume
+
+    def split(self, lower, upper, volume):
+        """
+        Finds the best cut of a box: the best of :data:`CANDIDATES` cuts per axis is refined by evaluating the
+        neighboring layers of voxels.
+
+        :return: Tuple of the cost and the evaluated halves (concavity, volume, lower, upper) or None if the box
+            cannot be cut
+        """
+        def evaluate(axis, cut):
+            first_upper, second_lower = list(upper), list(lower)
+            first_upper[axis] = second_lower[axis] = cut
+            first, second = self.evaluate(lower, first_upper), self.evaluate(second_lower, upper)
+            if first[1] and second[1]:
+                cost = first[0] + second[0] + BALANCE * abs(first[1] - second[1]) / volume
+                return cost, (first + (lower, first_upper), second + (second_lower, upper))
+
+        best, best_cut, step = None, None, 1
+        for axis in range(3):
+            length = upper[axis] - lower[axis]
+            cuts = sorted(set(lower[axis] + (length * numpy.arange(1, CANDIDATES + 1)) // (CANDIDATES + 1)))
+            for cut in cuts:
+                if lower[axis] < cut < upper[axis]:
+                    result = evaluate(axis, int(cut))
+                    if result and (best is None or result[0] < best[0]):
+                        best, best_cut, step = result, (axis, int(cut)), max(length // (CANDIDATES + 1), 1)
+        if best is None:
+            return None
+
+        axis, cut = best_cut
+        for refined in range(max(cut - step + 1, lower[axis] + 1), min(cut + step, upper[axis])):
+            if refined != cut:
+                result = evaluate(axis, refined)
+                if result and result[0] < best[0]:
+                    best = result
+        return best
+
+    def merge(self, parts, concavity):
+        """
+        Greedily merges the parts whose merged hull stays below the concavity threshold.
+
+        :param parts: List of tuples of the hull vertices and triangles, the volume (in voxels) and the lower and
+            upper corners of the bounding box (in voxels)
+        :return: List of the remaining parts
+        """
+        def touching(first, second):
+            return all(a <= d and c <= b for a, b, c, d in zip(first[3], first[4], second[3], second[4]))
+
+        def candidate(i, j):
+            hull = self.hull(numpy.concatenate([parts[i][0], parts[j][0]]), evaluation=False)
+            return self.concavity(hull[2], parts[i][2] + parts[j][2]), i, j, hull
+
+        alive = set(range(len(parts)))
+        heap = [candidate(i, j) for i in alive for j in alive if i < j and touching(parts[i], parts[j])]
+        heapq.heapify(heap)
+        while heap:
+            cost, i, j, (vertices, triangles, _) = heapq.heappop(heap)
+            if cost > concavity:
+                break
+            if i not in alive or j not in alive:
+                continue
+            first, second = parts[i], parts[j]
+            parts.append((vertices, triangles, first[2] + second[2], numpy.minimum(first[3], second[3]),
+                          numpy.maximum(first[4], second[4])))
+            alive -= {i, j}
+            k = len(parts) - 1
+            for other in alive:
+                if touching(parts[k], parts[other]):
+                    heapq.heappush(heap, candidate(other, k))
+            alive.add(k)
+        return [parts[i] for i in sorted(alive)]
+
+
+def decompose(vertices, triangles, concavity=0.01, max_hulls=16, resolution=32, max_vertices=64):
+    """
+    Computes an approximate convex decomposition of a mesh.
+
+    :param vertices: Array (N, 3)
+    :param triangles: Integer array (T, 3) of a closed mesh
+    :param concavity: Maximal concavity of a part (volume of the hull outside of the mesh relative to the volume of
+        the hull of the whole mesh)
+    :param max_hulls: Maximal number of hulls
+    :param resolution: Number of voxels along the longest side of the bounding box
+    :param max_vertices: Maximal number of vertices of a hull (hulls with more vertices are simplified by increasing
+        the tolerance of :func:`robot_designer_plugin.convex_hull.quickhull` by a quarter until they fit)
+    :return: List of tuples of the vertices (M, 3) and triangles (F, 3) of the hulls
+    :raises ValueError: if the mesh does not span a volume
+    """
+    decomposition = _Decomposition(vertices, triangles, resolution)
+    lower, upper = (0, 0, 0), tuple(int(i) for i in decomposition.shape)
+    volume = decomposition.volume(lower, upper)
+    if decomposition.whole[0] is None or volume <= 0:
+        raise ValueError("The mesh does not span a volume")
+
+    # Parts to be cut ordered by their concavity (the counter breaks ties deterministically)
+    heap, final, count = [(-decomposition.concavity(decomposition.whole[2], volume), 0, volume, lower, upper)], [], 0
+    while heap and len(heap) + len(final) < max_hulls:
+        part_concavity, _, volume, lower, upper = heapq.heappop(heap)
+        split = decomposition.split(lower, upper, volume) if -part_concavity > concavity else None
+        if split is None:
+            final.append((volume, lower, upper))
+            continue
+        for half_concavity, half_volume, half_lower, half_upper in split[1]:
+            count += 1
+            heapq.heappush(heap, (-half_concavity, count, half_volume, tuple(half_lower), tuple(half_upper)))
+    final.extend((volume, lower, upper) for _, _, volume, lower, upper in heap)
+
+    parts = []
+    for volume, lower, upper in final:
+        if count:
+            vertices, triangles, _ = decomposition.hull(decomposition.points(lower, upper), evaluation=False)
+        else:
+            vertices, triangles, _ = decomposition.whole
+        if vertices is not None:
+            parts.append((vertices, triangles, volume, numpy.array(lower), numpy.array(upper)))
+    return [decomposition.simplify(part[0], part[1], max_vertices) for part in decomposition.merge(parts, concavity)]
+
+
+def _decomposition_job(job):
+    vertices, triangles, parameters = job
+    try:
+        return decompose(vertices, triangles, **parameters), ''
+    except ValueError as e:
+        return None, str(e)
+
+
+def convex_decompositions(meshes, processes=1, **parameters):
+    """
+    Decomposes many meshes.
+
+    :param meshes: Sequence of tuples of the vertices (N, 3) and the triangles (T, 3)
+    :param processes: Number of worker processes (see :func:`robot_designer_plugin.pool.map_jobs`)
+    :param parameters: Keyword arguments of :func:`decompose`
+    :return: List of tuples of the hulls (see :func:`decompose`) and an error message (the hulls are None if the
+        mesh could not be decomposed, the message is empty otherwise)
+    """
+    return map_jobs(_decomposition_job, [(vertices, triangles, parameters) for vertices, triangles in meshes],
+                    processes)
@@ -40,10 +40,15 @@ This module includes import and export functions for different file formats for
 from importlib import reload
 from ..core import PluginManager
 
+from . import bindings
+from . import structure
+from . import robot_model
 from . import urdf
 from . import sdf
 from . import osim
 
+reload(structure)
+reload(robot_model)
 reload(urdf)
 reload(sdf)
 reload(osim)
@@ -52,6 +57,16 @@ PluginManager.register_plugin("SDF", [sdf.ImportPlain, sdf.ImportPackage, sdf.Im
 PluginManager.register_plugin("URDF", [urdf.ImportPlain, urdf.ImportPackage, urdf.ImportZippedPackage, urdf.ExportPlain, urdf.ExportPackage, urdf.ExportZippedPackage])
 
 
+def binding_load_times():
+    """
+    Returns the time spent loading the generated PyXB bindings so far (see
+    :func:`robot_designer_plugin.export.bindings.lazy_import`).
+
+    :return: Dictionary of module names and seconds
+    """
+    return dict(bindings.load_times)
+
+
 # todo add all import export plugins into this directory.
 # The file dialog should have a selection box for the format
 # todo that includes all plugins and draw the operators and arguments
@@ -0,0 +1,120 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Index of the objects that are associated with a :term:`robot model`. The exporters build it once per export with
+:meth:`ObjectAssociations.build` instead of searching the whole scene for every :term:`segment`.
+"""
+
+from collections import namedtuple, defaultdict
+from types import MappingProxyType
+
+SegmentObjects = namedtuple('SegmentObjects', 'visuals collisions frames markers sensors')
+"""
+Objects attached to a single segment. Each field is a tuple of Blender objects in scene order.
+"""
+
+_NO_OBJECTS = SegmentObjects((), (), (), (), ())
+
+_SENSOR_TAGS = {'CAMERA_SENSOR', 'LASER_SENSOR'}
+
+
+class ObjectAssociations(object):
+    """
+    Immutable mapping from segment names to the :class:`SegmentObjects` attached to them. Only objects that are
+    parented to a bone of the armature are associated with a segment. Muscles are associated with the model through
+    their robot name.
+    """
+
+    def __init__(self, armature_name, segments, muscles, children):
+        self.armature_name = armature_name
+        self._segments = MappingProxyType(segments)
+        self._children = MappingProxyType(children)
+        self.muscles = muscles
+
+    @classmethod
+    def build(cls, context, armature=None):
+        """
+        Creates the index in a single pass over the scene objects.
+
+        :param context: The current context
+        :param armature: The armature of the robot model (defaults to the active object)
+        :return: :class:`ObjectAssociations`
+        """
+        if armature is None:
+            armature = context.active_object
+
+        segments = defaultdict(lambda: SegmentObjects([], [], [], [], []))
+        children = defaultdict(list)
+        muscles = []
+
+        for obj in context.scene.objects:
+            if obj.parent is not None:
+                children[obj.parent.name].append(obj)
+
+            if obj.RobotEditor.muscles.robotName == armature.name:
+                muscles.append(obj)
+
+            if obj.parent != armature or not obj.parent_bone:
+                continue
+
+            tag = obj.RobotEditor.tag
+            objects = segments[obj.parent_bone]
+            if tag == 'PHYSICS_FRAME':
+                objects.frames.append(obj)
+            elif tag == 'MARKER':
+                objects.markers.append(obj)
+            elif tag in _SENSOR_TAGS:
+                objects.sensors.append(obj)
+            elif obj.type == 'MESH':
+                if tag == 'COLLISION':
+                    objects.collisions.append(obj)
+                else:
+                    objects.visuals.append(obj)
+
+        return cls(armature.name,
+                   {name: SegmentObjects(*(tuple(i) for i in objects)) for name, objects in segments.items()},
+                   tuple(muscles),
+                   {name: tuple(objects) for name, objects in children.items()})
+
+    def __getitem__(self, segment_name):
+        """
+        :param segment_name: Name of the segment (bone)
+        :return: :class:`SegmentObjects` (empty if nothing is attached)
+        """
+        return self._segments.get(segment_name, _NO_OBJECTS)
+
+    def __iter__(self):
+        return iter(self._segments)
+
+    def __len__(self):
+        return len(self._segments)
+
+    def children(self, obj):
+        """
+        :param obj: A Blender object
+        :return: Tuple of the scene objects whose parent is ``obj``
+        """
+        return self._children.get(obj.name, ())
@@ -0,0 +1,81 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Lazy import of the large generated PyXB bindings (SDF, URDF, model.config and OpenSim), which are only needed by the
+importers and exporters. Does not depend on Blender.
+"""
+
+import importlib.abc
+import importlib.util
+import sys
+import time
+
+load_times = {}
+"""
+Seconds spent executing the modules imported with :func:`lazy_import` (only contains loaded modules).
+"""
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """
+    Delegates to the actual loader (which compiles the module through its ``__pycache__``) and records the time
+    spent executing the module in :data:`load_times`.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        self.loader.exec_module(module)
+        load_times[module.__name__] = time.perf_counter() - start
+
+
+def lazy_import(name):
+    """
+    Imports a module on first attribute access. This is used for the large generated PyXB bindings that are only
+    needed by the importers and exporters. Since an imported module is returned from :data:`sys.modules`, reloading
+    the plugin does not construct the bindings again.
+
+    :param name: Absolute name of the module (its parent package has to be imported already)
+    :return: The (lazy) module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(_TimedLoader(spec.loader))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
@@ -12,8 +12,6 @@ class COLLADA(object):
         else:
             self.root = None
         self.logger = logging.getLogger("COLLADA")
-        # self.logger.setLevel(logging.INFO)
-        self.logger.setLevel(logging.DEBUG)
 
         self.namespace = 'http://www.collada.org/2008/03/COLLADASchema'
         self.ns = '{%s}' % self.namespace
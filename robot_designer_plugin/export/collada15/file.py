@@ -60,8 +60,9 @@ from ...operators.helpers import ModelSelected, ObjectMode
 # Plugin imports
 from . import  fix
 from . import collada
+from ..associations import ObjectAssociations
 
-def extractData(segment_name):
+def extractData(segment_name, associations):
     tree = collada.Tree()
     arm = bpy.context.active_object
 
@@ -111,11 +112,10 @@ def extractData(segment_name):
         tree.axis_type = 'prismatic'
     children = [child.name for child in currentBone.children]
 
-    tree.meshes = [mesh.name for mesh in bpy.data.objects if
-                   mesh.type == 'MESH' and mesh.parent_bone == segment_name]
+    segment_objects = associations[segment_name]
+    tree.meshes = [mesh.name for mesh in segment_objects.visuals + segment_objects.collisions]
 
-    markers = [m for m in bpy.data.objects if
-               m.RobotEditor.tag == 'MARKER' and m.parent_bone == segment_name]
+    markers = segment_objects.markers
     # tree.markers = [(m.name,(currentBone.matrix_local.inverted()*m.matrix_world.translation).to_tuple())
     #  for m in markers]
     # tree.markers = [(m.name,(m.matrix_parent_inverse*m.matrix_world.translation).to_tuple()) for m in markers]
@@ -128,7 +128,7 @@ def extractData(segment_name):
         m in markers]
 
     for child in children:
-        tree.addChild(extractData(child))
+        tree.addChild(extractData(child, associations))
 
     return tree
 # @PluginManager.register_class
@@ -198,12 +198,12 @@ class RobotEditor_exportCollada(RDOperator):
 
         tree = collada.Tree()
         tree.name = arm.name
-        tree.addChild(extractData(baseBoneName))
+        associations = ObjectAssociations.build(context, arm)
+        tree.addChild(extractData(baseBoneName, associations))
 
         handler.attach(tree)
 
-        massFrames = [obj for obj in context.scene.objects if
-                      obj.RobotEditor.tag == 'PHYSICS_FRAME' and obj.parent_bone is not '']
+        massFrames = [frame for segment_name in associations for frame in associations[segment_name].frames]
         for frame in massFrames:
             # transform = frame.parent.data.bones[frame.parent_bone].matrix_local.inverted() * frame.matrix_local
             segment_name = frame.parent.data.bones[frame.parent_bone].name
@@ -217,7 +217,7 @@ class RobotEditor_exportCollada(RDOperator):
 
             collisionModels = []
             collisionModelTransformations = {}
-            for model in [i for i in context.scene.objects if i.parent == frame]:
+            for model in associations.children(frame):
                 modelName = model.data.name.replace('.', '_') + '-mesh'
                 collisionModels.append(modelName)
                 # matrix = model.parent.data.bones[model.parent_bone].matrix_local.inverted() * model.matrix_local
@@ -229,7 +229,6 @@ class RobotEditor_exportCollada(RDOperator):
                 collisionModelTransformations[modelName].append(tuple([1, 0, 0, rotation.x]))
 
             # TODO also bring the matrix_local to all collisionmodels
-            print("mass frames", frame.name, collisionModels)
             handler.addMassObject(frame.name, frameTrafos,
                                   tuple(v for v in frame.RobotEditor.dynamics.inertiaTensor),
                                   frame.RobotEditor.dynamics.mass, collisionModels,
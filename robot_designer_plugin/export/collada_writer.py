@@ -0,0 +1,250 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Pure Python COLLADA 1.4.1 helpers that do not depend on Blender.
+
+:func:`write_collada` writes evaluated mesh buffers such that it can run in worker processes (see
+:mod:`robot_designer_plugin.export.mesh_export`). It writes the geometry (positions, normals, the active UV layer) and
+the diffuse colors of the materials. Textures are not exported. The node of the mesh does not have a transformation
+such that the geometry stays in the local frame of the object.
+
+:func:`strip_scene_matrices` removes the node transformations from files written by Blender's COLLADA exporter.
+"""
+
+import os
+import re
+from itertools import accumulate
+from xml.sax.saxutils import quoteattr
+
+COLLADA_NAMESPACE = 'http://www.collada.org/2005/11/COLLADASchema'
+
+WRITER_VERSION = 1
+"""
+Version of :func:`write_collada`, increased whenever the written files change (part of the mesh cache keys).
+"""
+
+_CHUNK = 3000
+
+_BEFORE_SCENES, _IN_SCENES, _IN_MATRIX, _AFTER_SCENES = range(4)
+
+
+def collada_id(name):
+    """
+    Converts a Blender name into a valid XML ID (in the same way as the Blender exporter).
+    """
+    return re.sub(r'[^A-Za-z0-9_\-]', '_', name)
+
+
+def _write_numbers(f, values, format):
+    for i in range(0, len(values), _CHUNK):
+        if i:
+            f.write(' ')
+        f.write(' '.join(format % v for v in values[i:i + _CHUNK]))
+
+
+def _write_source(f, source_id, values, params):
+    f.write('<source id="%s">\n<float_array id="%s-array" count="%d">' % (source_id, source_id, len(values)))
+    _write_numbers(f, values, '%.6g')
+    f.write('</float_array>\n<technique_common>\n<accessor source="#%s-array" count="%d" stride="%d">\n'
+            % (source_id, len(values) // len(params), len(params)))
+    for param in params:
+        f.write('<param name="%s" type="float"/>\n' % param)
+    f.write('</accessor>\n</technique_common>\n</source>\n')
+
+
+def write_collada(file_path, data):
+    """
+    Writes a COLLADA file.
+
+    :param file_path: The output file
+    :param data: Dictionary with the keys ``name`` (object name), ``mesh_name``, ``positions`` and ``normals`` (flat
+        per vertex), ``loop_vertices`` (vertex index of every polygon corner), ``loop_totals`` and
+        ``material_indices`` (per polygon), ``uvs`` (flat per polygon corner, may be empty) and ``materials``
+        (list of ``(name, (r, g, b, a))``)
+    :return: The number of bytes written
+    """
+    node_id = collada_id(data['name'])
+    mesh_id = collada_id(data['mesh_name']) + '-mesh'
+    materials = [(collada_id(name) + '-material', name, color) for name, color in data['materials']]
+    has_uvs = len(data['uvs']) > 0
+
+    # Group the polygons by material
+    loop_totals = data['loop_totals']
+    loop_starts = [0] + list(accumulate(loop_totals))[:-1]
+    groups = {}
+    for polygon, material in enumerate(data['material_indices']):
+        groups.setdefault(material if material < len(materials) else 0, []).append(polygon)
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<COLLADA xmlns="%s" version="1.4.1">\n' % COLLADA_NAMESPACE)
+        f.write('<asset>\n<contributor>\n<authoring_tool>RobotDesigner</authoring_tool>\n</contributor>\n'
+                '<unit name="meter" meter="1"/>\n<up_axis>Z_UP</up_axis>\n</asset>\n')
+
+        if materials:
+            f.write('<library_effects>\n')
+            for material_id, _, color in materials:
+                f.write('<effect id="%s-effect">\n<profile_COMMON>\n<technique sid="common">\n<lambert>\n'
+                        '<diffuse>\n<color sid="diffuse">%s</color>\n</diffuse>\n</lambert>\n</technique>\n'
+                        '</profile_COMMON>\n</effect>\n' % (material_id, ' '.join('%.6g' % c for c in color)))
+            f.write('</library_effects>\n<library_materials>\n')
+            for material_id, name, _ in materials:
+                f.write('<material id="%s" name=%s>\n<instance_effect url="#%s-effect"/>\n</material>\n'
+                        % (material_id, quoteattr(name), material_id))
+            f.write('</library_materials>\n')
+
+        f.write('<library_geometries>\n<geometry id="%s" name=%s>\n<mesh>\n'
+                % (mesh_id, quoteattr(data['mesh_name'])))
+        _write_source(f, mesh_id + '-positions', data['positions'], 'XYZ')
+        _write_source(f, mesh_id + '-normals', data['normals'], 'XYZ')
+        if has_uvs:
+            _write_source(f, mesh_id + '-map-0', data['uvs'], 'ST')
+        f.write('<vertices id="%s-vertices">\n<input semantic="POSITION" source="#%s-positions"/>\n</vertices>\n'
+                % (mesh_id, mesh_id))
+
+        loop_vertices = data['loop_vertices']
+        for material, polygons in sorted(groups.items()):
+            f.write('<polylist%s count="%d">\n' % (' material="%s"' % materials[material][0] if materials else '',
+                                                   len(polygons)))
+            f.write('<input semantic="VERTEX" source="#%s-vertices" offset="0"/>\n'
+                    '<input semantic="NORMAL" source="#%s-normals" offset="0"/>\n' % (mesh_id, mesh_id))
+            if has_uvs:
+                f.write('<input semantic="TEXCOORD" source="#%s-map-0" offset="1" set="0"/>\n' % mesh_id)
+            f.write('<vcount>')
+            _write_numbers(f, [loop_totals[i] for i in polygons], '%d')
+            f.write('</vcount>\n<p>')
+            indices = []
+            for polygon in polygons:
+                for loop in range(loop_starts[polygon], loop_starts[polygon] + loop_totals[polygon]):
+                    indices.append(loop_vertices[loop])
+                    if has_uvs:
+                        indices.append(loop)
+            _write_numbers(f, indices, '%d')
+            f.write('</p>\n</polylist>\n')
+        f.write('</mesh>\n</geometry>\n</library_geometries>\n')
+
+        f.write('<library_visual_scenes>\n<visual_scene id="Scene" name="Scene">\n'
+                '<node id="%s" name=%s type="NODE">\n<instance_geometry url="#%s" name=%s>\n'
+                % (node_id, quoteattr(data['name']), mesh_id, quoteattr(data['name'])))
+        if materials:
+            f.write('<bind_material>\n<technique_common>\n')
+            for material_id, _, _ in materials:
+                f.write('<instance_material symbol="%s" target="#%s"/>\n' % (material_id, material_id))
+            f.write('</technique_common>\n</bind_material>\n')
+        f.write('</instance_geometry>\n</node>\n</visual_scene>\n</library_visual_scenes>\n'
+                '<scene>\n<instance_visual_scene url="#Scene"/>\n</scene>\n</COLLADA>\n')
+    return os.path.getsize(file_path)
+
+
+def write_collada_job(job):
+    """
+    Writes a COLLADA file in a worker process and reports errors instead of raising them.
+
+    :param job: Tuple of the file path and the mesh buffers (see :func:`write_collada`)
+    :return: Tuple of the file path, the number of bytes written and an error message (or None)
+    """
+    file_path, data = job
+    try:
+        return file_path, write_collada(file_path, data), None
+    except Exception as e:
+        return file_path, 0, '%s: %s' % (type(e).__name__, e)
+
+
+def strip_scene_matrices(file_path, chunk_size=1 << 16):
+    """
+    Removes the ``<matrix>`` elements (and the lines they occupy) from the ``library_visual_scenes`` of a COLLADA
+    file such that the meshes stay in the frame of their objects. The file is streamed through a temporary file in
+    chunks, hence the memory consumption does not depend on the file size.
+
+    :param file_path: The COLLADA file
+    :param chunk_size: Number of characters read at once
+    :return: Tuple of the bytes read, the bytes written and the number of removed elements
+    """
+    temp_path = file_path + '.tmp'
+    state = _BEFORE_SCENES
+    skip_newline = False
+    removed = 0
+    buffer = ''
+
+    with open(file_path, encoding='utf-8', newline='') as source, \
+            open(temp_path, 'w', encoding='utf-8', newline='') as target:
+        eof = False
+        while not eof:
+            chunk = source.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+
+            while buffer:
+                if skip_newline:
+                    if not eof and buffer in ('', '\r'):
+                        break
+                    if buffer.startswith('\r\n'):
+                        buffer = buffer[2:]
+                    elif buffer.startswith('\n'):
+                        buffer = buffer[1:]
+                    skip_newline = False
+                    continue
+
+                if state == _AFTER_SCENES:
+                    target.write(buffer)
+                    buffer = ''
+                elif state == _IN_MATRIX:
+                    index = buffer.find('</matrix>')
+                    if index < 0:
+                        buffer = buffer[-len('</matrix>') + 1:] if not eof else ''
+                        break
+                    buffer = buffer[index + len('</matrix>'):]
+                    state = _IN_SCENES
+                    skip_newline = True
+                    removed += 1
+                else:
+                    tokens = ('<library_visual_scenes',) if state == _BEFORE_SCENES else \
+                        ('<matrix', '</library_visual_scenes>')
+                    hits = [(buffer.find(token), token) for token in tokens]
+                    hits = [hit for hit in hits if hit[0] >= 0]
+                    if not hits:
+                        # Keep the tail such that tokens (and the indentation of a matrix) can span chunks
+                        keep = len(buffer) - max(len(token) for token in tokens) + 1
+                        if state == _IN_SCENES:
+                            keep = min(keep, len(buffer.rstrip(' \t')))
+                        if eof:
+                            keep = len(buffer)
+                        target.write(buffer[:max(keep, 0)])
+                        buffer = buffer[max(keep, 0):]
+                        break
+
+                    index, token = min(hits)
+                    if token == '<matrix':
+                        target.write(buffer[:index].rstrip(' \t'))
+                        buffer = buffer[index:]
+                        state = _IN_MATRIX
+                    else:
+                        target.write(buffer[:index + len(token)])
+                        buffer = buffer[index + len(token):]
+                        state = _IN_SCENES if state == _BEFORE_SCENES else _AFTER_SCENES
+
+    read, written = os.path.getsize(file_path), os.path.getsize(temp_path)
+    os.replace(temp_path, file_path)
+    return read, written, removed
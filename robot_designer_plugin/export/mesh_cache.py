@@ -0,0 +1,177 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Content-addressed cache for exported mesh files. Every exported file is recorded in a manifest next to the meshes
+together with a hash of everything that determines its content (mesh data, modifiers, materials, scale and export
+options). Unchanged meshes are then reused (or hard-linked if the file name changed) instead of being exported again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from array import array
+
+MANIFEST_NAME = '.mesh_cache.json'
+MANIFEST_VERSION = 1
+
+COLLADA_OPTIONS = {'apply_modifiers': True, 'selected': True, 'use_texture_copies': True}
+"""
+Options for :func:`bpy.ops.wm.collada_export` shared by the exporters (part of the cache key).
+"""
+
+
+def _update_buffer(digest, collection, attribute, typecode, width=1):
+    buffer = array(typecode, [0]) * (len(collection) * width)
+    collection.foreach_get(attribute, buffer)
+    digest.update(buffer.tobytes())
+
+
+def _update_struct(digest, struct):
+    """
+    Hashes all simple properties (and the names of referenced data blocks) of a Blender struct.
+    """
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == 'POINTER':
+            value = getattr(value, 'name', None)
+        elif getattr(prop, 'is_array', False):
+            value = tuple(value)
+        digest.update(('%s=%r;' % (prop.identifier, value)).encode())
+
+
+def mesh_key(obj, options, version=''):
+    """
+    Computes the cache key of a mesh object.
+
+    :param obj: The Blender mesh object
+    :param options: Dictionary of the export options
+    :param version: Identity and version of the writer of the files
+    :return: Hex digest
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((version, obj.name, obj.data.name, tuple(obj.scale), sorted(options.items()))).encode())
+
+    data = obj.data
+    _update_buffer(digest, data.vertices, 'co', 'f', 3)
+    _update_buffer(digest, data.loops, 'vertex_index', 'i')
+    _update_buffer(digest, data.polygons, 'loop_total', 'i')
+    _update_buffer(digest, data.polygons, 'material_index', 'i')
+    _update_buffer(digest, data.polygons, 'use_smooth', 'b')
+    for layer in data.uv_layers:
+        digest.update(layer.name.encode())
+        _update_buffer(digest, layer.data, 'uv', 'f', 2)
+
+    for modifier in obj.modifiers:
+        _update_struct(digest, modifier)
+    for slot in obj.material_slots:
+        if slot.material is not None:
+            _update_struct(digest, slot.material)
+
+    return digest.hexdigest()
+
+
+class MeshExportCache(object):
+    """
+    Manifest of the mesh files exported into a directory.
+
+    :param directory: The directory the manifest is stored in (usually the toplevel export directory)
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.file_name = os.path.join(directory, MANIFEST_NAME)
+        self.files = {}
+        self.paths = {}
+        self.hits = 0
+        self.links = 0
+        self.misses = 0
+
+        try:
+            with open(self.file_name) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get('version') == MANIFEST_VERSION:
+            self.files = manifest.get('files', {})
+            self.paths = {j: i for i, j in self.files.items()}
+
+    def fetch(self, file_path, key):
+        """
+        Provides ``file_path`` from the cache. On a miss, an existing file is removed such that the exporter does
+        not write through a hard link into another cached file.
+
+        :param file_path: Absolute path of the mesh file
+        :param key: Key computed by :func:`mesh_key`
+        :return: True if the file is up to date, False if it has to be exported
+        """
+        relative_path = os.path.relpath(file_path, self.directory)
+        if self.files.get(relative_path) == key and os.path.isfile(file_path):
+            self.hits += 1
+            return True
+
+        if os.path.lexists(file_path):
+            os.remove(file_path)
+
+        source = os.path.join(self.directory, self.paths.get(key, relative_path))
+        if os.path.isfile(source):
+            try:
+                os.link(source, file_path)
+            except OSError:
+                shutil.copyfile(source, file_path)
+            self.store(file_path, key)
+            self.hits += 1
+            self.links += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def store(self, file_path, key):
+        """
+        Records a freshly exported file.
+        """
+        relative_path = os.path.relpath(file_path, self.directory)
+        self.files[relative_path] = key
+        self.paths[key] = relative_path
+
+    def save(self):
+        """
+        Writes the manifest. Entries of deleted files are dropped.
+        """
+        files = {i: j for i, j in self.files.items() if os.path.isfile(os.path.join(self.directory, i))}
+        temp_name = self.file_name + '.tmp'
+        with open(temp_name, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': files}, f, indent=1, sort_keys=True)
+        os.replace(temp_name, self.file_name)
+
+    def report(self):
+        """
+        :return: Summary of the cache statistics
+        """
+        return "Mesh cache: %d hits (%d linked), %d misses" % (self.hits, self.links, self.misses)
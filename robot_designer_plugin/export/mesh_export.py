@@ -0,0 +1,202 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Two-phase mesh export. While walking the kinematic tree, the exporters only queue the meshes with
+:meth:`MeshExportQueue.add`. :meth:`MeshExportQueue.run` then writes all files at once before the robot description
+is written.
+
+With a single process, the meshes are exported with Blender's COLLADA exporter. With several processes, the evaluated
+vertex and face buffers are read in Blender and the files are written by
+:func:`robot_designer_plugin.export.collada_writer.write_collada` in a pool of worker processes (see
+:func:`robot_designer_plugin.pool.map_jobs`). The cache keys include the writer and its version since the files of
+the two writers differ.
+"""
+
+from array import array
+from collections import namedtuple
+
+import bpy
+
+from .collada_writer import WRITER_VERSION, write_collada_job, strip_scene_matrices
+from .mesh_cache import COLLADA_OPTIONS, mesh_key
+from ..operators.model import SelectModel
+from ..pool import map_jobs
+
+MeshJob = namedtuple('MeshJob', 'mesh file_path key')
+
+
+class MeshExportError(Exception):
+    """
+    Raised if at least one mesh could not be exported.
+
+    :param failures: List of ``(file_path, message)`` tuples
+    """
+
+    def __init__(self, failures):
+        super().__init__("Failed to export %d mesh(es): %s" %
+                         (len(failures), ', '.join('%s (%s)' % i for i in failures)))
+        self.failures = failures
+
+
+def _buffer(collection, attribute, typecode, width=1):
+    buffer = array(typecode, [0]) * (len(collection) * width)
+    collection.foreach_get(attribute, buffer)
+    return buffer
+
+
+def evaluate_mesh(obj, scene):
+    """
+    Reads the geometry of an object with applied modifiers into plain buffers for
+    :func:`robot_designer_plugin.export.collada_writer.write_collada`.
+    """
+    mesh = obj.to_mesh(scene, True, 'PREVIEW')
+    try:
+        uv_layer = mesh.uv_layers.active
+        return {
+            'name': obj.name,
+            'mesh_name': obj.data.name,
+            'positions': _buffer(mesh.vertices, 'co', 'f', 3),
+            'normals': _buffer(mesh.vertices, 'normal', 'f', 3),
+            'loop_vertices': _buffer(mesh.loops, 'vertex_index', 'i'),
+            'loop_totals': _buffer(mesh.polygons, 'loop_total', 'i'),
+            'material_indices': _buffer(mesh.polygons, 'material_index', 'i'),
+            'uvs': _buffer(uv_layer.data, 'uv', 'f', 2) if uv_layer else array('f'),
+            'materials': [(slot.material.name, tuple(slot.material.diffuse_color) + (slot.material.alpha,))
+                          for slot in obj.material_slots if slot.material is not None],
+        }
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+
+class MeshExportQueue(object):
+    """
+    Collects the meshes of an export.
+
+    :param cache: :class:`robot_designer_plugin.export.mesh_cache.MeshExportCache` (optional)
+    :param processes: Number of worker processes
+    """
+
+    def __init__(self, cache=None, processes=1):
+        self.cache = cache
+        self.processes = processes
+        self.jobs = []
+        self.bytes_processed = 0
+
+    @property
+    def writer(self):
+        """
+        Identity and version of the writer of the mesh files.
+        """
+        if self.processes > 1:
+            return 'collada_writer %d' % WRITER_VERSION
+        return 'Blender COLLADA exporter %s' % bpy.app.version_string
+
+    def add(self, mesh, file_path):
+        """
+        Queues a mesh unless the cache provides an up to date file.
+
+        :param mesh: The Blender mesh object
+        :param file_path: The output file
+        """
+        key = None
+        if self.cache is not None:
+            key = mesh_key(mesh, COLLADA_OPTIONS, self.writer)
+            if self.cache.fetch(file_path, key):
+                return
+        self.jobs.append(MeshJob(mesh, file_path, key))
+
+    def run(self, operator, context):
+        """
+        Exports all queued meshes.
+
+        :param operator: The calling operator
+        :param context: The current context
+        :raises MeshExportError: if a mesh could not be written
+        """
+        jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return
+
+        if self.processes > 1:
+            operator.logger.info("Exporting %d meshes with %d processes", len(jobs), self.processes)
+            failures = self._run_parallel(jobs, operator, context)
+        else:
+            operator.logger.info("Exporting %d meshes", len(jobs))
+            failures = self._run_serial(jobs, operator)
+
+        if failures:
+            raise MeshExportError(failures)
+        operator.logger.info("Mesh export: %d bytes processed", self.bytes_processed)
+
+        for job in jobs:
+            if job.key is not None:
+                self.cache.store(job.file_path, job.key)
+
+    def _run_serial(self, jobs, operator):
+        model_name = bpy.context.active_object.name
+        failures = []
+        for job in jobs:
+            operator.logger.debug("Processing mesh: %s", job.mesh.name)
+            bpy.ops.object.select_all(action='DESELECT')
+            job.mesh.select = True
+            bpy.context.scene.objects.active = job.mesh
+
+            hide_flag_backup = job.mesh.hide
+            job.mesh.hide = False  # Blender does not want to export hidden objects.
+
+            try:
+                result = bpy.ops.wm.collada_export(filepath=job.file_path, **COLLADA_OPTIONS)
+                message = None if 'FINISHED' in result else 'COLLADA export %s' % ', '.join(result)
+            except RuntimeError as e:
+                # Raised by Blender if the exporter reports an error, collected like the errors of the workers
+                message = '%s: %s' % (type(e).__name__, e)
+            finally:
+                job.mesh.hide = hide_flag_backup
+            if message:
+                failures.append((job.file_path, message))
+                continue
+
+            # quick fix for dispersed meshes: keep the meshes in the frame of their objects
+            read, written, removed = strip_scene_matrices(job.file_path)
+            operator.logger.info("Mesh %s: %d bytes processed, %d bytes written, %d matrices removed",
+                                 job.mesh.name, read, written, removed)
+            self.bytes_processed += read
+
+        SelectModel.run(model_name=model_name)
+        return failures
+
+    def _run_parallel(self, jobs, operator, context):
+        buffers = [(job.file_path, evaluate_mesh(job.mesh, context.scene)) for job in jobs]
+        results = map_jobs(write_collada_job, buffers, self.processes)
+
+        failures = []
+        for file_path, written, message in results:
+            if message:
+                failures.append((file_path, message))
+            else:
+                operator.logger.info("Mesh file %s: %d bytes written", file_path, written)
+                self.bytes_processed += written
+        return failures
@@ -26,8 +26,12 @@
 
 from importlib import reload
 
-from . import osim_dom, osim_export, osim_import
+from ..bindings import lazy_import
+
+# The generated bindings are large, hence they are only loaded when an importer or exporter uses them
+osim_dom = lazy_import(__name__ + '.osim_dom')
+
+from . import osim_export, osim_import
 
-reload(osim_dom)
 reload(osim_export)
-reload(osim_import)
\ No newline at end of file
+reload(osim_import)
@@ -35,6 +35,7 @@ import mathutils
 ########
 # RD imports
 from ..osim import osim_dom  # xsd bindings
+from ..associations import ObjectAssociations
 from ...core import config, PluginManager, RDOperator
 from ...properties.globals import global_properties
 
@@ -163,7 +164,8 @@ class OsimExporter(object):
 
 
 def create_osim(operator: RDOperator, context,
-                filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False):
+                filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False,
+                associations=None):
   """
   Creates the .osim muscle definition file
 
@@ -174,11 +176,14 @@ def create_osim(operator: RDOperator, context,
   :param toplevel_directory: The directory in which to export
   :param in_ros_package: Whether to export into a ros package or plain files
   :param abs_filepaths: If not intstalled into a ros package decides whether to use absolute file paths.
+  :param associations: :class:`..associations.ObjectAssociations` of the model (built if not given)
   :return:
   """
   # Might be set at another place. Therefore need to clear it.
 
-  muscles = get_muscles(context.active_object.name, context)
+  if associations is None:
+    associations = ObjectAssociations.build(context)
+  muscles = list(associations.muscles)
   if muscles:
     pyxb.utils.domutils.BindingDOMSupport.SetDefaultNamespace(None)
     exporter = OsimExporter()
@@ -61,8 +61,6 @@ class OsimImporter(object):
         base_dir = os.path.dirname(file_path)
         self.logger.debug(base_dir)
         self.logger.debug(musclepath)
-        print("mpath")
-        print(musclepath)
         muscles_osim = open(base_dir + '/' + '/'.join(musclepath.split('/', 3)[3:])[:-2]).read()
         self.muscles = osim_dom.CreateFromDocument(muscles_osim)
 
@@ -136,7 +134,6 @@ class OsimImporter(object):
             type = 'THELEN'
             self.import_muscles(muscle, type)
             m += 1
-            print("import thelen")
         except:
             break
 
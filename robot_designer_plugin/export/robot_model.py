@@ -0,0 +1,343 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Intermediate representation of a :term:`robot model` that does not depend on Blender or PyXB.
+
+The model is filled by :meth:`robot_designer_plugin.export.sdf.generic.sdf_tree.SDFTree.parse_model` and
+:meth:`robot_designer_plugin.export.urdf.generic.urdf_tree.URDFTree.parse_model`, and the URDF importer
+(:class:`robot_designer_plugin.export.urdf.urdf_import.Importer`) creates the Blender scene from it. All records use
+``__slots__`` and store numbers as floats in tuples, such that large models need a fraction of the memory of the
+document object models.
+
+Conventions:
+
+* A pose is a tuple ``(x, y, z, roll, pitch, yaw)`` with fixed axis XYZ angles (as in URDF and SDF).
+* The pose of a link is relative to the frame of its parent link (i.e., the origin of the URDF joint). The frame of
+  a joint coincides with the frame of its child link. Root links are relative to the model frame.
+* Links are stored in depth-first order, hence the parent of a link always has a smaller index.
+* Poses of inertials, geometries and sensors are relative to the frame of their link.
+"""
+
+IDENTITY = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+"""
+The identity pose.
+"""
+
+GEOMETRY_TYPES = ('mesh', 'box', 'cylinder', 'sphere')
+"""
+Supported geometry types. The meaning of :attr:`Geometry.size` depends on the type: the scale for meshes, the
+size for boxes, ``(radius, length)`` for cylinders and ``(radius,)`` for spheres.
+"""
+
+
+def pose(values):
+    """
+    Creates a pose tuple from a sequence of six numbers (returns the shared :data:`IDENTITY` for zero poses).
+    """
+    values = tuple(float(i) for i in values)
+    if len(values) != 6:
+        raise ValueError("A pose requires six values, got %d" % len(values))
+    return IDENTITY if values == IDENTITY else values
+
+
+class Inertial(object):
+    """
+    Mass properties of a link.
+
+    :param mass: The mass in kg
+    :param pose: Pose of the center of mass (and the principal axes) in the link frame
+    :param inertia: Tuple ``(ixx, ixy, ixz, iyy, iyz, izz)``
+    """
+    __slots__ = ('mass', 'pose', 'inertia')
+
+    def __init__(self, mass=1.0, pose=IDENTITY, inertia=(1.0, 0.0, 0.0, 1.0, 0.0, 1.0)):
+        self.mass = mass
+        self.pose = pose
+        self.inertia = inertia
+
+    def __repr__(self):
+        return 'Inertial(%r, %r, %r)' % (self.mass, self.pose, self.inertia)
+
+
+class Geometry(object):
+    """
+    A visual or collision geometry of a link.
+
+    :param name: Name of the geometry (may be empty)
+    :param type: One of :data:`GEOMETRY_TYPES`
+    :param pose: Pose in the link frame
+    :param size: See :data:`GEOMETRY_TYPES`
+    :param uri: The mesh file as written in the robot description (``package://``, ``model://`` or a path)
+    """
+    __slots__ = ('name', 'type', 'pose', 'size', 'uri')
+
+    def __init__(self, name, type, pose=IDENTITY, size=(1.0, 1.0, 1.0), uri=''):
+        if type not in GEOMETRY_TYPES:
+            raise ValueError("Unsupported geometry type: %s" % type)
+        self.name = name
+        self.type = type
+        self.pose = pose
+        self.size = size
+        self.uri = uri
+
+    def __repr__(self):
+        return 'Geometry(%r, %r, %r, %r, %r)' % (self.name, self.type, self.pose, self.size, self.uri)
+
+
+class Sensor(object):
+    """
+    A sensor attached to a link.
+
+    :param name: Name of the sensor
+    :param type: Sensor type as in SDF (e.g., ``'camera'`` or ``'ray'``)
+    :param pose: Pose in the link frame
+    """
+    __slots__ = ('name', 'type', 'pose')
+
+    def __init__(self, name, type, pose=IDENTITY):
+        self.name = name
+        self.type = type
+        self.pose = pose
+
+    def __repr__(self):
+        return 'Sensor(%r, %r, %r)' % (self.name, self.type, self.pose)
+
+
+class Muscle(object):
+    """
+    A muscle spanning several links.
+
+    :param name: Name of the muscle
+    :param type: Muscle type (e.g., ``'MILLARD_EQUIL'``)
+    :param max_isometric_force: Maximal isometric force in N
+    :param points: Tuple of the path points ``(link name, x, y, z)`` in the frames of the links
+    """
+    __slots__ = ('name', 'type', 'max_isometric_force', 'points')
+
+    def __init__(self, name, type, max_isometric_force=1000.0, points=()):
+        self.name = name
+        self.type = type
+        self.max_isometric_force = max_isometric_force
+        self.points = points
+
+    def __repr__(self):
+        return 'Muscle(%r, %r, %r, %r)' % (self.name, self.type, self.max_isometric_force, self.points)
+
+
+class Link(object):
+    """
+    A rigid body. Created by :meth:`RobotModel.add_link`. The geometries and sensors are stored in tuples that
+    are shared while empty.
+    """
+    __slots__ = ('index', 'name', 'pose', 'parent', 'joint', 'inertial', 'visuals', 'collisions', 'sensors')
+
+    def __init__(self, index, name, pose, parent):
+        self.index = index
+        self.name = name
+        self.pose = pose
+        self.parent = parent
+        self.joint = -1
+        self.inertial = None
+        self.visuals = ()
+        self.collisions = ()
+        self.sensors = ()
+
+    def __repr__(self):
+        return 'Link(%d, %r)' % (self.index, self.name)
+
+
+class Joint(object):
+    """
+    Connects a parent link to a child link. Created by :meth:`RobotModel.add_joint`.
+    """
+    __slots__ = ('index', 'name', 'type', 'parent', 'child', 'axis', 'lower', 'upper', 'effort', 'velocity')
+
+    def __init__(self, index, name, type, parent, child, axis, lower, upper, effort, velocity):
+        self.index = index
+        self.name = name
+        self.type = type
+        self.parent = parent
+        self.child = child
+        self.axis = axis
+        self.lower = lower
+        self.upper = upper
+        self.effort = effort
+        self.velocity = velocity
+
+    def __repr__(self):
+        return 'Joint(%d, %r, %r, %d -> %d)' % (self.index, self.name, self.type, self.parent, self.child)
+
+
+class RobotModel(object):
+    """
+    A robot model consisting of links, joints and muscles. Links and joints are referenced by their index.
+
+    :param name: Name of the model
+    :param pose: Pose of the model in the world
+    """
+    __slots__ = ('name', 'pose', 'links', 'joints', 'muscles', 'muscle_uri', '_link_index', '_joint_index')
+
+    def __init__(self, name='', pose=IDENTITY):
+        self.name = name
+        self.pose = pose
+        self.links = []
+        self.joints = []
+        self.muscles = []
+        self.muscle_uri = ''
+        self._link_index = {}
+        self._joint_index = {}
+
+    def __len__(self):
+        return len(self.links)
+
+    def add_link(self, name, pose=IDENTITY, parent=-1):
+        """
+        Adds a link. Links have to be added after their parent.
+
+        :param name: Unique name of the link
+        :param pose: Pose relative to the parent link (or the model for root links)
+        :param parent: Index of the parent link (-1 for root links)
+        :return: The new :class:`Link`
+        :raises ValueError: if the name is not unique or the parent does not exist
+        """
+        if name in self._link_index:
+            raise ValueError("Duplicate link: %s" % name)
+        if not -1 <= parent < len(self.links):
+            raise ValueError("Parent of link %s does not exist: %d" % (name, parent))
+        link = Link(len(self.links), name, pose, parent)
+        self.links.append(link)
+        self._link_index[name] = link.index
+        return link
+
+    def add_joint(self, name, type, parent, child, axis=(0.0, 0.0, 1.0), lower=0.0, upper=0.0, effort=0.0,
+                  velocity=0.0):
+        """
+        Adds a joint between two links. A link can only have one parent joint.
+
+        :param name: Unique name of the joint
+        :param type: Joint type (``'revolute'``, ``'prismatic'``, ``'fixed'``, ...)
+        :param parent: Index of the parent link
+        :param child: Index of the child link
+        :param axis: Joint axis in the child link frame
+        :param lower: Lower limit (rad or m)
+        :param upper: Upper limit (rad or m)
+        :param effort: Maximal effort
+        :param velocity: Maximal velocity
+        :return: The new :class:`Joint`
+        :raises ValueError: if the name is not unique or the child link already has a joint
+        """
+        if name in self._joint_index:
+            raise ValueError("Duplicate joint: %s" % name)
+        if self.links[child].joint >= 0:
+            raise ValueError("Link %s already has a joint" % self.links[child].name)
+        joint = Joint(len(self.joints), name, type, parent, child, axis, lower, upper, effort, velocity)
+        self.joints.append(joint)
+        self._joint_index[name] = joint.index
+        self.links[child].joint = joint.index
+        return joint
+
+    def set_inertial(self, link, mass, pose=IDENTITY, inertia=(1.0, 0.0, 0.0, 1.0, 0.0, 1.0)):
+        """
+        Sets the mass properties of a link (see :class:`Inertial`).
+
+        :param link: Index of the link
+        :return: The new :class:`Inertial`
+        """
+        inertial = self.links[link].inertial = Inertial(mass, pose, inertia)
+        return inertial
+
+    def add_visual(self, link, name, type, pose=IDENTITY, size=(1.0, 1.0, 1.0), uri=''):
+        """
+        Adds a visual geometry to a link (see :class:`Geometry`).
+
+        :param link: Index of the link
+        :return: The new :class:`Geometry`
+        """
+        geometry = Geometry(name, type, pose, size, uri)
+        self.links[link].visuals += (geometry,)
+        return geometry
+
+    def add_collision(self, link, name, type, pose=IDENTITY, size=(1.0, 1.0, 1.0), uri=''):
+        """
+        Adds a collision geometry to a link (see :class:`Geometry`).
+
+        :param link: Index of the link
+        :return: The new :class:`Geometry`
+        """
+        geometry = Geometry(name, type, pose, size, uri)
+        self.links[link].collisions += (geometry,)
+        return geometry
+
+    def add_sensor(self, link, name, type, pose=IDENTITY):
+        """
+        Adds a sensor to a link (see :class:`Sensor`).
+
+        :param link: Index of the link
+        :return: The new :class:`Sensor`
+        """
+        sensor = Sensor(name, type, pose)
+        self.links[link].sensors += (sensor,)
+        return sensor
+
+    def add_muscle(self, name, type, max_isometric_force=1000.0, points=()):
+        """
+        Adds a muscle (see :class:`Muscle`).
+
+        :return: The new :class:`Muscle`
+        """
+        muscle = Muscle(name, type, max_isometric_force, tuple(points))
+        self.muscles.append(muscle)
+        return muscle
+
+    def link(self, name):
+        """
+        :return: The :class:`Link` with the given name
+        :raises KeyError: if there is no such link
+        """
+        return self.links[self._link_index[name]]
+
+    def joint(self, name):
+        """
+        :return: The :class:`Joint` with the given name
+        :raises KeyError: if there is no such joint
+        """
+        return self.joints[self._joint_index[name]]
+
+    def roots(self):
+        """
+        :return: List of the links without parent
+        """
+        return [link for link in self.links if link.parent < 0]
+
+    def children(self):
+        """
+        :return: List with the child link indices of every link
+        """
+        children = [[] for _ in self.links]
+        for link in self.links:
+            if link.parent >= 0:
+                children[link.parent].append(link.index)
+        return children
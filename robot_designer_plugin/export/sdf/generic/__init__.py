@@ -39,10 +39,14 @@ Generic (Blender-independent) parsing of SDF files.
 """
 
 from . import helpers
-from . import sdf_dom
-from . import sdf_tree
+from ...bindings import lazy_import
 from importlib import reload
 reload(helpers)
-reload(sdf_dom)
+
+# The generated bindings are large, hence they are only loaded when an importer or exporter uses them
+sdf_dom = lazy_import(__name__ + '.sdf_dom')
+model_config_dom = lazy_import(__name__ + '.model_config_dom')
+
+from . import sdf_tree
 reload(sdf_tree)
 
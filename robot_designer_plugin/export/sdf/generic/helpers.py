@@ -39,8 +39,11 @@ import re
 import numbers
 from .transformations import compose_matrix, concatenate_matrices, inverse_matrix, translation_from_matrix, euler_from_matrix
 
-# Blender-specific imports
-from mathutils import *
+# Blender-specific imports (only needed for the euler conversions, such that parsing works outside of Blender)
+try:
+    from mathutils import *
+except ImportError:
+    pass
 
 __author__ = 'ulbrich'
 
@@ -191,4 +194,4 @@ def get_list_value(element, default=0.0):
         else:
             return 0.0
     except AttributeError:
-        return default
\ No newline at end of file
+        return default
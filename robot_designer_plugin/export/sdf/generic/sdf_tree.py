@@ -1,14 +1,16 @@
 import logging
 import pyxb
 from . import sdf_dom
-from .helpers import list_to_string, string_to_list
+from .helpers import list_to_string, string_to_list, pose_string2homogeneous, pose2origin, pose_float2homogeneous, \
+    homo2origin
+from ...structure import index_kinematic_structure
+from .transformations import concatenate_matrices
 from pyxb import ContentNondeterminismExceededError
 import os
 
 from pprint import pprint
 
 logger = logging.getLogger('SDF')
-logger.setLevel(logging.DEBUG)
 #~/Documents/blender-2.78-d35bf3f-linux-glibc219-x86_64/2.78/python/bin/pyxbgen -u sdf_model.xsd -m sdf_model_dom
 
 def set_value(l):
@@ -20,6 +22,91 @@ def set_value(l):
     return ' '.join(i for i in l)
 
 
+_IDENTITY = (0.0,) * 6
+
+_LIMIT = (('lower', 0.0), ('upper', 0.0), ('effort', 0.0), ('velocity', 0.0))
+
+_INERTIA = (('ixx', 1.0), ('ixy', 0.0), ('ixz', 0.0), ('iyy', 1.0), ('iyz', 0.0), ('izz', 1.0))
+
+
+def _first(values, default=None):
+    """
+    Returns the first element of a (plural) DOM element or the default value.
+    """
+    return values[0] if len(values) else default
+
+
+def _floats(text, default):
+    """
+    Converts a XML vector to a tuple of floats. Returns the default if the element is missing or has the wrong size.
+    """
+    if text is None:
+        return default
+    values = tuple(string_to_list(str(text)))
+    return values if len(values) == len(default) else default
+
+
+def _values(element, fields):
+    """
+    Reads the (plural) float fields of a DOM element as tuple. Missing fields (or elements) are set to their defaults.
+    """
+    if element is None:
+        return tuple(default for _, default in fields)
+    return tuple(float(_first(getattr(element, name), default)) for name, default in fields)
+
+
+def _geometries(elements):
+    """
+    Converts visual or collision DOM elements to the arguments of
+    :meth:`robot_designer_plugin.export.robot_model.RobotModel.add_visual`.
+    """
+    for element in elements:
+        geometry = _first(element.geometry)
+        if geometry is None:
+            continue
+        name = str(element.name)
+        pose = _floats(_first(element.pose), _IDENTITY)
+        if geometry.mesh:
+            mesh = geometry.mesh[0]
+            yield name, 'mesh', pose, _floats(_first(mesh.scale), (1.0, 1.0, 1.0)), str(_first(mesh.uri, ''))
+        elif geometry.box:
+            yield name, 'box', pose, _floats(_first(geometry.box[0].size), (1.0, 1.0, 1.0)), ''
+        elif geometry.cylinder:
+            cylinder = geometry.cylinder[0]
+            yield name, 'cylinder', pose, (float(_first(cylinder.radius, 1.0)),
+                                                   float(_first(cylinder.length, 1.0))), ''
+        elif geometry.sphere:
+            yield name, 'sphere', pose, (float(_first(geometry.sphere[0].radius, 1.0)),), ''
+        else:
+            logger.warning("Unsupported geometry of %s skipped", element.name)
+
+
+def _geometry_element(factory, geometry, default_name):
+    """
+    Creates a visual or collision DOM element from a :class:`robot_designer_plugin.export.robot_model.Geometry`.
+    """
+    element = factory()
+    element.name = geometry.name or default_name
+    element.pose.append(list_to_string(geometry.pose))
+    shape = sdf_dom.geometry()
+    element.geometry.append(shape)
+    if geometry.type == 'mesh':
+        shape.mesh.append(sdf_dom.mesh())
+        shape.mesh[0].uri.append(geometry.uri)
+        shape.mesh[0].scale.append(list_to_string(geometry.size))
+    elif geometry.type == 'box':
+        shape.box.append(sdf_dom.box())
+        shape.box[0].size.append(list_to_string(geometry.size))
+    elif geometry.type == 'cylinder':
+        shape.cylinder.append(sdf_dom.cylinder())
+        shape.cylinder[0].radius.append(geometry.size[0])
+        shape.cylinder[0].length.append(geometry.size[1])
+    else:
+        shape.sphere.append(sdf_dom.sphere())
+        shape.sphere[0].radius.append(geometry.size[0])
+    return element
+
+
 class SDFTree(object):
     """
     A class that parses and represents a robot described by a SDF file.
@@ -29,12 +116,13 @@ class SDFTree(object):
     It uses a document object model (DOM) created by pyxbgen.py (in version 1.2.5 -- pyxb).
     """
 
-    def __init__(self, connected_joints=None, connected_links=None, robot=None):
+    def __init__(self, connected_joints=None, connected_links=None, robot=None, segment_links=None):
         """ Constructor
         :param root: if specified, the constructor copies the cross-references in the XML file from another
         SDFTree instance.
         :param connected_joints: If specified, the connectedJoints (cross-reference in the XML file) is set.
         :param connected_links: If specified, the connectedLinks (cross-reference in the XML file) is set.
+        :param segment_links: If specified, the segmentLinks (segment name to link index used when exporting) is set.
         :return:
         """
         self.children = []
@@ -46,6 +134,7 @@ class SDFTree(object):
 
         self.connectedLinks = connected_links
         self.connectedJoints = connected_joints
+        self.segmentLinks = segment_links
 
     @staticmethod
     def parse(file_name):
@@ -56,41 +145,29 @@ class SDFTree(object):
         and calls the recursive SDFTree.build() method to create a tree-like data structure representing the
         kinematic tree(s) of the robot.
         :param file_name: the name of the file to open
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
         """
 
         # read the file
         # robot = sdf_model_dom.parse(file_name, silence=True)
         # to add the root link to the kinematic chain, we create a virtual link on top of the root link. (temporal solution)
 
-        try:
-            root = sdf_dom.CreateFromDocument(open(file_name).read())
-        except ContentNondeterminismExceededError as e:
-            logger.error("Error raised %s, %s", e, e.instance.name)
-            raise e
+        root = SDFTree.read(file_name)
         robot = root.model[0]
         robot_location = string_to_list(root.model[0].pose[0])[0:3]
         robot_rotation = string_to_list(root.model[0].pose[0])[3:]
 
         muscles = str(robot.muscles)
-        logger.debug('Muscle Path:' + muscles)
-
-        # create mapping from (parent) links to joints  (a list)
-        connected_joints = {link: [joint for joint in robot.joint if link.name == joint.parent[0]] for link
-                            in robot.link}
-
-        # create mapping from joints to their child links (a dictionary)
-        connected_links = {joint: link for link in robot.link for joint in robot.joint if
-                           link.name == joint.child[0]}
+        logger.debug('Muscle Path: %s', muscles)
 
-        # find root links (i.e., links that are NOT connected to a joint)
-        child_links = [link.name for link in robot.link for joint in robot.joint if
-                       link.name == joint.child[0]]
+        # create mapping from (parent) links to joints (a list), from joints to their child links (a dictionary)
+        # and find root links (i.e., links that are NOT connected to a joint) -- the link, not link name
+        connected_joints, connected_links, root_links = index_kinematic_structure(
+            robot.link, robot.joint, lambda joint: joint.parent[0], lambda joint: joint.child[0], 'world')
 
-        ###  the link, not link name
-        root_links = [link for link in robot.link if link.name not in child_links]
-
-        logger.debug("Root links: %s", [i.name for i in root_links])
-        logger.debug("connected links: %s", {j.name: l.name for j, l in connected_links.items()})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Root links: %s", [i.name for i in root_links])
+            logger.debug("connected links: %s", {j.name: l.name for j, l in connected_links.items()})
 
         kinematic_chains = []
 
@@ -118,6 +195,156 @@ class SDFTree(object):
         logger.debug("kinematic chains: %s", kinematic_chains)
         return muscles, robot.name, robot_location, robot_rotation, root_links, kinematic_chains#, controller_cache, gazebo_tags
 
+    @staticmethod
+    def read(file_name):
+        """
+        Reads the document object model of a SDF file.
+
+        :param file_name: the name of the file to open
+        :return: the root (``sdf``) element
+        """
+        try:
+            with open(file_name) as f:
+                return sdf_dom.CreateFromDocument(f.read())
+        except ContentNondeterminismExceededError as e:
+            logger.error("Error raised %s, %s", e, e.instance.name)
+            raise e
+
+    @staticmethod
+    def parse_model(file_name, model):
+        """
+        Parses a SDF file into the Blender-free intermediate representation (see :meth:`SDFTree.fill_model`).
+
+        :param file_name: the name of the file to open
+        :param model: an empty :class:`robot_designer_plugin.export.robot_model.RobotModel` that is filled
+        :return: the model
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
+        """
+        return SDFTree.fill_model(SDFTree.read(file_name), model)
+
+    @staticmethod
+    def fill_model(root, model):
+        """
+        Fills the Blender-free intermediate representation from a document object model. The link poses of the file
+        (relative to the model) are converted to poses relative to the parent links.
+
+        :param root: the root (``sdf``) element (see :meth:`SDFTree.read`)
+        :param model: an empty :class:`robot_designer_plugin.export.robot_model.RobotModel` that is filled
+        :return: the model
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
+        """
+        robot = root.model[0]
+        connected_joints, connected_links, root_links = index_kinematic_structure(
+            robot.link, robot.joint, lambda joint: joint.parent[0], lambda joint: joint.child[0], 'world')
+
+        model.name = str(robot.name)
+        model.pose = _floats(_first(robot.pose), _IDENTITY)
+        model.muscle_uri = str(_first(robot.muscles, ''))
+
+        # depth-first traversal such that parents are added before their children
+        stack = [(link, None, -1) for link in reversed(root_links)]
+        frames = []
+        while stack:
+            link, joint, parent = stack.pop()
+            frames.append(pose_string2homogeneous(str(_first(link.pose, '0 0 0 0 0 0'))))
+            if parent < 0:
+                pose = _floats(_first(link.pose), _IDENTITY)
+            else:
+                xyz, rpy = pose2origin(frames[parent], frames[-1])
+                pose = tuple(float(i) for i in xyz) + tuple(float(i) for i in rpy)
+                pose = _IDENTITY if pose == _IDENTITY else pose
+            index = model.add_link(str(link.name), pose, parent).index
+
+            if joint is not None:
+                axis = _first(joint.axis)
+                limit = _first(axis.limit) if axis is not None else None
+                model.add_joint(str(joint.name), str(joint.type), parent, index,
+                                _floats(_first(axis.xyz) if axis is not None else None, (0.0, 0.0, 1.0)),
+                                *_values(limit, _LIMIT))
+
+            inertial = _first(link.inertial)
+            if inertial is not None:
+                model.set_inertial(index, float(_first(inertial.mass, 1.0)), _floats(_first(inertial.pose), _IDENTITY),
+                                   _values(_first(inertial.inertia), _INERTIA))
+            for arguments in _geometries(link.visual):
+                model.add_visual(index, *arguments)
+            for arguments in _geometries(link.collision):
+                model.add_collision(index, *arguments)
+            for sensor in link.sensor:
+                model.add_sensor(index, str(sensor.name), str(sensor.type),
+                                 _floats(_first(sensor.pose), _IDENTITY))
+
+            for child_joint in reversed(connected_joints[link]):
+                stack.append((connected_links[child_joint], child_joint, index))
+        return model
+
+    @staticmethod
+    def from_model(model):
+        """
+        Builds a tree from the Blender-free intermediate representation (the inverse of :meth:`SDFTree.fill_model`).
+        The poses of the links are converted into the model frame. Root links are not connected by a joint.
+
+        :param model: a :class:`robot_designer_plugin.export.robot_model.RobotModel`
+        :return: the root of the tree (see :meth:`SDFTree.write`)
+        """
+        root = SDFTree.create_empty(model.name)
+        robot = root.sdf.model[0]
+        robot.pose.append(list_to_string(model.pose))
+        if model.muscle_uri:
+            robot.muscles.append(model.muscle_uri)
+            robot.plugin.append(sdf_dom.plugin())
+            robot.plugin[0].name = "muscle_interface_plugin"
+            robot.plugin[0].filename = "libgazebo_ros_muscle_interface.so"
+
+        frames = []
+        for link in model.links:
+            frame = pose_float2homogeneous(link.pose)
+            if link.parent >= 0:
+                frame = concatenate_matrices(frames[link.parent], frame)
+            frames.append(frame)
+
+            node = root.add()
+            node.link.name = link.name
+            xyz, rpy = homo2origin(frame)
+            node.link.pose.append(list_to_string([float(i) for i in xyz] + [float(i) for i in rpy]))
+
+            if link.joint >= 0:
+                joint = model.joints[link.joint]
+                node.joint.name = joint.name
+                node.joint.type = joint.type
+                node.joint.axis[0].xyz.append(list_to_string(joint.axis))
+                limit = node.joint.axis[0].limit[0]
+                limit.lower.append(joint.lower)
+                limit.upper.append(joint.upper)
+                limit.effort.append(joint.effort)
+                limit.velocity.append(joint.velocity)
+                node.connect(link.name, model.links[joint.parent].name)
+            else:
+                node.joint.name = link.name + '_joint'
+                node.joint.type = 'fixed'
+                node.connect(link.name)
+
+            if link.inertial is not None:
+                inertial = node.link.inertial[0]
+                inertial.mass[0] = link.inertial.mass
+                inertial.pose[0] = list_to_string(link.inertial.pose)
+                inertia = inertial.inertia[0]
+                inertia.ixx[0], inertia.ixy[0], inertia.ixz[0], inertia.iyy[0], inertia.iyz[0], inertia.izz[0] = \
+                    link.inertial.inertia
+
+            for i, geometry in enumerate(link.visuals):
+                node.link.visual.append(_geometry_element(sdf_dom.visual, geometry, '%s_visual_%d' % (link.name, i)))
+            for i, geometry in enumerate(link.collisions):
+                node.link.collision.append(_geometry_element(sdf_dom.collision, geometry,
+                                                             '%s_collision_%d' % (link.name, i)))
+            for sensor in link.sensors:
+                element = sdf_dom.sensor()
+                element.name = sensor.name
+                element.type = sensor.type
+                element.pose.append(list_to_string(sensor.pose))
+                node.link.sensor.append(element)
+        return root
+
     def build(self, link, joint=None, depth=0):
         """
         Recursive function that builds up the tree representation of the robot. You do not have to call it manually (
@@ -153,7 +380,7 @@ class SDFTree(object):
 
         if not sdf.model:
             sdf.model.append(sdf_dom.model())
-        tree = SDFTree(connected_links={}, connected_joints={}, robot=sdf.model[0])
+        tree = SDFTree(connected_links={}, connected_joints={}, robot=sdf.model[0], segment_links={})
         tree.sdf = sdf
 
         tree.robot.name = name
@@ -173,20 +400,16 @@ class SDFTree(object):
         :param file_name:
         :return:
         """
-        print("connected joints: ", {j.name: l for j, l in self.connectedJoints.items()})
-
-        print("connected links: ", {j.name: l.name for j, l in self.connectedLinks.items()})
-
-        print("root link name: ", self.link.name)
-
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("connected joints: %s", {j.name: l for j, l in self.connectedJoints.items()})
+            logger.debug("connected links: %s", {j.name: l.name for j, l in self.connectedLinks.items()})
+            logger.debug("root link name: %s", self.link.name)
 
         for joint, link in self.connectedLinks.items():
             joint.child.append(link.name)
 
         for link, joints in self.connectedJoints.items():
             for joint in joints:
-                print("connected link name:", link.name)
-                print("connected link linked joint name: ", joint.name)
                 joint.parent.append(link.name)
 
         # # Connect root joints to self.link (the root link)
@@ -234,7 +457,8 @@ class SDFTree(object):
         :return: a reference to the newly created SDFTree instance.
         """
 
-        tree = SDFTree(connected_links=self.connectedLinks, connected_joints=self.connectedJoints, robot=self.robot)
+        tree = SDFTree(connected_links=self.connectedLinks, connected_joints=self.connectedJoints, robot=self.robot,
+                       segment_links=self.segmentLinks)
         tree.joint = sdf_dom.joint()
         tree.link = sdf_dom.link()
         tree.robot.link.append(tree.link)
@@ -250,7 +474,6 @@ class SDFTree(object):
 
         # e.g., virtual joint --> base link
         self.connectedLinks[tree.joint] = tree.link
-        print("connected links (joint->link): ", {j.name: l.name for j, l in self.connectedLinks.items()})
 
         # if self.link not in self.connectedJoints:
         #     self.connectedJoints[self.link] = []
@@ -270,6 +493,19 @@ class SDFTree(object):
 
         return tree
 
+    def connect(self, segment_name, parent_name=None):
+        """
+        Registers the link of this node for the segment (i.e., bone) name and appends the joint to the joints of
+        the link registered for the parent segment (if any). Used when exporting to find parent links in constant
+        time.
+
+        :param segment_name: The name of the segment this node represents.
+        :param parent_name: The name of the parent segment (or None).
+        """
+        self.segmentLinks[segment_name] = self.link
+        if parent_name is not None:
+            self.connectedJoints.setdefault(self.segmentLinks[parent_name], []).append(self.joint)
+
     def add_mesh(self, file_name, scale_factor=(1.0,1.0,1.0)):
         """
         Adds a mesh to current segment.
@@ -390,17 +626,16 @@ class SDFTree(object):
         link_inertial = sdf_dom.inertial()
         link_inertial_inertia = sdf_dom.CTD_ANON_45()
         # joint_axis_xyz = joint_axis.xyz.vector3
-        print('Joint Axis')
         if not joint.axis:
             joint.axis.append(joint_axis)
 
         if not joint.axis[0].limit:
-            print('Set defaults: Joint Axis Limit ')
+            logger.debug('Set defaults: Joint Axis Limit')
             joint.axis[0].limit.append(joint_axis_limit)
             # joint.axis[0].limit.append(BIND())
 
         if not link.inertial:
-            print('Set defaults: Joint Axis Limit ')
+            logger.debug('Set defaults: Link Inertial')
             link.inertial.append(link_inertial)
 
         if not link.inertial[0].inertia:
@@ -61,9 +61,12 @@ from mathutils import Vector
 from .generic import sdf_tree
 from .generic.helpers import list_to_string, string_to_list, localpose2globalpose
 from ...core import config, PluginManager, RDOperator
+from ...operators.dynamics import check_inertials
 from ...operators.helpers import ModelSelected, ObjectMode
-from ...operators.model import SelectModel
-from ..osim.osim_export import create_osim, get_muscles
+from ..osim.osim_export import create_osim
+from ..associations import ObjectAssociations
+from ..mesh_cache import MeshExportCache
+from ..mesh_export import MeshExportQueue
 
 from ...properties.globals import global_properties
 
@@ -95,91 +98,60 @@ def _uri_for_meshes_and_muscles(in_ros_package: bool, abs_file_paths, toplevel_d
         return "model://" + file_path
 
 
-def export_mesh(operator: RDOperator, context, name: str, directory: str, toplevel_dir: str, in_ros_package: bool,
-                abs_file_paths=False, export_collision=False):
+def export_mesh(operator: RDOperator, context, mesh, directory: str, toplevel_dir: str, in_ros_package: bool,
+                abs_file_paths=False, export_collision=False, queue=None):
     """
     Exports a mesh to a separate file.
 
     :param operator: The calling operator
     :param context: The current context
-    :param name: the name of the mesh (not the file name).
-    :type name: basestring.
+    :param mesh: the mesh object (see :class:`..associations.ObjectAssociations`).
     :param directory: The directory in which to install the meshes
     :param toplevel_dir: The directory in which to export
     :param in_ros_package: Whether to export into a ros package or plain files
     :param abs_file_paths: If not intstalled into a ros package decides whether to use absolute file paths.
     :param export_collision: Exporting a collision mesh or visualization mesh.
+    :param queue: :class:`..mesh_export.MeshExportQueue` that collects the mesh (exported immediately if not given)
     :return: name of the file the mesh is stored in.
     """
 
     if not export_collision:
-        meshes = [obj.name for obj in context.scene.objects if
-                  obj.type == "MESH" and obj.name == name and
-                  not obj.RobotEditor.tag == "COLLISION"]
         directory = os.path.join(directory, "meshes", "visual")
-
     else:
-        meshes = [obj.name for obj in context.scene.objects if
-                  obj.type == "MESH" and name == obj.name and
-                  obj.RobotEditor.tag == "COLLISION"]
         directory = os.path.join(directory, "meshes", "collisions")
 
-
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-    # There is max. 1 object in the list
-    assert len(meshes) <= 1
-    for mesh in meshes:
-        operator.logger.debug("Processing mesh: %s", mesh)
-
-        model_name = bpy.context.active_object.name
-        bpy.ops.object.select_all(action='DESELECT')
-        bpy.data.objects[mesh].select = True
-        bpy.context.scene.objects.active = bpy.data.objects[mesh]
-        # bpy.context.active_object.select = True
-
-        # get the mesh vertices number
-        bm = bpy.context.scene.objects.active.data
-        # print("# of vertices=%d" % len(bm.vertices))
-
-        if len(bm.vertices) > 1:
-            if '.' in mesh:
-                file_path = os.path.join(directory, bpy.data.objects[mesh].RobotEditor.fileName.replace('.', '_') + '.dae')
-            else:
-                file_path = os.path.join(directory, bpy.data.objects[mesh].RobotEditor.fileName + '.dae')
-
-            hide_flag_backup = bpy.context.scene.objects.active.hide
-            bpy.context.scene.objects.active.hide = False # Blender does not want to export hidden objects.
+    operator.logger.debug("Processing mesh: %s", mesh.name)
 
-            bpy.ops.wm.collada_export(filepath=file_path, apply_modifiers=True, selected=True, use_texture_copies=True)
+    # get the mesh vertices number
+    bm = mesh.data
 
-            bpy.context.scene.objects.active.hide = hide_flag_backup
-
-            # quick fix for dispersed meshes
-            # todo: find appropriate solution
-            with open(file_path, "r") as file:
-                lines = file.readlines()
-            with open(file_path, "w") as file:
-                for line in lines:
-                    if "matrix" not in line:
-                        file.write(line)
+    if len(bm.vertices) > 1:
+        if '.' in mesh.name:
+            file_path = os.path.join(directory, mesh.RobotEditor.fileName.replace('.', '_') + '.dae')
         else:
-            if '.' in mesh:
-                file_path = os.path.join(directory,
-                                         bpy.data.objects[mesh].RobotEditor.fileName.replace('.', '_') + '_vertices' + str(len(bm.vertices)) + '.dae')
-            else:
-                file_path = os.path.join(directory, bpy.data.objects[mesh].RobotEditor.fileName + '_vertices' + str(len(bm.vertices)) + '.dae')
-
-        SelectModel.run(model_name=model_name)
+            file_path = os.path.join(directory, mesh.RobotEditor.fileName + '.dae')
 
-        return _uri_for_meshes_and_muscles(in_ros_package, abs_file_paths, toplevel_dir, file_path)
+        if queue is None:
+            queue = MeshExportQueue()
+            queue.add(mesh, file_path)
+            queue.run(operator, context)
+        else:
+            queue.add(mesh, file_path)
+    else:
+        if '.' in mesh.name:
+            file_path = os.path.join(directory,
+                                     mesh.RobotEditor.fileName.replace('.', '_') + '_vertices' + str(len(bm.vertices)) + '.dae')
+        else:
+            file_path = os.path.join(directory, mesh.RobotEditor.fileName + '_vertices' + str(len(bm.vertices)) + '.dae')
 
-            # return ("model://" + os.path.join(model_folder_name, "meshes",
-            # mesh + ".dae"))
+    return _uri_for_meshes_and_muscles(in_ros_package, abs_file_paths, toplevel_dir, file_path)
 
 
-def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False):
+def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False,
+               associations=None, use_mesh_cache=True):
     """
     Creates the SDF XML file and exports the meshes
 
@@ -190,6 +162,8 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
     :param toplevel_directory: The directory in which to export
     :param in_ros_package: Whether to export into a ros package or plain files
     :param abs_filepaths: If not intstalled into a ros package decides whether to use absolute file paths.
+    :param associations: :class:`..associations.ObjectAssociations` of the model (built if not given)
+    :param use_mesh_cache: Reuse unchanged mesh files of a previous export into ``meshpath``
     :return:
     """
 
@@ -201,7 +175,7 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
         :param tree: Reference to a SDF Tree object. (Defined in sdf_tree.py)
         """
 
-        operator.logger.info("walk_segments: %s" % str(segment))
+        operator.logger.debug("walk_segments: %s", segment)
 
         child = tree.add()
         trafo, dummy = segment.RobotEditor.getTransform()
@@ -212,7 +186,7 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
         pose_rpy = list_to_string(trafo.to_euler())
         pose_xyz, pose_rpy = localpose2globalpose(ref_pose, pose_rpy, pose_xyz)
 
-        operator.logger.info(" child link pose'%s'" % ' '.join([pose_xyz, pose_rpy]))
+        operator.logger.debug(" child link pose'%s %s'", pose_xyz, pose_rpy)
         child.link.pose.append(' '.join([pose_xyz, pose_rpy]))
         # child.link.pos[0] = ' '.join([pose_xyz, pose_rpy])
         # if '_joint' in segment.name:
@@ -225,20 +199,12 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
         child.link.name = segment.name.replace("_joint", "_link")
 
 
-        if segment.parent:
-            parent_link = [l for j, l in tree.connectedLinks.items() if segment.parent.name == j.name]
-            if parent_link[0] in tree.connectedJoints:
-                tree.connectedJoints[parent_link[0]].append(child.joint)
-            else:
-                tree.connectedJoints[parent_link[0]] = [child.joint]
+        child.connect(segment.name, segment.parent.name if segment.parent else None)
 
         if segment.parent:
-            operator.logger.info(" segment parent name'%s'" % segment.parent.name)
-        operator.logger.info(" segment joint name'%s'" % child.joint.name)
-        operator.logger.info(" segment link name'%s'" % child.link.name)
-
-        print("connected links (joint->link): ", {j.name: l.name for j, l in tree.connectedLinks.items()})
-        print("connected joints (link->joint): ", {j.name: l for j, l in tree.connectedJoints.items()})
+            operator.logger.debug(" segment parent name'%s'", segment.parent.name)
+        operator.logger.debug(" segment joint name'%s'", child.joint.name)
+        operator.logger.debug(" segment link name'%s'", child.link.name)
 
         if segment.RobotEditor.axis_revert:
             revert = -1
@@ -260,14 +226,7 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
 
         #child.joint.axis[0].use_parent_model_frame.append(True)
 
-        operator.logger.info(" joint axis xyz'%s'" % joint_axis_xyz)
-
-        print('Parent link:', child.joint.parent)
-        print('Child link:', child.joint.child)
-        print('Joint type:', child.joint.type)
-        print('Axis:', child.joint.axis)
-        print('Axis limit:', child.joint.axis[0].limit)
-        print('Axis xyz:', child.joint.axis[0].xyz)
+        operator.logger.debug(" joint axis xyz'%s'", joint_axis_xyz)
 
 
         if segment.parent is None:
@@ -293,12 +252,10 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
             if segment.RobotEditor.jointMode == 'FIXED':
                 child.joint.type = 'fixed'
 
-        operator.logger.info(" joint type'%s'" % child.joint.type)
+        operator.logger.debug(" joint type'%s'", child.joint.type)
 
         # Add properties
-        armature = context.active_object
-        connected_meshes = [mesh.name for mesh in context.scene.objects if
-                            mesh.type == 'MESH' and mesh.parent_bone == segment.name and mesh.parent == armature]
+        segment_objects = associations[segment.name]
         # if len(connected_meshes) > 0:
         #     child.link.name = connected_meshes[0]
         # else:
@@ -308,96 +265,83 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
         #     # todo: several meshes assigned to the same bone
         #     # todo: solutions add another property to a bone or
         #     # chose the name from the list of connected meshes
-        for mesh in connected_meshes:
-            operator.logger.info("Connected mesh name: %s", mesh)
-            pose_bone = context.active_object.pose.bones[segment.name]
-            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * \
-                   bpy.data.objects[mesh].matrix_world
-
-           # bpy.context.active_object.matrix_world = segment_world * trafo_sdf * bpy.context.active_object.matrix_world  # * inverse_matrix(bpy.context.active_object.matrix_world)#* \
-            #  bpy.context.active_object.matrix_world
+        pose_bone = context.active_object.pose.bones[segment.name]
+        for mesh in segment_objects.visuals:
+            operator.logger.debug("Connected mesh name: %s", mesh.name)
+            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * mesh.matrix_world
 
             visual_path = export_mesh(operator, context, mesh, meshpath, toplevel_directory,
-                                      in_ros_package, abs_filepaths, export_collision=False)
-            operator.logger.info("visual mesh path: %s", visual_path)
+                                      in_ros_package, abs_filepaths, export_collision=False, queue=queue)
+            operator.logger.debug("visual mesh path: %s", visual_path)
 
-            if visual_path and "_vertices1.dae" not in visual_path:
+            if "_vertices1.dae" not in visual_path:
                 visual = child.add_mesh(visual_path,
-                                        [i * j for i, j in zip(bpy.data.objects[mesh].scale, blender_scale_factor)])
+                                        [i * j for i, j in zip(mesh.scale, blender_scale_factor)])
                 visual_pose_xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
                 visual_pose_rpy = list_to_string(pose.to_euler())
 
                 visual.pose.append(' '.join([visual_pose_xyz, visual_pose_rpy]))
-                visual.name = bpy.data.objects[mesh].name #child.link.name
+                visual.name = mesh.name #child.link.name
             else:
-                operator.logger.info("No visual model for: %s", mesh)
+                operator.logger.info("No visual model for: %s", mesh.name)
+
+        for mesh in segment_objects.collisions:
+            operator.logger.debug("Connected mesh name: %s", mesh.name)
+            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * mesh.matrix_world
 
             collision_path = export_mesh(operator, context, mesh, meshpath, toplevel_directory,
-                                         in_ros_package, abs_filepaths, export_collision=True)
+                                         in_ros_package, abs_filepaths, export_collision=True, queue=queue)
 
-            operator.logger.info("collision mesh path: %s", collision_path)
+            operator.logger.debug("collision mesh path: %s", collision_path)
 
-            if collision_path and "_vertices1.dae" not in collision_path:
+            if "_vertices1.dae" not in collision_path:
                 collision = child.add_collision(collision_path,
                                                      [i * j for i, j in
-                                                      zip(bpy.data.objects[mesh].scale, blender_scale_factor)])
+                                                      zip(mesh.scale, blender_scale_factor)])
 
-                operator.logger.info(" collision mesh pose translation wo scale'%s'" % pose.translation)
-                operator.logger.info(" collision mesh pose scale factor'%s'" % blender_scale_factor)
-                operator.logger.info(" collision mesh pose translation wi scale'%s'" % [i * j for i, j in zip(pose.translation, blender_scale_factor)])
+                operator.logger.debug(" collision mesh pose translation wo scale'%s'", pose.translation)
+                operator.logger.debug(" collision mesh pose scale factor'%s'", blender_scale_factor)
 
                 collision_pose_xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
                 collision_pose_rpy = list_to_string(pose.to_euler())
 
                 collision.pose.append(' '.join([collision_pose_xyz, collision_pose_rpy]))
-                collision.name = bpy.data.objects[mesh].name #           child.link.name + '_collision'
-                operator.logger.info(" collision mesh pose'%s'" % collision.pose[0])
-
-
-
+                collision.name = mesh.name #           child.link.name + '_collision'
+                operator.logger.debug(" collision mesh pose'%s'", collision.pose[0])
             else:
-                operator.logger.info("No collision model for: %s", mesh)
-
-        frame_names = [
-            frame.name for frame in context.scene.objects if
-            frame.RobotEditor.tag == 'PHYSICS_FRAME' and frame.parent_bone == segment.name]
+                operator.logger.info("No collision model for: %s", mesh.name)
 
         # If no frame is connected create a default one. This is required for Gazebo!
-        operator.logger.info("frame names: %s", frame_names)
+        operator.logger.debug("frame names: %s", [frame.name for frame in segment_objects.frames])
 
         # if not frame_names:
         #     child.add_inertial()
 
-        for frame in frame_names:
+        for frame in segment_objects.frames:
             # Add inertial definitions (for Gazebo)
             inertial = child.link.inertial[0]
-            print(inertial, inertial.__dict__)
-            if bpy.data.objects[frame].parent_bone == segment.name:
-                pose_bone = context.active_object.pose.bones[segment.name]
-
 
-                # set mass
-                inertial.mass[0] = bpy.data.objects[frame].RobotEditor.dynamics.mass
-                if inertial.mass[0] <= 0.:
-                    raise ValueError("Mass of "+frame+" is not positive, but "+str(inertial.mass[0]))
-                # Ugly, to throw an exception here. But appending info_list did not print the info in the GUI.
+            # set mass
+            inertial.mass[0] = frame.RobotEditor.dynamics.mass
+            if inertial.mass[0] <= 0.:
+                raise ValueError("Mass of "+frame.name+" is not positive, but "+str(inertial.mass[0]))
+            # Ugly, to throw an exception here. But appending info_list did not print the info in the GUI.
 
-                # set inertia
-                inertial.inertia[0].ixx[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaXX
-                inertial.inertia[0].ixy[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaXY
-                inertial.inertia[0].ixz[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaXZ
-                inertial.inertia[0].iyy[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaYY
-                inertial.inertia[0].iyz[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaYZ
-                inertial.inertia[0].izz[0] = bpy.data.objects[frame].RobotEditor.dynamics.inertiaZZ
+            # set inertia
+            inertial.inertia[0].ixx[0] = frame.RobotEditor.dynamics.inertiaXX
+            inertial.inertia[0].ixy[0] = frame.RobotEditor.dynamics.inertiaXY
+            inertial.inertia[0].ixz[0] = frame.RobotEditor.dynamics.inertiaXZ
+            inertial.inertia[0].iyy[0] = frame.RobotEditor.dynamics.inertiaYY
+            inertial.inertia[0].iyz[0] = frame.RobotEditor.dynamics.inertiaYZ
+            inertial.inertia[0].izz[0] = frame.RobotEditor.dynamics.inertiaZZ
 
-                # set inertial pose
-                pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * \
-                       bpy.data.objects[frame].matrix_world
+            # set inertial pose
+            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * frame.matrix_world
 
-                frame_pose_xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
-                frame_pose_rpy = list_to_string(pose.to_euler())
+            frame_pose_xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
+            frame_pose_rpy = list_to_string(pose.to_euler())
 
-                inertial.pose[0] = ' '.join([frame_pose_xyz, frame_pose_rpy])
+            inertial.pose[0] = ' '.join([frame_pose_xyz, frame_pose_rpy])
 
         #
         # # add joint controllers
@@ -413,11 +357,17 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
 
         # Add geometry
         for child_segments in segment.children:
-            operator.logger.info("Next Segment'%s'" % child_segments.name)
+            operator.logger.debug("Next Segment'%s'", child_segments.name)
             ref_pose = string_to_list(child.link.pose[0])
             walk_segments(child_segments, child, ref_pose)
 
     robot_name = context.active_object.name
+    if associations is None:
+        associations = ObjectAssociations.build(context)
+    # Fail before any mesh is exported
+    check_inertials(operator, context)
+    cache = MeshExportCache(meshpath) if use_mesh_cache else None
+    queue = MeshExportQueue(cache, global_properties.mesh_export_processes.get(context.scene))
 
     blender_scale_factor = context.active_object.scale
     blender_scale_factor = [blender_scale_factor[0],blender_scale_factor[2],blender_scale_factor[1]]
@@ -434,8 +384,7 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
     #     root.control_plugin = root.add_joint_control_plugin()
 
     # add root geometries to root.link
-    muscles = get_muscles(robot_name, context)
-    if muscles:
+    if associations.muscles:
         # add muscles path tag
         muscle_uri = _uri_for_meshes_and_muscles(
             in_ros_package,
@@ -453,11 +402,18 @@ def create_sdf(operator: RDOperator, context, filepath: str, meshpath: str, topl
                      b.parent is None]
 
     for segments in root_segments:
-        operator.logger.info("Root Segment'%s'" % segments.name)
+        operator.logger.info("Root Segment'%s'", segments.name)
         ref_pose = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]  # transform to gazebo coordinate frame
         walk_segments(segments, root, ref_pose)
 
-    operator.logger.info("Writing to '%s'" % filepath)
+    # Write the robot description only after all meshes have been exported
+    queue.run(operator, context)
+    if cache is not None:
+        cache.save()
+        operator.logger.info(cache.report())
+        operator.report({'INFO'}, cache.report())
+
+    operator.logger.info("Writing to '%s'", filepath)
     root.write(filepath)
 
 #     # insert gazebo tags before "</robot>" tag
@@ -689,15 +645,16 @@ class ExportPlain(RDOperator):
         toplevel_dir = self.filepath
         self.filepath = os.path.join(self.filepath, 'model.sdf')
 
+        associations = ObjectAssociations.build(context)
         create_sdf(self, context, filepath=self.filepath,
                     meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
-                    in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                    in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations)
         create_config(self, context, filepath=self.filepath,
                       meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
                       in_ros_package=False, abs_filepaths=self.abs_file_paths)
         create_osim(self, context, filepath=self.filepath,
                     meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
-                    in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                    in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -732,15 +689,16 @@ class ExportPackage(RDOperator):
         toplevel_dir = self.filepath
         self.filepath = os.path.join(self.filepath, 'model.sdf')
 
+        associations = ObjectAssociations.build(context)
         create_sdf(self, context, filepath=self.filepath,
                     meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
-                    in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                    in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations)
         create_config(self, context, filepath=self.filepath,
                       meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
                       in_ros_package=False, abs_filepaths=self.abs_file_paths)
         create_osim(self, context, filepath=self.filepath,
                     meshpath=toplevel_dir, toplevel_directory=toplevel_dir,
-                    in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                    in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -800,15 +758,17 @@ class ExportZippedPackage(RDOperator):
             temp_file = os.path.join(temp_dir, 'model.sdf')
             if not os.path.exists(temp_dir):
                 os.makedirs(temp_dir)
+            associations = ObjectAssociations.build(context)
             create_sdf(self, context, filepath=temp_file,
                        meshpath=temp_dir, toplevel_directory=temp_dir,
-                       in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                       in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations,
+                       use_mesh_cache=False)
             create_config(self, context, filepath=self.filepath,
                           meshpath=temp_dir, toplevel_directory=temp_dir,
                           in_ros_package=False, abs_filepaths=self.abs_file_paths)
             create_osim(self, context, filepath=self.filepath,
                         meshpath=temp_dir, toplevel_directory=temp_dir,
-                        in_ros_package=False, abs_filepaths=self.abs_file_paths)
+                        in_ros_package=False, abs_filepaths=self.abs_file_paths, associations=associations)
             self.logger.debug(temp_file)
             with zipfile.ZipFile(self.filepath, 'w') as zipf:
                 zipdir(target, zipf)
@@ -44,6 +44,7 @@ from bpy.props import StringProperty
 
 from ..osim.osim_import import OsimImporter
 from ...core.config import PLUGIN_PREFIX
+from ...core.logfile import LazyFormat
 
 
 # ######
@@ -365,11 +366,11 @@ class Importer(object):
         #oldscene = bpy.context.scene #get current scene in new file
         C = bpy.context
 
-        self.logger.info("Context mode: %s", C.mode)
+        self.logger.debug("Context mode: %s", C.mode)
         #         if context.mode != 'OBJECT':
         #             bpy.ops.object.mode_set(mode='OBJECT')
 
-        self.logger.info("parent name: %s", parent_name)
+        self.logger.debug("parent name: %s", parent_name)
         #self.logger.debug('active bone name : %s', C.active_bone.name)
         self.logger.debug('active object name : %s', C.active_object.name) # the name of the robot
 
@@ -390,8 +391,8 @@ class Importer(object):
 
         segment_name = C.active_bone.name
 
-        self.logger.info("%s -> %s", parent_name, segment_name)
-        self.logger.info("link name -> %s", node.link.name)
+        self.logger.debug("%s -> %s", parent_name, segment_name)
+        self.logger.debug("link name -> %s", node.link.name)
 
         # to confirm: SDF a joint's pose is given in child link frame, URDF joint frame = child link frame
 
@@ -405,10 +406,10 @@ class Importer(object):
         child_pose_homo = pose_float2homogeneous(rounded(child_link_pose))
         xyz, euler = pose2origin(parent_pose_homo, child_pose_homo)
 
-        self.logger.info("child link pose xyzeuler-> %s", child_link_pose)
-        self.logger.info("parent link pose xyzeuler-> %s", ref_pose)
-        self.logger.info("converted local pose xyz -> %s", xyz)
-        self.logger.info("converted local pose euler -> %s", euler)
+        self.logger.debug("child link pose xyzeuler-> %s", child_link_pose)
+        self.logger.debug("parent link pose xyzeuler-> %s", ref_pose)
+        self.logger.debug("converted local pose xyz -> %s", xyz)
+        self.logger.debug("converted local pose euler -> %s", euler)
 
         #urdf xyz = string_to_list(get_value(node.joint.origin.xyz, "0 0 0"))
         #urdf euler = string_to_list(get_value(node.joint.origin.rpy, '0 0 0'))
@@ -427,7 +428,7 @@ class Importer(object):
         else:
             axis = string_to_list('1 0 0')
         #axis = [round(axis[0]), round(axis[1]), round(axis[2])]
-        self.logger.info("axis -> %s", axis)
+        self.logger.debug("axis -> %s", axis)
         for i, element in enumerate(axis):
             if element == -1.0:
                 bpy.context.active_bone.RobotEditor.axis_revert = True
@@ -441,10 +442,10 @@ class Importer(object):
         else:
             # todo throw exception -- only main axes are supported. Add a limitations section to documentation
             # (which has to be created as well)!
-            self.logger.info("axis is wrong -> %s", axis)
+            self.logger.warning("axis is wrong -> %s", axis)
             pass
 
-        self.logger.info("axis -> %s", axis)
+        self.logger.debug("axis -> %s", axis)
 
         bpy.context.active_bone.RobotEditor.Euler.x.value = xyz[0]
         bpy.context.active_bone.RobotEditor.Euler.y.value = xyz[1]
@@ -489,9 +490,9 @@ class Importer(object):
 
         pose_bone = bpy.context.active_object.pose.bones[segment_name]
         self.logger.debug("bpy.context.active_object name (before iterating over visual): %s", bpy.context.active_object.name)
-        self.logger.debug("active object pose bone matrix: %s", homo2origin(pose_bone.matrix))
+        self.logger.debug("active object pose bone matrix: %s", LazyFormat(homo2origin, pose_bone.matrix))
         self.logger.debug("active object matrix world: %s",
-                          homo2origin(model.matrix_world))
+                          LazyFormat(homo2origin, model.matrix_world))
 
         segment_world = model.matrix_world * pose_bone.matrix
         # segment_world = pose_float2homogeneous(rounded(string_to_list("0 0 0.6 0 0 -1.570796")))*pose_bone.matrix
@@ -527,16 +528,16 @@ class Importer(object):
 
         pose_bone = bpy.context.active_object.pose.bones[segment_name]
         self.logger.debug("bpy.context.active_object name (before iterating over visual): %s", bpy.context.active_object.name)
-        self.logger.debug("active object pose bone matrix: %s", homo2origin(pose_bone.matrix))
+        self.logger.debug("active object pose bone matrix: %s", LazyFormat(homo2origin, pose_bone.matrix))
         self.logger.debug("active object matrix world: %s",
-                          homo2origin(model.matrix_world))
+                          LazyFormat(homo2origin, model.matrix_world))
 
         segment_world = model.matrix_world * pose_bone.matrix
         #segment_world = pose_float2homogeneous(rounded(string_to_list("0 0 0.6 0 0 -1.570796")))*pose_bone.matrix
 
-        self.logger.debug("[VISUAL] parsed: " + str(len(list(node.link.visual))) + " visual meshes.")
+        self.logger.debug("[VISUAL] parsed: %d visual meshes.", len(node.link.visual))
 
-        self.logger.debug("[COLLISION] parsed: " + str(len(list(node.link.collision))) + " collision meshes.")
+        self.logger.debug("[COLLISION] parsed: %d collision meshes.", len(node.link.collision))
 
         # Iterate first over visual models then over collision models
         VISUAL, COLLISON = 0, 1
@@ -609,16 +610,16 @@ class Importer(object):
 
                     if type == "cylinder":
                         trafo_sdf = self.import_cylinder(model)
-                        print("import cyl")
+                        self.logger.debug("Imported cylinder")
                     elif type == "box":
                         trafo_sdf = self.import_box(model)
-                        print("import box")
+                        self.logger.debug("Imported box")
                     elif type == "sphere":
                         trafo_sdf = self.import_sphere(model)
-                        print("import sphere")
+                        self.logger.debug("Imported sphere")
                     else:
                         trafo_sdf = self.import_geometry(model)
-                        print("import mesh")
+                        self.logger.debug("Imported mesh")
                     # if there are multiple objects in the COLLADA file, they will be selected
                     selected_objects = [i for i in bpy.context.selected_objects]
                     for object in selected_objects:
@@ -633,17 +634,17 @@ class Importer(object):
                         bpy.ops.object.select_all(False)
                         bpy.context.scene.objects.active = object  # bpy.data.objects[object]
                         bpy.context.active_object.select = True
-                        self.logger.debug("active object matrix world (from mesh): %s", homo2origin(bpy.context.active_object.matrix_world))
+                        self.logger.debug("active object matrix world (from mesh): %s", LazyFormat(homo2origin, bpy.context.active_object.matrix_world))
                         #bpy.context.active_object.matrix_world = pose_float2homogeneous(rounded(string_to_list("0 0 0 0 0 0")))
                         self.logger.debug("bpy.context.active_object name: %s", bpy.context.active_object.name)
-                        self.logger.debug("active object matrix world (before transfer): %s", homo2origin(bpy.context.active_object.matrix_world))
+                        self.logger.debug("active object matrix world (before transfer): %s", LazyFormat(homo2origin, bpy.context.active_object.matrix_world))
                         #if len(model.geometry[0].mesh) > 0:
                         bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
                         # after applying transform, matrix world becomes zero again
                         bpy.context.active_object.matrix_world =  segment_world * trafo_sdf * bpy.context.active_object.matrix_world#* inverse_matrix(bpy.context.active_object.matrix_world)#* \
                                                                #  bpy.context.active_object.matrix_world
-                        self.logger.debug("active object matrix world (after transfer): %s", homo2origin(bpy.context.active_object.matrix_world))
-                        self.logger.info("Model type: " + str(model_type))
+                        self.logger.debug("active object matrix world (after transfer): %s", LazyFormat(homo2origin, bpy.context.active_object.matrix_world))
+                        self.logger.debug("Model type: %s", model_type)
                         # Remove multiple "COL_" and "VIS_" strings before renaming
                         if model_type == COLLISON:
                             # %2d changed to %d because it created unwanted space with one digit numbers
@@ -665,7 +666,7 @@ class Importer(object):
                         # remove spaces from link name
                         bpy.context.active_object.name = bpy.context.active_object.name.replace(" ", "")
 
-                        if type == "mesh": print(bpy.context.active_object.name)
+                        self.logger.debug("Imported object: %s", bpy.context.active_object.name)
 
                         # The name might be altered by blender
                         assigned_name = bpy.context.active_object.name
@@ -864,8 +865,7 @@ class ImportPackage(RDOperator):
         importer.import_file()
         importer.import_config()
         if importer.MUSCLE_PATH != '[]':
-            print('muscle path:')
-            print(importer.MUSCLE_PATH)
+            self.logger.debug('muscle path: %s', importer.MUSCLE_PATH)
             osim_importer = OsimImporter(self.filepath, importer.MUSCLE_PATH)
             osim_importer.import_osim()
         return {'FINISHED'}
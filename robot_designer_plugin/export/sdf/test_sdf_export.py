@@ -0,0 +1,79 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Regression benchmark for :func:`robot_designer_plugin.export.sdf.sdf_export.create_sdf`. Exports armatures with
+250 and 500 segments and checks that the export time grows linearly. Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/export/sdf/test_sdf_export.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import robot_designer_plugin
+from robot_designer_plugin.operators.test_segments import build_model
+
+
+class ExportBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        robot_designer_plugin.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        robot_designer_plugin.unregister()
+
+    def export(self, size):
+        from robot_designer_plugin.export.sdf.sdf_export import ExportPlain
+
+        bpy.ops.wm.read_homefile(use_empty=True)
+        build_model('model_%d' % size, size, 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            ExportPlain.run(filepath=directory)
+            duration = time.perf_counter() - start
+            with open(os.path.join(directory, 'model.sdf')) as f:
+                self.assertEqual(f.read().count('<link '), size)
+        return duration
+
+    def runTest(self):
+        half = self.export(250)
+        full = self.export(500)
+        sys.stderr.write("SDF export: 250 segments %.2fs, 500 segments %.2fs\n" % (half, full))
+        # Linear growth doubles the time, quadratic growth would quadruple it
+        self.assertLess(full, 3 * half)
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,151 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Checks and indexes the kinematic structure of the links and joints of a robot description. Shared by the SDF and URDF
+parsers (:mod:`robot_designer_plugin.export.sdf.generic.sdf_tree` and
+:mod:`robot_designer_plugin.export.urdf.generic.urdf_tree`), it does not depend on Blender or PyXB.
+"""
+
+
+class KinematicStructureError(ValueError):
+    """
+    Raised when the links and joints of a robot description do not form kinematic trees.
+
+    The problems found are stored in the attributes:
+
+    * ``duplicate_links``: names of links that are defined more than once,
+    * ``duplicate_joints``: names of joints that are defined more than once,
+    * ``duplicate_children``: dictionary of link names to the names of all joints having this link as child,
+    * ``missing_links``: list of tuples (joint name, link name) for joints referring to a parent or child link that
+      does not exist,
+    * ``loops``: list of closed kinematic loops, each a list of link names.
+    """
+
+    def __init__(self, duplicate_links=(), duplicate_children=None, missing_links=(), loops=(), duplicate_joints=()):
+        self.duplicate_links = list(duplicate_links)
+        self.duplicate_joints = list(duplicate_joints)
+        self.duplicate_children = dict(duplicate_children or {})
+        self.missing_links = list(missing_links)
+        self.loops = [list(i) for i in loops]
+
+        messages = []
+        if self.duplicate_links:
+            messages.append("Duplicate links: %s" % ", ".join(self.duplicate_links))
+        if self.duplicate_joints:
+            messages.append("Duplicate joints: %s" % ", ".join(self.duplicate_joints))
+        for link, joints in self.duplicate_children.items():
+            messages.append("Link %s is the child of several joints: %s" % (link, ", ".join(joints)))
+        for joint, link in self.missing_links:
+            messages.append("Joint %s refers to unknown link %s" % (joint, link))
+        for loop in self.loops:
+            messages.append("Closed kinematic loop: %s" % " -> ".join(loop + loop[:1]))
+        super().__init__("\n".join(messages))
+
+
+def index_kinematic_structure(links, joints, parent_name, child_name, world=None):
+    """
+    Resolves the cross references between links and joints (that refer to their parent and child links by *name*)
+    with a single pass over the links and a single pass over the joints.
+
+    :param links: List of link elements (must have a ``name`` attribute).
+    :param joints: List of joint elements (must have a ``name`` attribute).
+    :param parent_name: Function returning the name of the parent link of a joint.
+    :param child_name: Function returning the name of the child link of a joint.
+    :param world: Name of the parent that refers to the world (SDF's ``world``) or None. The child links of such
+        joints are root links.
+    :return: Tuple of the mapping of links to the list of joints they are the parent of, the mapping of joints to
+        their child link and the list of root links (i.e., links that are not the child of any joint).
+    :raises KinematicStructureError: If link or joint names are not unique, a link is the child of several joints, a
+        joint refers to a parent or child link that does not exist or the joints form closed loops.
+    """
+    links_by_name = {}
+    duplicate_links = []
+    for link in links:
+        if link.name in links_by_name:
+            duplicate_links.append(link.name)
+        links_by_name[link.name] = link
+
+    connected_joints = {link: [] for link in links}
+    connected_links = {}
+    child_joints = {}
+    parent_links = {}
+    missing_links = []
+    joint_names = set()
+    duplicate_joints = []
+
+    for joint in joints:
+        if joint.name in joint_names:
+            duplicate_joints.append(joint.name)
+        joint_names.add(joint.name)
+
+        parent = links_by_name.get(parent_name(joint))
+        child = links_by_name.get(child_name(joint))
+        to_world = world is not None and parent_name(joint) == world and parent is None
+        if parent is None and not to_world:
+            missing_links.append((joint.name, parent_name(joint)))
+        if child is None:
+            missing_links.append((joint.name, child_name(joint)))
+
+        if parent is not None:
+            connected_joints[parent].append(joint)
+
+        if child is not None and not to_world:
+            connected_links[joint] = child
+            child_joints.setdefault(child.name, []).append(joint.name)
+            if parent is not None:
+                parent_links[child.name] = parent.name
+
+    duplicate_children = {link: names for link, names in child_joints.items() if len(names) > 1}
+    root_links = [link for link in links if link.name not in child_joints]
+
+    # With unique parents, links that cannot be reached from a root link hang on a closed loop
+    reached = set()
+    pending = [link.name for link in root_links]
+    while pending:
+        name = pending.pop()
+        if name in reached:
+            continue
+        reached.add(name)
+        pending.extend(connected_links[joint].name for joint in connected_joints[links_by_name[name]]
+                       if joint in connected_links)
+
+    loops = []
+    visited = set(reached)
+    for name in links_by_name:
+        path = []
+        position = {}
+        while name is not None and name not in visited:
+            position[name] = len(path)
+            path.append(name)
+            visited.add(name)
+            name = parent_links.get(name)
+        if name in position:
+            loops.append(list(reversed(path[position[name]:])))
+
+    if duplicate_links or duplicate_joints or duplicate_children or missing_links or loops:
+        raise KinematicStructureError(duplicate_links, duplicate_children, missing_links, loops, duplicate_joints)
+
+    return connected_joints, connected_links, root_links
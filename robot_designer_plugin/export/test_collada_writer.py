@@ -0,0 +1,134 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests for :func:`robot_designer_plugin.export.collada_writer.write_collada` and
+:func:`robot_designer_plugin.export.collada_writer.strip_scene_matrices`. Runs without Blender:
+
+    python3 robot_designer_plugin/export/test_collada_writer.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as etree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import loader
+
+collada_writer = loader.load('export.collada_writer')
+pool = loader.load('pool')
+
+NS = {'c': collada_writer.COLLADA_NAMESPACE}
+
+
+def cube(materials):
+    positions = [x for i in range(8) for x in ((i & 1) * 2 - 1, (i >> 1 & 1) * 2 - 1, (i >> 2) * 2 - 1)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return {
+        'name': 'cube.001',
+        'mesh_name': 'Cube',
+        'positions': positions,
+        'normals': [i / 3 ** 0.5 for i in positions],
+        'loop_vertices': [i for face in faces for i in face],
+        'loop_totals': [4] * 6,
+        'material_indices': [i % 2 for i in range(6)] if materials else [0] * 6,
+        'uvs': [],
+        'materials': [('red', (1, 0, 0, 1)), ('blue', (0, 0, 1, 1))] if materials else [],
+    }
+
+
+class WriteCollada(unittest.TestCase):
+    def write(self, data):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'cube.dae')
+            self.assertEqual(collada_writer.write_collada(file_name, data), os.path.getsize(file_name))
+            return etree.parse(file_name).getroot()
+
+    def runTest(self):
+        root = self.write(cube(False))
+        polylist = root.findall('.//c:polylist', NS)
+        self.assertEqual(len(polylist), 1)
+        self.assertEqual(len(polylist[0].find('c:p', NS).text.split()), 24)
+        self.assertEqual(root.find('.//c:float_array', NS).get('count'), '24')
+        self.assertIsNone(root.find('.//c:matrix', NS))
+        self.assertEqual(root.find('.//c:node', NS).get('id'), 'cube_001')
+
+        root = self.write(cube(True))
+        self.assertEqual([i.get('material') for i in root.findall('.//c:polylist', NS)],
+                         ['red-material', 'blue-material'])
+        self.assertEqual(len(root.findall('.//c:instance_material', NS)), 2)
+
+
+class WriteColladaJobs(unittest.TestCase):
+    def runTest(self):
+        # The workers import only the Blender-free modules (the package __init__ files require Blender)
+        with tempfile.TemporaryDirectory() as directory:
+            jobs = [(os.path.join(directory, 'cube.dae'), cube(True)),
+                    (os.path.join(directory, 'missing', 'cube.dae'), cube(False))]
+            results = pool.map_jobs(collada_writer.write_collada_job, jobs, processes=2)
+            self.assertEqual(results[0], (jobs[0][0], os.path.getsize(jobs[0][0]), None))
+            self.assertEqual(results[1][:2], (jobs[1][0], 0))
+            self.assertTrue(results[1][2].startswith('FileNotFoundError'))
+
+
+SCENE = """<?xml version="1.0" encoding="utf-8"?>
+<COLLADA>
+  <library_geometries>
+    <geometry id="matrix-mesh"><float_array>1 2 3</float_array></geometry>
+  </library_geometries>
+  <library_visual_scenes>
+    <visual_scene id="Scene" name="Scene">
+      <node id="a" name="a" type="NODE">
+        <matrix sid="transform">1 0 0 0 0 1 0 0 0 0 1 0 0 0 0 1</matrix>
+        <instance_geometry url="#matrix-mesh"/>
+      </node>
+      <node id="b"><matrix sid="transform">1 0 0 1</matrix><instance_geometry url="#b-mesh"/></node>
+    </visual_scene>
+  </library_visual_scenes>
+</COLLADA>
+"""
+
+
+class StripSceneMatrices(unittest.TestCase):
+    def runTest(self):
+        expected = SCENE.replace('        <matrix sid="transform">1 0 0 0 0 1 0 0 0 0 1 0 0 0 0 1</matrix>\n', '')
+        expected = expected.replace('<matrix sid="transform">1 0 0 1</matrix>', '')
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'scene.dae')
+            # Tokens and indentation have to be recognized across chunk boundaries
+            for chunk_size in (1, 2, 3, 7, 64, 1 << 16):
+                with open(file_name, 'w') as f:
+                    f.write(SCENE)
+                read, written, removed = collada_writer.strip_scene_matrices(file_name, chunk_size)
+                with open(file_name) as f:
+                    self.assertEqual(f.read(), expected)
+                self.assertEqual((read, written, removed), (len(SCENE), len(expected), 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
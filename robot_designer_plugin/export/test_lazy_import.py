@@ -0,0 +1,69 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark for the lazy import of the generated PyXB bindings
+(:func:`robot_designer_plugin.export.bindings.lazy_import`). The generic packages are loaded without
+Blender (requires PyXB 1.2.5 and numpy):
+
+    python3 robot_designer_plugin/export/test_lazy_import.py
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import loader
+
+
+class LazyBindings(unittest.TestCase):
+    def check(self, name, binding):
+        start = time.perf_counter()
+        package = loader.load('export.' + name)
+        import_time = time.perf_counter() - start
+        bindings = loader.load('export.bindings')
+        module_name = package.__name__ + '.' + binding
+        self.assertNotIn(module_name, bindings.load_times)
+
+        start = time.perf_counter()
+        self.assertTrue(hasattr(getattr(package, binding), 'CreateFromDocument'))
+        load_time = time.perf_counter() - start
+        self.assertIn(module_name, bindings.load_times)
+        self.assertIs(bindings.lazy_import(module_name), sys.modules[module_name])
+
+        sys.stderr.write("%s: package imported in %.1f ms, %s loaded in %.1f ms\n"
+                         % (name, import_time * 1000, binding, load_time * 1000))
+
+    def test_sdf(self):
+        self.check('sdf.generic', 'sdf_dom')
+
+    def test_urdf(self):
+        self.check('urdf.generic', 'urdf_dom')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests for :class:`robot_designer_plugin.export.mesh_cache.MeshExportCache`. Runs without Blender:
+
+    python3 robot_designer_plugin/export/test_mesh_cache.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    'mesh_cache', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mesh_cache.py'))
+mesh_cache = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mesh_cache)
+
+
+class MeshExportCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.first = os.path.join(self.directory.name, 'first.dae')
+        self.second = os.path.join(self.directory.name, 'second.dae')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def export(self, cache, file_path, key):
+        if not cache.fetch(file_path, key):
+            with open(file_path, 'w') as f:
+                f.write(key)
+            cache.store(file_path, key)
+
+    def runTest(self):
+        cache = mesh_cache.MeshExportCache(self.directory.name)
+        self.export(cache, self.first, 'a')
+        cache.save()
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # Unchanged meshes are reused, renamed ones are linked
+        cache = mesh_cache.MeshExportCache(self.directory.name)
+        self.export(cache, self.first, 'a')
+        self.export(cache, self.second, 'a')
+        self.assertEqual((cache.hits, cache.links, cache.misses), (2, 1, 0))
+        with open(self.second) as f:
+            self.assertEqual(f.read(), 'a')
+
+        # Re-exporting must not write through the hard link
+        self.export(cache, self.first, 'b')
+        self.assertEqual(cache.misses, 1)
+        with open(self.second) as f:
+            self.assertEqual(f.read(), 'a')
+        cache.save()
+
+        cache = mesh_cache.MeshExportCache(self.directory.name)
+        self.assertEqual(cache.files, {'first.dae': 'b', 'second.dae': 'a'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark for :meth:`robot_designer_plugin.export.sdf.generic.sdf_tree.SDFTree.parse` and
+:meth:`robot_designer_plugin.export.urdf.generic.urdf_tree.URDFTree.parse`. The generic packages are loaded
+without Blender (requires PyXB 1.2.5 and numpy):
+
+    python3 robot_designer_plugin/export/test_parse.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+BENCHMARK_LINKS = 10000
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import loader
+
+sdf_generic = loader.load('export.sdf.generic')
+urdf_generic = loader.load('export.urdf.generic')
+structure = loader.load('export.structure')
+
+
+def tree_edges(links):
+    """
+    Parent index of each link in a tree with a branching factor of four (the first link is the root).
+    """
+    return [(i, (i - 1) // 4) for i in range(1, links)]
+
+
+def write_sdf(file_name, links, edges):
+    with open(file_name, 'w') as f:
+        f.write('<?xml version="1.0" ?>\n<sdf version="1.5">\n<model name="benchmark">\n<pose>0 0 0 0 0 0</pose>\n')
+        for i in range(links):
+            f.write('<link name="link_%d"/>\n' % i)
+        for child, parent in edges:
+            f.write('<joint name="joint_%d" type="revolute"><parent>link_%d</parent><child>link_%d</child>'
+                    '</joint>\n' % (child, parent, child))
+        f.write('</model>\n</sdf>\n')
+
+
+def write_urdf(file_name, links, edges):
+    with open(file_name, 'w') as f:
+        f.write('<?xml version="1.0" ?>\n<robot name="benchmark">\n')
+        for i in range(links):
+            f.write('<link name="link_%d"/>\n' % i)
+        for child, parent in edges:
+            f.write('<joint name="joint_%d" type="revolute"><parent link="link_%d"/><child link="link_%d"/>'
+                    '<limit effort="1" lower="-1" upper="1" velocity="1"/></joint>\n' % (child, parent, child))
+        f.write('</robot>\n')
+
+
+def count(tree):
+    return 1 + sum(count(i) for i in tree.children)
+
+
+class ParseTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def sdf(self, links, edges):
+        file_name = os.path.join(self.directory.name, 'model.sdf')
+        write_sdf(file_name, links, edges)
+        return sdf_generic.sdf_tree.SDFTree.parse(file_name)
+
+    def urdf(self, links, edges):
+        file_name = os.path.join(self.directory.name, 'model.urdf')
+        write_urdf(file_name, links, edges)
+        return urdf_generic.urdf_tree.URDFTree.parse(file_name)
+
+
+class StructureErrors(ParseTest):
+    def sdf_joints(self, links, joints):
+        """
+        Parses a SDF file with the given links and joints ``(name, parent, child)``.
+        """
+        file_name = os.path.join(self.directory.name, 'joints.sdf')
+        with open(file_name, 'w') as f:
+            f.write('<?xml version="1.0" ?>\n<sdf version="1.5">\n<model name="joints">\n<pose>0 0 0 0 0 0</pose>\n')
+            for link in links:
+                f.write('<link name="%s"/>\n' % link)
+            for joint in joints:
+                f.write('<joint name="%s" type="revolute"><parent>%s</parent><child>%s</child></joint>\n' % joint)
+            f.write('</model>\n</sdf>\n')
+        return sdf_generic.sdf_tree.SDFTree.parse(file_name)
+
+    def runTest(self):
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.sdf(4, [(1, 0), (2, 1), (3, 2), (1, 3)])
+        self.assertEqual(error.exception.duplicate_children, {'link_1': ['joint_1', 'joint_1']})
+
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.sdf_joints(['a', 'b', 'c'], [('ab', 'a', 'b'), ('bc', 'b', 'c'), ('cb', 'c', 'b')])
+        self.assertEqual(error.exception.duplicate_children, {'b': ['ab', 'cb']})
+        self.assertEqual(error.exception.duplicate_joints, [])
+
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.sdf_joints(['a', 'b', 'c'], [('j', 'a', 'b'), ('j', 'b', 'c')])
+        self.assertEqual(error.exception.duplicate_joints, ['j'])
+
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.sdf_joints(['a', 'b'], [('ab', 'a', 'b'), ('xb', 'x', 'a')])
+        self.assertEqual(error.exception.missing_links, [('xb', 'x')])
+
+        _, _, _, _, root_links, chains = self.sdf_joints(['a', 'b'], [('fixed', 'world', 'a'), ('ab', 'a', 'b')])
+        self.assertEqual([count(i) for i in chains], [2])
+
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.sdf(4, [(1, 0), (2, 3), (3, 2)])
+        self.assertEqual([sorted(i) for i in error.exception.loops], [['link_2', 'link_3']])
+
+        with self.assertRaises(structure.KinematicStructureError) as error:
+            self.urdf(4, [(2, 3), (3, 2)])
+        self.assertEqual([sorted(i) for i in error.exception.loops], [['link_2', 'link_3']])
+
+
+class ParseBenchmark(ParseTest):
+    def runTest(self):
+        edges = tree_edges(BENCHMARK_LINKS)
+
+        start = time.perf_counter()
+        _, _, _, _, root_links, chains = self.sdf(BENCHMARK_LINKS, edges)
+        sdf_time = time.perf_counter() - start
+        self.assertEqual(len(root_links), 1)
+        self.assertEqual(count(chains[0]), BENCHMARK_LINKS)
+
+        start = time.perf_counter()
+        _, root_links, chains, _, _ = self.urdf(BENCHMARK_LINKS, edges)
+        urdf_time = time.perf_counter() - start
+        self.assertEqual(len(root_links), 1)
+        self.assertEqual(sum(count(i) for i in chains), BENCHMARK_LINKS - 1)
+
+        sys.stderr.write("Parsing %d links: SDF %.2fs, URDF %.2fs\n" % (BENCHMARK_LINKS, sdf_time, urdf_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and memory benchmark for :mod:`robot_designer_plugin.export.robot_model` and the ``parse_model`` methods of the
+SDF and URDF trees. Runs without Blender (requires PyXB 1.2.5 and numpy):
+
+    python3 robot_designer_plugin/export/test_robot_model.py
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_parse import loader, sdf_generic, urdf_generic, tree_edges, write_sdf, write_urdf, BENCHMARK_LINKS
+
+robot_model = loader.load('export.robot_model')
+
+SDF = '''<?xml version="1.0" ?>
+<sdf version="1.6">
+<model name="arm">
+<pose>0 0 0.5 0 0 0</pose>
+<muscles>model://arm/muscles.osim</muscles>
+<link name="base">
+<pose>0 0 1 0 0 0</pose>
+<inertial><pose>0 0 0.1 0 0 0</pose><mass>2</mass>
+<inertia><ixx>0.1</ixx><ixy>0</ixy><ixz>0</ixz><iyy>0.2</iyy><iyz>0</iyz><izz>0.3</izz></inertia></inertial>
+<visual name="base_visual"><pose>0 0 0.2 0 0 0</pose>
+<geometry><mesh><uri>model://arm/meshes/base.dae</uri><scale>1 1 2</scale></mesh></geometry></visual>
+<collision name="base_collision"><geometry><box><size>1 2 3</size></box></geometry></collision>
+<sensor name="camera" type="camera"><pose>0 0 0.1 0 0 0</pose></sensor>
+</link>
+<link name="upper"><pose>0 0 2 0 0 1.5</pose>
+<collision name="upper_collision"><geometry><cylinder><radius>0.1</radius><length>0.5</length></cylinder></geometry>
+</collision></link>
+<link name="lower"><pose>0 0 3 0 0 1.5</pose></link>
+<joint name="shoulder" type="revolute"><parent>base</parent><child>upper</child>
+<axis><xyz>0 1 0</xyz><limit><lower>-1</lower><upper>1</upper><effort>10</effort><velocity>2</velocity></limit></axis>
+</joint>
+<joint name="elbow" type="prismatic"><parent>upper</parent><child>lower</child><axis><xyz>1 0 0</xyz></axis></joint>
+</model>
+</sdf>
+'''
+
+URDF = '''<?xml version="1.0" ?>
+<robot name="arm">
+<link name="base">
+<inertial><origin xyz="0 0 0.1" rpy="0 0 0"/><mass value="2"/>
+<inertia ixx="0.1" ixy="0" ixz="0" iyy="0.2" iyz="0" izz="0.3"/></inertial>
+<visual><origin xyz="0 0 0.2" rpy="0 0 0"/>
+<geometry><mesh filename="package://arm/meshes/base.dae" scale="1 1 2"/></geometry></visual>
+<collision><geometry><box size="1 2 3"/></geometry></collision>
+</link>
+<link name="upper"><collision><geometry><sphere radius="0.1"/></geometry></collision></link>
+<link name="lower"/>
+<joint name="shoulder" type="revolute"><origin xyz="0 0 1" rpy="0 0 1.5"/><parent link="base"/><child link="upper"/>
+<axis xyz="0 1 0"/><limit effort="10" lower="-1" upper="1" velocity="2"/></joint>
+<joint name="elbow" type="prismatic"><origin xyz="0 0 1" rpy="0 0 0"/><parent link="upper"/><child link="lower"/>
+<axis xyz="1 0 0"/><limit effort="1" lower="0" upper="0.5" velocity="1"/></joint>
+<gazebo><plugin name="generic_controller" filename="libgeneric_controller_plugin.so">
+<controller joint_name="shoulder"><type>position</type><pid>100 1 1</pid></controller></plugin></gazebo>
+<gazebo reference="base"><mu1>0.5</mu1></gazebo>
+</robot>
+'''
+
+
+class RobotModelTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        file_name = os.path.join(self.directory.name, name)
+        with open(file_name, 'w') as f:
+            f.write(content)
+        return file_name
+
+    def assertPose(self, first, second):
+        self.assertEqual(len(first), 6)
+        for i, j in zip(first, second):
+            self.assertAlmostEqual(i, j)
+
+
+class Structure(RobotModelTest):
+    def runTest(self):
+        model = robot_model.RobotModel('test')
+        root = model.add_link('root')
+        child = model.add_link('child', robot_model.pose([1, 0, 0, 0, 0, 0]), root.index)
+        joint = model.add_joint('joint', 'revolute', root.index, child.index)
+        model.add_visual(child.index, 'visual', 'sphere', size=(0.1,))
+
+        self.assertIs(root.pose, robot_model.IDENTITY)
+        self.assertIs(robot_model.pose([0] * 6), robot_model.IDENTITY)
+        self.assertIs(model.link('child'), child)
+        self.assertIs(model.joint('joint'), joint)
+        self.assertEqual(child.joint, joint.index)
+        self.assertEqual(model.roots(), [root])
+        self.assertEqual(model.children(), [[1], []])
+        self.assertEqual(len(child.visuals), 1)
+        self.assertEqual(root.visuals, ())
+
+        with self.assertRaises(ValueError):
+            model.add_link('child')
+        with self.assertRaises(ValueError):
+            model.add_link('orphan', parent=5)
+        with self.assertRaises(ValueError):
+            model.add_joint('other', 'fixed', root.index, child.index)
+        with self.assertRaises(ValueError):
+            model.add_visual(root.index, 'plane', 'plane')
+        with self.assertRaises(AttributeError):
+            root.color = 'red'
+
+
+class ParseSDF(RobotModelTest):
+    def runTest(self):
+        model = sdf_generic.sdf_tree.SDFTree.parse_model(self.write('arm.sdf', SDF), robot_model.RobotModel())
+
+        self.assertEqual(model.name, 'arm')
+        self.assertPose(model.pose, (0, 0, 0.5, 0, 0, 0))
+        self.assertEqual(model.muscle_uri, 'model://arm/muscles.osim')
+        self.assertEqual([i.name for i in model.links], ['base', 'upper', 'lower'])
+        self.assertEqual([i.parent for i in model.links], [-1, 0, 1])
+
+        base, upper, lower = model.links
+        # link poses are converted from the model frame into the frames of the parents
+        self.assertPose(base.pose, (0, 0, 1, 0, 0, 0))
+        self.assertPose(upper.pose, (0, 0, 1, 0, 0, 1.5))
+        self.assertPose(lower.pose, (0, 0, 1, 0, 0, 0))
+
+        self.assertEqual(base.inertial.mass, 2.0)
+        self.assertPose(base.inertial.pose, (0, 0, 0.1, 0, 0, 0))
+        self.assertEqual(base.inertial.inertia, (0.1, 0.0, 0.0, 0.2, 0.0, 0.3))
+        self.assertIsNone(upper.inertial)
+
+        visual, = base.visuals
+        self.assertEqual((visual.name, visual.type, visual.size, visual.uri),
+                         ('base_visual', 'mesh', (1.0, 1.0, 2.0), 'model://arm/meshes/base.dae'))
+        self.assertPose(visual.pose, (0, 0, 0.2, 0, 0, 0))
+        self.assertEqual((base.collisions[0].type, base.collisions[0].size), ('box', (1.0, 2.0, 3.0)))
+        self.assertEqual((upper.collisions[0].type, upper.collisions[0].size), ('cylinder', (0.1, 0.5)))
+        self.assertEqual([(i.name, i.type) for i in base.sensors], [('camera', 'camera')])
+
+        shoulder, elbow = model.joints
+        self.assertEqual((shoulder.name, shoulder.type, shoulder.parent, shoulder.child),
+                         ('shoulder', 'revolute', 0, 1))
+        self.assertEqual(shoulder.axis, (0.0, 1.0, 0.0))
+        self.assertEqual((shoulder.lower, shoulder.upper, shoulder.effort, shoulder.velocity), (-1.0, 1.0, 10.0, 2.0))
+        self.assertEqual((elbow.type, elbow.axis, elbow.lower, elbow.upper), ('prismatic', (1.0, 0.0, 0.0), 0.0, 0.0))
+
+
+class ParseURDF(RobotModelTest):
+    def runTest(self):
+        model = urdf_generic.urdf_tree.URDFTree.parse_model(self.write('arm.urdf', URDF), robot_model.RobotModel())
+
+        self.assertEqual(model.name, 'arm')
+        self.assertEqual([i.name for i in model.links], ['base', 'upper', 'lower'])
+        self.assertEqual([i.joint for i in model.links], [-1, 0, 1])
+
+        base, upper, lower = model.links
+        self.assertPose(base.pose, (0, 0, 0, 0, 0, 0))
+        self.assertPose(upper.pose, (0, 0, 1, 0, 0, 1.5))
+        self.assertPose(lower.pose, (0, 0, 1, 0, 0, 0))
+
+        self.assertEqual(base.inertial.mass, 2.0)
+        self.assertEqual(base.inertial.inertia, (0.1, 0.0, 0.0, 0.2, 0.0, 0.3))
+        visual, = base.visuals
+        self.assertEqual((visual.type, visual.size, visual.uri),
+                         ('mesh', (1.0, 1.0, 2.0), 'package://arm/meshes/base.dae'))
+        self.assertPose(visual.pose, (0, 0, 0.2, 0, 0, 0))
+        self.assertEqual((upper.collisions[0].type, upper.collisions[0].size), ('sphere', (0.1,)))
+
+        shoulder, elbow = model.joints
+        self.assertEqual((shoulder.lower, shoulder.upper, shoulder.effort, shoulder.velocity), (-1.0, 1.0, 10.0, 2.0))
+        self.assertEqual((elbow.type, elbow.axis, elbow.upper), ('prismatic', (1.0, 0.0, 0.0), 0.5))
+
+
+class ImportURDF(RobotModelTest):
+    def runTest(self):
+        # The URDF importer reads the document once for the Gazebo tags and the model
+        tree = urdf_generic.urdf_tree.URDFTree
+        document = tree.read(self.write('arm.urdf', URDF))
+        controllers, gazebo_tags = tree.gazebo_tags(document)
+        self.assertEqual(list(controllers), ['shoulder'])
+        self.assertEqual((controllers['shoulder'].type, controllers['shoulder'].pid), ('position', '100 1 1'))
+        self.assertEqual([i.reference for i in gazebo_tags], ['base'])
+
+        # Segments are named after the joints of their links, which the controllers refer to
+        model = tree.fill_model(document, robot_model.RobotModel())
+        self.assertEqual([i.name for i in model.roots()], ['base'])
+        self.assertEqual(model.children(), [[1], [2], []])
+        self.assertEqual([model.joints[i.joint].name for i in model.links[1:]], ['shoulder', 'elbow'])
+
+
+class MemoryBenchmark(RobotModelTest):
+    def runTest(self):
+        edges = tree_edges(BENCHMARK_LINKS)
+        results = []
+        for extension, write, tree in (('sdf', write_sdf, sdf_generic.sdf_tree.SDFTree),
+                                       ('urdf', write_urdf, urdf_generic.urdf_tree.URDFTree)):
+            file_name = os.path.join(self.directory.name, 'benchmark.' + extension)
+            write(file_name, BENCHMARK_LINKS, edges)
+
+            # Memory allocated by the document object model and by the model that is still alive without the DOM
+            gc.collect()
+            tracemalloc.start()
+            try:
+                dom = tree.read(file_name)
+                dom_size, _ = tracemalloc.get_traced_memory()
+                model = tree.fill_model(dom, robot_model.RobotModel())
+                del dom
+                gc.collect()
+                model_size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            self.assertEqual(len(model), BENCHMARK_LINKS)
+            self.assertEqual(len(model.joints), BENCHMARK_LINKS - 1)
+            self.assertTrue(all(link.parent < link.index for link in model.links[1:]))
+            self.assertLess(model_size, dom_size / 4)
+            results.append("%s model %.1f MiB (%d bytes per link), DOM %.1f MiB" % (
+                extension.upper(), model_size / 2 ** 20, model_size // BENCHMARK_LINKS, dom_size / 2 ** 20))
+            del model
+
+        sys.stderr.write("Loading %d links: %s\n" % (BENCHMARK_LINKS, '; '.join(results)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,9 +39,12 @@ Generic (Blender-independent) parsing of URDF files.
 """
 
 from . import helpers
-from . import urdf_dom
-from . import urdf_tree
+from ...bindings import lazy_import
 from importlib import reload
 reload(helpers)
-reload(urdf_dom)
-reload(urdf_tree)
\ No newline at end of file
+
+# The generated bindings are large, hence they are only loaded when an importer or exporter uses them
+urdf_dom = lazy_import(__name__ + '.urdf_dom')
+
+from . import urdf_tree
+reload(urdf_tree)
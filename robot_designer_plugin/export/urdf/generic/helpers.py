@@ -37,8 +37,11 @@
 # system imports
 import re
 
-# Blender-specific imports
-from mathutils import *
+# Blender-specific imports (only needed for the euler conversions, such that parsing works outside of Blender)
+try:
+    from mathutils import *
+except ImportError:
+    pass
 
 __author__ = 'ulbrich'
 
@@ -83,7 +86,6 @@ def list_to_string(l):
     :param l:
     :return:
     """
-    print("HERER", l)
     return " ".join([str(i).rstrip('0').rstrip('.') for i in l])
 
 
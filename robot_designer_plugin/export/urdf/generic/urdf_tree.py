@@ -42,12 +42,12 @@ __author__ = 'Stefan Ulbrich (FZI)'
 import logging
 
 from . import urdf_dom
-from .helpers import list_to_string
+from .helpers import list_to_string, string_to_list
+from ...structure import index_kinematic_structure
 from pyxb import ContentNondeterminismExceededError
 import os
 
 logger = logging.getLogger('URFD')
-logger.setLevel(logging.DEBUG)
 
 
 def set_value(l):
@@ -59,6 +59,99 @@ def set_value(l):
     return ' '.join(i for i in l)
 
 
+_IDENTITY = (0.0,) * 6
+
+_LIMIT = (('lower', 0.0), ('upper', 0.0), ('effort', 0.0), ('velocity', 0.0))
+
+_INERTIA = (('ixx', 1.0), ('ixy', 0.0), ('ixz', 0.0), ('iyy', 1.0), ('iyz', 0.0), ('izz', 1.0))
+
+
+def _floats(text, default):
+    """
+    Converts a XML vector to a tuple of floats. Returns the default if the attribute is missing or has the wrong size.
+    """
+    if text is None:
+        return default
+    values = tuple(string_to_list(str(text)))
+    return values if len(values) == len(default) else default
+
+
+def _values(element, fields):
+    """
+    Reads the float attributes of a DOM element as tuple. Missing attributes (or elements) are set to their defaults.
+    """
+    if element is None:
+        return tuple(default for _, default in fields)
+    return tuple(default if getattr(element, name) is None else float(getattr(element, name))
+                 for name, default in fields)
+
+
+def _pose(origin):
+    """
+    Converts an origin element to a pose tuple.
+    """
+    if origin is None:
+        return _IDENTITY
+    return _floats(origin.xyz, (0.0, 0.0, 0.0)) + _floats(origin.rpy, (0.0, 0.0, 0.0))
+
+
+def _geometries(elements):
+    """
+    Converts visual or collision DOM elements to the arguments of
+    :meth:`robot_designer_plugin.export.robot_model.RobotModel.add_visual`.
+    """
+    for element in elements:
+        geometry = element.geometry
+        if geometry is None:
+            continue
+        name = str(getattr(element, 'name', None) or '')
+        if geometry.mesh is not None:
+            yield name, 'mesh', _pose(element.origin), _floats(geometry.mesh.scale, (1.0, 1.0, 1.0)), \
+                str(geometry.mesh.filename)
+        elif geometry.box is not None:
+            yield name, 'box', _pose(element.origin), _floats(geometry.box.size, (1.0, 1.0, 1.0)), ''
+        elif geometry.cylinder is not None:
+            yield name, 'cylinder', _pose(element.origin), _values(geometry.cylinder, (('radius', 1.0),
+                                                                                       ('length', 1.0))), ''
+        elif geometry.sphere is not None:
+            yield name, 'sphere', _pose(element.origin), _values(geometry.sphere, (('radius', 1.0),)), ''
+        else:
+            logger.warning("Unsupported geometry skipped")
+
+
+def _origin(pose):
+    """
+    Creates an origin element from a pose tuple.
+    """
+    origin = urdf_dom.PoseType()
+    origin.xyz = list_to_string(pose[:3])
+    origin.rpy = list_to_string(pose[3:])
+    return origin
+
+
+def _geometry_element(factory, geometry):
+    """
+    Creates a visual or collision DOM element from a :class:`robot_designer_plugin.export.robot_model.Geometry`.
+    """
+    element = factory()
+    element.origin = _origin(geometry.pose)
+    element.geometry = urdf_dom.GeometryType()
+    if geometry.type == 'mesh':
+        element.geometry.mesh = urdf_dom.MeshType()
+        element.geometry.mesh.filename = geometry.uri
+        element.geometry.mesh.scale = list_to_string(geometry.size)
+    elif geometry.type == 'box':
+        element.geometry.box = urdf_dom.BoxType()
+        element.geometry.box.size = list_to_string(geometry.size)
+    elif geometry.type == 'cylinder':
+        element.geometry.cylinder = urdf_dom.CylinderType()
+        element.geometry.cylinder.radius, element.geometry.cylinder.length = geometry.size
+    else:
+        element.geometry.sphere = urdf_dom.SphereType()
+        element.geometry.sphere.radius = geometry.size[0]
+    return element
+
+
 class URDFTree(object):
     """
     A class that parses and represents a robot described by a URDF file.
@@ -96,19 +189,48 @@ class URDFTree(object):
         and calls the recursive URDFTree.build() method to create a tree-like data structure representing the
         kinematic tree(s) of the robot.
         :param file_name: the name of the file to open
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
         """
 
         # read the file
         # robot = urdf_dom.parse(file_name, silence=True)
-        try:
-            robot = urdf_dom.CreateFromDocument(open(file_name).read())
-        except ContentNondeterminismExceededError as e:
-            logger.error("Error raised %s, %s", e, e.instance.name)
-            raise e
+        robot = URDFTree.read(file_name)
+
+        controller_cache, gazebo_tags = URDFTree.gazebo_tags(robot)
+
+        # create mapping from (parent) links to joints, from joints to their child links and find root links
+        # (i.e., links that are NOT connected to a joint)
+        connected_joints, connected_links, root_links = index_kinematic_structure(
+            robot.link, robot.joint, lambda joint: joint.parent.link, lambda joint: joint.child.link)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Root links: %s", [i.name for i in root_links])
+            logger.debug("connected links: %s", {j.name: l.name for j, l in connected_links.items()})
+
+        kinematic_chains = []
+
+        # Skips the basis links
+        for link in root_links:
+            for joint in connected_joints[link]:
+                tree = URDFTree(connected_links=connected_links, connected_joints=connected_joints, robot=robot)
+                kinematic_chains.append(tree)
+                tree.build(connected_links[joint], joint)
+
+        # todo: parse joint controllers
 
-        # parsing joint controllers
-        # create a dictionary [ joint_name, controller ] which is
-        # easily searchable during tree traversal
+        logger.debug("kinematic chains: %s", kinematic_chains)
+        return robot.name, root_links, kinematic_chains, controller_cache, gazebo_tags
+
+    @staticmethod
+    def gazebo_tags(robot):
+        """
+        Collects the Gazebo tags of a document object model. The controllers of the generic control plugin are
+        indexed by their joint names in a dictionary which is easily searchable during tree traversal. The tag of the
+        plugin is handled by the controllers and therefore omitted from the other tags.
+
+        :param robot: the root (``robot``) element (see :meth:`URDFTree.read`)
+        :return: tuple of the controller dictionary and the list of the other Gazebo tags
+        """
         controller_cache = {}
         gazebo_tags = []
         for gazebo_tag in robot.gazebo:
@@ -117,42 +239,128 @@ class URDFTree(object):
                 if plugin_tag.name == "generic_controller":
                     for controller in plugin_tag.controller:
                         # store the controller in cache, so it's accessible
-                        logger.debug("Found controller for joint: " + controller.joint_name + ", caching it.")
+                        logger.debug("Found controller for joint: %s, caching it.", controller.joint_name)
                         controller_cache[controller.joint_name] = controller
                     # remove last tag from the last, it is handled by controller plugin differently
                     gazebo_tags.pop()
         logger.debug("Built controller cache:")
         logger.debug(controller_cache)
+        return controller_cache, gazebo_tags
 
-        # create mapping from (parent) links to joints
-        connected_joints = {link: [joint for joint in robot.joint if link.name == joint.parent.link] for link
-                            in robot.link}
+    @staticmethod
+    def read(file_name):
+        """
+        Reads the document object model of a URDF file.
 
-        # create mapping from joints to their child links
-        connected_links = {joint: link for link in robot.link for joint in robot.joint if
-                           link.name == joint.child.link}
+        :param file_name: the name of the file to open
+        :return: the root (``robot``) element
+        """
+        try:
+            with open(file_name) as f:
+                return urdf_dom.CreateFromDocument(f.read())
+        except ContentNondeterminismExceededError as e:
+            logger.error("Error raised %s, %s", e, e.instance.name)
+            raise e
 
-        # find root links (i.e., links that are NOT connected to a joint)
-        child_links = [link.name for link in robot.link for joint in robot.joint if
-                       link.name == joint.child.link]
-        root_links = [link for link in robot.link if link.name not in child_links]
+    @staticmethod
+    def parse_model(file_name, model):
+        """
+        Parses a URDF file into the Blender-free intermediate representation (see :meth:`URDFTree.fill_model`).
 
-        logger.debug("Root links: %s", [i.name for i in root_links])
-        logger.debug("connected links: %s", {j.name: l.name for j, l in connected_links.items()})
+        :param file_name: the name of the file to open
+        :param model: an empty :class:`robot_designer_plugin.export.robot_model.RobotModel` that is filled
+        :return: the model
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
+        """
+        return URDFTree.fill_model(URDFTree.read(file_name), model)
 
-        kinematic_chains = []
+    @staticmethod
+    def fill_model(robot, model):
+        """
+        Fills the Blender-free intermediate representation from a document object model. The origin of a joint
+        becomes the pose of its child link.
 
-        # Skips the basis links
-        for link in root_links:
-            for joint in connected_joints[link]:
-                tree = URDFTree(connected_links=connected_links, connected_joints=connected_joints, robot=robot)
-                kinematic_chains.append(tree)
-                tree.build(connected_links[joint], joint)
+        :param robot: the root (``robot``) element (see :meth:`URDFTree.read`)
+        :param model: an empty :class:`robot_designer_plugin.export.robot_model.RobotModel` that is filled
+        :return: the model
+        :raises KinematicStructureError: if the links and joints do not form kinematic trees
+        """
+        connected_joints, connected_links, root_links = index_kinematic_structure(
+            robot.link, robot.joint, lambda joint: joint.parent.link, lambda joint: joint.child.link)
+
+        model.name = str(robot.name)
+
+        # depth-first traversal such that parents are added before their children
+        stack = [(link, None, -1) for link in reversed(root_links)]
+        while stack:
+            link, joint, parent = stack.pop()
+            index = model.add_link(str(link.name), _IDENTITY if joint is None else _pose(joint.origin), parent).index
+
+            if joint is not None:
+                axis = joint.axis.xyz if joint.axis is not None else None
+                model.add_joint(str(joint.name), str(joint.type), parent, index, _floats(axis, (1.0, 0.0, 0.0)),
+                                *_values(joint.limit, _LIMIT))
+
+            if link.inertial:
+                inertial = link.inertial[0]
+                model.set_inertial(index, 1.0 if inertial.mass is None else float(inertial.mass.value_),
+                                   _pose(inertial.origin), _values(inertial.inertia, _INERTIA))
+            for arguments in _geometries(link.visual):
+                model.add_visual(index, *arguments)
+            for arguments in _geometries(link.collision):
+                model.add_collision(index, *arguments)
+
+            for child_joint in reversed(connected_joints[link]):
+                stack.append((connected_links[child_joint], child_joint, index))
+        return model
 
-        # todo: parse joint controllers
+    @staticmethod
+    def from_model(model, base_link_name="base_link"):
+        """
+        Builds a tree from the Blender-free intermediate representation (the inverse of :meth:`URDFTree.fill_model`).
+        A single root link becomes the base link (its pose is dropped as URDF has no model pose). Several root links
+        are attached to a new base link with fixed joints.
 
-        logger.debug("kinematic chains: %s", kinematic_chains)
-        return robot.name, root_links, kinematic_chains, controller_cache, gazebo_tags
+        :param model: a :class:`robot_designer_plugin.export.robot_model.RobotModel`
+        :param base_link_name: name of the base link created for several root links
+        :return: the root of the tree (see :meth:`URDFTree.write`)
+        """
+        roots = model.roots()
+        single_root = len(roots) == 1
+        root = URDFTree.create_empty(model.name, roots[0].name if single_root else base_link_name)
+
+        nodes = []
+        for link in model.links:
+            if link.parent < 0 and single_root:
+                node = root
+            else:
+                node = (root if link.parent < 0 else nodes[link.parent]).add()
+                node.link.name = link.name
+                node.joint.origin = _origin(link.pose)
+                if link.joint >= 0:
+                    joint = model.joints[link.joint]
+                    node.joint.name = joint.name
+                    node.joint.type = joint.type
+                    node.joint.axis.xyz = list_to_string(joint.axis)
+                    node.joint.limit.lower, node.joint.limit.upper = joint.lower, joint.upper
+                    node.joint.limit.effort, node.joint.limit.velocity = joint.effort, joint.velocity
+                else:
+                    node.joint.name = link.name + '_joint'
+                    node.joint.type = 'fixed'
+            nodes.append(node)
+
+            if link.inertial is not None:
+                inertial = node.add_inertial()
+                inertial.mass.value_ = link.inertial.mass
+                inertial.origin = _origin(link.inertial.pose)
+                inertia = inertial.inertia
+                inertia.ixx, inertia.ixy, inertia.ixz, inertia.iyy, inertia.iyz, inertia.izz = link.inertial.inertia
+
+            for geometry in link.visuals:
+                node.link.visual.append(_geometry_element(urdf_dom.VisualType, geometry))
+            for geometry in link.collisions:
+                node.link.collision.append(_geometry_element(urdf_dom.CollisionType, geometry))
+        return root
 
     def build(self, link, joint=None, depth=0):
         """
@@ -338,10 +546,10 @@ class URDFTree(object):
         joint_controller = urdf_dom.GenericControllerPluginDefType()
         if joint_controller.pid == "1.0 1.0 1.0":
             joint_controller.pid = "100.0 1.0 1.0"
-            print("Debug: Joint Controller set")
+            logger.debug("Joint controller set")
 
         control_plugin.append(joint_controller)
-        print("Added joint controller.")
+        logger.debug("Added joint controller.")
 
         return joint_controller
 
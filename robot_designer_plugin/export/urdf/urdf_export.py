@@ -61,95 +61,73 @@ from mathutils import Vector
 from .generic import urdf_tree
 from .generic.helpers import list_to_string
 from ...core import config, PluginManager, RDOperator
+from ...operators.dynamics import check_inertials
 from ...operators.helpers import ModelSelected, ObjectMode
-from ...operators.model import SelectModel
+from ..associations import ObjectAssociations
+from ..mesh_cache import MeshExportCache
+from ..mesh_export import MeshExportQueue
 
 from ...properties.globals import global_properties
 
-def export_mesh(operator: RDOperator, context, name: str, directory: str, toplevel_dir: str, in_ros_package: bool,
-                abs_file_paths=False, export_collision=False):
+def export_mesh(operator: RDOperator, context, mesh, directory: str, toplevel_dir: str, in_ros_package: bool,
+                abs_file_paths=False, export_collision=False, queue=None):
     """
     Exports a mesh to a separate file.
 
     :param operator: The calling operator
     :param context: The current context
-    :param name: the name of the mesh (not the file name).
-    :type name: basestring.
+    :param mesh: the mesh object (see :class:`..associations.ObjectAssociations`).
     :param directory: The directory in which to install the meshes
     :param toplevel_dir: The directory in which to export
     :param in_ros_package: Whether to export into a ros package or plain files
     :param abs_file_paths: If not intstalled into a ros package decides whether to use absolute file paths.
     :param export_collision: Exporting a collision mesh or visualization mesh.
+    :param queue: :class:`..mesh_export.MeshExportQueue` that collects the mesh (exported immediately if not given)
     :return: name of the file the mesh is stored in.
     """
 
     if not export_collision:
-        meshes = [obj.name for obj in context.scene.objects if
-                  obj.type == "MESH" and obj.name == name and
-                  not obj.RobotEditor.tag == "COLLISION"]
         directory = os.path.join(directory, "meshes")
-
     else:
-        meshes = [obj.name for obj in context.scene.objects if
-                  obj.type == "MESH" and name == obj.name and
-                  obj.RobotEditor.tag == "COLLISION"]
         directory = os.path.join(directory, "collisions")
 
     if not os.path.exists(directory):
         os.makedirs(directory)
 
-    # There is max. 1 object in the list
-    assert len(meshes) <= 1
-    for mesh in meshes:
-        operator.logger.debug("Processing mesh: %s", mesh)
-
-        model_name = bpy.context.active_object.name
-        bpy.ops.object.select_all(action='DESELECT')
-        bpy.data.objects[mesh].select=True
-        bpy.context.scene.objects.active = bpy.data.objects[mesh]
-        #bpy.context.active_object.select = True
+    operator.logger.debug("Processing mesh: %s", mesh.name)
 
-        #get the mesh vertices number
-        bm = bpy.context.scene.objects.active.data
-        #print("# of vertices=%d" % len(bm.vertices))
+    #get the mesh vertices number
+    bm = mesh.data
 
-        if len(bm.vertices) > 1:
-            if '.' in mesh:
-                file_path = os.path.join(directory, mesh.replace('.', '_') + '.dae')
-            else:
-                file_path = os.path.join(directory, mesh + '.dae')
-
-            bpy.ops.wm.collada_export(
-                filepath=file_path, apply_modifiers=True, selected=True, use_texture_copies=True)
-
-            # quick fix for dispersed meshes
-            # todo: find appropriate solution
-            with open(file_path, "r") as file:
-                lines = file.readlines()
-            with open(file_path, "w") as file:
-                for line in lines:
-                    if "matrix" not in line:
-                        file.write(line)
+    if len(bm.vertices) > 1:
+        if '.' in mesh.name:
+            file_path = os.path.join(directory, mesh.name.replace('.', '_') + '.dae')
         else:
-            if '.' in mesh:
-                file_path = os.path.join(directory, mesh.replace('.', '_') + '_vertices' + str(len(bm.vertices)) + '.dae')
-            else:
-                file_path = os.path.join(directory, mesh + '_vertices' + str(len(bm.vertices)) + '.dae')
+            file_path = os.path.join(directory, mesh.name + '.dae')
 
-        SelectModel.run(model_name=model_name)
-        if in_ros_package:
-            return "package://" + os.path.relpath(file_path, toplevel_dir)
-        elif not abs_file_paths:
-            return "file://" + os.path.relpath(file_path, toplevel_dir)
+        if queue is None:
+            queue = MeshExportQueue()
+            queue.add(mesh, file_path)
+            queue.run(operator, context)
+        else:
+            queue.add(mesh, file_path)
+    else:
+        if '.' in mesh.name:
+            file_path = os.path.join(directory, mesh.name.replace('.', '_') + '_vertices' + str(len(bm.vertices)) + '.dae')
         else:
-            return "file://" + file_path
+            file_path = os.path.join(directory, mesh.name + '_vertices' + str(len(bm.vertices)) + '.dae')
 
-            # return ("model://" + os.path.join(model_folder_name, "meshes",
-            # mesh + ".dae"))
+    if in_ros_package:
+        return "package://" + os.path.relpath(file_path, toplevel_dir)
+    elif not abs_file_paths:
+        return "file://" + os.path.relpath(file_path, toplevel_dir)
+    else:
+        return "file://" + file_path
 
 
 def create_urdf(operator: RDOperator, context, base_link_name,
-                filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False):
+                filepath: str, meshpath: str, toplevel_directory: str, in_ros_package: bool, abs_filepaths=False,
+                associations=None, use_mesh_cache=True):
     """
     Creates the URDF XML file and exports the meshes
 
@@ -160,6 +138,8 @@ def create_urdf(operator: RDOperator, context, base_link_name,
     :param toplevel_directory: The directory in which to export
     :param in_ros_package: Whether to export into a ros package or plain files
     :param abs_filepaths: If not intstalled into a ros package decides whether to use absolute file paths.
+    :param associations: :class:`..associations.ObjectAssociations` of the model (built if not given)
+    :param use_mesh_cache: Reuse unchanged mesh files of a previous export into ``meshpath``
     :return:
     """
 
@@ -195,8 +175,7 @@ def create_urdf(operator: RDOperator, context, base_link_name,
             child.joint.axis.xyz = list_to_string(Vector((0, 0, 1)) * revert)
 
         if segment.parent is None:
-            print("Debug: parent bone is none", segment,
-                  segment.RobotEditor.jointMode)
+            operator.logger.debug("Parent bone is none: %s %s", segment.name, segment.RobotEditor.jointMode)
             child.joint.type = 'fixed'
         else:
             if segment.RobotEditor.jointMode == 'REVOLUTE':
@@ -213,8 +192,7 @@ def create_urdf(operator: RDOperator, context, base_link_name,
                 child.joint.type = 'fixed'
 
         # Add properties
-        connected_meshes = [mesh.name for mesh in context.scene.objects if
-                            mesh.type == 'MESH' and mesh.parent_bone == segment.name]
+        segment_objects = associations[segment.name]
         # if len(connected_meshes) > 0:
         #     child.link.name = connected_meshes[0]
         # else:
@@ -224,62 +202,58 @@ def create_urdf(operator: RDOperator, context, base_link_name,
         #     # todo: several meshes assigned to the same bone
         #     # todo: solutions add another property to a bone or
         #     # chose the name from the list of connected meshes
-        for mesh in connected_meshes:
-            pose_bone = context.active_object.pose.bones[segment.name]
-            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * \
-                   bpy.data.objects[mesh].matrix_world
+        pose_bone = context.active_object.pose.bones[segment.name]
+        for mesh in segment_objects.visuals:
+            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * mesh.matrix_world
 
             visual_path = export_mesh(operator, context, mesh, meshpath, toplevel_directory,
-                                      in_ros_package, abs_filepaths, export_collision=False)
-            if visual_path and "_vertices1.dae" not in visual_path:
+                                      in_ros_package, abs_filepaths, export_collision=False, queue=queue)
+            if "_vertices1.dae" not in visual_path:
                 visual = child.add_mesh(visual_path,
-                                        [i * j for i, j in zip(bpy.data.objects[mesh].scale, blender_scale_factor)])
+                                        [i * j for i, j in zip(mesh.scale, blender_scale_factor)])
                 visual.origin.xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
                 visual.origin.rpy = list_to_string(pose.to_euler())
             else:
-                operator.logger.info("No visual model for: %s", mesh)
+                operator.logger.info("No visual model for: %s", mesh.name)
+
+        for mesh in segment_objects.collisions:
+            pose = pose_bone.matrix.inverted() * context.active_object.matrix_world.inverted() * mesh.matrix_world
 
             collision_path = export_mesh(operator, context, mesh, meshpath, toplevel_directory,
-                                         in_ros_package, abs_filepaths, export_collision=True)
-            if collision_path and "_vertices1.dae" not in collision_path:
+                                         in_ros_package, abs_filepaths, export_collision=True, queue=queue)
+            if "_vertices1.dae" not in collision_path:
                 collision = child.add_collisionmodel(collision_path,
-                    [i * j for i, j in zip(bpy.data.objects[mesh].scale, blender_scale_factor)])
+                    [i * j for i, j in zip(mesh.scale, blender_scale_factor)])
 
                 collision.origin.xyz = list_to_string([i * j for i, j in zip(pose.translation, blender_scale_factor)])
                 collision.origin.rpy = list_to_string(pose.to_euler())
             else:
-                operator.logger.info("No collision model for: %s", mesh)
+                operator.logger.info("No collision model for: %s", mesh.name)
 
         # todo: pick up the real values from Physics Frame?
 
-        frame_names = [
-            frame.name for frame in context.scene.objects if frame.RobotEditor.tag == 'PHYSICS_FRAME' and frame.parent_bone==segment.name]
-
-	# If no frame is connected create a default one. This is required for Gazebo!
-        if not frame_names:
+        # If no frame is connected create a default one. This is required for Gazebo!
+        if not segment_objects.frames:
             child.add_inertial()
-	
 
-        for frame in frame_names:
+        for frame in segment_objects.frames:
             # Add inertial definitions (for Gazebo)
             inertial = child.add_inertial()
-            print(inertial, inertial.__dict__)
-            if bpy.data.objects[frame].parent_bone == segment.name:
-                # set mass
-                inertial.mass.value_ = bpy.data.objects[frame].RobotEditor.dynamics.mass
-
-                # set inertia
-                inertial.inertia.ixx = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaXX,4)
-                inertial.inertia.ixy = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaXY,4)
-                inertial.inertia.ixz = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaXZ,4)
-                inertial.inertia.iyy = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaYY,4)
-                inertial.inertia.iyz = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaYZ,4)
-                inertial.inertia.izz = round(bpy.data.objects[frame].RobotEditor.dynamics.inertiaZZ,4)
-
-                # set inertial pose
-                assert False, "FIXME: Use the matrix of the physics frame rather than intertiaTrans and inertiaRot!"
-                inertial.origin.xyz = list_to_string(bpy.data.objects[frame].RobotEditor.dynamics.inertiaTrans)
-                inertial.origin.rpy = list_to_string(bpy.data.objects[frame].RobotEditor.dynamics.inertiaRot)
+            # set mass
+            inertial.mass.value_ = frame.RobotEditor.dynamics.mass
+
+            # set inertia
+            inertial.inertia.ixx = round(frame.RobotEditor.dynamics.inertiaXX,4)
+            inertial.inertia.ixy = round(frame.RobotEditor.dynamics.inertiaXY,4)
+            inertial.inertia.ixz = round(frame.RobotEditor.dynamics.inertiaXZ,4)
+            inertial.inertia.iyy = round(frame.RobotEditor.dynamics.inertiaYY,4)
+            inertial.inertia.iyz = round(frame.RobotEditor.dynamics.inertiaYZ,4)
+            inertial.inertia.izz = round(frame.RobotEditor.dynamics.inertiaZZ,4)
+
+            # set inertial pose
+            assert False, "FIXME: Use the matrix of the physics frame rather than intertiaTrans and inertiaRot!"
+            inertial.origin.xyz = list_to_string(frame.RobotEditor.dynamics.inertiaTrans)
+            inertial.origin.rpy = list_to_string(frame.RobotEditor.dynamics.inertiaRot)
 
         # add joint controllers
         if operator.gazebo and segment.RobotEditor.jointController.isActive is True:
@@ -297,6 +271,12 @@ def create_urdf(operator: RDOperator, context, base_link_name,
             walk_segments(child_segments, child)
 
     robot_name = context.active_object.name
+    if associations is None:
+        associations = ObjectAssociations.build(context)
+    # Fail before any mesh is exported
+    check_inertials(operator, context)
+    cache = MeshExportCache(meshpath) if use_mesh_cache else None
+    queue = MeshExportQueue(cache, global_properties.mesh_export_processes.get(context.scene))
 
     blender_scale_factor = context.active_object.scale
 
@@ -314,7 +294,14 @@ def create_urdf(operator: RDOperator, context, base_link_name,
     for segments in root_segments:
         walk_segments(segments, root)
 
-    operator.logger.info("Writing to '%s'" % filepath)
+    # Write the robot description only after all meshes have been exported
+    queue.run(operator, context)
+    if cache is not None:
+        cache.save()
+        operator.logger.info(cache.report())
+        operator.report({'INFO'}, cache.report())
+
+    operator.logger.info("Writing to '%s'", filepath)
     root.write(filepath)
 
     # insert gazebo tags before "</robot>" tag
@@ -329,13 +316,14 @@ def create_urdf(operator: RDOperator, context, base_link_name,
 
 
 
-def create_package(operator: RDOperator, context, toplevel_dir, base_link_name):
+def create_package(operator: RDOperator, context, toplevel_dir, base_link_name, use_mesh_cache=True):
     '''
     Create a ros package. Copies a template from the resources folder and replaces place holders with the robot name.
 
     :param operator: The calling operator
     :param context: The current context
     :param toplevel_dir: The directory in which to export
+    :param use_mesh_cache: Reuse unchanged mesh files of a previous export into the package
     :return:
     '''
     import os
@@ -376,7 +364,8 @@ def create_package(operator: RDOperator, context, toplevel_dir, base_link_name):
 
     create_urdf(operator=operator, context=context, base_link_name=base_link_name,
                 filepath=os.path.join(target, "urdf", robot_name + ".urdf"),
-                meshpath=target, toplevel_directory=toplevel_dir, in_ros_package=True, abs_filepaths=False)
+                meshpath=target, toplevel_directory=toplevel_dir, in_ros_package=True, abs_filepaths=False,
+                use_mesh_cache=use_mesh_cache)
 
 
 @RDOperator.Preconditions(ModelSelected, ObjectMode)
@@ -423,7 +412,7 @@ class ExportZippedPackage(RDOperator):
                     file_path = os.path.join(root, file)
                     ziph.write(file_path, os.path.relpath(file_path, path))
         with tempfile.TemporaryDirectory() as target:
-            create_package(self, context, target, self.base_link_name)
+            create_package(self, context, target, self.base_link_name, use_mesh_cache=False)
 
             with zipfile.ZipFile(self.filepath, 'w') as zipf:
                 zipdir(target, zipf)
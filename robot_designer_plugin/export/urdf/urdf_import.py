@@ -64,8 +64,7 @@ from ...operators.dynamics import AssignPhysical, CreatePhysical, SelectPhysical
 # URDF-specific imports
 
 from .generic import urdf_tree
-
-from .generic.helpers import string_to_list, get_value
+from ..robot_model import RobotModel
 
 from ...properties.globals import global_properties
 
@@ -89,19 +88,19 @@ class Importer(object):
         self.operator = operator
         self.controllers = None
 
-    def import_geometry(self, model):
+    def import_geometry(self, geometry):
         """
         Adds a geometry to the blender scene. Uses the self.file_name variable of the parenting context
-        :param model: A urdf_dom.visual object.
+        :param geometry: A mesh :class:`robot_designer_plugin.export.robot_model.Geometry`.
         :return: Returns the transformation in the origin element (a 4x4 blender matrix).
         """
 
         # determine prefix path for loading meshes in case of paths relative to ROS_PACKAGE_PATH
         prefix_folder = ""
-        mesh_url = model.geometry.mesh.filename
+        mesh_url = geometry.uri
 
-        self.logger.info("base dir: %s", self.base_dir)
-        self.logger.info("mesh url: %s", mesh_url)
+        self.logger.debug("base dir: %s", self.base_dir)
+        self.logger.debug("mesh url: %s", mesh_url)
 
         # check for absolute file path
         if mesh_url.startswith(self.FILE_URL_ABSOLUTE):
@@ -129,34 +128,38 @@ class Importer(object):
                 pass
         elif extension == ".dae" or extension == ".DAE":
             try:
-                self.logger.info("mesh file: %s", mesh_path)
+                self.logger.debug("mesh file: %s", mesh_path)
                 bpy.ops.wm.collada_import(filepath=mesh_path, import_units=True)
             except:
                 pass
 
         bpy.context.active_object.RobotEditor.fileName = os.path.basename(os.path.splitext(mesh_path)[0])
 
-        scale_factor = string_to_list(model.geometry.mesh.scale)
+        scale_factor = geometry.size
         scale_matrix = Matrix([[1, 0, 0, 0], [0, 1, 0, 0],
                                 [0, 0, 1, 0], [0, 0, 0, 1]])
        # scale_matrix = Matrix([[scale_factor[0], 0, 0, 0], [0, scale_factor[1], 0, 0],
        #                        [0, 0, scale_factor[2], 0], [0, 0, 0, 1]])
 
-        return Matrix.Translation(Vector(string_to_list(model.origin.xyz))) * \
-               Euler(string_to_list(model.origin.rpy), 'XYZ').to_matrix().to_4x4() * scale_matrix
+        return Matrix.Translation(Vector(geometry.pose[:3])) * \
+               Euler(geometry.pose[3:], 'XYZ').to_matrix().to_4x4() * scale_matrix
 
 
-    def parse(self, node: urdf_tree.URDFTree, parent_name=""):
+    def parse(self, robot: RobotModel, children, index, parent_name=""):
         """
-        Recursively parses the URDF tree elements.
+        Recursively creates the segments of a link and its children. A segment is named after the joint of its link.
 
-        :param node: The actual segment
+        :param robot: The :class:`robot_designer_plugin.export.robot_model.RobotModel` read from the file
+        :param children: The child link indices of every link (see :meth:`RobotModel.children`)
+        :param index: Index of the link of the actual segment
         :param parent_name: Name of the parent segment (if None the segment is a root element)
         """
 
         C = bpy.context
+        link = robot.links[index]
+        joint = robot.joints[link.joint]
 
-        self.logger.info("parent name: %s", parent_name)
+        self.logger.debug("parent name: %s", parent_name)
         #self.logger.debug('active bone name : %s', C.active_bone.name)
         self.logger.debug('active object name (parse): %s', C.active_object.name)
 
@@ -169,12 +172,12 @@ class Importer(object):
 
         SelectSegment.run(segment_name=parent_name)
 
-        CreateNewSegment.run(segment_name=node.joint.name)
+        CreateNewSegment.run(segment_name=joint.name)
         segment_name = C.active_bone.name
-        self.logger.info("%s -> %s", parent_name, segment_name)
+        self.logger.debug("%s -> %s", parent_name, segment_name)
 
-        xyz = string_to_list(get_value(node.joint.origin.xyz, "0 0 0"))
-        euler = string_to_list(get_value(node.joint.origin.rpy, '0 0 0'))
+        xyz = link.pose[:3]
+        euler = link.pose[3:]
 
         if segment_name in self.controllers:
             controller = self.controllers[segment_name]
@@ -185,7 +188,7 @@ class Importer(object):
             bpy.context.active_bone.RobotEditor.jointController.I = float(PID[1])
             bpy.context.active_bone.RobotEditor.jointController.D = float(PID[2])
 
-        axis = string_to_list(node.joint.axis.xyz)
+        axis = list(joint.axis)
         for i, element in enumerate(axis):
             if element == -1.0:
                 bpy.context.active_bone.RobotEditor.axis_revert = True
@@ -210,54 +213,43 @@ class Importer(object):
         bpy.context.active_bone.RobotEditor.Euler.beta.value = round(degrees(euler[1]), 0)
         bpy.context.active_bone.RobotEditor.Euler.gamma.value = round(degrees(euler[2]), 0)
 
-        if node.joint.dynamics:
-            bpy.context.active_bone.RobotEditor.controller.maxVelocity = float(
-                    node.joint.limit.velocity)
-            # bpy.context.active_bone.RobotEditor.controller.maxVelocity = float(tree.joint.limit.friction)
+        if joint.velocity:
+            bpy.context.active_bone.RobotEditor.controller.maxVelocity = joint.velocity
+        if joint.effort:
+            bpy.context.active_bone.RobotEditor.controller.maxTorque = joint.effort
 
-        if node.joint.type == 'revolute':
+        if joint.type == 'revolute':
             bpy.context.active_bone.RobotEditor.jointMode = 'REVOLUTE'
-            bpy.context.active_bone.RobotEditor.theta.max = degrees(float(get_value(node.joint.limit.upper, 0)))
-            bpy.context.active_bone.RobotEditor.theta.min = degrees(float(get_value(node.joint.limit.lower, 0)))
-        if node.joint.type == 'prismatic':
+            bpy.context.active_bone.RobotEditor.theta.max = degrees(joint.upper)
+            bpy.context.active_bone.RobotEditor.theta.min = degrees(joint.lower)
+        if joint.type == 'prismatic':
             bpy.context.active_bone.RobotEditor.jointMode = 'PRISMATIC'
-            if node.joint.limit is not None:
-                bpy.context.active_bone.RobotEditor.d.max = float(get_value(node.joint.limit.upper, 0))
-                bpy.context.active_bone.RobotEditor.d.min = float(get_value(node.joint.limit.lower, 0))
+            bpy.context.active_bone.RobotEditor.d.max = joint.upper
+            bpy.context.active_bone.RobotEditor.d.min = joint.lower
 
-        if node.joint.type == 'fixed':
+        if joint.type == 'fixed':
             bpy.context.active_bone.RobotEditor.jointMode = 'FIXED'
 
-        # todo set the dynamics properties
-        if node.link.inertial is not None:
-            for inertia in node.link.inertial:
-                # dynamics is not associated to a bone!
-                origin = inertia.origin
-                i = inertia.inertia
-
-                CreatePhysical.run(frameName=node.link.name)
-                SelectPhysical.run(frameName=node.link.name)
-                SelectSegment.run(segment_name=node.joint.name)
-                AssignPhysical.run()
-
-                # get mass
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.mass = inertia.mass.value_
-
-                # get inertia
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaXX = i.ixx
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaXY = i.ixy
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaXZ = i.ixz
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaYY = i.iyy
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaYZ = i.iyz
-                bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaZZ = i.izz
-
-
-                # get inertia pose
-                try:
-                    bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaTrans = string_to_list(origin.xyz)
-                    bpy.data.objects[node.link.name].RobotEditor.dynamics.inertiaRot = string_to_list(origin.rpy)
-                except:
-                    pass
+        if link.inertial is not None:
+            # dynamics is not associated to a bone!
+            inertial = link.inertial
+
+            CreatePhysical.run(frameName=link.name)
+            SelectPhysical.run(frameName=link.name)
+            SelectSegment.run(segment_name=joint.name)
+            AssignPhysical.run()
+
+            frame = bpy.data.objects[link.name]
+            dynamics = frame.RobotEditor.dynamics
+            dynamics.mass = inertial.mass
+
+            # set inertial pose (like the SDF importer)
+            frame.location = inertial.pose[:3]
+            frame.rotation_euler = inertial.pose[3:]
+
+            # set inertia
+            dynamics.inertiaXX, dynamics.inertiaXY, dynamics.inertiaXZ, dynamics.inertiaYY, dynamics.inertiaYZ, \
+                dynamics.inertiaZZ = inertial.inertia
 
         model = bpy.context.active_object
         model_name = model.name
@@ -265,17 +257,16 @@ class Importer(object):
         pose_bone = bpy.context.active_object.pose.bones[segment_name]
         segment_world = model.matrix_world * pose_bone.matrix
 
-        self.logger.debug("[COLLISION] parsed: " + str(len(list(node.link.collision))) + " collision meshes.")
+        self.logger.debug("[COLLISION] parsed: %d collision meshes.", len(link.collisions))
 
         # Iterate first over visual models then over collision models
         VISUAL, COLLISON = 0, 1
-        for model_type, geometric_models in enumerate((node.link.visual, node.link.collision)):
+        for model_type, geometric_models in enumerate((link.visuals, link.collisions)):
             # Iterate over the geometric models that are declared for the link
-            for nr, model in enumerate(geometric_models):
-                # geometry is not optional in the xml
-                if model.geometry.mesh is not None:
+            for nr, geometry in enumerate(geometric_models):
+                if geometry.type == 'mesh':
 
-                    trafo_urdf = self.import_geometry(model)
+                    trafo_urdf = self.import_geometry(geometry)
                     # self.logger.debug("Trafo: \n%s", trafo_urdf)
                     # URDF (the import in ROS) exhibits a strange behavior:
                     # If there is a transformation preceding the mesh in a .dae file, only the scale is
@@ -312,22 +303,22 @@ class Importer(object):
 
                         # if the loop continues the name will be suffixed by a number
 
-                        self.logger.info("Model type: " + str(model_type))
+                        self.logger.debug("Model type: %s", model_type)
                         # Remove multiple "COL_" and "VIS_" strings before renaming
                         if model_type == COLLISON:
                             # %2d changed to %d because it created unwanted space with one digit numbers
-                            if not node.link.name.startswith("COL_"):
-                                bpy.context.active_object.name = "COL_%s" % (node.link.name)
+                            if not link.name.startswith("COL_"):
+                                bpy.context.active_object.name = "COL_%s" % (link.name)
                             else:
-                                bpy.context.active_object.name = "%s" % (node.link.name)
+                                bpy.context.active_object.name = "%s" % (link.name)
                             bpy.context.active_object.RobotEditor.tag = 'COLLISION'
                         else:
-                            if not node.link.name.startswith("VIS_"):
-                                bpy.context.active_object.name = "VIS_%s" % (node.link.name)
+                            if not link.name.startswith("VIS_"):
+                                bpy.context.active_object.name = "VIS_%s" % (link.name)
                             else:
-                                bpy.context.active_object.name = "%s" % (node.link.name)
+                                bpy.context.active_object.name = "%s" % (link.name)
 
-                        if not node.link.name.endswith("_" + str(nr)) and nr != 0:
+                        if not link.name.endswith("_" + str(nr)) and nr != 0:
                             bpy.context.active_object.name = "%s_%d" % (bpy.context.active_object.name, nr)
 
 
@@ -346,54 +337,54 @@ class Importer(object):
                         AssignGeometry.run()
 
                         # scale geometry
-                        if model.geometry.mesh.scale == []:
-                            scale_factor = [1, 1, 1]
-                        else:
-                            scale_factor = string_to_list(model.geometry.mesh.scale)
-
-                        bpy.data.objects[global_properties.mesh_name.get(bpy.context.scene)].scale = scale_factor
+                        bpy.data.objects[global_properties.mesh_name.get(bpy.context.scene)].scale = geometry.size
 
                 else:
                     self.logger.error("Mesh file not found")
                     pass
 
-        for sub_tree in node.children:
-            self.parse(sub_tree, segment_name)
+        for child in children[index]:
+            self.parse(robot, children, child, segment_name)
         return segment_name
 
     def import_file(self):
-        robot_name, root_links, kinematic_chains, self.controllers, gazebo_tags = \
-            urdf_tree.URDFTree.parse(self.file_path)
+        document = urdf_tree.URDFTree.read(self.file_path)
+        self.controllers, gazebo_tags = urdf_tree.URDFTree.gazebo_tags(document)
+        robot = urdf_tree.URDFTree.fill_model(document, RobotModel())
 
         self.logger.debug("%s,%s", self.base_dir, self.file_path)
         # store gazebo tags
         tag_buffer = ''
-        self.logger.debug('Processing {0} tags.'.format(len(gazebo_tags)))
+        self.logger.debug('Processing %d tags.', len(gazebo_tags))
         for gazebo_tag in gazebo_tags:
             curr_tag = gazebo_tag.toxml("utf-8").decode("utf-8")
             curr_tag = curr_tag[38:]  # remove <xml version=.../> tag
             tag_buffer = '{0}\n{1}'.format(tag_buffer, curr_tag)
         global_properties.gazebo_tags.set(bpy.context.scene, tag_buffer)
 
+        root_links = robot.roots()
         self.logger.debug('root links: %s', [i.name for i in root_links])
 
-        CreateNewModel.run(model_name=robot_name, base_segment_name="")
+        CreateNewModel.run(model_name=robot.name, base_segment_name="")
         model_name = bpy.context.active_object.name
 
         SelectModel.run(model_name=model_name)
         for link in root_links:
-            for visual in link.visual:
-                if visual.geometry.mesh is not None:
+            for visual in link.visuals:
+                if visual.type == 'mesh':
                     trafo = self.import_geometry(visual)
-                    s1 = string_to_list(visual.geometry.mesh.scale)
+                    s1 = visual.size
                     s2 = bpy.context.active_object.scale
                     scale = Matrix([[s1[0] * s2[0], 0, 0, 0], [0, s1[1] * s2[1], 0, 0],
                                     [0, 0, s1[2] * s2[2], 0], [0, 0, 0, 1]])
                     bpy.context.active_object.matrix_world = trafo * scale
 
-        for chain in kinematic_chains:
-            root_name = self.parse(chain)
-            UpdateSegments.run(segment_name=root_name, recurse=True)
+        # Skips the basis links
+        children = robot.children()
+        for link in root_links:
+            for child in children[link.index]:
+                root_name = self.parse(robot, children, child)
+                UpdateSegments.run(segment_name=root_name, recurse=True)
 
         try:
             SelectCoordinateFrame.run(mesh_name='CoordinateFrame')
@@ -47,6 +47,46 @@ from ..core.gui import InfoBox
 from .helpers import getSingleSegment, getSingleObject
 
 
+class CompositeCache(object):
+    """
+    Keeps the :class:`robot_designer_plugin.composite.CompositeBody` of the active model between redraws, such that
+    only the subtrees whose physics frames or joints changed are recomputed. The body is created again when the
+    model or its segments change.
+    """
+    _body = None
+    _key = None
+
+    @classmethod
+    def get(cls, armature):
+        key = (armature.as_pointer(), tuple((bone.name, bone.parent.name if bone.parent else '')
+                                            for bone in armature.data.bones))
+        if key != cls._key:
+            cls._body, cls._key = None, key
+        cls._body = dynamics.composite_body(armature, cls._body)
+        return cls._body
+
+
+def draw_mass_properties(layout, title, mass_properties):
+    mass, center, inertia = mass_properties
+    box = layout.box()
+    box.label(title, icon="MODIFIER")
+    column = box.column(align=True)
+    column.label("Mass: %.4g" % mass)
+    column.label("Center of mass: %.4g, %.4g, %.4g" % tuple(center))
+    column.label("Inertia: XX %.4g, YY %.4g, ZZ %.4g" % (inertia[0, 0], inertia[1, 1], inertia[2, 2]))
+    column.label("XY %.4g, XZ %.4g, YZ %.4g" % (inertia[0, 1], inertia[0, 2], inertia[1, 2]))
+
+
+def draw_composite(layout, context, segment):
+    """
+    Draws the mass, center of mass and inertia of the whole model and of the subtree of the selected segment.
+    """
+    body = CompositeCache.get(context.active_object)
+    draw_mass_properties(layout, "Whole robot (model frame)", body.whole())
+    if segment is not None:
+        draw_mass_properties(layout, "Subtree of %s (segment frame)" % segment.name, body.subtree(segment.name))
+
+
 def draw(layout, context):
     """
     Draws the user interface for modifying the dynamic properties of a segment.
@@ -115,3 +155,4 @@ def draw(layout, context):
         pass
 
     infoBox.draw_info()
+    draw_composite(layout, context, single_segment)
@@ -42,6 +42,7 @@ import bpy
 from .model import check_armature
 from ..core import PluginManager
 from ..core.gui import InfoBox
+from ..operators import dynamics
 from ..properties.globals import global_properties
 
 
@@ -78,6 +79,10 @@ def draw(layout, context):
 
     layout = layout.box()
     layout.label('Import/Export')
+    global_properties.mesh_export_processes.prop(context.scene, layout)
+    row = layout.row(align=True)
+    global_properties.inertial_repair.prop(context.scene, row)
+    dynamics.ValidateInertials.place_button(row)
 
     # # Will be added again once GIT persistence has been decided on
     #
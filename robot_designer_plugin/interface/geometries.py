@@ -160,6 +160,8 @@ def draw(layout, context):
             collision.GenerateCollisionMesh.place_button(column, infoBox=infoBox)
             collision.GenerateAllCollisionConvexHull.place_button(column, infoBox=infoBox)
             collision.GenerateCollisionConvexHull.place_button(column, infoBox=infoBox)
+            collision.GenerateAllCollisionDecompositions.place_button(column, infoBox=infoBox)
+            collision.GenerateCollisionDecomposition.place_button(column, infoBox=infoBox)
 
             box.row()
             infoBox.draw_info()
@@ -37,6 +37,7 @@
 
 import bpy
 from ..properties.globals import global_properties
+from ..operators.workspace import ComputeReachabilityMap
 
 def draw(layout, context):
     """
@@ -92,5 +93,5 @@ def draw(layout, context):
             joint_column.prop(context.active_bone.RobotEditor.d, "min", slider=False)
             joint_column.prop(context.active_bone.RobotEditor.d, "max", slider=False)
 
-
-
+    layout.separator()
+    layout.operator(ComputeReachabilityMap.bl_idname, text="Compute reachability map")
@@ -50,6 +50,7 @@ from bpy.props import EnumProperty
 
 from ..core import config, PluginManager
 from ..core.gui import InfoBox
+from ..core.profiling import operator_profiler
 from ..properties.globals import global_properties
 from .helpers import DebugBox
 
@@ -97,6 +98,27 @@ class UserInterface(bpy.types.Panel):
             row = layout.row(align=True)
             global_properties.operator_debug_level.prop(bpy.context.scene,row, expand=True)
 
+            box = layout.box()
+            global_properties.operator_profiling.prop(bpy.context.scene, box)
+            if global_properties.operator_profiling.get(bpy.context.scene):
+                row = box.row(align=True)
+                gui.ExportOperatorProfile.place_button(row, "Export")
+                gui.ResetOperatorProfile.place_button(row, "Reset")
+                global_properties.operator_profile_entries.prop(bpy.context.scene, box)
+                entries = operator_profiler.top(global_properties.operator_profile_entries.get(bpy.context.scene))
+                if entries:
+                    column = box.column(align=True)
+                    row = column.row()
+                    for title in ("Operator", "Calls", "Wall [ms]", "CPU [ms]", "Self [ms]"):
+                        row.label(title)
+                    for name, calls, wall, cpu, self_wall in entries:
+                        row = column.row()
+                        row.label(name.split('.')[-1])
+                        row.label("%d" % calls)
+                        row.label("%.1f" % (wall * 1000))
+                        row.label("%.1f" % (cpu * 1000))
+                        row.label("%.1f" % (self_wall * 1000))
+
         # M. Welter: Why is this needed? There is already a perfectly fine gui to switch modes, even in a prominent place, .
         # row = layout.row(align=True)
         # row.label("Set Mode")
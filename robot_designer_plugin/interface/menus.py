@@ -40,6 +40,7 @@
 # import os
 # import sys
 # import math
+from collections import namedtuple, defaultdict
 
 # ######
 # Blender imports
@@ -58,6 +59,108 @@ from ..core.logfile import gui_logger
 from ..properties.globals import global_properties
 from ..core.constants import StringConstants
 
+ObjectEntry = namedtuple('ObjectEntry', 'name parent_bone tag hide')
+"""
+Properties of a scene object that the menus display or filter by.
+"""
+
+
+class MenuCache(object):
+    """
+    Segment hierarchy and object associations shared by the :ref:`menus <menu>` below. Before, every
+    :meth:`draw` searched all scene objects and sorted the segments (at each level of the hierarchy) again. The index
+    is built once in a single pass over the bones and scene objects and reused until the active object changes or
+    :func:`invalidate_menu_cache` registers a change of objects or armatures. Names are stored instead of Blender
+    objects such that no freed data is referenced after undo or loading a file.
+    """
+
+    _cache = None
+
+    def __init__(self, context, key):
+        self.key = key
+
+        # Sorted segment names and tuples of segment names and indented labels in depth-first order
+        self.segment_names = []
+        self.segment_rows = []
+        model = context.active_object
+        if model is not None and model.type == 'ARMATURE':
+            roots, children = [], defaultdict(list)
+            for bone in model.data.bones:
+                self.segment_names.append(bone.name)
+                if bone.parent is None:
+                    roots.append(bone.name)
+                else:
+                    children[bone.parent.name].append(bone.name)
+            self.segment_names.sort(key=str.lower)
+
+            for root in roots:
+                self.segment_rows.append((root, root))
+                stack = [(bone, 0) for bone in sorted(children[root], key=str.lower, reverse=True)]
+                while stack:
+                    bone, level = stack.pop()
+                    self.segment_rows.append((bone, '    ' * level + '\__ ' + bone))
+                    stack.extend((child, level + 1) for child in sorted(children[bone], key=str.lower, reverse=True))
+
+        # ObjectEntry lists by Blender object type, the mesh connected to a segment by tag and segment name and
+        # tuples of the muscle names and the names of their robot models
+        self.armatures = []
+        self.objects = defaultdict(list)
+        self.segment_meshes = defaultdict(dict)
+        self.unparented = []
+        self.muscles = []
+        for obj in context.scene.objects:
+            tag = obj.RobotEditor.tag
+            self.objects[obj.type].append(ObjectEntry(obj.name, obj.parent_bone, tag, obj.hide))
+            if obj.type == 'ARMATURE':
+                self.armatures.append(obj.name)
+            elif obj.type == 'MESH' and obj.parent_bone:
+                self.segment_meshes[tag][obj.parent_bone] = obj.name
+            if obj.type in ('MESH', 'EMPTY') and obj.parent is None and obj.parent_bone == '':
+                self.unparented.append(obj.name)
+            if obj.RobotEditor.muscles.robotName:
+                self.muscles.append((obj.name, obj.RobotEditor.muscles.robotName))
+
+    @classmethod
+    def get(cls, context):
+        """
+        :return: The (cached) index of the current context
+        """
+        model = context.active_object
+        # Counts catch objects and segments that were added or removed without an update being registered
+        key = (context.scene.as_pointer(), model.as_pointer() if model else 0, len(context.scene.objects),
+               len(model.data.bones) if model and model.type == 'ARMATURE' else 0)
+        if cls._cache is None or cls._cache.key != key:
+            cls._cache = cls(context, key)
+        return cls._cache
+
+    @classmethod
+    def invalidate(cls):
+        cls._cache = None
+
+
+@PluginManager.register_handler('depsgraph_update_post')
+def invalidate_menu_cache(scene, depsgraph=None):
+    """
+    Handler that drops the cached :class:`MenuCache` if objects or armatures were changed.
+    """
+    if depsgraph is not None:
+        updated = depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('ARMATURE')
+    else:
+        updated = bpy.data.objects.is_updated or bpy.data.armatures.is_updated
+    if updated:
+        MenuCache.invalidate()
+
+
+@PluginManager.register_handler('load_post')
+@PluginManager.register_handler('undo_post')
+@PluginManager.register_handler('redo_post')
+def reset_menu_cache(*args):
+    """
+    Handler that drops the cached :class:`MenuCache` after loading a file, undo and redo.
+    """
+    MenuCache.invalidate()
+
+
 class BaseMenu(object):
 
     logger = gui_logger
@@ -82,14 +185,10 @@ class SegmentsGeometriesMenu(bpy.types.Menu, BaseMenu):
         hide_bone = global_properties.display_mesh_selection.get(context.scene)
         layout = self.layout
 
-        current_model = context.active_object
-        segment_names = [bone.name for bone in current_model.data.bones]
-        meshes = {obj.parent_bone: obj.name for obj in context.scene.objects if
-                  obj.parent_bone is not None and
-                  obj.type == 'MESH' and
-                  obj.RobotEditor.tag == mesh_type}
+        cache = MenuCache.get(context)
+        meshes = cache.segment_meshes.get(mesh_type, {})
 
-        for bone in sorted(segment_names, key=str.lower):
+        for bone in cache.segment_names:
             if bone in meshes:
                 text = bone + " <-- " + meshes[bone]
                 if hide_bone == 'disconnected':
@@ -116,29 +215,15 @@ class SegmentsMusclesMenu(bpy.types.Menu, BaseMenu):
 
     @RDOperator.OperatorLogger
     def draw(self, context):
-        mesh_type = global_properties.mesh_type.get(context.scene)
-        hide_bone = global_properties.display_mesh_selection.get(context.scene)
         layout = self.layout
 
-        current_model = context.active_object
-        segment_names = [bone.name for bone in current_model.data.bones]
-
     #    for bone in sorted(segment_names, key=str.lower):
     #        x = muscles.SelectSegmentMuscle
     #        x.segment_name = bone
     #        layout.operator(x.bl_idname, text=bone).segment_name = bone
 
-        for root in [bone.name for bone in current_model.data.bones if bone.parent is None]:
-            layout.operator(muscles.SelectSegmentMuscle.bl_idname, text=root).segment_name = root
-
-            def recursion(children, level=0):
-
-                for bone in sorted([bone.name for bone in children], key=str.lower):
-                    text = '    ' * level + '\__ ' + bone
-                    layout.operator(muscles.SelectSegmentMuscle.bl_idname, text=text).segment_name = bone
-                    recursion(current_model.data.bones[bone].children, level + 1)
-
-            recursion(current_model.data.bones[root].children)
+        for bone, text in MenuCache.get(context).segment_rows:
+            layout.operator(muscles.SelectSegmentMuscle.bl_idname, text=text).segment_name = bone
 
 
 class ConnectedObjectsMenu(bpy.types.Menu, BaseMenu):
@@ -161,35 +246,28 @@ class ConnectedObjectsMenu(bpy.types.Menu, BaseMenu):
         obj_hidden = self.show_connected.get(context.scene)
         layout = self.layout
         type = global_properties.display_mesh_selection.get(context.scene)
+        candidates = MenuCache.get(context).objects.get(self.blender_type, [])
         if type == 'all':
-            obj_names = [obj.name for obj in context.scene.objects if
-                         obj.type == self.blender_type and
-                         not obj.hide]
+            objs = [obj for obj in candidates if not obj.hide]
         elif type == 'collision':
-            obj_names = [obj.name for obj in context.scene.objects if
-                         obj.type == self.blender_type and
-                         obj.RobotEditor.tag == 'COLLISION' and
-                         not obj.hide]
+            objs = [obj for obj in candidates if obj.tag == 'COLLISION' and not obj.hide]
         elif type == 'visual':
-            obj_names = [obj.name for obj in context.scene.objects if
-                         obj.type == self.blender_type and
-                         obj.RobotEditor.tag == 'DEFAULT' and
-                         not obj.hide]
+            objs = [obj for obj in candidates if obj.tag == 'DEFAULT' and not obj.hide]
         elif type == 'none':
-            obj_names = []
+            objs = []
 
-        self.logger.debug(obj_names)
+        self.logger.debug([obj.name for obj in objs])
 
-        for obj in obj_names:
-            if bpy.data.objects[obj].parent_bone:
-                text = obj + " --> " + bpy.data.objects[obj].parent_bone
+        for obj in objs:
+            if obj.parent_bone:
+                text = obj.name + " --> " + obj.parent_bone
                 if obj_hidden == 'disconnected':
                     continue
             else:
-                text = obj
+                text = obj.name
                 if obj_hidden == 'connected':
                     continue
-            setattr(layout.operator(self.operator.bl_idname, text=text),self.operator_property, obj)
+            setattr(layout.operator(self.operator.bl_idname, text=text),self.operator_property, obj.name)
 
     @classmethod
     def putMenu(cls,layout, context, text=None, **kwargs):
@@ -287,9 +365,11 @@ class MassObjectMenu(bpy.types.Menu, BaseMenu):
         hide_obj = self.show_connected.get(context.scene)
 
         layout = self.layout
-        current_model = context.active_object
 
-        objs = [obj for obj in context.scene.objects if self.may_show(obj, hide_obj)]
+        # The same filter as in may_show() on the cached entries of the empties
+        objs = [obj for obj in MenuCache.get(context).objects.get(self.blender_type, []) if
+                obj.tag == 'PHYSICS_FRAME' and not obj.hide and
+                (obj.parent_bone or hide_obj != 'disconnected') and (not obj.parent_bone or hide_obj != 'connected')]
 
         for obj in objs:
             text = self.fmt_obj(obj)
@@ -301,8 +381,7 @@ class MassObjectMenu(bpy.types.Menu, BaseMenu):
         hide_obj = cls.show_connected.get(context.scene)
 
         # Get selected meshes
-        current_model = context.active_object
-        selected = [obj for obj in context.scene.objects if cls.may_show(obj, hide_obj) and obj.select]
+        selected = [obj for obj in context.selected_objects if cls.may_show(obj, hide_obj)]
 
         text = cls.text
         if len(selected) == 1:
@@ -331,12 +410,11 @@ class ModelMenu(bpy.types.Menu, BaseMenu):
     @RDOperator.OperatorLogger
     def draw(self, context):
         layout = self.layout
-        armatures = [obj for obj in context.scene.objects if obj.type == 'ARMATURE']
+        armatures = MenuCache.get(context).armatures
 
         layout.operator(model.CreateNewModel.bl_idname, text="New...")
 
-        for arm in armatures:
-            text = arm.name
+        for text in armatures:
             model.SelectModel.place_button(layout, text=text).model_name = text
 
 
@@ -354,10 +432,9 @@ class JoinModelMenu(bpy.types.Menu, BaseMenu):
         layout = self.layout
 
         current_model_name = context.active_object.data.name
-        armatures = [obj for obj in context.scene.objects if obj.type == 'ARMATURE' and not obj.name == current_model_name]
+        armatures = [name for name in MenuCache.get(context).armatures if not name == current_model_name]
 
-        for arm in armatures:
-            text = arm.name
+        for text in armatures:
             layout.operator(model.JoinModels.bl_idname, text=text).targetArmatureName = text
 
 
@@ -374,10 +451,7 @@ class CoordinateFrameMenu(bpy.types.Menu, BaseMenu):
     @RDOperator.OperatorLogger
     def draw(self, context):
         layout = self.layout
-        geometry_names = [obj.name for obj in context.scene.objects if
-                          obj.type in ('MESH', 'EMPTY') and
-                          obj.parent is None and
-                          obj.parent_bone == '']
+        geometry_names = MenuCache.get(context).unparented
 
         for mesh in geometry_names:
             model.SelectCoordinateFrame.place_button(layout, text=mesh).mesh_name = mesh
@@ -399,10 +473,10 @@ class MuscleMenu(bpy.types.Menu, BaseMenu):
         active_model = global_properties.model_name.get(context.scene)
         hide_muscle = global_properties.display_muscle_selection.get(context.scene)
 
-        for muscle in [obj.name for obj in context.scene.objects
-                       if bpy.data.objects[obj.name].RobotEditor.muscles.robotName == active_model
+        for muscle in [name for name, robot_name in MenuCache.get(context).muscles
+                       if robot_name == active_model
                         and hide_muscle == 'all'
-                        or hide_muscle.lower() == bpy.data.objects[obj.name].RobotEditor.muscles.robotName.lower()]:
+                        or hide_muscle.lower() == robot_name.lower()]:
              muscles.SelectMuscle.place_button(layout, text=muscle).muscle_name = muscle
 
 
@@ -435,22 +509,10 @@ class SegmentsMenu(bpy.types.Menu, BaseMenu):
 
     @RDOperator.OperatorLogger
     def draw(self, context):
-        current_model = context.active_object
-
         layout = self.layout
 
-        for root in [bone.name for bone in current_model.data.bones if bone.parent is None]:
-            layout.operator(segments.SelectSegment.bl_idname, text=root).segment_name = root
-
-            def recursion(children, level=0):
-
-                for bone in sorted([bone.name for bone in children], key=str.lower):
-
-                    text = '    ' * level + '\__ ' + bone
-                    layout.operator(segments.SelectSegment.bl_idname, text=text).segment_name = bone
-                    recursion(current_model.data.bones[bone].children, level + 1)
-
-            recursion(current_model.data.bones[root].children)
+        for bone, text in MenuCache.get(context).segment_rows:
+            layout.operator(segments.SelectSegment.bl_idname, text=text).segment_name = bone
 
 
 
@@ -464,19 +526,18 @@ class AssignParentMenu(bpy.types.Menu, BaseMenu):
 
     @RDOperator.OperatorLogger
     def draw(self, context):
-        arm = context.active_object
         current_segment = context.active_bone
 
         # can't parent to self or own children
-        disallowed_segments = current_segment.children_recursive
-        disallowed_segments.append(current_segment)
-        segment_names = [bone.name for bone in arm.data.bones if bone not in disallowed_segments]
+        disallowed_segments = {bone.name for bone in current_segment.children_recursive}
+        disallowed_segments.add(current_segment.name)
+        segment_names = [bone for bone in MenuCache.get(context).segment_names if bone not in disallowed_segments]
 
         layout = self.layout
 
         layout.operator(segments.InsertNewParentSegment.bl_idname, text="New...")
 
-        for bone in sorted(segment_names, key=str.lower):
+        for bone in segment_names:
             text = bone
             if current_segment.parent and bone == current_segment.parent.name:
                 text += " <-- Parent"
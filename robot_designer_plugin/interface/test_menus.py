@@ -0,0 +1,153 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of the :class:`robot_designer_plugin.interface.menus.MenuCache` on a model with 1000 segments
+and a scene with 5000 objects.
+
+Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/interface/test_menus.py
+
+Menus cannot be drawn in background mode. The benchmark compares building the index (the cost of the first menu
+after a change) with the cached lookups of the following draws.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import robot_designer_plugin
+
+SEGMENTS = 1000
+OBJECTS = 5000
+DRAWS = 100
+
+
+def build_scene(name, segments, objects):
+    """
+    Creates an armature with a tree of ``segments`` bones (binary, in reverse name order) and ``objects`` meshes of
+    which every second one is connected to a segment.
+    """
+    scene = bpy.context.scene
+    model_data = bpy.data.armatures.new(name)
+    model = bpy.data.objects.new(name, model_data)
+    scene.objects.link(model)
+    scene.objects.active = model
+
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+    for i in reversed(range(segments)):
+        bone = model_data.edit_bones.new('segment_%04d' % i)
+        bone.head = (0, 0, i)
+        bone.tail = (0, 0, i + 1)
+    for i in range(1, segments):
+        model_data.edit_bones['segment_%04d' % i].parent = model_data.edit_bones['segment_%04d' % ((i - 1) // 2)]
+    bpy.ops.object.mode_set(mode='POSE', toggle=False)
+
+    mesh_data = bpy.data.meshes.new(name + '_mesh')
+    for i in range(objects):
+        obj = bpy.data.objects.new('%s_mesh_%d' % (name, i), mesh_data)
+        scene.objects.link(obj)
+        if i % 2:
+            obj.parent = model
+            obj.parent_type = 'BONE'
+            obj.parent_bone = 'segment_%04d' % (i % segments)
+    return model
+
+
+def segment_rows(model):
+    """
+    The labels of the segment menus as the recursive implementation created them.
+    """
+    rows = []
+
+    def recursion(children, level=0):
+        for bone in sorted([bone.name for bone in children], key=str.lower):
+            rows.append((bone, '    ' * level + '\\__ ' + bone))
+            recursion(model.data.bones[bone].children, level + 1)
+
+    for root in [bone.name for bone in model.data.bones if bone.parent is None]:
+        rows.append((root, root))
+        recursion(model.data.bones[root].children)
+    return rows
+
+
+class MenuCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        robot_designer_plugin.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        robot_designer_plugin.unregister()
+
+    def runTest(self):
+        from robot_designer_plugin.interface.menus import MenuCache
+
+        bpy.ops.wm.read_homefile(use_empty=True)
+        model = build_scene('benchmark', SEGMENTS, OBJECTS)
+
+        cache = MenuCache.get(bpy.context)
+        self.assertEqual(cache.segment_rows, segment_rows(model))
+        self.assertEqual(cache.segment_names, sorted((bone.name for bone in model.data.bones), key=str.lower))
+        self.assertEqual(cache.armatures, ['benchmark'])
+        self.assertEqual(len(cache.objects['MESH']), OBJECTS)
+        self.assertEqual(cache.segment_meshes['DEFAULT']['segment_0001'], 'benchmark_mesh_4001')
+        self.assertIs(MenuCache.get(bpy.context), cache)
+
+        # Changes of objects are picked up after the dependency graph update
+        bpy.data.objects['benchmark_mesh_0'].RobotEditor.tag = 'COLLISION'
+        bpy.context.scene.update()
+        self.assertEqual(MenuCache.get(bpy.context).objects['MESH'][0].tag, 'COLLISION')
+        bpy.context.scene.objects.unlink(bpy.data.objects['benchmark_mesh_1'])
+        self.assertEqual(len(MenuCache.get(bpy.context).objects['MESH']), OBJECTS - 1)
+
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            segment_rows(model)
+        recursive = (time.perf_counter() - start) / DRAWS
+
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            MenuCache.invalidate()
+            MenuCache.get(bpy.context)
+        build = (time.perf_counter() - start) / DRAWS
+
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            MenuCache.get(bpy.context).segment_rows
+        cached = (time.perf_counter() - start) / DRAWS
+
+        sys.stderr.write("%d segments, %d objects: recursive segment menu %8.2f ms  index %8.2f ms  "
+                         "cached %8.4f ms\n" % (SEGMENTS, OBJECTS, recursive * 1000, build * 1000, cached * 1000))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
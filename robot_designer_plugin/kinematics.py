@@ -0,0 +1,287 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Vectorized forward kinematics of the :term:`segments<segment>` of a :term:`robot model` (requires numpy, but not
+Blender).
+
+:class:`KinematicTree` reads the parameters of the segments once (see :meth:`KinematicTree.from_armature`) and
+computes the frames of all segments for many joint configurations at once. The frame of a segment is
+
+    ``frame(parent) * parentMatrix * axis_matrix * translation * rotation``
+
+with the matrices of :meth:`robot_designer_plugin.properties.segments.RDSegment.getTransform`, i.e., the pose of the
+bone relative to the armature. Joint values are given in the units of the GUI (degrees for revolute joints) and the
+offsets of the segments are added as in ``getTransform``. The results agree with the ``mathutils`` matrices up to their
+single precision.
+"""
+
+import math
+
+import numpy
+
+REVOLUTE, PRISMATIC = 'REVOLUTE', 'PRISMATIC'
+
+_AXES = {'X': 0, 'Y': 1, 'Z': 2}
+
+
+def rotation_matrix(angle, axis):
+    """
+    :param angle: Angle in radians
+    :param axis: Index of the rotation axis (0 to 2)
+    :return: 4x4 rotation matrix
+    """
+    c, s = math.cos(angle), math.sin(angle)
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    matrix = numpy.identity(4)
+    matrix[i, i] = matrix[j, j] = c
+    matrix[i, j], matrix[j, i] = -s, s
+    return matrix
+
+
+def translation_matrix(vector):
+    """
+    :param vector: Translation (three values)
+    :return: 4x4 translation matrix
+    """
+    matrix = numpy.identity(4)
+    matrix[:3, 3] = vector
+    return matrix
+
+
+def euler_matrix(x, y, z, alpha, beta, gamma):
+    """
+    Transform of a segment in Euler mode (see
+    :meth:`robot_designer_plugin.properties.segments.RDEulerAnglesSegment.getTransformFromParent`).
+
+    :param x, y, z: Translation
+    :param alpha, beta, gamma: Fixed axis XYZ angles in degrees
+    """
+    return translation_matrix((x, y, z)).dot(rotation_matrix(math.radians(gamma), 2)).dot(
+        rotation_matrix(math.radians(beta), 1)).dot(rotation_matrix(math.radians(alpha), 0))
+
+
+def dh_matrix(theta, d, alpha, a):
+    """
+    Transform of a segment in Denavit-Hartenberg mode (see
+    :meth:`robot_designer_plugin.properties.segments.RDDenavitHartenbergSegment.getTransformFromParent`).
+
+    :param theta, alpha: Angles in degrees
+    :param d, a: Distances
+    """
+    return translation_matrix((a, 0, d)).dot(rotation_matrix(math.radians(alpha), 0)).dot(
+        rotation_matrix(math.radians(theta), 2))
+
+
+class KinematicTree(object):
+    """
+    The segment tree of a robot model as arrays.
+
+    :param names: Names of the segments (parents precede their children)
+    :param parents: Index of the parent of every segment (-1 for roots)
+    :param frames: Array (segments, 4, 4) of the constant transforms ``parentMatrix * axis_matrix``
+    :param joint_modes: Joint mode of every segment (only ``'REVOLUTE'`` and ``'PRISMATIC'`` joints move)
+    :param axes: Joint axis of every segment (``'X'``, ``'Y'`` or ``'Z'``)
+    :param signs: -1 for reverted prismatic axes, 1 otherwise
+    :param offsets: Offset added to the joint value of every segment
+    :param values: Current joint value of every segment
+    :param lower: Lower joint limit of every segment (unlimited if None)
+    :param upper: Upper joint limit of every segment (unlimited if None)
+    :raises ValueError: if a parent does not precede its child
+    """
+
+    def __init__(self, names, parents, frames, joint_modes, axes, signs, offsets, values, lower=None, upper=None):
+        self.names = list(names)
+        self.parents = numpy.asarray(parents, dtype=numpy.intp)
+        self.frames = numpy.asarray(frames, dtype=numpy.float64).reshape(len(self.names), 4, 4)
+        self.joint_modes = list(joint_modes)
+        self.axes = numpy.array([_AXES[i] for i in axes], dtype=numpy.intp)
+        self.signs = numpy.asarray(signs, dtype=numpy.float64)
+        self.offsets = numpy.asarray(offsets, dtype=numpy.float64)
+        self.values = numpy.asarray(values, dtype=numpy.float64)
+        self.lower = numpy.full(len(self.names), -numpy.inf) if lower is None else \
+            numpy.asarray(lower, dtype=numpy.float64)
+        self.upper = numpy.full(len(self.names), numpy.inf) if upper is None else \
+            numpy.asarray(upper, dtype=numpy.float64)
+
+        if any(parent >= index for index, parent in enumerate(self.parents)):
+            raise ValueError("Parents have to precede their children")
+
+        # Indices of the segments with a movable joint (the columns of the joint configurations)
+        self.dofs = [i for i, mode in enumerate(self.joint_modes) if mode in (REVOLUTE, PRISMATIC)]
+        self._dof_column = {segment: column for column, segment in enumerate(self.dofs)}
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def dof_names(self):
+        """
+        :return: Names of the segments with a movable joint
+        """
+        return [self.names[i] for i in self.dofs]
+
+    @classmethod
+    def from_segments(cls, segments):
+        """
+        Reads the parameters of the segments.
+
+        :param segments: Iterable of tuples of the segment name, the parent index and the
+            :class:`robot_designer_plugin.properties.segments.RDSegment` (parents first)
+        :return: :class:`KinematicTree`
+        """
+        names, parents, frames, modes, axes, signs, offsets, values, lower, upper = ([] for _ in range(10))
+        for name, parent, segment in segments:
+            inverted = -1 if segment.axis_revert else 1
+            if segment.parentMode == 'EULER':
+                e = segment.Euler
+                frame = euler_matrix(e.x.value, e.y.value, e.z.value, e.alpha.value, e.beta.value, e.gamma.value)
+            else:
+                h = segment.DH
+                frame = dh_matrix(h.theta.value, h.d.value, h.alpha.value, h.a.value)
+
+            dof = segment.theta if segment.jointMode == REVOLUTE else segment.d
+            if segment.jointMode == REVOLUTE:
+                frame = frame.dot(rotation_matrix(math.radians(180 * (1 - inverted) / 2), _AXES[segment.axis]))
+
+            names.append(name)
+            parents.append(parent)
+            frames.append(frame)
+            modes.append(segment.jointMode)
+            axes.append(segment.axis)
+            signs.append(inverted if segment.jointMode == PRISMATIC else 1)
+            offsets.append(dof.offset)
+            values.append(dof.value)
+            lower.append(dof.min)
+            upper.append(dof.max)
+        return cls(names, parents, frames, modes, axes, signs, offsets, values, lower, upper)
+
+    @classmethod
+    def from_armature(cls, armature):
+        """
+        Reads the segments of an armature in depth-first order.
+
+        :param armature: The :class:`bpy.types.Armature` (or the armature object) of the model
+        :return: :class:`KinematicTree`
+        """
+        bones = getattr(armature, 'data', armature).bones
+        index = {}
+        segments = []
+        stack = [bone for bone in reversed(list(bones)) if bone.parent is None]
+        while stack:
+            bone = stack.pop()
+            index[bone.name] = len(segments)
+            segments.append((bone.name, index[bone.parent.name] if bone.parent else -1, bone.RobotEditor))
+            stack.extend(reversed(list(bone.children)))
+        return cls.from_segments(segments)
+
+    def chain(self, segment):
+        """
+        :param segment: Index of a segment
+        :return: Indices of the segment and its ancestors (root first)
+        """
+        chain = []
+        while segment >= 0:
+            chain.append(segment)
+            segment = self.parents[segment]
+        return chain[::-1]
+
+    def configurations(self, count=1):
+        """
+        :param count: Number of configurations
+        :return: Array (count, dofs) with the current joint values
+        """
+        return numpy.tile(self.values[self.dofs], (count, 1))
+
+    def forward(self, configurations=None, base=None, out=None, chunk=1024):
+        """
+        Computes the frames of all segments for a batch of joint configurations.
+
+        :param configurations: Array (N, dofs) of joint values (degrees for revolute joints) in the order of
+            :attr:`dofs`, a single configuration (dofs,) or None for the current values
+        :param base: Optional 4x4 transform applied to all frames (e.g., the world matrix of the armature)
+        :param out: Optional float64 array (N, segments, 4, 4) the result is written to
+        :param chunk: Number of configurations computed at once
+        :return: Array (N, segments, 4, 4) of the frames relative to the armature (or to ``base``'s frame)
+        """
+        if configurations is None:
+            configurations = self.configurations()
+        configurations = numpy.asarray(configurations, dtype=numpy.float64)
+        if configurations.ndim == 1:
+            configurations = configurations[numpy.newaxis]
+        count = len(configurations)
+        if configurations.shape[1] != len(self.dofs):
+            raise ValueError("Expected %d joint values, got %d" % (len(self.dofs), configurations.shape[1]))
+
+        if out is None:
+            out = numpy.empty((count, len(self), 4, 4))
+        base = numpy.identity(4) if base is None else numpy.asarray(base, dtype=numpy.float64)
+        roots = numpy.matmul(base, self.frames)
+
+        # The frames are computed element-wise: buffer[segment, row, column] is a vector over the configurations of
+        # a chunk. Matrix products become a few large products and the joint rotations and translations operate on
+        # contiguous vectors. The last row of a frame is constant.
+        buffer = numpy.zeros((len(self), 4, 4, min(chunk, count)))
+        buffer[:, 3, 3] = 1.0
+        for begin in range(0, count, chunk):
+            size = min(chunk, count - begin)
+            frames = buffer[..., :size]
+            joints = configurations[begin:begin + size].T + self.offsets[self.dofs, numpy.newaxis]
+            for column, i in enumerate(self.dofs):
+                if self.joint_modes[i] == REVOLUTE:
+                    joints[column] = numpy.radians(joints[column])
+                else:
+                    joints[column] *= self.signs[i]
+
+            for i, parent in enumerate(self.parents):
+                frame = frames[i, :3]
+                if parent < 0:
+                    frame[:] = roots[i, :3, :, numpy.newaxis]
+                else:
+                    # frame[r, c] = sum_m parent[r, m] * frames[m, c]
+                    numpy.matmul(self.frames[i].T, frames[parent, :3], out=frame)
+
+                if i not in self._dof_column:
+                    continue
+                values = joints[self._dof_column[i]]
+                if self.joint_modes[i] == REVOLUTE:
+                    cos, sin = numpy.cos(values), numpy.sin(values)
+                    j, k = [(1, 2), (2, 0), (0, 1)][self.axes[i]]
+                    first, second = frame[:, j].copy(), frame[:, k]
+                    frame[:, j] *= cos
+                    frame[:, j] += second * sin
+                    second *= cos
+                    second -= first * sin
+                else:
+                    frame[:, 3] += frame[:, self.axes[i]] * values
+
+            out[begin:begin + size] = frames.transpose(3, 0, 1, 2)
+        return out
+
+    def frame(self, name, configurations=None, base=None):
+        """
+        :return: Array (N, 4, 4) of the frames of a single segment
+        """
+        return self.forward(configurations, base)[:, self.names.index(name)]
@@ -0,0 +1,96 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Imports the Blender-free modules of the plugin (e.g., :mod:`robot_designer_plugin.translate` or
+:mod:`robot_designer_plugin.export.sdf.generic`) without Blender. The ``__init__.py`` files of the plugin packages
+require Blender, hence the parent packages that are not imported yet are registered as empty packages instead. The
+modules keep their names below :data:`PACKAGE`, such that their relative imports work and their functions can be
+pickled by reference.
+
+This module only depends on the standard library. It is used by the tests, the batch translation and the worker
+processes of :func:`robot_designer_plugin.pool.map_jobs`, which run it as their initializer (see :data:`WORKER`).
+"""
+
+import importlib
+import os
+import pickle
+import sys
+import types
+
+PACKAGE = 'robot_designer_plugin'
+"""
+Name of the plugin package.
+"""
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+"""
+Directory of the plugin package.
+"""
+
+WORKER = '__robot_designer_worker__'
+"""
+Name under which the module is run by the initializer of the worker processes.
+"""
+
+
+def register_package(name, path):
+    """
+    Registers an empty package unless a module of the name is imported already (e.g., inside Blender).
+
+    :param name: Full name of the package
+    :param path: Directory of the package
+    :return: The package
+    """
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [path]
+        sys.modules[name] = package
+    return sys.modules[name]
+
+
+def load(name, package=PACKAGE):
+    """
+    Imports a Blender-free module of the plugin (reusing a previously imported instance).
+
+    :param name: Name relative to the plugin package (e.g., ``'export.sdf.generic'``)
+    :param package: Name of the plugin package
+    :return: The module ``<package>.<name>``
+    """
+    parts = name.split('.')
+    for i in range(len(parts)):
+        register_package('.'.join([package] + parts[:i]), os.path.join(DIRECTORY, *parts[:i]))
+    return importlib.import_module(package + '.' + name)
+
+
+if __name__ == WORKER:
+    # Executed by runpy.run_path in a new worker process with the globals ``modules`` (full names of the modules to
+    # load) and ``call`` (a pickled function and its arguments, which is unpickled only after the modules are loaded)
+    for module in modules:
+        package, _, name = module.partition('.')
+        load(name, package)
+    function, args = pickle.loads(call)
+    if function is not None:
+        function(*args)
@@ -0,0 +1,193 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Exact mass properties of closed triangle meshes (requires numpy, but not Blender).
+
+The volume, center of mass and inertia tensor of a solid of uniform density are integrated exactly over the signed
+tetrahedra spanned by every triangle and a reference point (the divergence theorem). Polygons are fan triangulated,
+which is exact for planar polygons. The triangles of many meshes are processed at once with numpy: the per-triangle
+terms are computed for all meshes together and summed per mesh with :func:`numpy.bincount`.
+
+The result is only meaningful for closed, consistently oriented (manifold) meshes; :func:`manifold_defects` counts the
+half-edges that violate this. Meshes with inward facing normals are flipped.
+"""
+
+from collections import namedtuple
+
+import numpy
+
+# Index pairs of the second moments
+_PAIRS = ((0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2))
+
+MassProperties = namedtuple('MassProperties', 'volume mass center inertia defects flipped')
+"""
+Mass properties of a mesh: the volume, the mass, the center of mass, the 3x3 inertia tensor about the center of mass
+(in the axes of the vertices), the number of :func:`manifold defects<manifold_defects>` and whether the normals were
+inverted.
+"""
+
+
+def mesh_arrays(mesh):
+    """
+    Reads the vertices and triangles of a Blender mesh with ``foreach_get``.
+
+    :param mesh: :class:`bpy.types.Mesh` (with applied modifiers)
+    :return: Tuple of the vertices (N, 3) and the triangles (T, 3)
+    """
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', vertices)
+    loop_vertices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertices)
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    return vertices.reshape(-1, 3), triangulate(loop_totals, loop_vertices)
+
+
+def triangulate(loop_totals, loop_vertices):
+    """
+    Fan triangulation of polygons.
+
+    :param loop_totals: Number of vertices of every polygon
+    :param loop_vertices: Vertex indices of the polygons (concatenated)
+    :return: Integer array (T, 3) of the triangles
+    """
+    loop_totals = numpy.asarray(loop_totals, dtype=numpy.intp)
+    loop_vertices = numpy.asarray(loop_vertices, dtype=numpy.intp)
+    starts = numpy.cumsum(loop_totals) - loop_totals
+    counts = numpy.maximum(loop_totals - 2, 0)
+
+    # Triangle k of a polygon is (first, first + k + 1, first + k + 2)
+    first = numpy.repeat(starts, counts)
+    k = numpy.arange(len(first)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    return numpy.stack([loop_vertices[first], loop_vertices[first + k + 1], loop_vertices[first + k + 2]], axis=1)
+
+
+def manifold_defects(triangles):
+    """
+    Counts the half-edges (the directed edges of the triangles) that have no opposite half-edge or occur more than
+    once. Open boundaries, non-manifold edges and inconsistently oriented faces cause defects.
+
+    :param triangles: Integer array (T, 3)
+    :return: Number of defects (0 for closed, consistently oriented meshes)
+    """
+    triangles = numpy.asarray(triangles, dtype=numpy.int64)
+    if not len(triangles):
+        return 0
+    start, end = triangles.ravel(), triangles[:, [1, 2, 0]].ravel()
+    size = int(triangles.max()) + 1
+
+    half_edges = numpy.sort(start * size + end)
+    opposite = numpy.sort(end * size + start)
+    found = numpy.searchsorted(half_edges, opposite)
+    unmatched = numpy.count_nonzero(half_edges[numpy.minimum(found, len(half_edges) - 1)] != opposite)
+    return int(unmatched + numpy.count_nonzero(half_edges[1:] == half_edges[:-1]))
+
+
+def mass_properties(vertices, triangles, density=1.0):
+    """
+    :param vertices: Array (N, 3)
+    :param triangles: Integer array (T, 3) with outward facing normals (counter-clockwise)
+    :param density: Mass per volume
+    :return: :class:`MassProperties`
+    """
+    return batch_mass_properties([(vertices, triangles)], density)[0]
+
+
+def batch_mass_properties(meshes, density=1.0):
+    """
+    Computes the mass properties of many meshes at once.
+
+    :param meshes: Sequence of tuples of the vertices (N, 3) and the triangles (T, 3)
+    :param density: Mass per volume (a scalar or one value per mesh)
+    :return: List of :class:`MassProperties` (the inertia of meshes without volume is zero)
+    """
+    count = len(meshes)
+    density = numpy.broadcast_to(numpy.asarray(density, dtype=numpy.float64), (count,))
+    if not count:
+        return []
+
+    # The triangles are spanned with the mean vertex of their mesh, which avoids cancellation far from the origin
+    origins = numpy.array([numpy.mean(v, axis=0) if len(v) else numpy.zeros(3) for v, _ in meshes],
+                          dtype=numpy.float64).reshape(count, 3)
+    sizes = numpy.array([len(t) for _, t in meshes], dtype=numpy.intp)
+    starts = numpy.cumsum(sizes) - sizes
+    # Coordinates as contiguous vectors over the triangles: corners[k, i] is coordinate i of the corners k
+    corners = numpy.empty((3, 3, sizes.sum()))
+    for i, (vertices, triangles), begin in zip(range(count), meshes, starts):
+        coordinates = (numpy.asarray(vertices, dtype=numpy.float64) - origins[i]).T.copy()
+        for k, indices in enumerate(numpy.asarray(triangles, dtype=numpy.intp).reshape(-1, 3).T):
+            corners[k, :, begin:begin + sizes[i]] = coordinates[:, indices]
+    a, b, c = corners
+
+    # Per triangle: six times the signed volume of the tetrahedron (origin, a, b, c), its first moments (times 24)
+    # and the integrals of x_i * x_j (times 120), summed per mesh
+    terms = numpy.empty((10, corners.shape[2]))
+    det = terms[0]
+    det[:] = a[0] * (b[1] * c[2] - b[2] * c[1]) + a[1] * (b[2] * c[0] - b[0] * c[2]) + \
+        a[2] * (b[0] * c[1] - b[1] * c[0])
+    total = a + b + c
+    numpy.multiply(total, det, out=terms[1:4])
+    for row, (i, j) in enumerate(_PAIRS, 4):
+        terms[row] = (a[i] * a[j] + b[i] * b[j] + c[i] * c[j] + total[i] * total[j]) * det
+    sums = numpy.zeros((count, 10))
+    nonempty = sizes > 0
+    if numpy.any(nonempty):
+        sums[nonempty] = numpy.add.reduceat(terms, starts[nonempty], axis=1).T
+
+    volume = sums[:, 0] / 6
+    first = sums[:, 1:4] / 24
+    second = numpy.empty((count, 3, 3))
+    for column, (i, j) in enumerate(_PAIRS, 4):
+        second[:, i, j] = second[:, j, i] = sums[:, column] / 120
+
+    flipped = volume < 0
+    sign = numpy.where(flipped, -1.0, 1.0)
+    volume *= sign
+    first *= sign[:, numpy.newaxis]
+    second *= sign[:, numpy.newaxis, numpy.newaxis]
+
+    results = []
+    identity = numpy.identity(3)
+    for i, (vertices, triangles) in enumerate(meshes):
+        defects = manifold_defects(triangles)
+        if volume[i] <= 0:
+            results.append(MassProperties(0.0, 0.0, origins[i], numpy.zeros((3, 3)), defects, False))
+            continue
+        offset = first[i] / volume[i]
+        # Covariance about the center of mass, the inertia tensor is trace(C) * E - C
+        covariance = density[i] * (second[i] - volume[i] * numpy.outer(offset, offset))
+        inertia = numpy.trace(covariance) * identity - covariance
+        results.append(MassProperties(float(volume[i]), float(density[i] * volume[i]), origins[i] + offset, inertia,
+                                      defects, bool(flipped[i])))
+    return results
+
+
+def inertia_components(inertia):
+    """
+    :param inertia: 3x3 inertia tensor
+    :return: Tuple ``(ixx, ixy, ixz, iyy, iyz, izz)`` of the tensor elements (as stored by the segments)
+    """
+    return tuple(float(inertia[i, j]) for i, j in ((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)))
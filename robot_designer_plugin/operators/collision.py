@@ -49,14 +49,145 @@ import sys
 import bpy
 from bpy.props import FloatProperty, IntProperty
 # import mathutils
-import bmesh
+import numpy
 
 # ######
 # RobotDesigner imports
 from ..core import config, PluginManager, RDOperator
+from ..convex_hull import convex_hulls
+from ..decomposition import convex_decompositions
+from ..mass_properties import mesh_arrays
 from .helpers import ModelSelected, SingleMeshSelected
 from .rigid_bodies import SelectGeometry
 
+
+def mesh_points(obj, scene):
+    """
+    Reads the vertices of a mesh object with applied modifiers with ``foreach_get``.
+
+    :return: Array (N, 3) of the vertices in the frame of the object
+    """
+    mesh = obj.to_mesh(scene, True, 'PREVIEW')
+    try:
+        points = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+        mesh.vertices.foreach_get('co', points)
+    finally:
+        bpy.data.meshes.remove(mesh)
+    return points.reshape(-1, 3)
+
+
+def mesh_triangles(obj, scene):
+    """
+    Reads the triangles of a mesh object with applied modifiers.
+
+    :return: Tuple of the vertices (N, 3) in the frame of the object and the triangles (T, 3)
+    """
+    mesh = obj.to_mesh(scene, True, 'PREVIEW')
+    try:
+        return mesh_arrays(mesh)
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+
+def create_collision_mesh(name, vertices, triangles, visual):
+    """
+    Creates (or replaces the mesh of) a collision object with ``foreach_set``. The object gets the parent (bone) and
+    transform of the visual mesh it was generated from. The selection is not changed.
+
+    :param name: Name of the object
+    :param vertices: Array (N, 3) of the vertices in the frame of the visual
+    :param triangles: Integer array (T, 3)
+    :param visual: The visual mesh object
+    :return: The object
+    """
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', vertices.astype(numpy.float32).ravel())
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set('vertex_index', triangles.astype(numpy.int32).ravel())
+    mesh.polygons.add(len(triangles))
+    mesh.polygons.foreach_set('loop_start', numpy.arange(0, triangles.size, 3, dtype=numpy.int32))
+    mesh.polygons.foreach_set('loop_total', numpy.full(len(triangles), 3, dtype=numpy.int32))
+    mesh.update(calc_edges=True)
+    if 'RD_COLLISON_OBJECT_MATERIAL' in bpy.data.materials:
+        mesh.materials.append(bpy.data.materials['RD_COLLISON_OBJECT_MATERIAL'])
+
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.scene.objects.link(obj)
+    else:
+        old_mesh, obj.data = obj.data, mesh
+        if not old_mesh.users:
+            bpy.data.meshes.remove(old_mesh)
+    obj.RobotEditor.tag = 'COLLISION'
+    obj.RobotEditor.fileName = obj.name
+    obj.parent = visual.parent
+    obj.parent_type = visual.parent_type
+    obj.parent_bone = visual.parent_bone
+    obj.matrix_parent_inverse = visual.matrix_parent_inverse.copy()
+    obj.matrix_basis = visual.matrix_basis.copy()
+    return obj
+
+
+def generate_convex_hulls(operator, context, visuals, processes=1):
+    """
+    Creates the convex hulls ``COL_<name>_convex_hull`` of visual meshes. The hulls are computed from the vertices
+    in a pool of processes (see :func:`robot_designer_plugin.convex_hull.convex_hulls`), meshes without volume are
+    reported and skipped.
+
+    :param operator: The calling operator (for logging and reports)
+    :param visuals: The visual mesh objects
+    :param processes: Number of worker processes
+    :return: The created collision objects
+    """
+    results = convex_hulls([mesh_points(obj, context.scene) for obj in visuals], processes)
+    created = []
+    for obj, (vertices, triangles, message) in zip(visuals, results):
+        if message:
+            operator.logger.info("No convex hull for %s: %s", obj.name, message)
+            operator.report({'WARNING'}, "No convex hull for %s: %s" % (obj.name, message))
+            continue
+        created.append(create_collision_mesh('COL_' + obj.name[4:] + "_convex_hull", vertices, triangles, obj))
+        operator.logger.debug("Created mesh: %s (%d vertices)", created[-1].name, len(vertices))
+    return created
+
+
+def generate_convex_decompositions(operator, context, visuals, processes=1, **parameters):
+    """
+    Creates the approximate convex decompositions ``COL_<name>_part_<i>`` of visual meshes (see
+    :func:`robot_designer_plugin.decomposition.convex_decompositions`). Parts left over from a previous decomposition
+    into more hulls (of the same visual) are deleted, meshes without volume are reported and skipped. The exporters
+    write a collision element per part.
+
+    :param operator: The calling operator (for logging and reports)
+    :param visuals: The visual mesh objects
+    :param processes: Number of worker processes
+    :param parameters: Keyword arguments of :func:`robot_designer_plugin.decomposition.decompose`
+    :return: The created collision objects
+    """
+    results = convex_decompositions([mesh_triangles(obj, context.scene) for obj in visuals], processes,
+                                    **parameters)
+    created = []
+    for obj, (hulls, message) in zip(visuals, results):
+        if message:
+            operator.logger.info("No convex decomposition for %s: %s", obj.name, message)
+            operator.report({'WARNING'}, "No convex decomposition for %s: %s" % (obj.name, message))
+            continue
+        prefix = 'COL_' + obj.name[4:] + "_part_"
+        names = [prefix + str(i) for i in range(len(hulls))]
+        # Only the parts of this visual: the name must be the prefix followed by the number (the prefix of a visual
+        # named like "<name>_part_1" would match the parts of "<name>" otherwise) and the segment must be the same
+        stale = [o for o in bpy.data.objects if o.name.startswith(prefix) and o.name[len(prefix):].isdigit()
+                 and o.parent == obj.parent and o.parent_bone == obj.parent_bone and o.name not in names]
+        for part in stale:
+            bpy.data.objects.remove(part, True)
+        for name, (vertices, triangles) in zip(names, hulls):
+            created.append(create_collision_mesh(name, vertices, triangles, obj))
+        operator.logger.debug("Decomposed %s into %d hulls", obj.name, len(hulls))
+    return created
+
+
 @RDOperator.Preconditions(ModelSelected)
 @PluginManager.register_class
 class GenerateAllCollisionMeshes(RDOperator):
@@ -97,33 +228,82 @@ class GenerateAllCollisionMeshes(RDOperator):
 @PluginManager.register_class
 class GenerateAllCollisionConvexHull(RDOperator):
     """
-    :ref:`operator` for ...
+    :ref:`operator` for creating the convex hulls of all visual meshes of the model (see
+    :func:`generate_convex_hulls`).
 
-    **Preconditions:**
+    **Preconditions:** A model is selected.
 
-    **Postconditions:**
+    **Postconditions:** The collision meshes ``COL_<name>_convex_hull`` exist, the selection is unchanged.
     """
     bl_idname = config.OPERATOR_PREFIX + "generatallecollisionconvexhull"
     bl_label = "Generate convex hulls for all collision meshes"
 
+    processes = IntProperty(name="Processes", default=1, min=1, max=64,
+                            description="Number of worker processes computing the hulls")
+
+    @classmethod
+    def run(cls, processes=1):
+        return super().run(**cls.pass_keywords())
+
     @RDOperator.OperatorLogger
     # @Postconditions(ModelSelected)
     def execute(self, context):
-        visuals = [o.name for o in context.scene.objects if o.type == 'MESH'
+        visuals = [o for o in context.scene.objects if o.type == 'MESH'
                    and o.parent == context.active_object and o.RobotEditor.tag != "COLLISION"]
 
-        self.logger.debug("Visuals: %s", visuals)
+        self.logger.debug("Visuals: %s", [o.name for o in visuals])
+        created = generate_convex_hulls(self, context, visuals, self.processes)
+        self.report({'INFO'}, "Created %d of %d convex hulls" % (len(created), len(visuals)))
 
-        for i in visuals:
-            self.logger.debug("Compute convex hull for: " + i)
-            SelectGeometry.run(geometry_name=i)
-            GenerateCollisionConvexHull.run()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+@RDOperator.Preconditions(ModelSelected)
+@PluginManager.register_class
+class GenerateAllCollisionDecompositions(RDOperator):
+    """
+    :ref:`operator` for decomposing all visual meshes of the model into convex collision meshes (see
+    :func:`generate_convex_decompositions`).
+
+    **Preconditions:** A model is selected.
+
+    **Postconditions:** The collision meshes ``COL_<name>_part_<i>`` exist, the selection is unchanged.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "generateallcollisiondecompositions"
+    bl_label = "Generate convex decompositions for all collision meshes"
+
+    concavity = FloatProperty(name="Concavity", default=0.01, min=0.0, max=1.0, precision=3,
+                              description="Maximal volume of a hull outside of the mesh relative to the volume of "
+                                          "the convex hull of the mesh")
+    max_hulls = IntProperty(name="Maximal Hulls", default=16, min=1, max=256,
+                            description="Maximal number of convex hulls per mesh")
+    resolution = IntProperty(name="Resolution", default=32, min=8, max=128,
+                             description="Number of voxels along the longest side of a mesh")
+    processes = IntProperty(name="Processes", default=1, min=1, max=64,
+                            description="Number of worker processes decomposing the meshes")
+
+    @classmethod
+    def run(cls, concavity=0.01, max_hulls=16, resolution=32, processes=1):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        visuals = [o for o in context.scene.objects if o.type == 'MESH'
+                   and o.parent == context.active_object and o.RobotEditor.tag != "COLLISION"]
+
+        self.logger.debug("Visuals: %s", [o.name for o in visuals])
+        created = generate_convex_decompositions(self, context, visuals, self.processes, concavity=self.concavity,
+                                                 max_hulls=self.max_hulls, resolution=self.resolution)
+        self.report({'INFO'}, "Created %d convex hulls for %d meshes" % (len(created), len(visuals)))
 
         return {'FINISHED'}
 
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+
 @RDOperator.Preconditions(ModelSelected, SingleMeshSelected)
 @PluginManager.register_class
 class GenerateCollisionMesh(RDOperator):
@@ -210,12 +390,11 @@ class GenerateCollisionMesh(RDOperator):
 @PluginManager.register_class
 class GenerateCollisionConvexHull(RDOperator):
     """
-    :ref:`operator` for creating a collision mesh using the builtin
-    convex hull computation.
+    :ref:`operator` for creating the convex hull of the selected visual mesh (see :func:`generate_convex_hulls`).
 
-    **Preconditions:**
+    **Preconditions:** A model and a single mesh are selected.
 
-    **Postconditions:**
+    **Postconditions:** The collision mesh ``COL_<name>_convex_hull`` exists, the selection is unchanged.
     """
     bl_idname = config.OPERATOR_PREFIX + "generateconvexhull"
     bl_label = "Generate convex hull for selected"
@@ -226,107 +405,53 @@ class GenerateCollisionConvexHull(RDOperator):
         return super().run(**cls.pass_keywords())
     @RDOperator.OperatorLogger
     def execute(self, context):
-        from . import segments, model
+        target = [i for i in context.selected_objects if i.type == 'MESH'][0]
+        self.logger.debug("Creating Collision mesh for: %s", target.name)
 
-        target_name = [i.name for i in bpy.context.selected_objects if i.type == 'MESH'][0]
+        if not generate_convex_hulls(self, context, [target]):
+            return {'CANCELLED'}
+        return {'FINISHED'}
 
-        self.logger.debug("Creating Collision mesh for: %s", target_name)
-        armature = context.active_object.name
-        
-        cv_hull_obj_name = 'COL_' + target_name[4:] + "_convex_hull"
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        exp_object = bpy.data.objects[target_name]
-        orig_object = bpy.data.objects[target_name]
-        
-        orig_object.select = True
-        orig_object.name = target_name + "_CONVEX_HULL_TMP_OBJECT"
-        bpy.ops.object.duplicate()
-        
-        
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' and obj.name == target_name + "_CONVEX_HULL_TMP_OBJECT" + ".001":
-                obj.name = cv_hull_obj_name
-                obj.select = True
-                exp_object.select = False
-                exp_object = obj
-                
-        try:
-            collisionMesh = exp_object.data
-            self.logger.debug("Got collision mesh input")
-            bm = bmesh.new() # create an empty BMesh
-            self.logger.debug("Created new bmesh object")
-        
-            bm.from_mesh(collisionMesh) # fill it in from a Mesh
-            self.logger.debug("Filled bmesh object with data")
-          
-            verts = [v for v in bm.verts if (not v.hide)]
-            edges = [e for e in bm.edges if (not e.hide)]
-            faces = [f for f in bm.faces if (not f.hide)]
-          
-            cv_input = bm.verts #(verts, edges, faces)
-            # Set use_existing_faces=False so that all new geometry is added to the mesh 'bm'.
-            # Then we can go and delete everything that is not in the output of the operator.
-            # This will leave only the convex hull.
-            # Why? I noticed that under some conditions, where are leftover faces/vertices
-            # from the original mesh. I believe this happens when the input mesh is not a closed
-            # manifold, i.e. not topologically a sphere-like.
-            new = bmesh.ops.convex_hull(bm, input=cv_input, use_existing_faces=False)
-          
-            self.logger.debug("Convex hull computation done.")
-
-            # To delete leftover vertices and faces.
-            # https://blender.stackexchange.com/questions/1541/how-can-i-delete-mesh-parts-with-python
-            # enum {
-            # DEL_VERTS = 1,
-            # DEL_EDGES,
-            # DEL_ONLYFACES,
-            # DEL_EDGESFACES,
-            # DEL_FACES,
-            # DEL_ALL,
-            # DEL_ONLYTAGGED
-            # };
-            new = set(new["geom"])
-            to_delete = [v for v in bm.verts if not v in new]
-            bmesh.ops.delete(bm, geom=to_delete, context=1)
-            to_delete = [f for f in bm.faces if not f in new]
-            bmesh.ops.delete(bm, geom=to_delete, context=5)
-
-            bm.to_mesh(collisionMesh)
-            bm.free()
-          
-            exp_object.select = True
-            
-            exp_object.RobotEditor.tag = 'COLLISION'
-            self.logger.debug("Created mesh: %s", exp_object.name)
-          
-            orig_object.name = target_name
-            
-            bpy.ops.object.select_all(action='DESELECT')
-            
-            if 'RD_COLLISON_OBJECT_MATERIAL' in bpy.data.materials:
-                bpy.ops.object.material_slot_add()
-                context.active_object.data.materials[0] = bpy.data.materials[
-                    'RD_COLLISON_OBJECT_MATERIAL']
-                self.logger.debug("Assigned material to : %s",
-                                  bpy.context.active_object.name)
-            else:
-                self.logger.debug("Could not find material for collision mesh")
-
-            bpy.ops.object.select_all(action='DESELECT')
-            model.SelectModel.run(model_name=armature)
-            segments.SelectSegment.run(segment_name=bpy.data.objects[target_name].parent_bone)
-            bpy.data.objects[name].select = True
-            bpy.ops.object.parent_set(type='BONE', keep_transform=True)
-            model.SelectModel.run(model_name=armature)
-        except Exception as e:
-            orig_object.name = target_name
-            self.logger.info("Exception when computing convex hull")
-            self.logger.info(type(e))
-            self.logger.info(e)
-            return{'CANCELLED'}
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+@RDOperator.Preconditions(ModelSelected, SingleMeshSelected)
+@PluginManager.register_class
+class GenerateCollisionDecomposition(RDOperator):
+    """
+    :ref:`operator` for decomposing the selected visual mesh into convex collision meshes (see
+    :func:`generate_convex_decompositions`).
 
+    **Preconditions:** A model and a single mesh are selected.
+
+    **Postconditions:** The collision meshes ``COL_<name>_part_<i>`` exist, the selection is unchanged.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "generatecollisiondecomposition"
+    bl_label = "Generate convex decomposition for selected"
+
+    concavity = FloatProperty(name="Concavity", default=0.01, min=0.0, max=1.0, precision=3,
+                              description="Maximal volume of a hull outside of the mesh relative to the volume of "
+                                          "the convex hull of the mesh")
+    max_hulls = IntProperty(name="Maximal Hulls", default=16, min=1, max=256,
+                            description="Maximal number of convex hulls")
+    resolution = IntProperty(name="Resolution", default=32, min=8, max=128,
+                             description="Number of voxels along the longest side of the mesh")
+
+    @classmethod
+    def run(cls, concavity=0.01, max_hulls=16, resolution=32):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        target = [i for i in context.selected_objects if i.type == 'MESH'][0]
+        self.logger.debug("Decomposing: %s", target.name)
+
+        created = generate_convex_decompositions(self, context, [target], concavity=self.concavity,
+                                                 max_hulls=self.max_hulls, resolution=self.resolution)
+        if not created:
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Created %d convex hulls" % len(created))
         return {'FINISHED'}
 
     def invoke(self, context, event):
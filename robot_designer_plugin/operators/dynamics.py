@@ -50,14 +50,19 @@ from mathutils import Matrix
 from collections import defaultdict
 
 import bpy
+import numpy
 from bpy.props import StringProperty, FloatProperty, BoolProperty
 
 # ######
 # RobotDesigner imports
 from ..core import config, PluginManager, RDOperator
+from ..composite import CompositeBody, combine
+from ..kinematics import KinematicTree
+from ..mass_properties import mesh_arrays, batch_mass_properties, inertia_components
+from ..validation import validate_inertials, repair_inertials, repairable, inertia_matrices, FLOAT32_TOLERANCE
 from .helpers import ModelSelected, SingleSegmentSelected, SingleMassObjectSelected
 
-from ..properties.globals import global_properties
+from ..properties.globals import global_properties, ObjectRegistry
 
 
 # operator to create physics frame
@@ -235,42 +240,43 @@ class ComputePhysical(RDOperator):
             return '<'+', '.join([str(self.visual), str(self.collision), str(self.physics_frame)])+'>'
 
 
-    def maybe_compute_and_assign_mass_props(self, bone, associations):
-        assert associations.physics_frame is not None
+    def select_mesh(self, associations):
+        """
+        :return: The mesh the mass properties of a segment are computed from (or None)
+        """
+        if associations.physics_frame is None:
+            return None
         if associations.collision and not self.from_visual_geometry:
-            the_mesh = associations.collision
-        elif associations.visual and self.from_visual_geometry:
-            the_mesh = associations.visual
-        else:
-            return
-        bounds = the_mesh.bound_box
-        len = (bounds[-1][0]-bounds[0][0],
-               bounds[-1][1]-bounds[0][1],
-               bounds[1][2]-bounds[0][2]) # The 1 is no error!
-        com = list(map(lambda x: x*0.5,
-              (bounds[-1][0] +bounds[0][0],
-               bounds[-1][1] + bounds[0][1],
-               bounds[1][2] + bounds[0][2])))
-        mass = len[0]*len[1]*len[2]*self.density
-        # Of a Brick.
-        Iunit = (1./12.*(len[1]**2 + len[2]**2),
-                 1./12.*(len[0]**2 + len[2]**2),
-                 1./12.*(len[0]**2 + len[1]**2))
-        print ("bone:", bone, len, mass, Iunit, com)
-        d = associations.physics_frame.RobotEditor.dynamics
-        d.inertiaXX = mass*Iunit[0]
-        d.inertiaYY = mass*Iunit[1]
-        d.inertiaZZ = mass*Iunit[2]
-        d.inertiaXY = 0.
-        d.inertiaXZ = 0.
-        d.inertiaYZ = 0.
-        d.mass = mass
-        #d.inertiaTrans = com
-        #d.inertiaRot   = [0., 0., 0.]
-        #print ("Setting matrix "+str(the_mesh.matrix_world))
-        m_com = Matrix.Translation(com)
-        associations.physics_frame.matrix_world = the_mesh.matrix_world * m_com
-
+            return associations.collision
+        if associations.visual and self.from_visual_geometry:
+            return associations.visual
+        return None
+
+    @staticmethod
+    def read_mesh(obj, scene):
+        """
+        Reads the triangles of a mesh object with applied modifiers. The vertices are scaled like the object, i.e.,
+        they are given in the rotated frame of the object.
+
+        :return: Tuple of the vertices and the triangles
+        """
+        mesh = obj.to_mesh(scene, True, 'PREVIEW')
+        try:
+            vertices, triangles = mesh_arrays(mesh)
+        finally:
+            bpy.data.meshes.remove(mesh)
+        return vertices * tuple(obj.matrix_world.to_scale()), triangles
+
+    @staticmethod
+    def assign_mass_props(the_mesh, physics_frame, result):
+        d = physics_frame.RobotEditor.dynamics
+        d.inertiaXX, d.inertiaXY, d.inertiaXZ, d.inertiaYY, d.inertiaYZ, d.inertiaZZ = \
+            inertia_components(result.inertia)
+        d.mass = result.mass
+        # The inertia tensor is given in the axes of the mesh, the frame is placed at the center of mass
+        location, rotation, _ = the_mesh.matrix_world.decompose()
+        physics_frame.matrix_world = Matrix.Translation(location) * rotation.to_matrix().to_4x4() * \
+            Matrix.Translation(result.center)
 
     @RDOperator.OperatorLogger
     @RDOperator.Postconditions(ModelSelected)
@@ -294,8 +300,23 @@ class ComputePhysical(RDOperator):
 
         bones = [ b for b in armature.data.bones if b.select ]
 
-        for bone in bones:
-            self.maybe_compute_and_assign_mass_props(bone, segment_associations[bone])
+        segments = [(bone, segment_associations[bone].physics_frame, self.select_mesh(segment_associations[bone]))
+                    for bone in bones]
+        segments = [i for i in segments if i[2] is not None]
+
+        # The mass properties of all meshes are computed at once
+        results = batch_mass_properties([self.read_mesh(mesh, context.scene) for _, _, mesh in segments],
+                                        self.density)
+        for (bone, physics_frame, mesh), result in zip(segments, results):
+            self.logger.debug("%s: %s, mass %f, center %s", bone.name, mesh.name, result.mass, result.center)
+            if result.defects:
+                self.report({'WARNING'}, "Mesh %s is not closed and consistently oriented (%d defective half-edges), "
+                                         "the mass properties of %s are not exact" %
+                            (mesh.name, result.defects, bone.name))
+            if result.volume <= 0:
+                self.report({'WARNING'}, "Mesh %s has no volume, %s is not changed" % (mesh.name, bone.name))
+                continue
+            self.assign_mass_props(mesh, physics_frame, result)
 
         return {'FINISHED'}
 
@@ -335,3 +356,156 @@ class DetachPhysical(RDOperator):
         current_frame.parent = None
         current_frame.matrix_world = physNode_global
         return {'FINISHED'}
+
+
+def segment_bodies(armature):
+    """
+    Reads the mass properties of the physics frames of a model relative to their segments (several frames of a
+    segment are combined).
+
+    :param armature: The armature object of the model
+    :return: Dictionary from segment names to tuples of the mass, the center of mass and the inertia tensor in the
+        segment frame
+    """
+    world_inverse = armature.matrix_world.inverted()
+    parts = defaultdict(list)
+    for frame in ObjectRegistry.get().tagged('PHYSICS_FRAME', armature.name):
+        if frame.parent_bone not in armature.pose.bones:
+            continue
+        pose = armature.pose.bones[frame.parent_bone].matrix.inverted() * world_inverse * frame.matrix_world
+        location, rotation, _ = pose.decompose()
+        rotation = numpy.array(rotation.to_matrix())
+        d = frame.RobotEditor.dynamics
+        inertia = numpy.array([[d.inertiaXX, d.inertiaXY, d.inertiaXZ],
+                               [d.inertiaXY, d.inertiaYY, d.inertiaYZ],
+                               [d.inertiaXZ, d.inertiaYZ, d.inertiaZZ]])
+        parts[frame.parent_bone].append((d.mass, tuple(location), rotation.dot(inertia).dot(rotation.T)))
+    return {name: combine(*zip(*bodies)) for name, bodies in parts.items()}
+
+
+def composite_body(armature, body=None):
+    """
+    Reads the physics frames and the current pose of a model into a
+    :class:`robot_designer_plugin.composite.CompositeBody` (the frame of the armature is the model frame). Passing
+    the body of a previous call only recomputes the subtrees whose physics frames or joints changed. Balance studies
+    over many poses can use the segment order of :class:`robot_designer_plugin.kinematics.KinematicTree`::
+
+        body = composite_body(armature)
+        tree = KinematicTree.from_armature(armature)
+        mass, centers, inertias = body.whole_body(tree.forward(configurations))
+
+    :param armature: The armature object of the model
+    :param body: :class:`CompositeBody` of the model to update (created if None)
+    :return: :class:`CompositeBody`
+    """
+    if body is None:
+        tree = KinematicTree.from_armature(armature)
+        body = CompositeBody(tree.names, tree.parents)
+    bodies = segment_bodies(armature)
+    for index, name in enumerate(body.names):
+        body.set_body(index, *bodies.get(name, (0.0,)))
+    body.set_frames([numpy.array(armature.pose.bones[name].matrix) for name in body.names])
+    return body
+
+
+def _first_by_segment(objects):
+    result = {}
+    for obj in objects:
+        result.setdefault(obj.parent_bone, obj)
+    return result
+
+
+def check_inertials(operator, context, policy=None):
+    """
+    Validates the inertials of all physics frames of the active model at once (see
+    :mod:`robot_designer_plugin.validation`) and repairs the failing frames. The ``'geometry'`` policy recomputes the
+    inertia tensors (keeping positive masses) and the centers of mass from the collision meshes (or the visual
+    meshes) of the segments like :class:`ComputePhysical`; frames without a mesh are projected.
+
+    :param operator: The calling operator (the report is logged)
+    :param context: The current context
+    :param policy: Repair policy (defaults to the setting of the scene)
+    :return: :class:`robot_designer_plugin.validation.InertialReport` after the repair
+    :raises ValueError: if errors remain
+    """
+    armature = context.active_object
+    if policy is None:
+        policy = global_properties.inertial_repair.get(context.scene)
+    registry = ObjectRegistry.get()
+    tree = KinematicTree.from_armature(armature)
+    frames = _first_by_segment(registry.tagged('PHYSICS_FRAME', armature.name))
+    frames = [frames.get(name) for name in tree.names]
+
+    def read():
+        masses = numpy.full(len(frames), numpy.nan)
+        components = numpy.zeros((len(frames), 6))
+        for index, frame in enumerate(frames):
+            if frame is not None:
+                d = frame.RobotEditor.dynamics
+                masses[index] = d.mass
+                components[index] = d.inertiaXX, d.inertiaXY, d.inertiaXZ, d.inertiaYY, d.inertiaYZ, d.inertiaZZ
+        return masses, inertia_matrices(components)
+
+    masses, inertias = read()
+    report = validate_inertials(tree.names, tree.parents, masses, inertias, tolerance=FLOAT32_TOLERANCE)
+    failed = repairable(report)
+    if policy != 'none' and failed:
+        if policy == 'geometry':
+            meshes = _first_by_segment(registry.geometries('DEFAULT', armature.name))
+            meshes.update(_first_by_segment(registry.geometries('COLLISION', armature.name)))
+            segments = [i for i in failed if tree.names[i] in meshes]
+            results = batch_mass_properties(
+                [ComputePhysical.read_mesh(meshes[tree.names[i]], context.scene) for i in segments])
+            for index, result in zip(segments, results):
+                if result.volume <= 0:
+                    continue
+                if masses[index] > 0:
+                    result = result._replace(mass=masses[index], inertia=result.inertia * masses[index] / result.mass)
+                ComputePhysical.assign_mass_props(meshes[tree.names[index]], frames[index], result)
+            masses, inertias = read()
+        remaining = validate_inertials(tree.names, tree.parents, masses, inertias, tolerance=FLOAT32_TOLERANCE)
+        masses, inertias = repair_inertials(masses, inertias, 'clamp' if policy == 'clamp' else 'project',
+                                            repairable(remaining))
+        for index in failed:
+            d = frames[index].RobotEditor.dynamics
+            d.mass = masses[index]
+            d.inertiaXX, d.inertiaXY, d.inertiaXZ, d.inertiaYY, d.inertiaYZ, d.inertiaZZ = \
+                inertia_components(inertias[index])
+        seconds = report.seconds
+        report = validate_inertials(tree.names, tree.parents, masses, inertias, tolerance=FLOAT32_TOLERANCE)
+        report.repaired = {tree.names[i]: policy for i in failed}
+        report.seconds += seconds
+
+    operator.logger.info("Inertial validation: %s", report.to_json())
+    if report.issues or report.repaired:
+        operator.report({'WARNING'} if report.issues else {'INFO'}, str(report))
+    if not report.ok:
+        raise ValueError(str(report))
+    return report
+
+
+@RDOperator.Preconditions(ModelSelected)
+@PluginManager.register_class
+class ValidateInertials(RDOperator):
+    """
+    :ref:`operator` for validating (and repairing) the inertials of all physics frames of the model without
+    exporting it (see :func:`check_inertials`).
+
+    **Preconditions:** A model is selected.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "validate_inertials"
+    bl_label = "Validate inertials"
+
+    @classmethod
+    def run(cls):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        try:
+            report = check_inertials(self, context)
+        except ValueError:
+            return {'CANCELLED'}
+        if not report.issues and not report.repaired:
+            self.report({'INFO'}, str(report))
+        return {'FINISHED'}
@@ -38,9 +38,11 @@
 # System imports
 # Blender imports
 import bpy
+from bpy.props import StringProperty, EnumProperty
 
 # RobotDesigner imports
 from ..core import config, PluginManager, RDOperator
+from ..core.profiling import operator_profiler
 
 
 @PluginManager.register_class
@@ -71,3 +73,51 @@ class PrintTransformations(RDOperator):
         return {'FINISHED'}
 
 
+@PluginManager.register_class
+class ExportOperatorProfile(RDOperator):
+    """
+    :ref:`operator` for writing the calls recorded by the operator profiler to a JSON file that can be opened with
+    the Chrome tracing viewer or speedscope.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "export_operator_profile"
+    bl_label = "Export operator profile"
+
+    filter_glob = StringProperty(default="*.json", options={'HIDDEN'})
+    filepath = StringProperty(name="Filename", subtype='FILE_PATH')
+    format = EnumProperty(items=[('chrome', 'Chrome trace', 'Trace event format (chrome://tracing)'),
+                                 ('speedscope', 'Speedscope', 'Evented speedscope profile')],
+                          name="Format", default='chrome')
+
+    @classmethod
+    def run(cls, filepath, format='chrome'):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        operator_profiler.write(self.filepath, self.format)
+        self.report({'INFO'}, "Operator profile written to %s" % self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = 'operator_profile.json'
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+@PluginManager.register_class
+class ResetOperatorProfile(RDOperator):
+    """
+    :ref:`operator` for discarding the calls recorded by the operator profiler.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "reset_operator_profile"
+    bl_label = "Reset operator profile"
+
+    @classmethod
+    def run(cls):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        operator_profiler.reset()
+        return {'FINISHED'}
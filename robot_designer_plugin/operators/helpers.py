@@ -98,6 +98,62 @@ def _mat3_to_vec_roll(mat):
     return vec, roll
 
 
+class SelectionState(object):
+    """
+    Selection counts shared by the :ref:`conditions <condition>` below. The :meth:`RDOperator.poll
+    <robot_designer_plugin.core.operators.RDOperator.poll>` method of every button is called on each redraw of a
+    panel. Instead of scanning the bones and selected objects once per button, the counts are computed once and
+    reused until :func:`invalidate_selection_state` is called on the next update of the dependency graph.
+    """
+
+    _state = None
+
+    def __init__(self, context, key):
+        self.key = key
+
+        self.selected_segments = 0
+        if context.active_bone and context.active_object:
+            bones = context.active_object.data.bones
+            selected = [False] * len(bones)
+            bones.foreach_get('select', selected)
+            self.selected_segments = sum(selected)
+
+        self.selected_meshes = 0
+        self.selected_cameras = 0
+        self.selected_mass_objects = 0
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                self.selected_meshes += 1
+            elif obj.type == StringConstants.camera:
+                self.selected_cameras += 1
+            elif obj.type == StringConstants.empty and obj.RobotEditor.tag == "PHYSICS_FRAME":
+                self.selected_mass_objects += 1
+
+    @classmethod
+    def get(cls):
+        """
+        :return: The (cached) selection state of the current context
+        """
+        context = bpy.context
+        # Pointers instead of the objects themselves such that no freed data is referenced after loading a file
+        key = tuple(i.as_pointer() if i else 0 for i in (context.active_object, context.active_bone))
+        if cls._state is None or cls._state.key != key:
+            cls._state = cls(context, key)
+        return cls._state
+
+    @classmethod
+    def invalidate(cls):
+        cls._state = None
+
+
+@PluginManager.register_handler('depsgraph_update_post')
+def invalidate_selection_state(*args):
+    """
+    Handler that drops the cached :class:`SelectionState`.
+    """
+    SelectionState.invalidate()
+
+
 class ModelSelected(Condition):
     @staticmethod
     def check():
@@ -121,8 +177,7 @@ class SingleSegmentSelected(Condition):
         :return: True if the condition is met, else false. String with error message.
         """
         if bpy.context.active_bone:
-            selected_segments = [i for i in bpy.context.active_object.data.bones if i.select]
-            return len(selected_segments) == 1, "Single Segment must be selected"
+            return SelectionState.get().selected_segments == 1, "Single Segment must be selected"
         else:
             return False, "No Object select"
 
@@ -136,8 +191,7 @@ class AtLeastOneSegmentSelected(Condition):
         :return: True if the condition is met, else false. String with error message.
         """
         if bpy.context.active_bone:
-            selected_segments = [i for i in bpy.context.active_object.data.bones if i.select]
-            return len(selected_segments) >= 1, "At least one segment must be selected"
+            return SelectionState.get().selected_segments >= 1, "At least one segment must be selected"
         else:
             return False, "No Object select"
 
@@ -150,8 +204,7 @@ class SingleMeshSelected(Condition):
 
         :return: True if the condition is met, else false. String with error message.
         """
-        selected = [i for i in bpy.context.selected_objects if i.type == 'MESH']
-        return len(selected) == 1, "Single mesh object must be selected."
+        return SelectionState.get().selected_meshes == 1, "Single mesh object must be selected."
 
 
 class ObjectMode(Condition):
@@ -196,8 +249,7 @@ class SingleCameraSelected(Condition):
         """
         :term:`condition` that assures that a :class:`bpy.types.Camera` associated object is selected.
         """
-        selected = [i for i in bpy.context.selected_objects if i.type == StringConstants.camera]
-        return len(selected) == 1, "Single camera object must be selected."
+        return SelectionState.get().selected_cameras == 1, "Single camera object must be selected."
 
 
 class SingleMassObjectSelected(Condition):
@@ -206,9 +258,7 @@ class SingleMassObjectSelected(Condition):
         """
         :term:`condition` that assures that a :class:`bpy.types.Camera` associated object is selected.
         """
-        selected = [i for i in bpy.context.selected_objects if
-                    i.type == StringConstants.empty and i.RobotEditor.tag == "PHYSICS_FRAME"]
-        return len(selected) == 1, "Single mass object must be selected."
+        return SelectionState.get().selected_mass_objects == 1, "Single mass object must be selected."
 
 
 class SelectObjectBase(RDOperator):
@@ -39,6 +39,7 @@ Sphinx-autodoc tag
 """
 
 # System imports
+from collections import namedtuple
 from math import degrees, radians
 
 # Blender imports
@@ -48,6 +49,7 @@ from bpy.props import StringProperty, BoolProperty
 
 # RobotDesigner imports
 from ..core import config, PluginManager, Condition, RDOperator
+from ..core.logfile import operator_logger as logger
 
 #from .rigid_bodies import AssignGeometry, SelectGeometry
 from .rigid_bodies import *
@@ -520,11 +522,134 @@ class CreateNewSegment(RDOperator):
 
 
 
+SegmentUpdate = namedtuple('SegmentUpdate', 'name matrix joint_matrix joint_mode axis min_rot max_rot')
+"""
+Everything :class:`UpdateSegments` needs to rebuild one segment. Computed from the bone's
+:class:`robot_designer_plugin.properties.segments.RDSegment` before any mode switch happens.
+"""
+
+
+def collect_segment_updates(armature_data, segment_name, recurse=True):
+    """
+    Walks the kinematic tree starting at ``segment_name`` and computes the transforms of all segments
+    (see :meth:`robot_designer_plugin.properties.segments.RDSegment.getTransform`) in a single pass.
+    Segments that are not known to the RobotDesigner are skipped together with their children.
+
+    :param armature_data: The :class:`bpy.types.Armature` of the model.
+    :param segment_name: Name of the segment to start from.
+    :param recurse: If false, only the segment itself is considered.
+    :return: List of :class:`SegmentUpdate` with parents always preceding their children.
+    """
+    updates = []
+    pending = [segment_name]
+    while pending:
+        bone = armature_data.bones[pending.pop()]
+        segment = bone.RobotEditor
+        if not segment.RD_Bone:
+            logger.info("Not updated (not a RD segment): %s", bone.name)
+            continue
+
+        matrix, joint_matrix = segment.getTransform()
+        updates.append(SegmentUpdate(bone.name, matrix, joint_matrix, segment.jointMode, segment.axis,
+                                     segment.theta.min, segment.theta.max))
+        if recurse:
+            pending.extend(reversed([i.name for i in bone.children]))
+
+    return updates
+
+
+def apply_segment_updates(model, updates):
+    """
+    Applies precomputed :class:`SegmentUpdate` to the edit bones (head, tail and roll) in a single edit mode session
+    and to the pose bones (pose and joint limit constraint) in a single pose mode session. Only the data API is
+    used such that neither the selection nor the active segment changes.
+
+    :param model: The armature object.
+    :param updates: List of :class:`SegmentUpdate` as returned by :func:`collect_segment_updates`.
+    """
+    if not updates:
+        return
+
+    current_mode = model.mode
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+
+    edit_bones = model.data.edit_bones
+    for update in updates:
+        editbone = edit_bones[update.name]
+        editbone.use_inherit_rotation = True
+
+        # Express desired matrix in frame of the Armature. Parents precede their children, hence the
+        # parent's edit bone is already up to date.
+        matrix = update.matrix
+        if editbone.parent is not None:
+            matrix = editbone.parent.matrix * matrix
+
+        # Adjust bone properties to match RD transform specs.
+        # Try to move it around rigidly. Keep length.
+        pos = matrix.to_translation()
+        axis, roll = _mat3_to_vec_roll(matrix.to_3x3())
+        length = editbone.length
+        editbone.head = pos  # Changes length.
+        editbone.tail = pos + length * axis
+        editbone.roll = roll
+
+    bpy.ops.object.mode_set(mode='POSE', toggle=False)
+
+    pose_bones = model.pose.bones
+    for update in updates:
+        pose_bone = pose_bones[update.name]
+        pose_bone.matrix_basis = update.joint_matrix
+        _update_joint_constraint(pose_bone, update)
+
+    bpy.ops.object.mode_set(mode=current_mode, toggle=False)
+
+
+def _update_joint_constraint(pose_bone, update):
+    """
+    Sets the rotation limits of the ``RobotEditorConstraint`` of a pose bone according to the joint settings
+    (or removes it if the joint is not revolute).
+
+    :param pose_bone: The :class:`bpy.types.PoseBone`.
+    :param update: The :class:`SegmentUpdate` of the segment.
+    """
+    if update.joint_mode == 'REVOLUTE':
+        if 'RobotEditorConstraint' not in pose_bone.constraints:
+            pose_bone.constraints.new('LIMIT_ROTATION').name = 'RobotEditorConstraint'
+        constraint = \
+            [i for i in pose_bone.constraints if i.type == 'LIMIT_ROTATION'][0]
+        constraint.name = 'RobotEditorConstraint'
+        constraint.owner_space = 'LOCAL'
+        constraint.use_limit_x = True
+        constraint.use_limit_y = True
+        constraint.use_limit_z = True
+        constraint.min_x = 0.0
+        constraint.min_y = 0.0
+        constraint.min_z = 0.0
+        constraint.max_x = 0.0
+        constraint.max_y = 0.0
+        constraint.max_z = 0.0
+        if update.axis == 'X':
+            constraint.min_x = radians(update.min_rot)
+            constraint.max_x = radians(update.max_rot)
+        elif update.axis == 'Y':
+            constraint.min_y = radians(update.min_rot)
+            constraint.max_y = radians(update.max_rot)
+        elif update.axis == 'Z':
+            constraint.min_z = radians(update.min_rot)
+            constraint.max_z = radians(update.max_rot)
+    elif 'RobotEditorConstraint' in pose_bone.constraints:
+        pose_bone.constraints.remove(pose_bone.constraints['RobotEditorConstraint'])
+
+
 @PluginManager.register_class
 class UpdateSegments(RDOperator):
     """
     :term:`operator` for updating the :term:`robot models` after parameters changed.
     If a :term:`segment` name is given it will proceed recursively.
+
+    By default, the transforms of all affected segments are computed first and then applied in one edit mode and
+    one pose mode session (see :func:`collect_segment_updates` and :func:`apply_segment_updates`). If :attr:`batch`
+    is false, the former implementation runs instead (see :meth:`execute_per_segment`).
     """
     bl_idname = config.OPERATOR_PREFIX + "udpate_model"
     bl_label = "update model"
@@ -532,13 +657,46 @@ class UpdateSegments(RDOperator):
     # model_name = StringProperty()
     segment_name = StringProperty(default="")
     recurse = BoolProperty(default=True)
+    batch = BoolProperty(default=True)
 
+    @classmethod
+    def run(cls, segment_name="", recurse=True, batch=True):
+        return super().run(**cls.pass_keywords())
 
     @RDOperator.Postconditions(ModelSelected)
     @RDOperator.OperatorLogger
     #    @RDOperator.Postconditions(ModelSelected)
     #    @Preconditions(ModelSelected)
     def execute(self, context):
+        if not self.batch:
+            return self.execute_per_segment(context)
+
+        self.logger.debug("UpdateSegments: recurse=%s, batch=%s, bone=%s", self.recurse, self.batch,
+                          self.segment_name)
+
+        model = context.active_object
+        armature_data = model.data
+
+        if self.segment_name:
+            segment_name = self.segment_name
+        else:
+            segment_name = armature_data.bones[0].name
+
+        updates = collect_segment_updates(armature_data, segment_name, self.recurse)
+        if not updates:
+            return {'FINISHED'}
+
+        apply_segment_updates(model, updates)
+
+        SelectSegment.run(segment_name=segment_name)
+
+        return {'FINISHED'}
+
+    def execute_per_segment(self, context):
+        """
+        The former implementation: selects the segment, updates its edit bone and pose bone in separate mode
+        switches and calls the operator again for each child.
+        """
         current_mode = bpy.context.object.mode
         self.logger.debug("UpdateSegments: recurse=%s, bone=%s", str(self.recurse), str(self.segment_name))
 
@@ -632,7 +790,7 @@ class UpdateSegments(RDOperator):
                               bpy.data.armatures[armature_data_name].bones[
                                   segment_name].children]
             for child_name in children_names:
-                UpdateSegments.run(segment_name=child_name, recurse=self.recurse)
+                UpdateSegments.run(segment_name=child_name, recurse=self.recurse, batch=False)
 
         SelectSegment.run(segment_name=segment_name)
 
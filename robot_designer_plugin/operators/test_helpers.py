@@ -0,0 +1,131 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Benchmark of the :ref:`condition` checks of a panel redraw with and without the shared
+:class:`robot_designer_plugin.operators.helpers.SelectionState` on a model with 1000 selected segments.
+
+Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/operators/test_helpers.py
+
+The Designer panel cannot be drawn in background mode. Instead, :meth:`RDOperator.poll
+<robot_designer_plugin.core.operators.RDOperator.poll>` is called for every registered operator with preconditions,
+which is what the panels do for each of their buttons.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import robot_designer_plugin
+
+SEGMENTS = 1000
+REDRAWS = 20
+
+
+def build_model(name, size):
+    """
+    Creates an armature with a chain of ``size`` selected bones and a selected mesh.
+    """
+    scene = bpy.context.scene
+    model_data = bpy.data.armatures.new(name)
+    model = bpy.data.objects.new(name, model_data)
+    scene.objects.link(model)
+    scene.objects.active = model
+    model.select = True
+
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+    for i in range(size):
+        bone = model_data.edit_bones.new('segment_%d' % i)
+        bone.head = (0, 0, i)
+        bone.tail = (0, 0, i + 1)
+        if i:
+            bone.parent = model_data.edit_bones['segment_%d' % (i - 1)]
+    bpy.ops.object.mode_set(mode='POSE', toggle=False)
+
+    for bone in model_data.bones:
+        bone.select = True
+    model_data.bones.active = model_data.bones[0]
+
+    mesh = bpy.data.objects.new(name + '_mesh', bpy.data.meshes.new(name + '_mesh'))
+    scene.objects.link(mesh)
+    mesh.select = True
+    return model
+
+
+class SelectionStateBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        robot_designer_plugin.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        robot_designer_plugin.unregister()
+
+    def redraw(self, operators, cached):
+        from robot_designer_plugin.operators.helpers import SelectionState
+
+        start = time.perf_counter()
+        for _ in range(REDRAWS):
+            SelectionState.invalidate()
+            for operator in operators:
+                if not cached:
+                    SelectionState.invalidate()
+                operator.poll(bpy.context)
+        return (time.perf_counter() - start) / REDRAWS
+
+    def runTest(self):
+        from robot_designer_plugin.core import RDOperator
+        from robot_designer_plugin.operators.helpers import SelectionState, SingleSegmentSelected, \
+            AtLeastOneSegmentSelected, SingleMeshSelected
+
+        bpy.ops.wm.read_homefile(use_empty=True)
+        build_model('benchmark', SEGMENTS)
+
+        self.assertEqual(SingleSegmentSelected.check()[0], False)
+        self.assertEqual(AtLeastOneSegmentSelected.check()[0], True)
+        self.assertEqual(SingleMeshSelected.check()[0], True)
+
+        # A selection change is picked up after the dependency graph update
+        bpy.context.active_object.data.bones[1].select = False
+        bpy.context.scene.update()
+        self.assertEqual(SelectionState.get().selected_segments, SEGMENTS - 1)
+
+        operators = list(RDOperator._pre_conditions)
+        per_button = self.redraw(operators, False)
+        shared = self.redraw(operators, True)
+        sys.stderr.write("%d segments, %d operators: per button %8.2f ms  shared %8.2f ms  speedup %6.1fx\n" %
+                         (SEGMENTS, len(operators), per_button * 1000, shared * 1000,
+                          per_button / shared if shared else float('inf')))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,123 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Benchmark of the batch kinematic rebuild of :class:`robot_designer_plugin.operators.segments.UpdateSegments`
+against the former per-bone recursion on synthetic chains and binary trees.
+
+Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/operators/test_segments.py
+
+Set the environment variable ``RD_BENCHMARK_SIZES`` (e.g., ``10,100``) to limit the model sizes.
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import robot_designer_plugin
+
+SIZES = [int(i) for i in os.environ.get('RD_BENCHMARK_SIZES', '10,100,1000').split(',')]
+
+
+def build_model(name, size, branching):
+    """
+    Creates an armature with ``size`` RobotDesigner segments. With a branching factor of one, the segments form a
+    chain, otherwise a tree.
+    """
+    from robot_designer_plugin.properties.globals import global_properties
+
+    scene = bpy.context.scene
+    global_properties.do_kinematic_update.set(scene, False)
+
+    model_data = bpy.data.armatures.new(name)
+    model = bpy.data.objects.new(name, model_data)
+    scene.objects.link(model)
+    scene.objects.active = model
+    model.select = True
+
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+    for i in range(size):
+        bone = model_data.edit_bones.new('segment_%d' % i)
+        bone.head = (0, 0, 0)
+        bone.tail = (0, 0, 1)
+        if i:
+            bone.parent = model_data.edit_bones['segment_%d' % ((i - 1) // branching)]
+    bpy.ops.object.mode_set(mode='POSE', toggle=False)
+
+    for i, bone in enumerate(model_data.bones):
+        segment = bone.RobotEditor
+        segment.RD_Bone = True
+        segment.Euler.z.value = 0.1
+        segment.Euler.alpha.value = 10.0 * (i % 7)
+        segment.theta.value = 5.0
+    bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+
+    global_properties.do_kinematic_update.set(scene, True)
+    return model
+
+
+class UpdateSegmentsBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        robot_designer_plugin.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        robot_designer_plugin.unregister()
+
+    def rebuild(self, model, batch):
+        from robot_designer_plugin.operators.segments import UpdateSegments
+
+        start = time.perf_counter()
+        UpdateSegments.run(segment_name='segment_0', recurse=True, batch=batch)
+        return time.perf_counter() - start
+
+    def runTest(self):
+        for branching, shape in ((1, 'chain'), (2, 'tree')):
+            for size in SIZES:
+                bpy.ops.wm.read_homefile(use_empty=True)
+                model = build_model('%s_%d' % (shape, size), size, branching)
+
+                batch = self.rebuild(model, True)
+                heads = [tuple(b.head_local) for b in model.data.bones]
+                per_bone = self.rebuild(model, False)
+
+                # Both paths have to produce the same model
+                for head, bone in zip(heads, model.data.bones):
+                    self.assertAlmostEqual(sum(abs(a - b) for a, b in zip(head, bone.head_local)), 0.0, places=4)
+
+                sys.stderr.write("%5s %5d segments: batch %8.3fs  per-bone %8.3fs  speedup %6.1fx\n" %
+                                 (shape, size, batch, per_bone, per_bone / batch if batch else float('inf')))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,125 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Operators for the workspace of a :term:`segment` (see :mod:`robot_designer_plugin.workspace`).
+"""
+
+# System imports
+import os
+
+# Blender imports
+import bpy
+from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty
+
+# RobotDesigner imports
+from ..core import config, PluginManager, RDOperator
+from ..kinematics import KinematicTree
+from ..workspace import reachability_map
+from .helpers import ModelSelected, SingleSegmentSelected
+
+
+def create_point_cloud(name, points, parent):
+    """
+    Creates (or replaces the vertices of) a mesh object without edges and faces that is parented to the model.
+
+    :param name: Name of the object
+    :param points: Array (N, 3) of the vertices in the frame of the model
+    :param parent: The armature object of the model
+    :return: The object
+    """
+    obj = bpy.data.objects.get(name)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set('co', points.astype('float32').ravel())
+    mesh.update()
+
+    if obj is None:
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.scene.objects.link(obj)
+    else:
+        old_mesh, obj.data = obj.data, mesh
+        if not old_mesh.users:
+            bpy.data.meshes.remove(old_mesh)
+    obj.parent = parent
+    obj.matrix_parent_inverse.identity()
+    return obj
+
+
+@RDOperator.Preconditions(ModelSelected, SingleSegmentSelected)
+@PluginManager.register_class
+class ComputeReachabilityMap(RDOperator):
+    """
+    :ref:`operator` for sampling the workspace of the active segment within the joint limits. The voxels reached by
+    the segment are written to a ``.npz`` file (see :class:`robot_designer_plugin.workspace.ReachabilityMap`) and
+    shown as a point cloud of the voxel centers that is parented to the model.
+
+    **Preconditions:** A model and a single segment (the end effector) are selected.
+
+    **Postconditions:** The point cloud object ``RM_<segment>`` exists.
+    """
+    bl_idname = config.OPERATOR_PREFIX + "compute_reachability_map"
+    bl_label = "Compute reachability map"
+
+    filter_glob = StringProperty(default="*.npz", options={'HIDDEN'})
+    filepath = StringProperty(name="Filename", subtype='FILE_PATH')
+    samples = IntProperty(name="Samples", default=100000, min=1, description="Number of sampled joint configurations")
+    voxel_size = FloatProperty(name="Voxel size", default=0.02, min=0.0001, unit='LENGTH',
+                               description="Edge length of the voxels")
+    processes = IntProperty(name="Processes", default=1, min=1, max=64,
+                            description="Number of worker processes sampling the configurations")
+    manipulability = BoolProperty(name="Manipulability", default=False,
+                                  description="Store the maximal orientation manipulability of every voxel")
+
+    @classmethod
+    def run(cls, filepath, samples=100000, voxel_size=0.02, processes=1, manipulability=False):
+        return super().run(**cls.pass_keywords())
+
+    @RDOperator.OperatorLogger
+    def execute(self, context):
+        model = context.active_object
+        end_effector = context.active_bone.name
+        try:
+            result = reachability_map(KinematicTree.from_armature(model), end_effector, self.samples,
+                                      self.voxel_size, self.manipulability, self.processes)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        if self.filepath:
+            result.save(self.filepath)
+        create_point_cloud('RM_' + end_effector, result.centers(), model)
+        context.scene.objects.active = model
+
+        self.report({'INFO'}, "Reachability map of %s: %d voxels from %d samples%s" % (
+            end_effector, len(result), result.samples, " written to %s" % self.filepath if self.filepath else ""))
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = os.path.join(os.path.dirname(bpy.data.filepath),
+                                         'reachability_%s.npz' % context.active_bone.name)
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
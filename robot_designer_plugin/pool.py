@@ -0,0 +1,78 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Pool of worker processes for the Blender-free computations (convex hulls and decompositions, workspace maps, mesh
+files). The workers are started with ``forkserver`` (or ``spawn`` where it is not available) instead of being forked
+from Blender: they run the plain Python interpreter and import only the modules of the jobs with
+:func:`robot_designer_plugin.loader.load`, not Blender or the ``__init__.py`` files of the plugin packages. Hence,
+the functions run in the workers must be defined in Blender-free modules.
+"""
+
+import multiprocessing
+import pickle
+import runpy
+import sys
+
+from . import loader
+
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+"""
+Start method of the worker processes.
+"""
+
+
+def _python():
+    # Blender's sys.executable is the Blender binary, the workers need its bundled Python interpreter
+    bpy = sys.modules.get('bpy')
+    return getattr(getattr(bpy, 'app', None), 'binary_path_python', None) or sys.executable
+
+
+def map_jobs(function, jobs, processes=1, initializer=None, initargs=()):
+    """
+    Applies a function to all jobs. With several processes and jobs, the jobs are distributed to a pool of worker
+    processes (one job at a time), otherwise they are computed in this process.
+
+    :param function: Module-level function of a Blender-free module taking a single job
+    :param jobs: List of picklable jobs
+    :param processes: Number of worker processes
+    :param initializer: Optional module-level function (of a Blender-free module) called with ``initargs`` before
+        the first job (once in every worker)
+    :param initargs: Arguments of the initializer
+    :return: List of the results (in the order of the jobs)
+    """
+    if processes > 1 and len(jobs) > 1:
+        context = multiprocessing.get_context(START_METHOD)
+        context.set_executable(_python())
+        # The workers load the modules with the loader before the jobs and the initializer are unpickled
+        worker_globals = {'modules': sorted({i.__module__ for i in (function, initializer) if i is not None}),
+                          'call': pickle.dumps((initializer, initargs))}
+        with context.Pool(min(processes, len(jobs)), runpy.run_path,
+                          (loader.__file__, worker_globals, loader.WORKER)) as pool:
+            return pool.map(function, jobs, chunksize=1)
+
+    if initializer is not None:
+        initializer(*initargs)
+    return [function(job) for job in jobs]
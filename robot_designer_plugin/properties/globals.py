@@ -36,7 +36,7 @@
 # ######
 
 # System imports
-import logging
+from collections import defaultdict
 
 # Blender imports
 import bpy
@@ -44,7 +44,8 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, StringProperty,
 
 # RobotDesigner imports
 from ..core import PluginManager
-from ..core.logfile import operator_logger, LogFunction
+from ..core.logfile import operator_logger, LogFunction, set_level
+from ..core.profiling import operator_profiler
 from ..operators.segments import SelectSegment, UpdateSegments
 from ..operators.muscles import SelectMuscle
 from ..core.property import PropertyGroupHandlerBase, PropertyHandler
@@ -55,6 +56,129 @@ class RDSelectedObjects(PropertyGroupHandlerBase):
 
         self.visible = PropertyHandler()
 
+class ObjectRegistry(object):
+    """
+    Index of the RobotDesigner objects used by the visibility toggles and renames of :class:`RDGlobals`. Instead of
+    searching all ``bpy.data.objects`` in every callback, the objects are grouped once by tag and model (the name of
+    the parent), the geometries connected to segments by tag and model, and the muscles by robot model and muscle
+    type.
+
+    The index is dropped by :func:`invalidate_object_registry` when objects are updated, after loading a file, undo
+    and redo, and rebuilt when the number of objects changes. Hiding objects does not change the index, hence the
+    callbacks mark their own updates with :meth:`own_update` (only if they actually assign a property) such that the
+    handler keeps the index.
+    """
+
+    _registry = None
+    _own_update = False
+
+    def __init__(self, key):
+        self.key = key
+        self._tags = defaultdict(lambda: defaultdict(list))
+        self._geometries = defaultdict(lambda: defaultdict(list))
+        self._muscles = defaultdict(lambda: defaultdict(list))
+
+        for obj in bpy.data.objects:
+            tag = obj.RobotEditor.tag
+            if tag != 'DEFAULT':
+                self._tags[tag][obj.parent.name if obj.parent else ''].append(obj)
+            if obj.type == 'MESH' and obj.parent_bone:
+                self._geometries[tag][obj.parent.name if obj.parent else ''].append(obj)
+            muscle = obj.RobotEditor.muscles
+            if muscle.robotName:
+                self._muscles[muscle.robotName][muscle.muscleType].append(obj)
+
+    @staticmethod
+    def _select(index, first, second):
+        groups = index.values() if first is None else [index[first]] if first in index else []
+        return [obj for group in groups for key, objects in group.items() if second is None or key == second
+                for obj in objects]
+
+    def tagged(self, tag, model=None):
+        """
+        :param tag: Object tag other than ``'DEFAULT'`` (e.g., ``'PHYSICS_FRAME'`` or ``'CAMERA_SENSOR'``)
+        :param model: Name of the robot model (all models if None)
+        :return: List of the objects with the tag
+        """
+        return self._select(self._tags, tag, model)
+
+    def geometries(self, tag=None, model=None):
+        """
+        :param tag: Object tag (``'DEFAULT'`` for visuals, ``'COLLISION'``, all tags if None)
+        :param model: Name of the robot model (all models if None)
+        :return: List of the meshes connected to segments
+        """
+        return self._select(self._geometries, tag, model)
+
+    def geometry_tags(self):
+        """
+        :return: The tags of the connected meshes
+        """
+        return list(self._geometries)
+
+    def muscles(self, model=None, muscle_type=None):
+        """
+        :param model: Name of the robot model (all models if None)
+        :param muscle_type: Muscle type (all types if None)
+        :return: List of the muscle objects
+        """
+        return self._select(self._muscles, model, muscle_type)
+
+    @classmethod
+    def get(cls):
+        """
+        :return: The (cached) registry
+        """
+        # The count catches objects that were added or removed without an update being registered
+        key = len(bpy.data.objects)
+        if cls._registry is None or cls._registry.key != key:
+            cls._registry = cls(key)
+        return cls._registry
+
+    @classmethod
+    def invalidate(cls):
+        cls._registry = None
+
+    @classmethod
+    def own_update(cls):
+        """
+        Marks that the objects are updated by a toggle that does not affect the registry. Must only be called right
+        before an assignment, otherwise the flag would hide the next (unrelated) update from the handler.
+        """
+        cls._own_update = True
+
+
+@PluginManager.register_handler('depsgraph_update_post')
+def invalidate_object_registry(scene, depsgraph=None):
+    """
+    Handler that drops the :class:`ObjectRegistry` if objects were updated (except by the toggles).
+    """
+    if depsgraph is not None:
+        updated = depsgraph.id_type_updated('OBJECT')
+    else:
+        updated = bpy.data.objects.is_updated
+    if updated and not ObjectRegistry._own_update:
+        ObjectRegistry.invalidate()
+    ObjectRegistry._own_update = False
+
+
+@PluginManager.register_handler('load_post')
+@PluginManager.register_handler('undo_post')
+@PluginManager.register_handler('redo_post')
+def reset_object_registry(*args):
+    """
+    Handler that drops the :class:`ObjectRegistry` after loading a file, undo and redo.
+    """
+    ObjectRegistry.invalidate()
+
+
+def _set_hidden(objects, hide):
+    for obj in objects:
+        if obj.hide != hide:
+            ObjectRegistry.own_update()
+            obj.hide = hide
+
+
 class RDGlobals(PropertyGroupHandlerBase):
     """
     Property group that contains all globally defined parameters mostly related to the state of the GUI
@@ -63,22 +187,18 @@ class RDGlobals(PropertyGroupHandlerBase):
     @staticmethod
     def debug_level_callback(self, context):
         operator_logger.info('Switching debug level')
-        level = global_properties.operator_debug_level.get(context.scene)
-        if level == 'debug':
-            operator_logger.setLevel(logging.DEBUG)
-        elif level == 'info':
-            operator_logger.setLevel(logging.INFO)
-        elif level == 'warning':
-            operator_logger.setLevel(logging.WARNING)
-        else:
-            operator_logger.setLevel(logging.ERROR)
+        set_level(global_properties.operator_debug_level.get(context.scene))
+
+    @staticmethod
+    def profiling_callback(self, context):
+        operator_profiler.enabled = global_properties.operator_profiling.get(context.scene)
+        operator_logger.info('Operator profiling %s', 'enabled' if operator_profiler.enabled else 'disabled')
 
     @staticmethod
     def updateGlobals(self, context):
-        model_name = context.active_object.name
         segment_name = context.active_bone.name
 
-        UpdateSegments.run(model_name=model_name, segment_name=segment_name)
+        UpdateSegments.run(segment_name=segment_name)
 
 
     @staticmethod
@@ -88,11 +208,7 @@ class RDGlobals(PropertyGroupHandlerBase):
 
     @staticmethod
     def display_physics(self, context):
-        for physics in [physics for physics in bpy.data.objects if physics.RobotEditor.tag == 'PHYSICS_FRAME']:
-            if self.display_physics_selection == True:
-                physics.hide = False
-            else:
-                physics.hide = True
+        _set_hidden(ObjectRegistry.get().tagged('PHYSICS_FRAME'), not self.display_physics_selection)
 
     @staticmethod
     def updateMuscleName(self, context):
@@ -117,22 +233,18 @@ class RDGlobals(PropertyGroupHandlerBase):
         """
 
         hide_geometry = global_properties.display_mesh_selection.get(context.scene)
-        geometry_name = [obj.name for obj in bpy.data.objects if
-                     not obj.parent_bone is None and
-                     obj.type == 'MESH']
+        registry = ObjectRegistry.get()
 
-        for mesh in geometry_name:
-            obj = bpy.data.objects[mesh]
+        for tag in registry.geometry_tags():
             if hide_geometry == 'all':
-                obj.hide = False
-            elif hide_geometry== 'collision' and obj.RobotEditor.tag == 'COLLISION':
-                obj.hide = False
-            elif hide_geometry == 'visual' and obj.RobotEditor.tag == 'DEFAULT':
-                obj.hide = False
-            elif hide_geometry == 'none':
-                obj.hide = True
+                hide = False
+            elif hide_geometry == 'collision' and tag == 'COLLISION':
+                hide = False
+            elif hide_geometry == 'visual' and tag == 'DEFAULT':
+                hide = False
             else:
-                obj.hide = True
+                hide = True
+            _set_hidden(registry.geometries(tag), hide)
 
 
     @staticmethod
@@ -142,29 +254,14 @@ class RDGlobals(PropertyGroupHandlerBase):
         """
 
         hide_muscles = global_properties.display_muscle_selection.get(context.scene)
+        registry = ObjectRegistry.get()
 
-
-        muscle_names = [obj.name for obj in bpy.data.objects if
-         bpy.data.objects[obj.name].RobotEditor.muscles.robotName != '']
-
-        for muscle in muscle_names:
-            obj = bpy.data.objects[muscle]
-            if hide_muscles == 'all':
-                obj.hide = False
-           # elif hide_muscles == 'MYOROBOTICS' and obj.RobotEditor.muscles.muscleType == 'MYOROBOTICS':
-           #     obj.hide = False
-            elif hide_muscles == 'MILLARD_EQUIL' and obj.RobotEditor.muscles.muscleType == 'MILLARD_EQUIL':
-                obj.hide = False
-            elif hide_muscles == 'MILLARD_ACCEL' and obj.RobotEditor.muscles.muscleType == 'MILLARD_ACCEL':
-                obj.hide = False
-            elif hide_muscles == 'THELEN' and obj.RobotEditor.muscles.muscleType == 'THELEN':
-                obj.hide = False
-            elif hide_muscles == 'RIGID_TENDON' and obj.RobotEditor.muscles.muscleType == 'RIGID_TENDON':
-                obj.hide = False
-            elif hide_muscles == 'none':
-                obj.hide = True
-            else:
-                obj.hide = True
+        if hide_muscles == 'all':
+            _set_hidden(registry.muscles(), False)
+        else:
+            # Shows the muscles of the selected type ('none' matches no muscle type)
+            for muscle in registry.muscles():
+                _set_hidden([muscle], muscle.RobotEditor.muscles.muscleType != hide_muscles)
 
     @staticmethod
     def name_update(self, context):
@@ -172,26 +269,23 @@ class RDGlobals(PropertyGroupHandlerBase):
         updates the robot name for every assigned muscle
         """
         if self.old_name != '':
-            muscles = [obj for obj in bpy.data.objects if obj.RobotEditor.muscles.robotName == self.old_name]
-
-            for muscle in muscles:
+            for muscle in ObjectRegistry.get().muscles(self.old_name):
                 muscle.RobotEditor.muscles.robotName = self.model_name
 
             self.old_name = self.model_name
 
         bpy.context.active_object.name = self.model_name
+        ObjectRegistry.invalidate()
 
     @staticmethod
     def muscle_dim_update(self, context):
         """
         updates the visualization dimension of all muscles in scene
         """
-        print("in the function")
-        active_model = self.model_name
-        for muscle in [obj.name for obj in bpy.data.objects
-            if bpy.data.objects[obj.name].RobotEditor.muscles.robotName == active_model]:
-                bpy.data.objects[muscle].data.bevel_depth = self.muscle_dim
-                print("changeing ----")
+        for muscle in ObjectRegistry.get().muscles(self.model_name):
+            if muscle.data.bevel_depth != self.muscle_dim:
+                ObjectRegistry.own_update()
+                muscle.data.bevel_depth = self.muscle_dim
 
 
 
@@ -295,11 +389,29 @@ class RDGlobals(PropertyGroupHandlerBase):
 
         self.gazebo_tags = PropertyHandler(StringProperty(name="Gazebo tags", default=""))
 
+        self.mesh_export_processes = PropertyHandler(IntProperty(
+            name="Mesh export processes", default=1, min=1, max=64,
+            description="Number of processes writing the meshes of an export (one uses Blender's COLLADA exporter)"))
+
+        self.inertial_repair = PropertyHandler(EnumProperty(
+            items=[('none', 'Report', 'Only report invalid inertials (errors cancel the export)'),
+                   ('clamp', 'Clamp', 'Clamp masses and principal moments of invalid inertials'),
+                   ('project', 'Project', 'Project the principal moments of invalid inertials onto valid ones'),
+                   ('geometry', 'Geometry', 'Recompute invalid inertials from the meshes of their segments')],
+            name="Inertial repair", default='none',
+            description="Repair policy of the inertial validation before an export"))
+
         self.operator_debug_level = PropertyHandler(EnumProperty(
             items=[('debug', 'Debug', 'Log everything including debug messages (verbose)'),
                    ('info', 'Info', 'Log information'),
                    ('warning', 'Warning', 'Log only warnings'),
-                   ('error', 'Error', 'Log only errors')], update=self.debug_level_callback))
+                   ('error', 'Error', 'Log only errors')], default='info', update=self.debug_level_callback))
+
+        self.operator_profiling = PropertyHandler(BoolProperty(
+            name="Profile operators", default=False, update=self.profiling_callback,
+            description="Record the wall and CPU time of all (nested) operator calls"))
+        self.operator_profile_entries = PropertyHandler(IntProperty(name="Slowest operators", default=10, min=1,
+                                                                    max=100))
 
         self.active_muscle = PropertyHandler(StringProperty(name="Active Muscle", default=""))
 
@@ -319,3 +431,20 @@ class RDGlobals(PropertyGroupHandlerBase):
 
 global_properties = RDGlobals()
 global_properties.register(bpy.types.Scene)
+
+
+@PluginManager.register_handler('load_post')
+def apply_debug_level(*args):
+    """
+    Handler that applies the logging level stored in the loaded file.
+    """
+    set_level(global_properties.operator_debug_level.get(bpy.context.scene))
+
+
+@PluginManager.register_handler('load_post')
+def apply_operator_profiling(*args):
+    """
+    Handler that enables or disables the operator profiler as stored in the loaded file (the update callback of the
+    property only runs when it is changed in the GUI).
+    """
+    operator_profiler.enabled = global_properties.operator_profiling.get(bpy.context.scene)
@@ -0,0 +1,125 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of the visibility toggles of :class:`robot_designer_plugin.properties.globals.RDGlobals` with the
+:class:`robot_designer_plugin.properties.globals.ObjectRegistry` in a scene with a robot and 5000 environment objects.
+
+Run it in Blender from the repository root:
+
+    blender --background --python robot_designer_plugin/properties/test_globals.py
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import robot_designer_plugin
+
+SEGMENTS = 100
+ENVIRONMENT = 5000
+TOGGLES = 20
+
+
+def build_scene(name, segments, environment):
+    """
+    Creates an armature with ``segments`` bones, a visual and a collision mesh per segment and ``environment``
+    unconnected meshes.
+    """
+    scene = bpy.context.scene
+    model_data = bpy.data.armatures.new(name)
+    model = bpy.data.objects.new(name, model_data)
+    scene.objects.link(model)
+    scene.objects.active = model
+
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+    for i in range(segments):
+        bone = model_data.edit_bones.new('segment_%d' % i)
+        bone.head = (0, 0, i)
+        bone.tail = (0, 0, i + 1)
+    bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+
+    mesh_data = bpy.data.meshes.new('mesh')
+    for i in range(segments):
+        for tag in ('DEFAULT', 'COLLISION'):
+            obj = bpy.data.objects.new('%s_%s_%d' % (name, tag.lower(), i), mesh_data)
+            scene.objects.link(obj)
+            obj.parent = model
+            obj.parent_type = 'BONE'
+            obj.parent_bone = 'segment_%d' % i
+            obj.RobotEditor.tag = tag
+    for i in range(environment):
+        scene.objects.link(bpy.data.objects.new('environment_%d' % i, mesh_data))
+    return model
+
+
+class ObjectRegistryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        robot_designer_plugin.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        robot_designer_plugin.unregister()
+
+    def runTest(self):
+        from robot_designer_plugin.properties.globals import global_properties, ObjectRegistry
+
+        bpy.ops.wm.read_homefile(use_empty=True)
+        build_scene('robot', SEGMENTS, ENVIRONMENT)
+        scene = bpy.context.scene
+
+        registry = ObjectRegistry.get()
+        self.assertEqual(len(registry.geometries()), 2 * SEGMENTS)
+        self.assertEqual(len(registry.geometries('COLLISION', 'robot')), SEGMENTS)
+
+        global_properties.display_mesh_selection.set(scene, 'collision')
+        self.assertTrue(bpy.data.objects['robot_default_0'].hide)
+        self.assertFalse(bpy.data.objects['robot_collision_0'].hide)
+        self.assertFalse(bpy.data.objects['environment_0'].hide)
+
+        # Hiding objects keeps the registry, a change of the tags replaces it
+        scene.update()
+        self.assertIs(ObjectRegistry.get(), registry)
+        bpy.data.objects['robot_default_0'].RobotEditor.tag = 'COLLISION'
+        scene.update()
+        self.assertEqual(len(ObjectRegistry.get().geometries('COLLISION')), SEGMENTS + 1)
+
+        start = time.perf_counter()
+        for i in range(TOGGLES):
+            global_properties.display_mesh_selection.set(scene, 'visual' if i % 2 else 'collision')
+            scene.update()
+        toggle = (time.perf_counter() - start) / TOGGLES
+        sys.stderr.write("%d connected meshes, %d environment objects: toggle %8.2f ms\n" %
+                         (2 * SEGMENTS, ENVIRONMENT, toggle * 1000))
+
+
+if __name__ == '__main__':
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,118 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests for the process pool driver of :mod:`robot_designer_plugin.batch`. Runs without Blender:
+
+    python3 robot_designer_plugin/test_batch.py
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+
+spec = importlib.util.spec_from_file_location(
+    'batch', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'batch.py'))
+batch = importlib.util.module_from_spec(spec)
+sys.modules['batch'] = batch  # the direct mode pickles the functions of the module
+spec.loader.exec_module(batch)
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, *names):
+        return os.path.join(self.directory.name, *names)
+
+    def touch(self, *names):
+        os.makedirs(os.path.dirname(self.path(*names)), exist_ok=True)
+        open(self.path(*names), 'w').close()
+        return self.path(*names)
+
+
+class ModelFormat(BatchTest):
+    def runTest(self):
+        self.assertEqual(batch.model_format(self.touch('robot.SDF')), ('sdf', False))
+        self.assertEqual(batch.model_format(self.touch('robot.urdf')), ('urdf', False))
+        with zipfile.ZipFile(self.path('package.zip'), 'w') as z:
+            z.writestr('robot/meshes/base.dae', '')
+            z.writestr('robot/urdf/robot.urdf', '')
+        self.assertEqual(batch.model_format(self.path('package.zip')), ('urdf', True))
+        with zipfile.ZipFile(self.path('empty.zip'), 'w') as z:
+            z.writestr('readme.txt', '')
+        self.assertRaises(ValueError, batch.model_format, self.path('empty.zip'))
+        self.assertRaises(ValueError, batch.model_format, self.touch('robot.dae'))
+
+
+class Inputs(BatchTest):
+    def runTest(self):
+        first = self.touch('a', 'robot.urdf')
+        second = self.touch('b', 'c', 'robot.urdf')
+        files = batch.expand_inputs([self.path('**', '*.urdf'), first])
+        self.assertEqual(files, [first, second])
+
+        outputs = batch.output_names(files, self.path('out'))
+        self.assertEqual(outputs, [self.path('out', 'robot'), self.path('out', 'robot_2')])
+
+
+class MissingBlender(BatchTest):
+    def runTest(self):
+        files = [self.touch('robot.urdf'), self.touch('other.sdf')]
+        summary = batch.convert(files, 'sdf', self.path('out'), processes=2, batch_size=1,
+                                blender=self.path('no_blender'))
+        self.assertEqual(summary['succeeded'], 0)
+        self.assertEqual(summary['failed'], 2)
+        self.assertEqual([i['input'] for i in summary['files']], files)
+        self.assertTrue(all(i['error'].startswith('Could not start Blender') for i in summary['files']))
+
+
+class Direct(BatchTest):
+    def runTest(self):
+        robot = self.path('robot', 'robot.urdf')
+        os.makedirs(os.path.dirname(robot))
+        with open(robot, 'w') as f:
+            f.write('<robot name="robot"><link name="base"/><link name="arm"/><joint name="joint" type="fixed">'
+                    '<parent link="base"/><child link="arm"/></joint></robot>')
+        with zipfile.ZipFile(self.path('package.zip'), 'w') as z:
+            z.write(robot, 'robot/robot.urdf')
+        files = [robot, self.path('package.zip'), self.touch('robot.dae')]
+
+        summary = batch.convert(files, 'sdf', self.path('out'), processes=2, direct=True)
+        self.assertEqual((summary['succeeded'], summary['failed']), (2, 1))
+        self.assertEqual([i['input'] for i in summary['files']], files)
+        self.assertEqual(summary['files'][1]['output_file'], self.path('out', 'package', 'model.sdf'))
+        self.assertTrue(os.path.isfile(self.path('out', 'robot', 'model.sdf')))
+        self.assertTrue(summary['files'][2]['error'].startswith('ValueError'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of :mod:`robot_designer_plugin.composite`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_composite.py
+"""
+
+import importlib.util
+import os
+import sys
+import time
+import unittest
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_kinematics import kinematics, random_tree
+from test_mass_properties import mass_properties, box, triangles, rotation
+
+spec = importlib.util.spec_from_file_location(
+    'composite', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'composite.py'))
+composite = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(composite)
+
+BENCHMARK_SEGMENTS = 60
+BENCHMARK_POSES = 10000
+
+
+def random_body(rng):
+    """
+    :return: Mass, center and inertia tensor of a random box
+    """
+    size, matrix = rng.uniform(0.1, 1, 3), rotation(*rng.uniform(-3, 3, 3))
+    mass = rng.uniform(0.5, 5)
+    x, y, z = size ** 2
+    return mass, rng.uniform(-0.5, 0.5, 3), matrix.dot(numpy.diag([y + z, x + z, x + y]) * mass / 12).dot(matrix.T)
+
+
+def reference(body, frames, segments):
+    """
+    Combines the bodies of the segments in the model frame one by one.
+    """
+    parts = [composite.transform(frames[i], body.centers[i], body.inertias[i]) for i in segments]
+    return composite.combine(body.masses[segments], [i[0] for i in parts], [i[1] for i in parts])
+
+
+def subtree(tree, index):
+    return [i for i in range(len(tree)) if index in tree.chain(i)]
+
+
+def setup(rng, size):
+    tree = kinematics.KinematicTree.from_segments(random_tree(rng, size))
+    body = composite.CompositeBody(tree.names, tree.parents)
+    for i in range(size):
+        body.set_body(i, *random_body(rng))
+    return tree, body
+
+
+class Combine(unittest.TestCase):
+    def runTest(self):
+        # Two boxes combined equal the mass properties of a mesh made of both
+        first, second = box((1, 2, 0.5), (1, 0, 0), rotation(0.2, 0.4, 0)), box((0.3, 0.3, 3), (-1, 2, 1))
+        meshes = [triangles(first), triangles(second)]
+        both = mass_properties.mass_properties(numpy.concatenate([meshes[0][0], meshes[1][0]]),
+                                               numpy.concatenate([meshes[0][1], meshes[1][1] + 8]), 7)
+        parts = mass_properties.batch_mass_properties(meshes, 7)
+        mass, center, inertia = composite.combine([i.mass for i in parts], [i.center for i in parts],
+                                                  [i.inertia for i in parts])
+        self.assertAlmostEqual(mass, both.mass)
+        numpy.testing.assert_allclose(center, both.center, atol=1e-12)
+        numpy.testing.assert_allclose(inertia, both.inertia, atol=1e-12)
+
+        self.assertEqual(composite.combine([0.0], [(1, 2, 3)], [numpy.zeros((3, 3))])[0], 0.0)
+
+
+class Incremental(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        tree, body = setup(rng, 30)
+        frames = tree.forward()[0]
+        body.set_frames(frames)
+
+        mass, center, inertia = body.whole()
+        self.assertEqual(body.recomputed, 30)
+        expected = reference(body, frames, range(30))
+        self.assertAlmostEqual(mass, expected[0])
+        numpy.testing.assert_allclose(center, expected[1], atol=1e-10)
+        numpy.testing.assert_allclose(inertia, expected[2], atol=1e-10)
+
+        index = 20
+        sub_mass, sub_center, sub_inertia = body.subtree(tree.names[index])
+        expected = reference(body, numpy.matmul(numpy.linalg.inv(frames[index]), frames), subtree(tree, index))
+        self.assertAlmostEqual(sub_mass, expected[0])
+        numpy.testing.assert_allclose(sub_center, expected[1], atol=1e-10)
+        numpy.testing.assert_allclose(sub_inertia, expected[2], atol=1e-10)
+
+        # An unchanged body does not invalidate anything, a changed body invalidates the segment and its ancestors
+        body.set_body(index, body.masses[index], body.centers[index], body.inertias[index])
+        body.set_body(index, *random_body(rng))
+        body.recomputed = 0
+        mass, center, inertia = body.whole()
+        self.assertEqual(body.recomputed, len(tree.chain(index)))
+        expected = reference(body, frames, range(30))
+        numpy.testing.assert_allclose(inertia, expected[2], atol=1e-10)
+
+        # A moved joint invalidates the ancestors of its segment only
+        moved = next(i for i in reversed(tree.dofs) if tree.parents[i] >= 0)
+        configuration = tree.configurations()[0]
+        configuration[tree.dofs.index(moved)] += 30
+        frames = tree.forward(configuration)[0]
+        body.recomputed = 0
+        body.set_frames(frames)
+        mass, center, inertia = body.whole()
+        self.assertEqual(body.recomputed, len(tree.chain(moved)) - 1)
+        expected = reference(body, frames, range(30))
+        numpy.testing.assert_allclose(center, expected[1], atol=1e-10)
+        numpy.testing.assert_allclose(inertia, expected[2], atol=1e-10)
+
+        # The batch computation agrees
+        batch_mass, centers, inertias = body.whole_body(frames[numpy.newaxis])
+        self.assertAlmostEqual(batch_mass, mass)
+        numpy.testing.assert_allclose(centers[0], center, atol=1e-10)
+        numpy.testing.assert_allclose(inertias[0], inertia, atol=1e-10)
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(2)
+        tree, body = setup(rng, BENCHMARK_SEGMENTS)
+        configurations = rng.uniform(-90, 90, (BENCHMARK_POSES, len(tree.dofs)))
+        frames = tree.forward(configurations)
+
+        start = time.perf_counter()
+        mass, centers, inertias = body.whole_body(frames)
+        batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for n in range(100):
+            body.set_frames(frames[n])
+            _, center, _ = body.whole()
+        numpy.testing.assert_allclose(center, centers[99], atol=1e-10)
+        incremental = (time.perf_counter() - start) / 100
+
+        start = time.perf_counter()
+        for n in range(100):
+            body.set_body(n % BENCHMARK_SEGMENTS, *random_body(rng))
+            body.whole()
+        changed_body = (time.perf_counter() - start) / 100
+
+        sys.stderr.write("%d segments: %d poses in %.3f s (%.0f per second); one pose at a time %.2f ms, one changed "
+                         "body %.2f ms\n" % (BENCHMARK_SEGMENTS, BENCHMARK_POSES, batch, BENCHMARK_POSES / batch,
+                                             incremental * 1000, changed_body * 1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
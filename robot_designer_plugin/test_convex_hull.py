@@ -0,0 +1,173 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of :mod:`robot_designer_plugin.convex_hull`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_convex_hull.py
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_mass_properties import mass_properties, box, uv_sphere, cylinder, triangles, rotation
+import loader
+
+convex_hull = loader.load('convex_hull')
+
+BENCHMARK_LINKS = 30
+
+
+def assert_hull(test, points, vertices, hull_triangles, tolerance=None):
+    """
+    Checks that the hull is closed, consistently oriented and contains all points (within the tolerance of
+    :func:`convex_hull.quickhull`, points dropped near a face may end up a bit farther outside of its replacements).
+    """
+    test.assertEqual(mass_properties.manifold_defects(hull_triangles), 0)
+    test.assertEqual(len(vertices) - len(hull_triangles) * 3 // 2 + len(hull_triangles), 2)  # Euler characteristic
+    corners = vertices[hull_triangles]
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals /= numpy.linalg.norm(normals, axis=1)[:, numpy.newaxis]
+    distances = points.dot(normals.T) - numpy.sum(normals * corners[:, 0], axis=1)
+    if tolerance is None:
+        tolerance = convex_hull.TOLERANCE * numpy.sum(numpy.abs(points).max(axis=0)) / 2
+    test.assertLessEqual(distances.max(), tolerance * 2.002)
+    # The hull vertices are input points
+    test.assertTrue(numpy.all(numpy.isin(vertices.view('f8,f8,f8'), points.view('f8,f8,f8'))))
+
+
+class RandomPoints(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        for count in (4, 10, 1000, 100000):
+            points = rng.normal(size=(count, 3))
+            vertices, hull_triangles = convex_hull.quickhull(points)
+            assert_hull(self, points, vertices, hull_triangles)
+            self.assertGreater(mass_properties.mass_properties(vertices, hull_triangles).volume, 0)
+
+        # All points on a sphere are hull vertices
+        points = rng.normal(size=(2000, 3))
+        points /= numpy.linalg.norm(points, axis=1)[:, numpy.newaxis]
+        vertices, hull_triangles = convex_hull.quickhull(points)
+        self.assertEqual(len(vertices), 2000)
+        assert_hull(self, points, vertices, hull_triangles)
+
+
+class Shapes(unittest.TestCase):
+    def runTest(self):
+        # A box filled with a grid (in single precision like Blender) far from the origin
+        matrix = rotation(0.3, -0.2, 1.1)
+        grid = numpy.stack(numpy.meshgrid(*[numpy.linspace(-0.5, 0.5, 11)] * 3), axis=-1).reshape(-1, 3)
+        points = ((grid * (0.1, 0.2, 0.3)).dot(matrix.T) + (100, -50, 20)).astype(numpy.float32).astype(float)
+        vertices, hull_triangles = convex_hull.quickhull(points)
+        # Besides the corners, points on the edges (within the tolerance) may become vertices
+        self.assertLess(len(vertices), 20)
+        self.assertAlmostEqual(mass_properties.mass_properties(vertices, hull_triangles).volume, 0.006, 6)
+        assert_hull(self, points, vertices, hull_triangles)
+
+        # Convex meshes are their own hull
+        for shape in (box((1, 2, 3)), uv_sphere(0.5, 32, 16), cylinder(0.2, 1, 24)):
+            points, mesh_triangles = triangles(shape)
+            vertices, hull_triangles = convex_hull.quickhull(points)
+            self.assertEqual(len(vertices), len(points))
+            self.assertAlmostEqual(mass_properties.mass_properties(vertices, hull_triangles).volume,
+                                   mass_properties.mass_properties(points, mesh_triangles).volume, 9)
+
+        # A concave L-shape made of two boxes
+        points = numpy.concatenate([triangles(box((2, 1, 1), (0.5, 0, 0)))[0],
+                                    triangles(box((1, 1, 2), (0, 0, 0.5)))[0]])
+        vertices, hull_triangles = convex_hull.quickhull(points)
+        self.assertEqual(len(vertices), 10)
+        self.assertAlmostEqual(mass_properties.mass_properties(vertices, hull_triangles).volume, 3.5, 9)
+
+
+class CoplanarPoints(unittest.TestCase):
+    def runTest(self):
+        # Rotated grids with duplicates have many (nearly) coplanar and collinear points
+        rng = numpy.random.default_rng(4)
+        for noise, tolerance in ((0, None), (1e-7, None), (0, 1e-3), (1e-4, 1e-2), (1e-2, 0.05)):
+            for _ in range(20):
+                grid = rng.integers(0, 6, (rng.integers(20, 400), 3)) / 5
+                points = numpy.concatenate([grid, grid[:10]]).dot(rotation(*rng.uniform(-3, 3, 3)).T)
+                points += rng.normal(scale=noise, size=points.shape)
+                vertices, hull_triangles = convex_hull.quickhull(points, tolerance)
+                assert_hull(self, points, vertices, hull_triangles, tolerance)
+
+
+class Degenerate(unittest.TestCase):
+    def runTest(self):
+        square = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0.5, 0.5, 0)]
+        self.assertRaises(ValueError, convex_hull.quickhull, square)
+        self.assertRaises(ValueError, convex_hull.quickhull, [(i, 2 * i, 3 * i) for i in range(10)])
+        self.assertRaises(ValueError, convex_hull.quickhull, [(1, 2, 3)] * 10)
+        self.assertRaises(ValueError, convex_hull.quickhull, square[:3])
+
+        results = convex_hull.convex_hulls([square, triangles(box(1))[0]])
+        self.assertEqual(results[0][:2], (None, None))
+        self.assertIn('coplanar', results[0][2])
+        self.assertEqual((len(results[1][0]), results[1][2]), (8, ''))
+
+
+class Parallel(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(2)
+        point_sets = [rng.normal(size=(500, 3)) for _ in range(5)]
+        serial = convex_hull.convex_hulls(point_sets)
+        parallel = convex_hull.convex_hulls(point_sets, processes=2)
+        for (vertices, hull_triangles, message), result in zip(serial, parallel):
+            numpy.testing.assert_array_equal(vertices, result[0])
+            numpy.testing.assert_array_equal(hull_triangles, result[1])
+        self.assertEqual(len(parallel), 5)
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        # Visual meshes of a robot: dense spheres and cylinders (all vertices on the hull) and noisy scans
+        rng = numpy.random.default_rng(3)
+        point_sets = []
+        for i in range(BENCHMARK_LINKS):
+            if i % 3 == 0:
+                points = triangles(uv_sphere(0.1, 32, 16))[0]
+            elif i % 3 == 1:
+                points = triangles(cylinder(0.05, 0.3, 64))[0]
+            else:
+                points = rng.normal(scale=(0.1, 0.05, 0.3), size=(20000, 3))
+            point_sets.append(points.dot(rotation(*rng.uniform(-3, 3, 3)).T).astype(numpy.float32))
+
+        start = time.perf_counter()
+        results = convex_hull.convex_hulls(point_sets)
+        seconds = time.perf_counter() - start
+        self.assertTrue(all(not message for _, _, message in results))
+        sys.stderr.write("%d meshes (%d vertices): hulls with %d vertices in %.3f s\n" % (
+            BENCHMARK_LINKS, sum(len(p) for p in point_sets), sum(len(v) for v, _, _ in results), seconds))
+
+
+if __name__ == '__main__':
+    unittest.main()
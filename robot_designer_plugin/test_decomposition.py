@@ -0,0 +1,188 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of :mod:`robot_designer_plugin.decomposition`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_decomposition.py
+"""
+
+import math
+import os
+import sys
+import time
+import unittest
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_mass_properties import mass_properties, box, uv_sphere, triangles, rotation
+from test_convex_hull import convex_hull
+import loader
+
+decomposition = loader.load('decomposition')
+
+BENCHMARK_LINKS = 4
+
+
+def boxes(*shapes):
+    """
+    :return: Vertices and triangles of touching boxes given as tuples of the size and the center
+    """
+    vertices, result = [], []
+    for size, center in shapes:
+        v, t = triangles(box(size, center))
+        result.append(t + sum(len(i) for i in vertices))
+        vertices.append(v)
+    return numpy.concatenate(vertices), numpy.concatenate(result)
+
+
+def gripper(matrix=numpy.identity(3)):
+    """
+    :return: A palm with two fingers (a U-shape with a volume of 3.5)
+    """
+    vertices, result = boxes(((3, 1, 0.5), (0, 0, 0)), ((0.5, 1, 2), (-1.25, 0, 1.25)),
+                             ((0.5, 1, 2), (1.25, 0, 1.25)))
+    return vertices.dot(matrix.T), result
+
+
+def torus(major, minor, segments, sides):
+    angles = 2 * math.pi * numpy.arange(segments) / segments
+    circle = 2 * math.pi * numpy.arange(sides) / sides
+    radius = major + minor * numpy.cos(circle)
+    vertices = numpy.stack([numpy.outer(numpy.cos(angles), radius), numpy.outer(numpy.sin(angles), radius),
+                            numpy.tile(minor * numpy.sin(circle), (segments, 1))], axis=2).reshape(-1, 3)
+    quads = [(i * sides + j, ((i + 1) % segments) * sides + j, ((i + 1) % segments) * sides + (j + 1) % sides,
+              i * sides + (j + 1) % sides) for i in range(segments) for j in range(sides)]
+    return vertices, mass_properties.triangulate([4] * len(quads), [i for quad in quads for i in quad])
+
+
+def hull_volume(hulls):
+    return sum(mass_properties.mass_properties(*hull).volume for hull in hulls)
+
+
+def outside_distances(points, hulls):
+    """
+    :return: Distances of the points outside of the union of the hulls (0 inside of a hull)
+    """
+    distances = numpy.full(len(points), numpy.inf)
+    for vertices, hull_triangles in hulls:
+        corners = vertices[hull_triangles]
+        normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        normals /= numpy.linalg.norm(normals, axis=1)[:, numpy.newaxis]
+        planes = points.dot(normals.T) - numpy.sum(normals * corners[:, 0], axis=1)
+        distances = numpy.minimum(distances, numpy.maximum(planes.max(axis=1), 0))
+    return distances
+
+
+class Voxelize(unittest.TestCase):
+    def runTest(self):
+        vertices, cube = triangles(box(1, (0.3, 0.1, 0.2)))
+        filled = decomposition.voxelize(vertices, cube, (-0.27, -0.43, -0.35), 0.1, (12, 12, 12))
+        self.assertAlmostEqual(filled.sum() * 0.001, 1.0, 2)
+        self.assertTrue(numpy.all((filled >= 0) & (filled <= 1)))
+        # The orientation of the triangles does not matter
+        numpy.testing.assert_allclose(decomposition.voxelize(vertices, cube[:, ::-1], (-0.27, -0.43, -0.35), 0.1,
+                                                             (12, 12, 12)), filled)
+
+        vertices, sphere = triangles(uv_sphere(0.5, 32, 16))
+        filled = decomposition.voxelize(vertices, sphere, (-0.5, -0.5, -0.5), 0.05, (20, 20, 20))
+        self.assertAlmostEqual(filled.sum() * 0.05 ** 3, mass_properties.mass_properties(vertices, sphere).volume, 2)
+
+        samples, directions = decomposition.surface_samples(vertices, sphere, 0.05)
+        numpy.testing.assert_allclose(numpy.linalg.norm(samples, axis=1), 0.5, atol=0.02)
+        self.assertTrue(numpy.all(numpy.linalg.norm(samples + 1e-3 * directions, axis=1) < 0.5))
+
+
+class Decompose(unittest.TestCase):
+    def runTest(self):
+        # Convex meshes stay whole
+        vertices, sphere = triangles(uv_sphere(0.5, 32, 16))
+        hulls = decomposition.decompose(vertices, sphere)
+        self.assertEqual(len(hulls), 1)
+        self.assertLessEqual(len(hulls[0][0]), 64)
+
+        # An L-shape is cut at the face between its boxes
+        hulls = decomposition.decompose(*boxes(((2, 1, 1), (0.5, 0, 0)), ((1, 1, 1), (0, 0, 1))))
+        self.assertEqual(len(hulls), 2)
+        self.assertAlmostEqual(hull_volume(hulls), 3.0, 6)
+
+        # Palm and fingers of a rotated gripper (the faces are not aligned with the voxels)
+        vertices, mesh = gripper(rotation(0.2, 0.5, -0.3))
+        hulls = decomposition.decompose(vertices, mesh)
+        self.assertTrue(3 <= len(hulls) <= 6, len(hulls))
+        self.assertLess(abs(hull_volume(hulls) / 3.5 - 1), 0.1)
+        for hull in hulls:
+            self.assertEqual(mass_properties.manifold_defects(hull[1]), 0)
+        samples = decomposition.surface_samples(vertices, mesh, 0.05)[0]
+        self.assertLess(outside_distances(samples, hulls).max(), 0.15)
+        # The single hull fills the gap between the fingers
+        self.assertGreater(mass_properties.mass_properties(*convex_hull.quickhull(vertices)).volume, 7)
+
+        self.assertEqual(len(decomposition.decompose(vertices, mesh, max_hulls=2)), 2)
+        self.assertEqual(len(decomposition.decompose(vertices, mesh, concavity=1.0)), 1)
+
+        hulls = decomposition.decompose(*torus(1, 0.25, 48, 16))
+        self.assertGreaterEqual(len(hulls), 6)
+        self.assertLess(abs(hull_volume(hulls) / (2 * math.pi ** 2 * 0.25 ** 2) - 1), 0.15)
+
+
+class Degenerate(unittest.TestCase):
+    def runTest(self):
+        square = numpy.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], dtype=float)
+        flat = numpy.array([(0, 1, 2), (0, 2, 3)])
+        self.assertRaises(ValueError, decomposition.decompose, square, flat)
+        self.assertRaises(ValueError, decomposition.decompose, numpy.zeros((0, 3)), numpy.zeros((0, 3), int))
+
+        results = decomposition.convex_decompositions([(square, flat), triangles(box(1))])
+        self.assertIsNone(results[0][0])
+        self.assertIn('volume', results[0][1])
+        self.assertEqual((len(results[1][0]), results[1][1]), (1, ''))
+
+
+class Parallel(unittest.TestCase):
+    def runTest(self):
+        meshes = [gripper(), triangles(box(1)), torus(1, 0.3, 24, 12)]
+        serial = decomposition.convex_decompositions(meshes, max_hulls=4)
+        parallel = decomposition.convex_decompositions(meshes, processes=2, max_hulls=4)
+        for (hulls, message), (other, other_message) in zip(serial, parallel):
+            self.assertEqual((len(hulls), message), (len(other), other_message))
+            for first, second in zip(hulls, other):
+                numpy.testing.assert_array_equal(first[0], second[0])
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        meshes = [gripper(rotation(*rng.uniform(-3, 3, 3))) for _ in range(BENCHMARK_LINKS)]
+        start = time.perf_counter()
+        results = decomposition.convex_decompositions(meshes)
+        seconds = time.perf_counter() - start
+        sys.stderr.write("%d grippers: %d hulls in %.3f s\n" % (
+            BENCHMARK_LINKS, sum(len(hulls) for hulls, _ in results), seconds))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of :mod:`robot_designer_plugin.kinematics`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_kinematics.py
+
+The reference is a transcription of :meth:`robot_designer_plugin.properties.segments.RDSegment.getTransform` that
+builds the matrices like ``mathutils`` (``Euler.to_matrix`` and ``Matrix.Translation``) one segment at a time.
+"""
+
+import math
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import loader
+
+kinematics = loader.load('kinematics')
+
+BENCHMARK_DOFS = 30
+BENCHMARK_CONFIGURATIONS = 100000
+
+
+def euler_to_matrix(x, y, z):
+    """
+    ``mathutils.Euler((x, y, z), 'XYZ').to_matrix()`` resized to 4x4 (``eul_to_mat3`` of Blender).
+    """
+    ci, cj, ch = math.cos(x), math.cos(y), math.cos(z)
+    si, sj, sh = math.sin(x), math.sin(y), math.sin(z)
+    cc, cs, sc, ss = ci * ch, ci * sh, si * ch, si * sh
+    return numpy.array([[cj * ch, sj * sc - cs, sj * cc + ss, 0],
+                        [cj * sh, sj * ss + cc, sj * cs - sc, 0],
+                        [-sj, cj * si, cj * ci, 0],
+                        [0, 0, 0, 1]])
+
+
+def translation(x, y, z):
+    matrix = numpy.identity(4)
+    matrix[:3, 3] = x, y, z
+    return matrix
+
+
+def get_transform(segment):
+    """
+    Transcription of ``RDSegment.getTransform``.
+    """
+    inverted = -1 if segment.axis_revert else 1
+    if segment.parentMode == 'EULER':
+        e = segment.Euler
+        parent = translation(e.x.value, e.y.value, e.z.value).dot(
+            euler_to_matrix(math.radians(e.alpha.value), math.radians(e.beta.value), math.radians(e.gamma.value)))
+    else:
+        h = segment.DH
+        parent = translation(h.a.value, 0, h.d.value).dot(euler_to_matrix(math.radians(h.alpha.value), 0, 0)).dot(
+            euler_to_matrix(0, 0, math.radians(h.theta.value)))
+
+    axis = 'XYZ'.index(segment.axis)
+    rotation = axis_matrix = move = numpy.identity(4)
+    if segment.jointMode == 'REVOLUTE':
+        angles = [0, 0, 0]
+        angles[axis] = math.radians(segment.theta.value + segment.theta.offset)
+        rotation = euler_to_matrix(*angles)
+        angles[axis] = math.radians(180 * (1 - inverted) / 2)
+        axis_matrix = euler_to_matrix(*angles)
+    if segment.jointMode == 'PRISMATIC':
+        vector = [0, 0, 0]
+        vector[axis] = inverted * (segment.d.value + segment.d.offset)
+        move = translation(*vector)
+    return parent.dot(axis_matrix), move.dot(rotation)
+
+
+def dof(value=0.0, offset=0.0):
+    return SimpleNamespace(value=value, offset=offset, min=-90.0, max=90.0)
+
+
+def random_segment(rng, joint_mode):
+    return SimpleNamespace(
+        parentMode=rng.choice(['EULER', 'DH']), jointMode=joint_mode, axis=rng.choice(['X', 'Y', 'Z']),
+        axis_revert=bool(rng.integers(2)),
+        theta=dof(rng.uniform(-180, 180), rng.uniform(-10, 10)), d=dof(rng.uniform(-1, 1), rng.uniform(-1, 1)),
+        Euler=SimpleNamespace(**{i: dof(rng.uniform(-1, 1)) for i in ('x', 'y', 'z')},
+                              **{i: dof(rng.uniform(-180, 180)) for i in ('alpha', 'beta', 'gamma')}),
+        DH=SimpleNamespace(theta=dof(rng.uniform(-180, 180)), d=dof(rng.uniform(-1, 1)),
+                           alpha=dof(rng.uniform(-180, 180)), a=dof(rng.uniform(-1, 1))))
+
+
+def random_tree(rng, size, joint_modes=('REVOLUTE', 'PRISMATIC', 'FIXED', 'BALL')):
+    """
+    :return: List of (name, parent index, segment) with random parents
+    """
+    return [('segment_%d' % i, int(rng.integers(i)) - 1 if i else -1, random_segment(rng, rng.choice(joint_modes)))
+            for i in range(size)]
+
+
+def reference_frames(segments, base=numpy.identity(4)):
+    frames = []
+    for name, parent, segment in segments:
+        matrix, joint = get_transform(segment)
+        frames.append((frames[parent] if parent >= 0 else base).dot(matrix).dot(joint))
+    return numpy.array(frames)
+
+
+class ForwardKinematics(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        segments = random_tree(rng, 40)
+        tree = kinematics.KinematicTree.from_segments(segments)
+        self.assertEqual(tree.dof_names, [name for name, _, segment in segments
+                                          if segment.jointMode in ('REVOLUTE', 'PRISMATIC')])
+
+        # Current values (a single configuration) and a base transform
+        base = translation(1, 2, 3).dot(euler_to_matrix(0.1, 0.2, 0.3))
+        numpy.testing.assert_allclose(tree.forward(base=base)[0], reference_frames(segments, base), atol=1e-12)
+
+        # Batches larger than a chunk
+        configurations = rng.uniform(-180, 180, (50, len(tree.dofs)))
+        frames = tree.forward(configurations, chunk=16)
+        self.assertEqual(frames.shape, (50, 40, 4, 4))
+        for n in (0, 17, 49):
+            for column, i in enumerate(tree.dofs):
+                segment = segments[i][2]
+                (segment.theta if segment.jointMode == 'REVOLUTE' else segment.d).value = configurations[n, column]
+            numpy.testing.assert_allclose(frames[n], reference_frames(segments), atol=1e-12)
+            numpy.testing.assert_allclose(tree.frame('segment_5', configurations[n]),
+                                          reference_frames(segments)[5:6], atol=1e-12)
+
+        self.assertRaises(ValueError, tree.forward, numpy.zeros((1, len(tree.dofs) + 1)))
+        self.assertRaises(ValueError, kinematics.KinematicTree, ['a', 'b'], [1, -1], numpy.zeros((2, 4, 4)),
+                          ['FIXED'] * 2, ['X'] * 2, [1] * 2, [0] * 2, [0] * 2)
+
+
+class Armature(unittest.TestCase):
+    def runTest(self):
+        def bone(name, parent=None):
+            result = SimpleNamespace(name=name, parent=parent, children=[],
+                                     RobotEditor=random_segment(rng, 'REVOLUTE'))
+            if parent:
+                parent.children.append(result)
+            return result
+
+        rng = numpy.random.default_rng(2)
+        root = bone('root')
+        first = bone('first', root)
+        # Bones are not necessarily ordered like the tree
+        bones = [bone('second', first), first, root, bone('third', root)]
+
+        tree = kinematics.KinematicTree.from_armature(SimpleNamespace(data=SimpleNamespace(bones=bones)))
+        self.assertEqual(tree.names, ['root', 'first', 'second', 'third'])
+        self.assertEqual(list(tree.parents), [-1, 0, 1, 0])
+        self.assertEqual(tree.chain(2), [0, 1, 2])
+        self.assertEqual(list(tree.lower), [-90.0] * 4)
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(3)
+        segments = [('segment_%d' % i, i - 1, random_segment(rng, ('REVOLUTE', 'PRISMATIC')[i % 4 == 3]))
+                    for i in range(BENCHMARK_DOFS)]
+        tree = kinematics.KinematicTree.from_segments(segments)
+        configurations = rng.uniform(-180, 180, (BENCHMARK_CONFIGURATIONS, BENCHMARK_DOFS))
+        out = numpy.empty((BENCHMARK_CONFIGURATIONS, BENCHMARK_DOFS, 4, 4))
+
+        start = time.perf_counter()
+        for _ in range(3):
+            tree.forward(configurations, out=out)
+        seconds = (time.perf_counter() - start) / 3
+
+        start = time.perf_counter()
+        for n in range(1000):
+            reference_frames(segments)
+        per_configuration = (time.perf_counter() - start) / 1000
+
+        sys.stderr.write("%d DoF: %d configurations in %.3f s (%.0f per second), one at a time %.0f per second\n" %
+                         (BENCHMARK_DOFS, BENCHMARK_CONFIGURATIONS, seconds, BENCHMARK_CONFIGURATIONS / seconds,
+                          1 / per_configuration))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmarks of :mod:`robot_designer_plugin.mass_properties` on shapes with analytic mass properties. Runs
+without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_mass_properties.py
+"""
+
+import importlib.util
+import math
+import os
+import sys
+import time
+import unittest
+
+import numpy
+
+spec = importlib.util.spec_from_file_location(
+    'mass_properties', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mass_properties.py'))
+mass_properties = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mass_properties)
+
+BENCHMARK_MESHES = 200
+BENCHMARK_RESOLUTION = 64
+
+
+def rotation(x, y, z):
+    """
+    :return: 3x3 rotation matrix Rz * Ry * Rx
+    """
+    def axis(angle, i):
+        c, s = math.cos(angle), math.sin(angle)
+        j, k = [(1, 2), (2, 0), (0, 1)][i]
+        matrix = numpy.identity(3)
+        matrix[j, j] = matrix[k, k] = c
+        matrix[j, k], matrix[k, j] = -s, s
+        return matrix
+    return axis(z, 2).dot(axis(y, 1)).dot(axis(x, 0))
+
+
+def box(size, center=(0, 0, 0), matrix=numpy.identity(3)):
+    """
+    :return: Vertices, loop totals and loop vertices of a box made of quads
+    """
+    corners = numpy.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)])
+    vertices = (corners * size).dot(matrix.T) + center
+    quads = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    return vertices, [4] * 6, [i for quad in quads for i in quad]
+
+
+def uv_sphere(radius, segments, rings):
+    """
+    :return: Vertices, loop totals and loop vertices of a UV sphere (triangles at the poles, quads otherwise)
+    """
+    vertices = [(0, 0, -radius)]
+    for ring in range(1, rings):
+        polar = math.pi * ring / rings
+        vertices.extend((radius * math.sin(polar) * math.cos(2 * math.pi * i / segments),
+                         radius * math.sin(polar) * math.sin(2 * math.pi * i / segments),
+                         -radius * math.cos(polar)) for i in range(segments))
+    vertices.append((0, 0, radius))
+
+    def index(ring, i):
+        return 1 + (ring - 1) * segments + i % segments
+
+    totals, loops = [], []
+    for i in range(segments):
+        totals.append(3)
+        loops.extend((0, index(1, i + 1), index(1, i)))
+        for ring in range(1, rings - 1):
+            totals.append(4)
+            loops.extend((index(ring, i), index(ring, i + 1), index(ring + 1, i + 1), index(ring + 1, i)))
+        totals.append(3)
+        loops.extend((index(rings - 1, i), index(rings - 1, i + 1), len(vertices) - 1))
+    return numpy.array(vertices), totals, loops
+
+
+def cylinder(radius, height, segments):
+    """
+    :return: Vertices, loop totals and loop vertices of a cylinder with n-gon caps
+    """
+    angles = 2 * math.pi * numpy.arange(segments) / segments
+    ring = numpy.stack([radius * numpy.cos(angles), radius * numpy.sin(angles)], axis=1)
+    vertices = numpy.concatenate([numpy.insert(ring, 2, -height / 2, axis=1),
+                                  numpy.insert(ring, 2, height / 2, axis=1)])
+    totals = [segments, segments] + [4] * segments
+    loops = list(reversed(range(segments))) + list(range(segments, 2 * segments))
+    for i in range(segments):
+        j = (i + 1) % segments
+        loops.extend((i, j, segments + j, segments + i))
+    return vertices, totals, loops
+
+
+def triangles(shape):
+    vertices, totals, loops = shape
+    return vertices, mass_properties.triangulate(totals, loops)
+
+
+class Collection(list):
+    """
+    Stands in for a ``bpy_prop_collection`` with ``foreach_get``.
+    """
+    def __init__(self, items, attribute):
+        super().__init__(items)
+        self.attribute = attribute
+
+    def foreach_get(self, attribute, out):
+        assert attribute == self.attribute
+        out[:] = numpy.ravel(self)
+
+
+class Triangulate(unittest.TestCase):
+    def runTest(self):
+        numpy.testing.assert_array_equal(mass_properties.triangulate([3, 4, 5], range(12)),
+                                         [[0, 1, 2], [3, 4, 5], [3, 5, 6], [7, 8, 9], [7, 9, 10], [7, 10, 11]])
+        self.assertEqual(mass_properties.triangulate([], []).shape, (0, 3))
+
+        vertices, totals, loops = box((1, 2, 3))
+        mesh = type('Mesh', (), {})()
+        mesh.vertices = Collection(vertices, 'co')
+        mesh.loops = Collection(loops, 'vertex_index')
+        mesh.polygons = Collection(totals, 'loop_total')
+        read_vertices, read_triangles = mass_properties.mesh_arrays(mesh)
+        numpy.testing.assert_allclose(read_vertices, vertices)
+        self.assertEqual(read_triangles.shape, (12, 3))
+
+
+class Box(unittest.TestCase):
+    def runTest(self):
+        size, center, matrix = numpy.array([0.1, 0.4, 0.25]), numpy.array([3.0, -2.0, 100.0]), rotation(0.3, -0.7, 1.1)
+        result = mass_properties.mass_properties(*triangles(box(size, center, matrix)), density=2700)
+
+        mass = 2700 * size.prod()
+        x, y, z = size ** 2
+        expected = matrix.dot(numpy.diag([y + z, x + z, x + y]) * mass / 12).dot(matrix.T)
+        self.assertAlmostEqual(result.volume, size.prod(), places=12)
+        self.assertAlmostEqual(result.mass, mass, places=9)
+        numpy.testing.assert_allclose(result.center, center, atol=1e-12)
+        numpy.testing.assert_allclose(result.inertia, expected, atol=1e-12)
+        # The products of inertia of a rotated box do not vanish
+        self.assertGreater(abs(result.inertia[0, 1]), 1e-3)
+        self.assertEqual((result.defects, result.flipped), (0, False))
+        numpy.testing.assert_allclose(mass_properties.inertia_components(result.inertia),
+                                      [expected[i, j] for i, j in ((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2))])
+
+
+class Orientation(unittest.TestCase):
+    def runTest(self):
+        vertices, faces = triangles(box((1, 2, 3)))
+        flipped = mass_properties.mass_properties(vertices, faces[:, ::-1])
+        self.assertTrue(flipped.flipped)
+        self.assertAlmostEqual(flipped.volume, 6.0)
+        numpy.testing.assert_allclose(flipped.inertia, mass_properties.mass_properties(vertices, faces).inertia)
+
+        # An open box and a box with a single inverted face are not manifold
+        self.assertEqual(mass_properties.mass_properties(vertices, faces[:-2]).defects, 4)
+        inverted = faces.copy()
+        inverted[:2] = inverted[:2, ::-1]
+        self.assertEqual(mass_properties.manifold_defects(inverted), 12)
+
+        empty = mass_properties.mass_properties(numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=int))
+        self.assertEqual((empty.volume, empty.mass), (0.0, 0.0))
+
+
+class Sphere(unittest.TestCase):
+    def runTest(self):
+        errors = []
+        for segments in (16, 64, 256):
+            result = mass_properties.mass_properties(*triangles(uv_sphere(0.5, segments, segments // 2)), density=3)
+            volume = 4 / 3 * math.pi * 0.5 ** 3
+            expected = 0.4 * 3 * volume * 0.5 ** 2
+            self.assertEqual(result.defects, 0)
+            numpy.testing.assert_allclose(result.center, 0, atol=1e-12)
+            numpy.testing.assert_allclose(result.inertia - numpy.diag(numpy.diag(result.inertia)), 0, atol=1e-12)
+            errors.append(abs(result.inertia[2, 2] - expected) / expected)
+        # The error of the inscribed polyhedron decreases quadratically with the resolution
+        self.assertLess(errors[2], 1e-3)
+        self.assertLess(errors[2], errors[1] / 10)
+        self.assertLess(errors[1], errors[0] / 10)
+
+
+class Cylinder(unittest.TestCase):
+    def runTest(self):
+        radius, height, segments = 0.2, 1.5, 512
+        result = mass_properties.mass_properties(*triangles(cylinder(radius, height, segments)), density=1000)
+        # The inscribed prism of a regular polygon
+        area = segments / 2 * radius ** 2 * math.sin(2 * math.pi / segments)
+        mass = 1000 * area * height
+        self.assertEqual(result.defects, 0)
+        self.assertAlmostEqual(result.mass, mass, places=9)
+        numpy.testing.assert_allclose(numpy.diag(result.inertia),
+                                      [mass * (3 * radius ** 2 + height ** 2) / 12] * 2 + [mass * radius ** 2 / 2],
+                                      rtol=1e-4)
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        sphere = triangles(uv_sphere(1.0, BENCHMARK_RESOLUTION, BENCHMARK_RESOLUTION // 2))
+        meshes = [(sphere[0] * rng.uniform(0.5, 2, 3) + rng.uniform(-5, 5, 3), sphere[1])
+                  for _ in range(BENCHMARK_MESHES)]
+        count = sum(len(t) for _, t in meshes)
+
+        start = time.perf_counter()
+        results = mass_properties.batch_mass_properties(meshes, rng.uniform(500, 8000, BENCHMARK_MESHES))
+        seconds = time.perf_counter() - start
+        self.assertEqual(len(results), BENCHMARK_MESHES)
+        self.assertTrue(all(i.defects == 0 and i.mass > 0 for i in results))
+
+        # Error of the bounding box estimate for a box rotated by 45 degrees about Z
+        vertices, faces = triangles(box((1, 0.2, 0.2), matrix=rotation(0, 0, math.pi / 4)))
+        exact = mass_properties.mass_properties(vertices, faces)
+        size = vertices.max(axis=0) - vertices.min(axis=0)
+        brick = size.prod() * (size[0] ** 2 + size[1] ** 2) / 12
+
+        sys.stderr.write("%d meshes with %d triangles in %.3f s (%.1f M triangles per second); bounding box estimate "
+                         "of a rotated box: %.1fx mass, %.1fx Izz\n" %
+                         (BENCHMARK_MESHES, count, seconds, count / seconds / 1e6, size.prod() / exact.mass,
+                          brick / exact.inertia[2, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
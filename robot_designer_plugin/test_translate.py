@@ -0,0 +1,155 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests for the Blender-free translation of :mod:`robot_designer_plugin.translate`. Runs without Blender (requires PyXB
+1.2.5 and numpy):
+
+    python3 robot_designer_plugin/test_translate.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import loader
+
+translate = loader.load('translate')
+
+URDF = '''<?xml version="1.0" ?>
+<robot name="arm">
+<link name="base">
+<inertial><origin xyz="0 0 0.1" rpy="0 0 0"/><mass value="2"/>
+<inertia ixx="0.1" ixy="0" ixz="0" iyy="0.2" iyz="0" izz="0.3"/></inertial>
+<visual><origin xyz="0 0 0.2" rpy="0 0 0"/>
+<geometry><mesh filename="package://arm/meshes/base.dae" scale="1 1 2"/></geometry></visual>
+<collision><geometry><mesh filename="package://arm/meshes/base.dae"/></geometry></collision>
+</link>
+<link name="upper"><visual><geometry><mesh filename="package://arm/other/base.dae"/></geometry></visual>
+<collision><geometry><sphere radius="0.1"/></geometry></collision></link>
+<link name="lower"><visual><geometry><mesh filename="package://arm/meshes/missing.dae"/></geometry></visual></link>
+<joint name="shoulder" type="continuous"><origin xyz="0 0 1" rpy="0 0 1.5"/><parent link="base"/>
+<child link="upper"/><axis xyz="0 1 0"/></joint>
+<joint name="elbow" type="planar"><origin xyz="0 0 1" rpy="0 0 0"/><parent link="upper"/><child link="lower"/>
+<axis xyz="1 0 0"/></joint>
+</robot>
+'''
+
+
+class TranslateTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.write(os.path.join('arm', 'meshes', 'base.dae'), 'base')
+        self.write(os.path.join('arm', 'other', 'base.dae'), 'other')
+        self.input = self.write(os.path.join('arm', 'arm.urdf'), URDF)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, *names):
+        return os.path.join(self.directory.name, *names)
+
+    def write(self, name, content):
+        os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+        with open(self.path(name), 'w') as f:
+            f.write(content)
+        return self.path(name)
+
+    def parse(self, file_name):
+        format = os.path.splitext(file_name)[1][1:]
+        return translate.tree_class(format).parse_model(file_name, translate.robot_model().RobotModel())
+
+
+class ResolveURI(TranslateTest):
+    def runTest(self):
+        base = os.path.join(os.sep, 'models', 'arm')
+        self.assertEqual(translate.resolve_uri('model://arm/a.dae', base), os.path.join(base, 'a.dae'))
+        self.assertEqual(translate.resolve_uri('package://arm/a.dae', base), os.path.join(base, 'a.dae'))
+        self.assertEqual(translate.resolve_uri('meshes/a.dae', base), os.path.join(base, 'meshes', 'a.dae'))
+        self.assertEqual(translate.resolve_uri('file:///tmp/a.dae', base), os.path.join(os.sep, 'tmp', 'a.dae'))
+
+
+class URDFToSDF(TranslateTest):
+    def runTest(self):
+        result = translate.translate(self.input, self.path('out', 'robot'), 'sdf')
+        self.assertEqual(result['output_file'], self.path('out', 'robot', 'model.sdf'))
+        self.assertEqual((result['links'], result['joints']), (3, 2))
+        # The shared mesh is placed once per directory, the clashing name is numbered
+        self.assertEqual((result['linked'], result['copied']), (3, 0))
+        self.assertEqual(len(result['warnings']), 2)
+        self.assertIn('elbow', result['warnings'][0])
+        self.assertIn('missing.dae', result['warnings'][1])
+
+        visual = self.path('out', 'robot', 'meshes', 'visual', 'base.dae')
+        self.assertTrue(os.path.samefile(visual, self.path('arm', 'meshes', 'base.dae')))
+        self.assertTrue(os.path.samefile(self.path('out', 'robot', 'meshes', 'visual', 'base_2.dae'),
+                                         self.path('arm', 'other', 'base.dae')))
+        self.assertTrue(os.path.isfile(self.path('out', 'robot', 'meshes', 'collisions', 'base.dae')))
+
+        model = self.parse(result['output_file'])
+        self.assertEqual([i.name for i in model.links], ['base', 'upper', 'lower'])
+        self.assertEqual(model.link('base').visuals[0].uri, 'model://robot/meshes/visual/base.dae')
+        self.assertEqual(model.link('base').visuals[0].size, (1.0, 1.0, 2.0))
+        self.assertEqual(model.link('base').collisions[0].uri, 'model://robot/meshes/collisions/base.dae')
+        self.assertEqual(model.link('upper').visuals[0].uri, 'model://robot/meshes/visual/base_2.dae')
+        self.assertEqual(model.link('lower').visuals[0].uri, 'package://arm/meshes/missing.dae')
+        self.assertEqual(model.link('base').inertial.mass, 2.0)
+        self.assertEqual(model.link('base').inertial.inertia, (0.1, 0.0, 0.0, 0.2, 0.0, 0.3))
+        for i, j in zip(model.link('upper').pose, (0, 0, 1, 0, 0, 1.5)):
+            self.assertAlmostEqual(i, j)
+
+        shoulder = model.joint('shoulder')
+        self.assertEqual((shoulder.type, shoulder.lower, shoulder.upper), ('revolute', -1e16, 1e16))
+        self.assertEqual(shoulder.axis, (0.0, 1.0, 0.0))
+        self.assertEqual(model.joint('elbow').type, 'fixed')
+
+
+class RoundTrip(TranslateTest):
+    def runTest(self):
+        sdf = translate.translate(self.input, self.path('sdf', 'arm'), 'sdf', link=False)
+        self.assertEqual((sdf['linked'], sdf['copied']), (0, 3))
+        urdf = translate.translate(sdf['output_file'], self.path('urdf', 'arm'), 'urdf')
+        self.assertEqual(urdf['output_file'], self.path('urdf', 'arm', 'arm.urdf'))
+
+        original, model = self.parse(self.input), self.parse(urdf['output_file'])
+        self.assertEqual([i.name for i in model.links], [i.name for i in original.links])
+        for first, second in zip(model.links, original.links):
+            for i, j in zip(first.pose, second.pose):
+                self.assertAlmostEqual(i, j)
+        self.assertEqual(model.link('base').visuals[0].uri, 'package://arm/meshes/base.dae')
+        self.assertEqual(model.link('base').collisions[0].uri, 'package://arm/collisions/base.dae')
+        self.assertEqual(model.link('upper').collisions[0].type, 'sphere')
+        # The unlimited revolute joint of SDF is continuous again
+        self.assertEqual([(i.name, i.type, i.lower, i.upper) for i in model.joints],
+                         [('shoulder', 'continuous', 0.0, 0.0), ('elbow', 'fixed', 0.0, 0.0)])
+        self.assertTrue(os.path.isfile(self.path('urdf', 'arm', 'meshes', 'base.dae')))
+        self.assertRaises(ValueError, translate.translate, self.path('arm', 'meshes', 'base.dae'), self.path('x'),
+                          'sdf')
+
+
+if __name__ == '__main__':
+    unittest.main()
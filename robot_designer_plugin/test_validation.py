@@ -0,0 +1,174 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests and benchmark of :mod:`robot_designer_plugin.validation`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_validation.py
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import time
+import unittest
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_mass_properties import rotation
+
+directory = os.path.dirname(os.path.abspath(__file__))
+spec = importlib.util.spec_from_file_location('validation', os.path.join(directory, 'validation.py'))
+validation = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validation)
+spec = importlib.util.spec_from_file_location('robot_model', os.path.join(directory, 'export', 'robot_model.py'))
+robot_model = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(robot_model)
+
+BENCHMARK_LINKS = 10000
+
+
+def tensor(moments, matrix=numpy.identity(3)):
+    return matrix.dot(numpy.diag(moments)).dot(matrix.T)
+
+
+def checks(report):
+    return sorted((i.link, i.check) for i in report.issues)
+
+
+class Validate(unittest.TestCase):
+    def runTest(self):
+        names = ['base', 'good', 'massless', 'indefinite', 'impossible', 'tiny', 'light', 'none']
+        parents = [-1, 0, 1, 1, 1, 1, 0, 0]
+        matrix = rotation(0.3, 0.2, 0.1)
+        masses = [10.0, 2.0, 0.0, 1.0, 1.0, 1.0, 0.01, numpy.nan]
+        inertias = [tensor(m, matrix) for m in ([1, 1, 1], [0.1, 0.2, 0.25], [0.1, 0.1, 0.1], [-0.1, 0.2, 0.2],
+                                                [0.1, 0.1, 0.3], [1e-8, 1e-3, 1e-3], [1e-4, 1e-4, 1e-4], [0, 0, 0])]
+
+        report = validation.validate_inertials(names, parents, masses, inertias)
+        self.assertEqual(checks(report), [('impossible', 'triangle_inequality'), ('indefinite', 'positive_definite'),
+                                          ('light', 'mass_ratio'), ('massless', 'mass'), ('tiny', 'tiny_inertia')])
+        self.assertFalse(report.ok)
+        self.assertEqual(report.failed('mass'), ['massless'])
+        self.assertEqual(len(report.errors), 3)
+        # The mass ratio of the children of a massless link is taken to the closest ancestor with a mass
+        self.assertEqual(report.issues[-1].link, 'light')
+        self.assertAlmostEqual(report.issues[-1].value, 1000)
+
+        data = json.loads(report.to_json())
+        self.assertEqual((data['links'], data['errors'], data['warnings']), (8, 3, 2))
+        self.assertEqual(data['issues'][0]['check'], 'mass')
+        self.assertIn('massless: mass 0 is not positive (error)', str(report))
+
+
+class SinglePrecision(unittest.TestCase):
+    def runTest(self):
+        # Flat plates are on the bound of the triangle inequality, which Blender's float properties round across
+        moments = numpy.array([[0.1, 0.2, 0.3], [0.0013, 0.0027, 0.004]], dtype=numpy.float32)
+        inertias = [tensor(m.astype(numpy.float64)) for m in moments]
+        arguments = (['plate', 'thin'], [-1, 0], [1.0, 1.0], inertias)
+
+        report = validation.validate_inertials(*arguments)
+        self.assertEqual(checks(report), [('plate', 'triangle_inequality'), ('thin', 'triangle_inequality')])
+        report = validation.validate_inertials(*arguments, tolerance=validation.FLOAT32_TOLERANCE)
+        self.assertTrue(report.ok, str(report))
+        self.assertEqual(report.issues, [])
+
+
+class Repair(unittest.TestCase):
+    def runTest(self):
+        matrix = rotation(0.5, -0.4, 1.0)
+        masses = numpy.array([-1.0, 1.0, 1.0])
+        inertias = numpy.array([tensor(m, matrix) for m in ([0.1, 0.2, 0.2], [0.1, 0.1, 0.5], [-1e-3, 1e-8, 0.5])])
+
+        for policy in ('clamp', 'project'):
+            repaired_masses, repaired = validation.repair_inertials(masses, inertias, policy)
+            report = validation.validate_inertials(['a', 'b', 'c'], [-1, -1, -1], repaired_masses, repaired)
+            self.assertTrue(report.ok, str(report))
+            self.assertEqual(report.issues, [])
+            self.assertEqual(repaired_masses[0], 1e-3)
+            # The principal axes are kept
+            for inertia in repaired:
+                numpy.testing.assert_allclose(matrix.T.dot(inertia).dot(matrix),
+                                              numpy.diag(numpy.diag(matrix.T.dot(inertia).dot(matrix))), atol=1e-12)
+
+        _, clamped = validation.repair_inertials(masses, inertias, 'clamp', [1])
+        numpy.testing.assert_allclose(numpy.linalg.eigvalsh(clamped[1]), [0.1, 0.1, 0.2])
+        _, projected = validation.repair_inertials(masses, inertias, 'project', [1])
+        numpy.testing.assert_allclose(numpy.linalg.eigvalsh(projected[1]), [0.2, 0.2, 0.4])
+        numpy.testing.assert_array_equal(projected[0], inertias[0])
+        self.assertRaises(ValueError, validation.repair_inertials, masses, inertias, 'geometry')
+
+
+class Model(unittest.TestCase):
+    def runTest(self):
+        model = robot_model.RobotModel('test')
+        root = model.add_link('root')
+        child = model.add_link('child', parent=root.index)
+        model.add_link('empty', parent=child.index)
+        model.set_inertial(root.index, 5.0, inertia=(1.0, 0.0, 0.0, 1.0, 0.0, 1.0))
+        pose = robot_model.pose([0, 0, 1, 0, 0, 0])
+        model.set_inertial(child.index, 1.0, pose, (0.1, 0.0, 0.0, 0.1, 0.0, 0.5))
+
+        report = validation.validate_model(model)
+        self.assertEqual(checks(report), [('child', 'triangle_inequality')])
+        self.assertIsNone(model.link('empty').inertial)
+
+        report = validation.validate_model(model, 'project')
+        self.assertTrue(report.ok)
+        self.assertEqual(report.repaired, {'child': 'project'})
+        numpy.testing.assert_allclose(model.link('child').inertial.inertia, (0.2, 0, 0, 0.2, 0, 0.4))
+        self.assertEqual(model.link('child').inertial.pose, pose)
+        self.assertEqual(model.link('root').inertial.inertia, (1.0, 0.0, 0.0, 1.0, 0.0, 1.0))
+
+
+class Benchmark(unittest.TestCase):
+    def runTest(self):
+        rng = numpy.random.default_rng(1)
+        names = ['link_%d' % i for i in range(BENCHMARK_LINKS)]
+        parents = [int(rng.integers(i)) - 1 if i else -1 for i in range(BENCHMARK_LINKS)]
+        masses = rng.uniform(0.1, 10, BENCHMARK_LINKS)
+        moments = rng.uniform(0.01, 1, (BENCHMARK_LINKS, 3))
+        inertias = numpy.array([tensor(m, rotation(*rng.uniform(-3, 3, 3))) for m in moments])
+
+        start = time.perf_counter()
+        report = validation.validate_inertials(names, parents, masses, inertias)
+        seconds = time.perf_counter() - start
+        failed = len(report.failed('triangle_inequality'))
+        self.assertGreater(failed, 0)
+
+        start = time.perf_counter()
+        masses, inertias = validation.repair_inertials(masses, inertias, 'project', validation.repairable(report))
+        repair_seconds = time.perf_counter() - start
+        self.assertTrue(validation.validate_inertials(names, parents, masses, inertias).ok)
+
+        sys.stderr.write("%d links validated in %.1f ms (%d failed the triangle inequality), repaired in %.1f ms\n" %
+                         (BENCHMARK_LINKS, seconds * 1000, failed, repair_seconds * 1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
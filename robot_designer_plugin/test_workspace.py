@@ -0,0 +1,169 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Tests of :mod:`robot_designer_plugin.workspace`. Runs without Blender (requires numpy):
+
+    python3 robot_designer_plugin/test_workspace.py
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_kinematics import kinematics, dof
+import loader
+
+workspace = loader.load('workspace')
+
+BENCHMARK_SAMPLES = 200000
+
+
+def segment(joint_mode='FIXED', axis='Z', x=0.0, lower=-180.0, upper=180.0):
+    zero = {i: dof() for i in ('x', 'y', 'z', 'alpha', 'beta', 'gamma')}
+    zero['x'] = dof(x)
+    limits = SimpleNamespace(value=0.0, offset=0.0, min=lower, max=upper)
+    return SimpleNamespace(parentMode='EULER', jointMode=joint_mode, axis=axis, axis_revert=False,
+                           theta=limits, d=limits, Euler=SimpleNamespace(**zero), DH=None)
+
+
+def planar_arm():
+    """
+    Two links of length 1 rotating about Z and a branch that does not move the end effector.
+    """
+    return kinematics.KinematicTree.from_segments([
+        ('base', -1, segment('REVOLUTE')),
+        ('upper', 0, segment('REVOLUTE')),
+        ('lower', 1, segment('REVOLUTE', x=1.0)),
+        ('hand', 2, segment(x=1.0)),
+        ('branch', 0, segment('PRISMATIC', 'X', lower=0.0, upper=1.0)),
+    ])
+
+
+def wrist():
+    """
+    Three revolute joints about X, Y and Z at the same point.
+    """
+    return kinematics.KinematicTree.from_segments([
+        ('base', -1, segment()),
+        ('roll', 0, segment('REVOLUTE', 'X')),
+        ('pitch', 1, segment('REVOLUTE', 'Y')),
+        ('yaw', 2, segment('REVOLUTE', 'Z', x=0.5)),
+    ])
+
+
+class PlanarArm(unittest.TestCase):
+    def runTest(self):
+        tree = planar_arm()
+        # The joint of the root segment and the branch are not sampled
+        self.assertEqual(workspace.sampled_dofs(tree, tree.names.index('hand')), [1, 2])
+
+        result = workspace.reachability_map(tree, 'hand', 20000, 0.1, manipulability=True, chunk_size=3000, seed=1)
+        self.assertEqual(result.dof_names, ['upper', 'lower'])
+        self.assertEqual(result.samples, 20000)
+        self.assertEqual(int(result.counts.sum()), 20000)
+        self.assertEqual(len(result), len(numpy.unique(result.indices, axis=0)))
+
+        centers = result.centers()
+        self.assertTrue(numpy.all(numpy.linalg.norm(centers[:, :2], axis=1) <= 2 + math.sqrt(2) * 0.05))
+        self.assertTrue(numpy.all(result.indices[:, 2] == 0))
+        self.assertGreater(len(result), math.pi * 2 ** 2 / 0.1 ** 2 * 0.8)
+        # Two parallel axes cannot rotate the hand about X or Y
+        numpy.testing.assert_allclose(result.manipulability, 0.0, atol=1e-6)
+
+        # A base transform moves the map
+        base = kinematics.translation_matrix((0, 0, 1.05))
+        moved = workspace.reachability_map(tree, 'hand', 1000, 0.1, base=base, seed=1)
+        self.assertTrue(numpy.all(moved.indices[:, 2] == 10))
+
+
+class Wrist(unittest.TestCase):
+    def runTest(self):
+        tree = wrist()
+        result = workspace.reachability_map(tree, 'yaw', 5000, 0.05, manipulability=True, seed=2)
+        self.assertTrue(numpy.all(numpy.linalg.norm(result.centers(), axis=1) <= 0.5 + math.sqrt(3) * 0.025))
+
+        # sqrt(det(Jw Jw^T)) = |cos(pitch)| for roll, pitch and yaw axes
+        configurations = numpy.array([[0, 0, 0], [10, 60, 20], [0, 90, 0]], dtype=float)
+        frames = tree.forward(configurations)
+        numpy.testing.assert_allclose(workspace.orientation_manipulability(tree, frames, [0, 1, 2]),
+                                      [1.0, 0.5, 0.0], atol=1e-6)
+        self.assertTrue(numpy.all(result.manipulability <= 1.0 + 1e-9))
+        self.assertGreater(result.manipulability.max(), 0.9)
+
+        # Unlimited joints cannot be sampled
+        tree.upper[2] = numpy.inf
+        self.assertRaises(ValueError, workspace.reachability_map, tree, 'yaw', 100, 0.05)
+
+
+class SaveLoad(unittest.TestCase):
+    def runTest(self):
+        result = workspace.reachability_map(planar_arm(), 'hand', 2000, 0.2, manipulability=True, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'map.npz')
+            result.save(file_name)
+            loaded = workspace.ReachabilityMap.load(file_name)
+
+            plain = workspace.reachability_map(planar_arm(), 'hand', 100, 0.2, seed=3)
+            plain.save(file_name)
+            self.assertIsNone(workspace.ReachabilityMap.load(file_name).manipulability)
+
+        self.assertEqual((loaded.voxel_size, loaded.samples, loaded.end_effector, loaded.dof_names),
+                         (0.2, 2000, 'hand', ['upper', 'lower']))
+        numpy.testing.assert_array_equal(loaded.indices, result.indices)
+        numpy.testing.assert_array_equal(loaded.counts, result.counts)
+        numpy.testing.assert_array_equal(loaded.manipulability, result.manipulability)
+
+
+class Parallel(unittest.TestCase):
+    def runTest(self):
+        tree = planar_arm()
+        serial = workspace.reachability_map(tree, 'hand', BENCHMARK_SAMPLES, 0.05, True, chunk_size=20000, seed=4)
+        start = time.perf_counter()
+        serial = workspace.reachability_map(tree, 'hand', BENCHMARK_SAMPLES, 0.05, True, chunk_size=20000, seed=4)
+        serial_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        parallel = workspace.reachability_map(tree, 'hand', BENCHMARK_SAMPLES, 0.05, True, processes=4,
+                                              chunk_size=20000, seed=4)
+        parallel_seconds = time.perf_counter() - start
+
+        # The chunks have their own random generators, hence the result does not depend on the processes
+        numpy.testing.assert_array_equal(parallel.indices, serial.indices)
+        numpy.testing.assert_array_equal(parallel.counts, serial.counts)
+        numpy.testing.assert_array_equal(parallel.manipulability, serial.manipulability)
+
+        sys.stderr.write("%d samples: %.3f s serial, %.3f s with 4 processes, %d voxels\n" %
+                         (BENCHMARK_SAMPLES, serial_seconds, parallel_seconds, len(serial)))
+
+
+if __name__ == '__main__':
+    unittest.main()
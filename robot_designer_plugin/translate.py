@@ -0,0 +1,274 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Direct translation between SDF and URDF without Blender (requires PyXB 1.2.5 and numpy).
+
+The input is parsed into the intermediate :class:`robot_designer_plugin.export.robot_model.RobotModel` which is
+written with the tree of the target format. Mesh files are hard-linked (or copied if that is not possible) into the
+layout of the exporters instead of being imported and exported again:
+
+* SDF: ``<output>/model.sdf`` with meshes in ``<output>/meshes/visual`` and ``<output>/meshes/collisions``
+  (``model://`` URIs)
+* URDF: ``<output>/<output name>.urdf`` with meshes in ``<output>/meshes`` and ``<output>/collisions``
+  (``package://`` URIs)
+
+Joint types without counterpart in the target format are replaced by fixed joints and reported as warnings. The
+command line interface is ``robot_designer_plugin/batch.py --direct``.
+"""
+
+import os
+import shutil
+import time
+
+from . import loader
+
+FORMATS = ('sdf', 'urdf')
+"""
+Supported model formats.
+"""
+
+JOINT_TYPES = {
+    'sdf': {'revolute', 'revolute2', 'prismatic', 'ball', 'universal', 'screw', 'gearbox', 'fixed'},
+    'urdf': {'revolute', 'continuous', 'prismatic', 'fixed', 'floating', 'planar'},
+}
+"""
+Joint types of the formats.
+"""
+
+UNLIMITED = 1e16
+"""
+Joint limit used by SDF for unlimited joints (continuous URDF joints).
+"""
+
+
+def export_module(name):
+    """
+    Imports a Blender-free module or package of the ``export`` directory (see
+    :func:`robot_designer_plugin.loader.load`).
+
+    :param name: Name relative to the ``export`` package (e.g., ``'sdf.generic'``)
+    :return: The module
+    """
+    return loader.load('export.' + name, __package__)
+
+
+def robot_model():
+    """
+    :return: The :mod:`robot_designer_plugin.export.robot_model` module
+    """
+    return export_module('robot_model')
+
+
+def tree_class(format):
+    """
+    :param format: ``'sdf'`` or ``'urdf'``
+    :return: :class:`SDFTree` or :class:`URDFTree`
+    """
+    if format == 'sdf':
+        return export_module('sdf.generic').sdf_tree.SDFTree
+    return export_module('urdf.generic').urdf_tree.URDFTree
+
+
+def resolve_uri(uri, base_dir):
+    """
+    Resolves the URI of a mesh (or muscle) file like the importers: ``model://`` and ``package://`` URIs are relative
+    to the parent of the directory of the model file.
+
+    :param uri: The URI
+    :param base_dir: Directory of the model file
+    :return: The file name
+    """
+    for prefix in ('model://', 'package://'):
+        if uri.startswith(prefix):
+            return os.path.normpath(os.path.join(os.path.dirname(base_dir), uri[len(prefix):]))
+    if uri.startswith('file://'):
+        uri = uri[len('file://'):]
+    return os.path.normpath(os.path.join(base_dir, uri))
+
+
+def link_or_copy(source, target):
+    """
+    Hard-links a file or copies it if links are not supported (e.g., across file systems).
+
+    :return: ``'linked'`` or ``'copied'``
+    """
+    if os.path.lexists(target):
+        if os.path.exists(target) and os.path.samefile(source, target):
+            return 'linked'
+        os.remove(target)
+    try:
+        os.link(source, target)
+        return 'linked'
+    except OSError:
+        shutil.copy2(source, target)
+        return 'copied'
+
+
+class _Files(object):
+    """
+    Places the referenced files of a model in the output directory. Every source file is transferred once per target
+    directory, files with clashing names are numbered.
+    """
+
+    def __init__(self, base_dir, output_dir, scheme, link):
+        self.base_dir = base_dir
+        self.output_dir = output_dir
+        self.scheme = scheme
+        self.link = link
+        self.targets = {}
+        self.used = set()
+        self.counts = {'linked': 0, 'copied': 0}
+        self.warnings = []
+
+    def place(self, uri, directory, name=None):
+        """
+        :param uri: URI in the input model
+        :param directory: Target directory relative to the output directory
+        :param name: Target file name (defaults to the source name)
+        :return: The URI in the output model (unchanged if the file does not exist)
+        """
+        source = resolve_uri(uri, self.base_dir)
+        if not os.path.isfile(source):
+            self.warnings.append("Missing file %s (%s)" % (uri, source))
+            return uri
+
+        key = (source, directory)
+        if key not in self.targets:
+            stem, extension = os.path.splitext(name or os.path.basename(source))
+            target, number = os.path.join(directory, stem + extension), 1
+            while target in self.used:
+                number += 1
+                target = os.path.join(directory, '%s_%d%s' % (stem, number, extension))
+            self.used.add(target)
+
+            os.makedirs(os.path.join(self.output_dir, directory), exist_ok=True)
+            if self.link:
+                self.counts[link_or_copy(source, os.path.join(self.output_dir, target))] += 1
+            else:
+                shutil.copy2(source, os.path.join(self.output_dir, target))
+                self.counts['copied'] += 1
+            self.targets[key] = target
+        return '%s%s/%s' % (self.scheme, os.path.basename(self.output_dir), self.targets[key].replace(os.sep, '/'))
+
+
+def convert_joints(model, target):
+    """
+    Replaces the joint types that do not exist in the target format. Continuous joints become unlimited revolute
+    joints in SDF and vice versa.
+
+    :return: List of warnings
+    """
+    warnings = []
+    for joint in model.joints:
+        if joint.type == 'continuous' and target == 'sdf':
+            joint.type, joint.lower, joint.upper = 'revolute', -UNLIMITED, UNLIMITED
+        elif joint.type == 'revolute' and target == 'urdf' and -joint.lower >= UNLIMITED and joint.upper >= UNLIMITED:
+            joint.type, joint.lower, joint.upper = 'continuous', 0.0, 0.0
+        elif joint.type not in JOINT_TYPES[target]:
+            warnings.append("Joint %s: %s joints are not supported by %s, replaced by a fixed joint" %
+                            (joint.name, joint.type, target.upper()))
+            joint.type = 'fixed'
+    return warnings
+
+
+def output_file(output_dir, target):
+    """
+    :return: Name of the robot description written by :func:`translate` (as the export operators name it)
+    """
+    if target == 'sdf':
+        return os.path.join(output_dir, 'model.sdf')
+    return os.path.join(output_dir, os.path.basename(output_dir) + '.urdf')
+
+
+def translate(input_file, output_dir, target, link=True):
+    """
+    Translates a SDF or URDF file.
+
+    :param input_file: The ``.sdf`` or ``.urdf`` file
+    :param output_dir: Directory the model is written to
+    :param target: Target format (``'sdf'`` or ``'urdf'``)
+    :param link: Hard-link the mesh files (copy them otherwise)
+    :return: Dictionary with the output file, the number of links and joints, the linked and copied files and
+        the warnings
+    :raises ValueError: if a format is not supported
+    """
+    source = os.path.splitext(input_file)[1][1:].lower()
+    if source not in FORMATS or target not in FORMATS:
+        raise ValueError("Unsupported translation: %s to %s" % (source or input_file, target))
+
+    output_dir = os.path.abspath(output_dir)
+    model = tree_class(source).parse_model(input_file, robot_model().RobotModel())
+    warnings = convert_joints(model, target)
+
+    files = _Files(os.path.dirname(os.path.abspath(input_file)), output_dir,
+                   'model://' if target == 'sdf' else 'package://', link)
+    visual_dir, collision_dir = (os.path.join('meshes', 'visual'), os.path.join('meshes', 'collisions')) \
+        if target == 'sdf' else ('meshes', 'collisions')
+    for model_link in model.links:
+        for geometry in model_link.visuals:
+            if geometry.type == 'mesh':
+                geometry.uri = files.place(geometry.uri, visual_dir)
+        for geometry in model_link.collisions:
+            if geometry.type == 'mesh':
+                geometry.uri = files.place(geometry.uri, collision_dir)
+
+    if model.muscles or model.muscle_uri:
+        if target == 'sdf' and model.muscle_uri:
+            model.muscle_uri = files.place(model.muscle_uri, '', 'muscles.osim')
+        elif target == 'sdf':
+            warnings.append("Muscles without an OpenSim file cannot be translated and have been dropped")
+        else:
+            warnings.append("Muscles are not supported by URDF and have been dropped")
+            model.muscle_uri = ''
+
+    file_name = output_file(output_dir, target)
+    tree_class(target).from_model(model).write(file_name)
+    return {
+        'output_file': file_name,
+        'links': len(model.links),
+        'joints': len(model.joints),
+        'linked': files.counts['linked'],
+        'copied': files.counts['copied'],
+        'warnings': warnings + files.warnings,
+    }
+
+
+def translate_job(job, target, link=True):
+    """
+    Translates a file for :func:`robot_designer_plugin.batch.convert` and reports errors in the result.
+
+    :param job: Dictionary with the keys ``input`` and ``output``
+    :return: Result dictionary (see :func:`robot_designer_plugin.batch.convert_file`)
+    """
+    result = {'input': job['input'], 'output': job['output'], 'status': 'failed'}
+    start = time.perf_counter()
+    try:
+        result.update(translate(job['input'], job['output'], target, link))
+        result['status'] = 'ok'
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    result['seconds'] = time.perf_counter() - start
+    return result
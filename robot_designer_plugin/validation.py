@@ -0,0 +1,290 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Validation and repair of the inertial parameters of a :term:`robot model` before it is exported (requires numpy, but
+not Blender).
+
+All links are checked at once with a single batched eigendecomposition of the inertia tensors:
+
+* ``mass``: the mass is not positive (error)
+* ``positive_definite``: the inertia tensor has a non-positive principal moment (error)
+* ``triangle_inequality``: a principal moment exceeds the sum of the other two, i.e., no rigid body has this inertia
+  (error)
+* ``tiny_inertia``: a principal moment is below ``min_inertia``, which destabilizes physics engines (warning)
+* ``mass_ratio``: the masses of a link and of its closest ancestor with a mass differ by more than
+  ``max_mass_ratio`` (warning)
+
+The repair policies change the mass and principal moments of the failing links and keep their principal axes:
+
+* ``'clamp'``: clamps the mass to ``min_mass``, the principal moments to ``min_inertia`` and the largest principal
+  moment to the sum of the others
+* ``'project'``: clamps the mass and the principal moments like ``'clamp'`` but projects the principal moments onto
+  the triangle inequality (the closest valid moments in the least-squares sense)
+
+Recomputing the inertia from the geometry requires Blender (see
+:func:`robot_designer_plugin.operators.dynamics.check_inertials`). Mass ratios are only reported.
+"""
+
+import json
+import time
+from collections import namedtuple
+
+import numpy
+
+POLICIES = ('none', 'clamp', 'project', 'geometry')
+"""
+Repair policies (``'geometry'`` is applied in Blender).
+"""
+
+ERRORS = ('mass', 'positive_definite', 'triangle_inequality')
+"""
+Checks whose failures prevent an export.
+"""
+
+FLOAT32_TOLERANCE = 1e-6
+"""
+Relative tolerance for inertials read from Blender properties, which are stored in single precision (a flat plate with
+moments 0.1, 0.2 and 0.3 violates the triangle inequality by 2.5e-8 once rounded).
+"""
+
+InertialIssue = namedtuple('InertialIssue', 'link check severity value message')
+"""
+A failed check of a link: the link name, the check, ``'error'`` or ``'warning'``, the offending value and a message.
+"""
+
+
+class InertialReport(object):
+    """
+    Structured result of :func:`validate_inertials`.
+
+    :param names: Names of the validated links
+    :param issues: List of :class:`InertialIssue`
+    :param repaired: Dictionary from the names of repaired links to the applied policy
+    :param seconds: Duration of the validation
+    """
+
+    def __init__(self, names, issues, repaired=None, seconds=0.0):
+        self.names = list(names)
+        self.issues = issues
+        self.repaired = dict(repaired or {})
+        self.seconds = seconds
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.severity == 'error']
+
+    @property
+    def warnings(self):
+        return [i for i in self.issues if i.severity == 'warning']
+
+    @property
+    def ok(self):
+        """
+        True if no check failed with an error.
+        """
+        return not self.errors
+
+    def failed(self, check=None):
+        """
+        :param check: Name of a check (all checks if None)
+        :return: Names of the links that failed the check
+        """
+        return sorted({i.link for i in self.issues if check is None or i.check == check})
+
+    def as_dict(self):
+        return {
+            'links': len(self.names),
+            'ok': self.ok,
+            'errors': len(self.errors),
+            'warnings': len(self.warnings),
+            'issues': [i._asdict() for i in self.issues],
+            'repaired': self.repaired,
+            'seconds': self.seconds,
+        }
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=2)
+
+    def __str__(self):
+        lines = ["Validated the inertials of %d links in %.1f ms: %d errors, %d warnings, %d repaired" %
+                 (len(self.names), self.seconds * 1000, len(self.errors), len(self.warnings), len(self.repaired))]
+        lines.extend("%s: %s (%s)" % (i.link, i.message, i.severity) for i in self.issues)
+        return '\n'.join(lines)
+
+
+def inertia_matrices(components):
+    """
+    :param components: Array (N, 6) of ``(ixx, ixy, ixz, iyy, iyz, izz)``
+    :return: Array (N, 3, 3) of the symmetric inertia tensors
+    """
+    components = numpy.asarray(components, dtype=numpy.float64).reshape(-1, 6)
+    xx, xy, xz, yy, yz, zz = components.T
+    return numpy.stack([numpy.stack([xx, xy, xz], axis=-1),
+                        numpy.stack([xy, yy, yz], axis=-1),
+                        numpy.stack([xz, yz, zz], axis=-1)], axis=1)
+
+
+def inertia_components(inertias):
+    """
+    :param inertias: Array (N, 3, 3)
+    :return: Array (N, 6) of ``(ixx, ixy, ixz, iyy, iyz, izz)``
+    """
+    inertias = numpy.asarray(inertias)
+    return inertias[:, [0, 0, 0, 1, 1, 2], [0, 1, 2, 1, 2, 2]]
+
+
+def _mass_parents(parents, masses):
+    """
+    :return: Index of the closest ancestor with a positive mass of every link (-1 if there is none)
+    """
+    result = numpy.full(len(parents), -1, dtype=numpy.intp)
+    for index, parent in enumerate(parents):
+        if parent >= 0:
+            result[index] = parent if masses[parent] > 0 else result[parent]
+    return result
+
+
+def validate_inertials(names, parents, masses, inertias, max_mass_ratio=100.0, min_inertia=1e-6, tolerance=1e-9):
+    """
+    Checks the inertial parameters of all links at once.
+
+    :param names: Names of the links
+    :param parents: Index of the parent of every link (-1 for roots, parents precede their children)
+    :param masses: Array (N,) of the masses (NaN for links without inertial, which are not checked)
+    :param inertias: Array (N, 3, 3) of the inertia tensors (see :func:`inertia_matrices`)
+    :param max_mass_ratio: Largest accepted ratio between the masses of adjacent links
+    :param min_inertia: Smallest accepted principal moment
+    :param tolerance: Relative tolerance of the triangle inequality and of the smallest principal moment (the default
+        suits double precision input, use :data:`FLOAT32_TOLERANCE` for values read from Blender)
+    :return: :class:`InertialReport`
+    """
+    start = time.perf_counter()
+    masses = numpy.asarray(masses, dtype=numpy.float64)
+    inertias = numpy.asarray(inertias, dtype=numpy.float64).reshape(-1, 3, 3)
+    present = ~numpy.isnan(masses)
+    moments = numpy.linalg.eigvalsh(inertias) if len(inertias) else numpy.zeros((0, 3))
+    scale = numpy.maximum(numpy.abs(moments).max(axis=1, initial=0.0), numpy.finfo(float).tiny)
+
+    failures = [
+        ('mass', 'error', present & ~(masses > 0), masses, "mass %g is not positive"),
+        ('positive_definite', 'error', present & (moments[:, 0] <= 0), moments[:, 0],
+         "inertia tensor is not positive definite (smallest principal moment %g)"),
+        # Moments are sorted, hence only the largest can exceed the sum of the others
+        ('triangle_inequality', 'error', present & (moments[:, 0] > 0) &
+         (moments[:, 2] - moments[:, 1] - moments[:, 0] > tolerance * scale), moments[:, 2],
+         "largest principal moment %g exceeds the sum of the others"),
+        ('tiny_inertia', 'warning', present & (moments[:, 0] > 0) & (moments[:, 0] < min_inertia * (1 - tolerance)),
+         moments[:, 0],
+         "smallest principal moment %%g is below %g" % min_inertia),
+    ]
+
+    mass_parents = _mass_parents(parents, numpy.where(present, masses, 0.0))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        has_parent = (mass_parents >= 0) & present & (masses > 0)
+        ratios = numpy.where(has_parent, masses / masses[mass_parents], 1.0)
+        ratios = numpy.maximum(ratios, 1 / ratios)
+    failures.append(('mass_ratio', 'warning', has_parent & (ratios > max_mass_ratio), ratios,
+                     "mass differs from the parent by a factor of %%.4g (more than %g)" % max_mass_ratio))
+
+    issues = []
+    for check, severity, failed, values, message in failures:
+        for index in numpy.flatnonzero(failed):
+            issues.append(InertialIssue(names[index], check, severity, float(values[index]),
+                                        message % values[index]))
+    order = {name: index for index, name in enumerate(names)}
+    issues.sort(key=lambda i: (order[i.link], ERRORS.index(i.check) if i.check in ERRORS else len(ERRORS)))
+    return InertialReport(names, issues, seconds=time.perf_counter() - start)
+
+
+def repair_inertials(masses, inertias, policy, indices=None, min_mass=1e-3, min_inertia=1e-6):
+    """
+    Repairs the mass and principal moments of links with the ``'clamp'`` or ``'project'`` policy.
+
+    :param masses: Array (N,) of the masses
+    :param inertias: Array (N, 3, 3) of the inertia tensors
+    :param policy: ``'clamp'`` or ``'project'``
+    :param indices: Links to repair (all if None)
+    :return: Tuple of the repaired masses and inertia tensors (copies)
+    :raises ValueError: for other policies
+    """
+    if policy not in ('clamp', 'project'):
+        raise ValueError("Unsupported repair policy: %s" % policy)
+    masses = numpy.array(masses, dtype=numpy.float64)
+    inertias = numpy.array(inertias, dtype=numpy.float64).reshape(-1, 3, 3)
+    indices = numpy.arange(len(masses)) if indices is None else numpy.asarray(indices, dtype=numpy.intp)
+    if not len(indices):
+        return masses, inertias
+
+    masses[indices] = numpy.maximum(numpy.nan_to_num(masses[indices]), min_mass)
+    moments, axes = numpy.linalg.eigh(inertias[indices])
+    moments = numpy.maximum(moments, min_inertia)
+    # The moments are sorted, only the largest can violate the triangle inequality
+    excess = numpy.maximum(moments[:, 2] - moments[:, 1] - moments[:, 0], 0.0)
+    if policy == 'clamp':
+        moments[:, 2] -= excess
+    else:
+        # Moves the moments perpendicularly onto the plane m2 = m0 + m1
+        moments += excess[:, numpy.newaxis] / 3 * numpy.array([1.0, 1.0, -1.0])
+    inertias[indices] = numpy.matmul(axes * moments[:, numpy.newaxis], axes.swapaxes(1, 2))
+    return masses, inertias
+
+
+def repairable(report):
+    """
+    :return: Sorted indices of the links of a report that a policy can repair (all failures except mass ratios)
+    """
+    order = {name: index for index, name in enumerate(report.names)}
+    return sorted({order[i.link] for i in report.issues if i.check != 'mass_ratio'})
+
+
+def validate_model(model, policy='none', min_mass=1e-3, **thresholds):
+    """
+    Validates (and repairs) the inertials of a :class:`robot_designer_plugin.export.robot_model.RobotModel`.
+
+    :param policy: ``'none'``, ``'clamp'`` or ``'project'`` (repaired inertials are replaced in the model)
+    :param min_mass: Smallest mass of repaired links
+    :param thresholds: Keyword arguments of :func:`validate_inertials`
+    :return: :class:`InertialReport` after the repair
+    """
+    names = [link.name for link in model.links]
+    parents = [link.parent for link in model.links]
+    masses = numpy.array([link.inertial.mass if link.inertial else numpy.nan for link in model.links])
+    inertias = inertia_matrices([link.inertial.inertia if link.inertial else (0.0,) * 6 for link in model.links])
+
+    report = validate_inertials(names, parents, masses, inertias, **thresholds)
+    failed = repairable(report)
+    if policy == 'none' or not failed:
+        return report
+
+    masses, inertias = repair_inertials(masses, inertias, policy, failed, min_mass,
+                                        thresholds.get('min_inertia', 1e-6))
+    for index, components in zip(failed, inertia_components(inertias[failed])):
+        link = model.links[index]
+        model.set_inertial(index, float(masses[index]), link.inertial.pose, tuple(float(i) for i in components))
+    repaired = validate_inertials(names, parents, masses, inertias, **thresholds)
+    repaired.repaired = {names[i]: policy for i in failed}
+    repaired.seconds += report.seconds
+    return repaired
@@ -0,0 +1,222 @@
+# #####
+# This file is part of the RobotDesigner of the Neurorobotics subproject (SP10)
+# in the Human Brain Project (HBP).
+# It has been forked from the RobotEditor (https://gitlab.com/h2t/roboteditor)
+# developed at the Karlsruhe Institute of Technology in the
+# High Performance Humanoid Technologies Laboratory (H2T).
+# #####
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+"""
+Workspace (reachability) maps of a :term:`segment` computed with the vectorized forward kinematics of
+:class:`robot_designer_plugin.kinematics.KinematicTree` (requires numpy, but not Blender).
+
+The joints between the root and the end effector are sampled uniformly within their limits (the joints of root
+segments and of other branches keep their current values). The positions of the end effector are binned into cubic
+voxels that count the samples reaching them. Optionally, the orientation manipulability ``sqrt(det(Jw Jw^T))`` of the
+angular part ``Jw`` of the geometric Jacobian (per radian) is computed and the maximum of each voxel is kept.
+
+The samples are split into chunks that are spread across a pool of worker processes (see
+:func:`robot_designer_plugin.pool.map_jobs`). Every chunk has its own random
+generator derived from the seed, hence the map does not depend on the number of processes.
+"""
+
+import numpy
+
+from .pool import map_jobs
+
+
+class ReachabilityMap(object):
+    """
+    Sparse voxel map of the positions reached by an end effector.
+
+    :param voxel_size: Edge length of the voxels
+    :param indices: Integer array (voxels, 3) of the voxel coordinates (the voxel ``i`` spans
+        ``indices[i] * voxel_size`` to ``(indices[i] + 1) * voxel_size``)
+    :param counts: Number of samples in every voxel
+    :param manipulability: Maximal orientation manipulability in every voxel (or None)
+    :param samples: Total number of samples
+    :param end_effector: Name of the end effector segment
+    :param dof_names: Names of the sampled joints (segments)
+    """
+
+    def __init__(self, voxel_size, indices, counts, manipulability=None, samples=0, end_effector='',
+                 dof_names=()):
+        self.voxel_size = voxel_size
+        self.indices = indices
+        self.counts = counts
+        self.manipulability = manipulability
+        self.samples = samples
+        self.end_effector = end_effector
+        self.dof_names = list(dof_names)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def centers(self):
+        """
+        :return: Array (voxels, 3) of the voxel centers
+        """
+        return (self.indices + 0.5) * self.voxel_size
+
+    def save(self, file_name):
+        """
+        Writes the map to a compressed ``.npz`` file.
+        """
+        arrays = {'voxel_size': self.voxel_size, 'indices': self.indices, 'counts': self.counts,
+                  'samples': self.samples, 'end_effector': self.end_effector,
+                  'dof_names': numpy.array(self.dof_names, dtype=str)}
+        if self.manipulability is not None:
+            arrays['manipulability'] = self.manipulability
+        numpy.savez_compressed(file_name, **arrays)
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Reads a map written by :meth:`save`.
+
+        :return: :class:`ReachabilityMap`
+        """
+        with numpy.load(file_name) as data:
+            return cls(float(data['voxel_size']), data['indices'], data['counts'],
+                       data['manipulability'] if 'manipulability' in data else None, int(data['samples']),
+                       str(data['end_effector']), [str(i) for i in data['dof_names']])
+
+
+def sampled_dofs(tree, end_effector):
+    """
+    :param tree: :class:`robot_designer_plugin.kinematics.KinematicTree`
+    :param end_effector: Index of the end effector segment
+    :return: Columns of the joint configurations (see :attr:`KinematicTree.dofs`) that move the end effector
+    """
+    chain = set(tree.chain(end_effector))
+    return [column for column, segment in enumerate(tree.dofs) if segment in chain and tree.parents[segment] >= 0]
+
+
+def sample_configurations(tree, columns, count, rng):
+    """
+    Samples joint configurations uniformly within the joint limits.
+
+    :param tree: :class:`robot_designer_plugin.kinematics.KinematicTree`
+    :param columns: Sampled columns (see :func:`sampled_dofs`), the others keep their current values
+    :param count: Number of configurations
+    :param rng: :class:`numpy.random.Generator`
+    :return: Array (count, dofs)
+    :raises ValueError: if a sampled joint is not limited
+    """
+    segments = [tree.dofs[i] for i in columns]
+    lower, upper = tree.lower[segments], tree.upper[segments]
+    if not numpy.all(numpy.isfinite(lower) & numpy.isfinite(upper)):
+        raise ValueError("Sampled joints have to be limited")
+    configurations = tree.configurations(count)
+    configurations[:, columns] = rng.uniform(lower, upper, (count, len(columns)))
+    return configurations
+
+
+def orientation_manipulability(tree, frames, columns):
+    """
+    :param tree: :class:`robot_designer_plugin.kinematics.KinematicTree`
+    :param frames: Array (N, segments, 4, 4) of :meth:`KinematicTree.forward`
+    :param columns: Columns of the joints of the end effector's chain
+    :return: Array (N,) with ``sqrt(det(Jw Jw^T))`` of the angular Jacobians ``Jw``
+    """
+    # The rotation axis of a revolute joint is the axis of its segment frame, prismatic joints do not rotate
+    segments = [tree.dofs[i] for i in columns if tree.joint_modes[tree.dofs[i]] == 'REVOLUTE']
+    jacobian = numpy.stack([frames[:, i, :3, tree.axes[i]] for i in segments], axis=2) if segments else \
+        numpy.zeros((len(frames), 3, 1))
+    return numpy.sqrt(numpy.maximum(numpy.linalg.det(numpy.matmul(jacobian, jacobian.transpose(0, 2, 1))), 0.0))
+
+
+def _bin(indices, counts, scores):
+    """
+    Merges duplicate voxels (summing the counts and keeping the maximal scores).
+    """
+    indices, inverse = numpy.unique(indices, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    counts = numpy.bincount(inverse, weights=counts, minlength=len(indices)).astype(numpy.int64)
+    if scores is not None:
+        maxima = numpy.zeros(len(indices))
+        numpy.maximum.at(maxima, inverse, scores)
+        scores = maxima
+    return indices, counts, scores
+
+
+def sample_chunk(tree, end_effector, columns, count, seed, voxel_size, manipulability=False, base=None):
+    """
+    Samples a chunk of configurations and bins the end effector positions.
+
+    :param seed: Seed (or :class:`numpy.random.SeedSequence`) of the chunk
+    :return: Tuple of the voxel indices, counts and scores (or None)
+    """
+    configurations = sample_configurations(tree, columns, count, numpy.random.default_rng(seed))
+    frames = tree.forward(configurations, base)
+    indices = numpy.floor(frames[:, end_effector, :3, 3] / voxel_size).astype(numpy.int32)
+    scores = orientation_manipulability(tree, frames, columns) if manipulability else None
+    return _bin(indices, numpy.ones(count), scores)
+
+
+_worker_arguments = None
+
+
+def _initialize_worker(*arguments):
+    global _worker_arguments
+    _worker_arguments = arguments
+
+
+def _sample_worker(job):
+    tree, end_effector, columns, voxel_size, manipulability, base = _worker_arguments
+    count, seed = job
+    return sample_chunk(tree, end_effector, columns, count, seed, voxel_size, manipulability, base)
+
+
+def reachability_map(tree, end_effector, samples, voxel_size, manipulability=False, processes=1, chunk_size=10000,
+                     seed=None, base=None):
+    """
+    Computes the reachability map of a segment.
+
+    :param tree: :class:`robot_designer_plugin.kinematics.KinematicTree`
+    :param end_effector: Name of the end effector segment
+    :param samples: Number of sampled configurations
+    :param voxel_size: Edge length of the voxels
+    :param manipulability: Compute the orientation manipulability of the voxels
+    :param processes: Number of worker processes
+    :param chunk_size: Number of configurations per chunk
+    :param seed: Seed of the random generator
+    :param base: Optional 4x4 transform of the model (the map is relative to the model frame otherwise)
+    :return: :class:`ReachabilityMap`
+    :raises ValueError: if a sampled joint is not limited
+    """
+    index = tree.names.index(end_effector)
+    columns = sampled_dofs(tree, index)
+    counts = [chunk_size] * (samples // chunk_size) + ([samples % chunk_size] if samples % chunk_size else [])
+    jobs = list(zip(counts, numpy.random.SeedSequence(seed).spawn(len(counts))))
+    arguments = (tree, index, columns, voxel_size, manipulability, base)
+
+    # The tree is passed once to every worker instead of being pickled for every chunk
+    results = map_jobs(_sample_worker, jobs, processes, _initialize_worker, arguments)
+
+    if results:
+        indices, voxel_counts, scores = _bin(numpy.concatenate([i[0] for i in results]),
+                                             numpy.concatenate([i[1] for i in results]),
+                                             numpy.concatenate([i[2] for i in results]) if manipulability else None)
+    else:
+        indices, voxel_counts, scores = numpy.zeros((0, 3), numpy.int32), numpy.zeros(0, numpy.int64), \
+            numpy.zeros(0) if manipulability else None
+    return ReachabilityMap(voxel_size, indices, voxel_counts, scores, samples, end_effector,
+                           [tree.names[tree.dofs[i]] for i in columns])